@@ -0,0 +1,110 @@
+"""
+Benchmark the video export stage.
+
+Transcodes one intermediate MP4 into every requested format, first one
+format at a time and then concurrently as the export pipeline does. With
+--manim the intermediate is rendered from a small generated scene first, so
+the whole path from Manim code to final files is measured. Otherwise a
+synthetic clip is made with ffmpeg's test source. Only software codecs are
+used, so this runs on CPU-only machines.
+
+Usage:
+    python scripts/benchmarks/benchmark_export.py --duration 30 --formats mp4 webm gif
+    python scripts/benchmarks/benchmark_export.py --manim --quality medium
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from certify_studio.manim_integration.export_pipeline import (
+    manim_quality,
+    render_manim_code,
+    transcode,
+    transcode_all
+)
+from certify_studio.manim_integration.render_cache import RenderCache
+
+SCENE_CODE = """from manim import *
+
+class BenchmarkScene(Scene):
+    def construct(self):
+        boxes = VGroup(*[Square().scale(0.4) for _ in range(8)]).arrange(RIGHT)
+        self.play(Create(boxes))
+        for box in boxes:
+            self.play(box.animate.set_fill(BLUE, opacity=0.8).rotate(PI / 4), run_time=0.5)
+        self.play(FadeOut(boxes))
+"""
+
+
+def synthetic_clip(path: Path, duration: int, size: str) -> Path:
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size={size}:rate=30:duration={duration}",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path),
+        ],
+        check=True
+    )
+    return path
+
+
+async def main_async(args):
+    work = Path(tempfile.mkdtemp(prefix="export_bench_"))
+
+    start = time.perf_counter()
+    if args.manim:
+        source = await render_manim_code(
+            SCENE_CODE, "BenchmarkScene", work / "render",
+            quality=manim_quality(args.quality),
+            cache=RenderCache(work / "cache", max_bytes=10 ** 10)
+        )
+    else:
+        source = synthetic_clip(work / "source.mp4", args.duration, args.size)
+    print(f"intermediate: {source.stat().st_size / 1e6:.1f} MB in {time.perf_counter() - start:.2f}s")
+
+    sequential = {}
+    for format in args.formats:
+        start = time.perf_counter()
+        await transcode(source, work / "sequential" / f"out.{format}", format)
+        sequential[format] = time.perf_counter() - start
+        print(f"  {format:<5} alone       {sequential[format]:7.2f}s")
+
+    last_report = {}
+
+    def progress(format, fraction):
+        if fraction - last_report.get(format, 0) >= 0.25 or fraction == 1.0:
+            last_report[format] = fraction
+            print(f"    {format} {fraction:.0%}")
+
+    start = time.perf_counter()
+    outputs = await transcode_all(source, work / "concurrent", "out", args.formats, progress=progress)
+    concurrent = time.perf_counter() - start
+
+    total = sum(sequential.values())
+    print(f"\nsequential total {total:7.2f}s")
+    print(f"concurrent total {concurrent:7.2f}s  ({total / concurrent:.2f}x)")
+    for format, path in outputs.items():
+        print(f"  {format:<5} {path.stat().st_size / 1e6:7.2f} MB")
+    print(f"\noutputs in {work}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--formats", nargs="+", default=["mp4", "webm", "gif"])
+    parser.add_argument("--duration", type=int, default=20, help="synthetic clip length in seconds")
+    parser.add_argument("--size", default="1280x720", help="synthetic clip resolution")
+    parser.add_argument("--manim", action="store_true", help="render the intermediate with Manim")
+    parser.add_argument("--quality", default="low", help="Manim quality for --manim")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark KnowledgeGraph.suggest_next_concepts and find_learning_path.
+
+Compares the indexed prerequisite frontier + stacked-embedding scoring with
+the previous full scan (per-concept prerequisite check and pairwise cosine
+similarity per learned concept) on synthetic graphs, and times the
+topological planner on the deepest concept.
+
+Usage:
+    python scripts/benchmarks/benchmark_knowledge_frontier.py --sizes 10000 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from certify_studio.knowledge.graph import Concept, ConceptType, KnowledgeGraph
+
+
+async def build_graph(n_concepts: int, dim: int, seed: int) -> KnowledgeGraph:
+    """Build a layered DAG with up to three prerequisites per concept."""
+    rng = np.random.default_rng(seed)
+    graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+    for i in range(n_concepts):
+        prereqs = []
+        if i >= 10:
+            window = max(0, i - 500)
+            prereqs = [f"c{j}" for j in rng.choice(np.arange(window, i), size=3, replace=False)]
+        await graph.add_concept(Concept(
+            id=f"c{i}",
+            name=f"Concept {i}",
+            type=ConceptType.FUNDAMENTAL,
+            description="",
+            cognitive_level="understand",
+            difficulty=float(rng.random()),
+            prerequisites=prereqs,
+            embedding=rng.standard_normal(dim).astype(np.float32)
+        ))
+    return graph
+
+
+def legacy_suggest(graph: KnowledgeGraph, learned: list, n: int) -> list:
+    """The previous implementation: full scan plus pairwise similarity."""
+    learned_set = set(learned)
+    suggestions = []
+    avg_difficulty = np.mean([graph.concepts[c].difficulty for c in learned])
+    for concept_id, concept in graph.concepts.items():
+        if concept_id in learned_set:
+            continue
+        if not all(p in learned_set for p in concept.prerequisites):
+            continue
+        factors = [sum(
+            1 for l in learned
+            if graph.graph.has_edge(l, concept_id) or graph.graph.has_edge(concept_id, l)
+        ) / len(learned)]
+        sims = []
+        for l in learned:
+            a, b = concept.embedding, graph.concepts[l].embedding
+            sims.append(float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b))))
+        factors.append(np.mean(sims))
+        factors.append(concept.effectiveness_score)
+        factors.append(max(0, 1.0 - abs(concept.difficulty - (avg_difficulty + 0.1))))
+        suggestions.append((concept_id, np.mean(factors)))
+    suggestions.sort(key=lambda x: x[1], reverse=True)
+    return suggestions[:n]
+
+
+async def run(sizes: list, n_learned: int, repeats: int, skip_legacy: bool):
+    for size in sizes:
+        graph = await build_graph(size, dim=384, seed=size)
+        learned = [f"c{i}" for i in range(min(n_learned, size))]
+
+        # Warm the embedding matrix so it isn't billed to the first query
+        await graph.suggest_next_concepts(learned)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            await graph.suggest_next_concepts(learned)
+        indexed_ms = (time.perf_counter() - start) / repeats * 1000
+
+        frontier = graph.create_frontier(learned)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            await graph.suggest_next_concepts(learned, frontier=frontier)
+        frontier_ms = (time.perf_counter() - start) / repeats * 1000
+
+        line = (f"{size:>8} concepts | indexed {indexed_ms:9.2f} ms"
+                f" | reused frontier {frontier_ms:9.2f} ms")
+        if not skip_legacy:
+            start = time.perf_counter()
+            legacy_suggest(graph, learned, 5)
+            legacy_ms = (time.perf_counter() - start) * 1000
+            line += f" | legacy scan {legacy_ms:10.2f} ms ({legacy_ms / indexed_ms:.1f}x)"
+        print(line)
+
+        start = time.perf_counter()
+        path = await graph.find_learning_path([], f"c{size - 1}")
+        plan_ms = (time.perf_counter() - start) * 1000
+        print(f"{'':>8}          | planner {plan_ms:9.2f} ms for a {len(path)}-concept path")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--learned", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.learned, args.repeats, args.skip_legacy))
+
+
+if __name__ == "__main__":
+    main()
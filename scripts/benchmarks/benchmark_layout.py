@@ -0,0 +1,103 @@
+"""
+Benchmark force-directed diagram layout.
+
+Compares the previous pure-Python layout loop, which computed every pair
+of nodes in every iteration, with the vectorized ForceDirectedLayout on
+random sparse graphs. The legacy loop is skipped above --legacy-limit
+nodes because its cost grows quadratically.
+
+Usage:
+    python scripts/benchmarks/benchmark_layout.py --sizes 50 500 5000
+    python scripts/benchmarks/benchmark_layout.py --sizes 2000 --degree 3 --legacy-limit 0
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from certify_studio.agents.content.diagram_generation.force_layout import ForceDirectedLayout
+
+
+def random_graph(n, degree, seed):
+    rng = random.Random(seed)
+    edges = [(i, rng.randrange(i)) for i in range(1, n)]  # spanning tree keeps it connected
+    edges += [(rng.randrange(n), rng.randrange(n)) for _ in range(int(n * (degree - 1) / 2))]
+    return edges
+
+
+def legacy_layout(n, edges, iterations=50):
+    """The O(n^2)-per-iteration loop the layout engine used before."""
+    positions = [
+        [0.5 + 0.3 * math.cos(2 * math.pi * i / n), 0.5 + 0.3 * math.sin(2 * math.pi * i / n)]
+        for i in range(n)
+    ]
+    for _ in range(iterations):
+        forces = [[0.0, 0.0] for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = positions[j][0] - positions[i][0]
+                dy = positions[j][1] - positions[i][1]
+                distance = max(math.sqrt(dx * dx + dy * dy), 0.01)
+                force = 0.01 / (distance * distance)
+                forces[i][0] -= force * dx / distance
+                forces[i][1] -= force * dy / distance
+                forces[j][0] += force * dx / distance
+                forces[j][1] += force * dy / distance
+        for source, target in edges:
+            dx = positions[target][0] - positions[source][0]
+            dy = positions[target][1] - positions[source][1]
+            distance = max(math.sqrt(dx * dx + dy * dy), 0.01)
+            force = distance * 0.1
+            forces[source][0] += force * dx / distance
+            forces[source][1] += force * dy / distance
+            forces[target][0] -= force * dx / distance
+            forces[target][1] -= force * dy / distance
+        for i in range(n):
+            positions[i][0] = max(0.1, min(0.9, positions[i][0] + forces[i][0] * 0.1))
+            positions[i][1] = max(0.1, min(0.9, positions[i][1] + forces[i][1] * 0.1))
+    return positions
+
+
+def edge_length_ratio(positions, edges, n):
+    """Mean edge length relative to the ideal spacing for n nodes; lower is tighter."""
+    total = sum(math.dist(positions[s], positions[t]) for s, t in edges if s != t)
+    return total / max(len(edges), 1) / math.sqrt(1 / n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--degree", type=float, default=2.5, help="average node degree")
+    parser.add_argument("--legacy-limit", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>6} {'legacy':>10} {'vectorized':>11} {'iters':>6} {'speedup':>8} {'edge/k':>7}")
+    for n in args.sizes:
+        edges = random_graph(n, args.degree, args.seed)
+
+        legacy = None
+        if n <= args.legacy_limit:
+            start = time.perf_counter()
+            legacy_layout(n, edges)
+            legacy = time.perf_counter() - start
+
+        layout = ForceDirectedLayout(seed=args.seed)
+        start = time.perf_counter()
+        positions = layout.run(n, edges)
+        vectorized = time.perf_counter() - start
+
+        legacy_text = f"{legacy:9.3f}s" if legacy is not None else f"{'-':>10}"
+        speedup = f"{legacy / vectorized:7.1f}x" if legacy is not None else f"{'-':>8}"
+        ratio = edge_length_ratio(positions.tolist(), edges, n)
+        print(f"{n:>6} {legacy_text} {vectorized:10.3f}s {layout.iterations_run:>6} {speedup} {ratio:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
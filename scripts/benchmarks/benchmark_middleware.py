@@ -0,0 +1,182 @@
+"""
+Benchmark per-request middleware overhead.
+
+Compares the previous stack of BaseHTTPMiddleware subclasses (request ID,
+logging, security headers, rate limiting, metrics) against the single
+pure-ASGI RequestPipelineMiddleware. Requests are driven straight through
+the ASGI interface with many in flight at once, so the numbers reflect
+middleware cost rather than network or server overhead.
+
+Usage:
+    python scripts/benchmarks/benchmark_middleware.py --requests 20000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from certify_studio.api.middleware import RequestPipelineMiddleware, route_template
+from certify_studio.api.rate_limit import rate_limiter
+from certify_studio.integrations.observability.metrics import track_request_metrics
+
+logger = logging.getLogger("benchmark")
+
+
+async def plain(request):
+    return PlainTextResponse("ok")
+
+
+async def stream(request):
+    async def chunks():
+        for _ in range(32):
+            yield b"x" * 1024
+    return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+
+def build_app() -> Starlette:
+    return Starlette(routes=[Route("/items/{item_id}", plain), Route("/stream", stream)])
+
+
+# The previous middleware, reduced to the work each layer did per request
+
+class LegacyRequestID(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyLogging(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        logger.info("Request started", extra={"path": request.url.path})
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info("Request completed", extra={"status_code": response.status_code})
+        response.headers["X-Process-Time"] = str(duration)
+        return response
+
+
+class LegacySecurityHeaders(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        for name, value in RequestPipelineMiddleware.SECURITY_HEADERS:
+            response.headers[name.decode()] = value.decode()
+        return response
+
+
+class LegacyRateLimit(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        result = await rate_limiter.hit(f"ip:{request.client.host}", 10 ** 9, 60)
+        if not result.allowed:
+            return JSONResponse({"message": "Rate limit exceeded"}, status_code=429)
+        response = await call_next(request)
+        response.headers.update(result.headers())
+        return response
+
+
+class LegacyMetrics(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        track_request_metrics(
+            request.method, route_template(request.scope),
+            response.status_code, time.perf_counter() - start_time
+        )
+        return response
+
+
+def wrap_legacy(app):
+    for middleware in (LegacySecurityHeaders, LegacyRateLimit, LegacyLogging, LegacyMetrics, LegacyRequestID):
+        app = middleware(app)
+    return app
+
+
+def wrap_pipeline(app):
+    return RequestPipelineMiddleware(app, calls=10 ** 9, period=60, metrics=True)
+
+
+async def call(app, path: str) -> int:
+    """Issue one GET through the ASGI interface and drain the response."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"bench")],
+        "client": ("10.0.0.1", 5000), "server": ("bench", 80),
+    }
+    received = False
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)
+
+    body = 0
+
+    async def send(message):
+        nonlocal body
+        if message["type"] == "http.response.body":
+            body += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return body
+
+
+async def run(app, path: str, total: int, concurrency: int) -> float:
+    """Mean wall time per request (microseconds) with `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await call(app, path)
+
+    await asyncio.gather(*(one(i) for i in range(min(total, 500))))  # warm up
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return (time.perf_counter() - start) / total * 1e6
+
+
+async def main_async(args):
+    logging.disable(logging.INFO)
+    rate_limiter.use_redis = False
+
+    stacks = {
+        "bare": build_app(),
+        "legacy": wrap_legacy(build_app()),
+        "pipeline": wrap_pipeline(build_app()),
+    }
+    for path in ("/items/42", "/stream"):
+        print(f"\n{path}  ({args.requests} requests, {args.concurrency} concurrent)")
+        timings = {name: await run(app, path, args.requests, args.concurrency) for name, app in stacks.items()}
+        for name, micros in timings.items():
+            overhead = micros - timings["bare"]
+            print(f"  {name:<9} {micros:8.1f} us/request   overhead {overhead:7.1f} us")
+        speedup = (timings["legacy"] - timings["bare"]) / max(timings["pipeline"] - timings["bare"], 1e-9)
+        print(f"  overhead reduction: {speedup:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark command typo lookups.
+
+Compares the previous linear scan, which computed the edit distance from
+each command to every known command, with the prebuilt symmetric-delete
+index. The vocabulary is padded with synthetic command names to show how both
+approaches scale as more technologies and their CLIs are added.
+
+Usage:
+    python scripts/benchmarks/benchmark_typo_index.py --vocab-sizes 30 1000 5000
+    python scripts/benchmarks/benchmark_typo_index.py --queries 5000 --max-distance 1
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'src'))
+
+from certify_studio.agents.specialized.quality_assurance.fuzzy_index import FuzzyIndex, edit_distance
+from certify_studio.agents.specialized.quality_assurance.technical_validator import COMMON_COMMANDS
+
+
+def vocabulary(size, rng):
+    words = list(COMMON_COMMANDS)
+    while len(words) < size:
+        words.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))))
+    return list(dict.fromkeys(words))
+
+
+def queries(words, count, rng):
+    """Known commands with zero to three random edits."""
+    result = []
+    for _ in range(count):
+        word = list(rng.choice(words))
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(word) + 1)
+            operation = rng.choice("ids")
+            if operation == "i":
+                word.insert(position, rng.choice(string.ascii_lowercase))
+            elif word and position < len(word):
+                if operation == "d":
+                    del word[position]
+                else:
+                    word[position] = rng.choice(string.ascii_lowercase)
+        result.append("".join(word) or "x")
+    return result
+
+
+def linear_scan(word, words, max_distance):
+    """The loop the validator used before."""
+    return [valid for valid in words if edit_distance(word, valid) <= max_distance]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vocab-sizes", type=int, nargs="+", default=[30, 1000, 5000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-distance", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'vocab':>6} {'build':>9} {'linear':>9} {'indexed':>9} {'speedup':>8}")
+    for size in args.vocab_sizes:
+        rng = random.Random(args.seed)
+        words = vocabulary(size, rng)
+        batch = queries(words, args.queries, rng)
+
+        start = time.perf_counter()
+        index = FuzzyIndex(words, args.max_distance)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = [linear_scan(word, words, args.max_distance) for word in batch]
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = [index.search(word, args.max_distance) for word in batch]
+        indexed = time.perf_counter() - start
+
+        assert all(sorted(e) == sorted(w for _, w in f) for e, f in zip(expected, found))
+        print(f"{len(words):>6} {build:8.3f}s {linear:8.3f}s {indexed:8.3f}s {linear / indexed:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
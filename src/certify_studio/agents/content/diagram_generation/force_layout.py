@@ -0,0 +1,232 @@
+"""
+Vectorized force-directed layout.
+
+Fruchterman-Reingold forces computed on numpy arrays. Small graphs use
+exact all-pairs repulsion; larger graphs use a Barnes-Hut approximation
+over a hierarchy of grids, where distant groups of nodes act as one body
+at their centre of mass, so an iteration costs O(n log n) instead of
+O(n^2). Cooling adapts to progress and the simulation stops early once
+nodes have settled. A fixed seed gives identical layouts for identical
+graphs.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+_NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+# Offsets from a parent-aligned cell to the children of the parent's 3x3 neighbourhood
+_CHILD_OFFSETS = np.arange(-2, 4)
+
+
+class ForceDirectedLayout:
+    """Force-directed layout on a unit square."""
+
+    COOLING = 0.9
+    MAX_DEPTH = 12
+
+    def __init__(
+        self,
+        iterations: int = 300,
+        tolerance: float = 0.01,
+        seed: int = 0,
+        exact_limit: int = 1000,
+        nodes_per_cell: int = 4,
+        gravity: float = 0.05
+    ):
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.seed = seed
+        self.exact_limit = exact_limit
+        self.nodes_per_cell = nodes_per_cell
+        self.gravity = gravity
+        self.iterations_run = 0
+
+    def run(
+        self,
+        n: int,
+        edges: Sequence[Tuple[int, int]],
+        initial: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Lay out ``n`` nodes connected by ``edges`` (index pairs).
+
+        Returns an (n, 2) array of positions scaled into [0, 1].
+        """
+        self.iterations_run = 0
+        if n == 0:
+            return np.zeros((0, 2))
+        if n == 1:
+            return np.full((1, 2), 0.5)
+
+        rng = np.random.default_rng(self.seed)
+        pos = np.array(initial, dtype=float) if initial is not None else rng.random((n, 2))
+        edge_index = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edge_index = edge_index[edge_index[:, 0] != edge_index[:, 1]]
+
+        k = np.sqrt(1.0 / n)  # ideal edge length for unit area
+        temperature = 0.1
+        energy = np.inf
+        progress = 0
+
+        for iteration in range(self.iterations):
+            if n <= self.exact_limit:
+                disp = self._repulsion_exact(pos, k)
+            else:
+                disp = self._repulsion_tree(pos, k)
+            disp += self._attraction(pos, edge_index, k, n)
+            disp += self.gravity * (pos.mean(axis=0) - pos)
+
+            length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 1e-12)
+            step = np.minimum(length, temperature)
+            pos += disp / length[:, None] * step[:, None]
+            self.iterations_run = iteration + 1
+
+            # Adaptive cooling: heat up after steady progress, cool when energy rises
+            previous, energy = energy, float((length ** 2).sum())
+            if energy < previous:
+                progress += 1
+                if progress >= 5:
+                    progress = 0
+                    temperature /= self.COOLING
+            else:
+                progress = 0
+                temperature *= self.COOLING
+
+            if step.mean() < self.tolerance * k:
+                break
+
+        return self._normalize(pos)
+
+    @staticmethod
+    def _weighted_pull(pos: np.ndarray, bodies: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        """Sum of weight[i, j] * (pos[i] - bodies[j]) over j."""
+        return pos * weight.sum(axis=1)[:, None] - weight @ bodies
+
+    @staticmethod
+    def _squared_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        dist_sq = (a ** 2).sum(axis=1)[:, None] + (b ** 2).sum(axis=1)[None, :] - 2 * a @ b.T
+        return np.maximum(dist_sq, 1e-9)
+
+    def _repulsion_exact(self, pos: np.ndarray, k: float) -> np.ndarray:
+        # F = k^2 / d along the unit vector, i.e. k^2 / d^2 times the offset
+        weight = k * k / self._squared_distances(pos, pos)
+        np.fill_diagonal(weight, 0.0)
+        return self._weighted_pull(pos, pos, weight)
+
+    def _repulsion_tree(self, pos: np.ndarray, k: float) -> np.ndarray:
+        """
+        Barnes-Hut style repulsion over a hierarchy of grids.
+
+        At each level a node feels the cells that were too close to
+        approximate at the parent level but are not adjacent at this one,
+        each as a single body at its centre of mass. At the finest level
+        nodes in adjacent cells interact exactly.
+        """
+        n = len(pos)
+        lo = pos.min(axis=0)
+        unit = (pos - lo) / np.maximum(pos.max(axis=0) - lo, 1e-9)
+        depth = max(2, int(np.ceil(np.log(max(n / self.nodes_per_cell, 1)) / np.log(4))))
+        disp = np.zeros_like(pos)
+
+        level = 1
+        while True:
+            level += 1
+            side = 2 ** level
+            cell_xy = np.minimum((unit * side).astype(np.int64), side - 1)
+            cell = cell_xy[:, 1] * side + cell_xy[:, 0]
+            counts = np.bincount(cell, minlength=side * side)
+            occupied = np.maximum(counts, 1)
+            com_x = np.bincount(cell, weights=pos[:, 0], minlength=side * side) / occupied
+            com_y = np.bincount(cell, weights=pos[:, 1], minlength=side * side) / occupied
+
+            # Children of the parent's neighbours that are not our neighbours
+            base = (cell_xy // 2) * 2
+            cand_x = np.repeat(base[:, 0:1] + _CHILD_OFFSETS, 6, axis=1)
+            cand_y = np.tile(base[:, 1:2] + _CHILD_OFFSETS, 6)
+            valid = (
+                (cand_x >= 0) & (cand_x < side) & (cand_y >= 0) & (cand_y < side)
+                & ((np.abs(cand_x - cell_xy[:, 0:1]) > 1) | (np.abs(cand_y - cell_xy[:, 1:2]) > 1))
+            )
+            index = (cand_y * side + cand_x) * valid
+            mass = counts[index] * valid
+
+            dx = pos[:, 0:1] - com_x[index]
+            dy = pos[:, 1:2] - com_y[index]
+            weight = mass * (k * k) / np.maximum(dx * dx + dy * dy, 1e-9)
+            disp[:, 0] += (dx * weight).sum(axis=1)
+            disp[:, 1] += (dy * weight).sum(axis=1)
+
+            # Go deeper than the uniform estimate while clusters keep cells crowded
+            crowded = (counts ** 2).sum() > n * self.nodes_per_cell
+            if level >= depth and (not crowded or level >= self.MAX_DEPTH):
+                break
+
+        return disp + self._repulsion_near(pos, cell_xy, counts, cell, side, k)
+
+    @staticmethod
+    def _repulsion_near(
+        pos: np.ndarray,
+        cell_xy: np.ndarray,
+        counts: np.ndarray,
+        cell: np.ndarray,
+        side: int,
+        k: float
+    ) -> np.ndarray:
+        """Exact repulsion between nodes in adjacent finest-level cells."""
+        n = len(pos)
+        disp = np.zeros_like(pos)
+        order = np.argsort(cell, kind="stable")
+        starts = np.cumsum(counts) - counts
+        nodes = np.arange(n)
+        for dx, dy in _NEIGHBOUR_OFFSETS:
+            nx, ny = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+            valid = (nx >= 0) & (nx < side) & (ny >= 0) & (ny < side)
+            neighbour = ny[valid] * side + nx[valid]
+            per_node = counts[neighbour]
+            total = int(per_node.sum())
+            if total == 0:
+                continue
+            src = np.repeat(nodes[valid], per_node)
+            offsets = np.arange(total) - np.repeat(np.cumsum(per_node) - per_node, per_node)
+            dst = order[np.repeat(starts[neighbour], per_node) + offsets]
+            keep = src != dst
+            src, dst = src[keep], dst[keep]
+
+            delta = pos[src] - pos[dst]
+            dist_sq = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+            force = delta * (k * k / dist_sq)[:, None]
+            disp[:, 0] += np.bincount(src, weights=force[:, 0], minlength=n)
+            disp[:, 1] += np.bincount(src, weights=force[:, 1], minlength=n)
+        return disp
+
+    @staticmethod
+    def _attraction(pos: np.ndarray, edge_index: np.ndarray, k: float, n: int) -> np.ndarray:
+        disp = np.zeros_like(pos)
+        if len(edge_index) == 0:
+            return disp
+        src, dst = edge_index[:, 0], edge_index[:, 1]
+        delta = pos[dst] - pos[src]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+        # F = d^2 / k along delta / d
+        force = delta * (dist / k)[:, None]
+        for axis in (0, 1):
+            disp[:, axis] += np.bincount(src, weights=force[:, axis], minlength=n)
+            disp[:, axis] -= np.bincount(dst, weights=force[:, axis], minlength=n)
+        return disp
+
+    @staticmethod
+    def _normalize(pos: np.ndarray) -> np.ndarray:
+        lo = pos.min(axis=0)
+        span = pos.max(axis=0) - lo
+        scale = span.max()
+        if scale <= 0:
+            return np.full_like(pos, 0.5)
+        # Keep the aspect ratio and centre the shorter axis
+        return (pos - lo) / scale + (1 - span / scale) / 2
+
+
+def fit_to_box(positions: np.ndarray, low: Tuple[float, float], high: Tuple[float, float]) -> np.ndarray:
+    """Map unit-square positions into the box ``low``..``high``."""
+    low_arr, high_arr = np.asarray(low, dtype=float), np.asarray(high, dtype=float)
+    return low_arr + positions * (high_arr - low_arr)
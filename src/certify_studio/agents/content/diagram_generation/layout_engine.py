@@ -3,8 +3,10 @@ Layout algorithms for diagram positioning.
 """
 
 from typing import Dict, List, Any, Optional
+import asyncio
 import math
 
+from .force_layout import ForceDirectedLayout, fit_to_box
 from .models import DiagramElement, DiagramEdge, LayoutAlgorithm
 
 
@@ -44,63 +46,29 @@ class DiagramLayoutEngine:
     ) -> Dict[str, Dict[str, float]]:
         """Force-directed graph layout algorithm."""
         
-        positions = {}
-        
-        # Initialize positions randomly
-        for i, element in enumerate(elements):
-            angle = 2 * math.pi * i / len(elements)
-            radius = 0.3
-            positions[element.id] = {
-                "x": 0.5 + radius * math.cos(angle),
-                "y": 0.5 + radius * math.sin(angle)
-            }
-        
-        # Simulate forces
-        iterations = 50
-        for _ in range(iterations):
-            forces = {el.id: {"x": 0, "y": 0} for el in elements}
-            
-            # Repulsive forces between all nodes
-            for i, el1 in enumerate(elements):
-                for j, el2 in enumerate(elements):
-                    if i >= j:
-                        continue
-                    
-                    dx = positions[el2.id]["x"] - positions[el1.id]["x"]
-                    dy = positions[el2.id]["y"] - positions[el1.id]["y"]
-                    distance = max(math.sqrt(dx*dx + dy*dy), 0.01)
-                    
-                    # Repulsive force
-                    force = 0.01 / (distance * distance)
-                    forces[el1.id]["x"] -= force * dx / distance
-                    forces[el1.id]["y"] -= force * dy / distance
-                    forces[el2.id]["x"] += force * dx / distance
-                    forces[el2.id]["y"] += force * dy / distance
-            
-            # Attractive forces along edges
-            for edge in edges:
-                if edge.source_id in positions and edge.target_id in positions:
-                    dx = positions[edge.target_id]["x"] - positions[edge.source_id]["x"]
-                    dy = positions[edge.target_id]["y"] - positions[edge.source_id]["y"]
-                    distance = max(math.sqrt(dx*dx + dy*dy), 0.01)
-                    
-                    # Attractive force
-                    force = distance * 0.1
-                    forces[edge.source_id]["x"] += force * dx / distance
-                    forces[edge.source_id]["y"] += force * dy / distance
-                    forces[edge.target_id]["x"] -= force * dx / distance
-                    forces[edge.target_id]["y"] -= force * dy / distance
-            
-            # Apply forces
-            for el_id in positions:
-                positions[el_id]["x"] += forces[el_id]["x"] * 0.1
-                positions[el_id]["y"] += forces[el_id]["y"] * 0.1
-                
-                # Keep within bounds
-                positions[el_id]["x"] = max(0.1, min(0.9, positions[el_id]["x"]))
-                positions[el_id]["y"] = max(0.1, min(0.9, positions[el_id]["y"]))
-        
-        return positions
+        if not elements:
+            return {}
+        
+        constraints = constraints or {}
+        index = {element.id: i for i, element in enumerate(elements)}
+        edge_pairs = [
+            (index[edge.source_id], index[edge.target_id])
+            for edge in edges
+            if edge.source_id in index and edge.target_id in index
+        ]
+        
+        layout = ForceDirectedLayout(
+            iterations=constraints.get("iterations", 300),
+            seed=constraints.get("seed", 0)
+        )
+        # Large graphs take long enough to stall the event loop
+        unit_positions = await asyncio.to_thread(layout.run, len(elements), edge_pairs)
+        positions = fit_to_box(unit_positions, (0.1, 0.1), (0.9, 0.9))
+        
+        return {
+            element.id: {"x": float(x), "y": float(y)}
+            for element, (x, y) in zip(elements, positions)
+        }
     
     async def _hierarchical_layout(
         self,
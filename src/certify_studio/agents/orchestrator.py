@@ -11,9 +11,12 @@ from enum import Enum
 import asyncio
 from pathlib import Path
 import json
+import shutil
+import uuid
 
 from langchain.chat_models.base import BaseChatModel
 
+from ..config import settings
 from ..core.logging import get_logger
 from .certification.domain_extraction_agent import DomainExtractionAgent, LearningDomain
 from .content.animation_choreography_agent import AnimationChoreographyAgent
@@ -113,7 +116,7 @@ class AgenticOrchestrator:
             # Phase 5: Export in requested formats
             await self._update_progress(GenerationPhase.EXPORT, progress_callback)
             exports = await self._export_content(
-                rendered_content, config
+                rendered_content, config, progress_callback
             )
             
             # Create result
@@ -490,7 +493,8 @@ class AgenticOrchestrator:
     async def _export_content(
         self,
         rendered_content: Dict[str, Any],
-        config: GenerationConfig
+        config: GenerationConfig,
+        progress_callback: Optional[callable] = None
     ) -> Dict[str, Path]:
         """Export content in requested formats."""
         
@@ -498,13 +502,14 @@ class AgenticOrchestrator:
         
         exports = {}
         
+        video_formats = [f for f in config.export_formats if f in ("mp4", "webm", "gif")]
+        if video_formats:
+            exports.update(await self._export_video(
+                rendered_content, config, video_formats, progress_callback
+            ))
+        
         for format in config.export_formats:
-            if format == "mp4":
-                export_path = config.output_path / f"{config.exam_code}_educational.mp4"
-                # In production, this would call Manim's export
-                exports["mp4"] = export_path
-                
-            elif format == "interactive_html":
+            if format == "interactive_html":
                 export_path = config.output_path / f"{config.exam_code}_interactive.html"
                 await self._export_interactive_html(
                     rendered_content, export_path, config
@@ -524,6 +529,53 @@ class AgenticOrchestrator:
         logger.info(f"Exported content to {len(exports)} formats")
         return exports
     
+    async def _export_video(
+        self,
+        rendered_content: Dict[str, Any],
+        config: GenerationConfig,
+        formats: List[str],
+        progress_callback: Optional[callable] = None
+    ) -> Dict[str, Path]:
+        """
+        Render all scenes once, join them, and transcode to each video format.
+        
+        Scenes render in parallel on the render farm; the joined MP4 is the
+        single intermediate that every format is converted from concurrently.
+        """
+        # Imported here: manim_integration imports agent modules
+        from ..manim_integration.export_pipeline import ExportError, manim_quality, transcode_all
+        from ..manim_integration.scene_generator import ManimSceneGenerator
+        
+        # A directory per run: concurrent generations of one exam must not share scenes
+        work_dir = Path(settings.MANIM_TEMP_DIR) / "exports" / f"{config.exam_code}_{uuid.uuid4().hex}"
+        intermediate = work_dir / f"{config.exam_code}_full.mp4"
+        
+        async def report(format: str, fraction: float) -> None:
+            if progress_callback:
+                await progress_callback(GenerationPhase.EXPORT, f"{format} {fraction:.0%}")
+        
+        try:
+            # Every scene must render; a video with scenes missing is not a successful export
+            scenes = await ManimSceneGenerator().render_scenes(
+                rendered_content["scenes"],
+                work_dir / "scenes",
+                quality=manim_quality(settings.MANIM_QUALITY),
+                concat_output=intermediate,
+                require_all=True
+            )
+            if not scenes:
+                raise ExportError("No scenes were rendered")
+            
+            return await transcode_all(
+                intermediate,
+                config.output_path,
+                f"{config.exam_code}_educational",
+                formats,
+                progress=report
+            )
+        finally:
+            await asyncio.to_thread(shutil.rmtree, work_dir, True)
+    
     async def _export_interactive_html(
         self,
         content: Dict[str, Any],
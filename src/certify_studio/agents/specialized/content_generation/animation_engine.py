@@ -5,8 +5,10 @@ Animation choreography and generation engine.
 from typing import List, Dict, Any, Optional, Tuple
 import asyncio
 from datetime import datetime
+from pathlib import Path
 from loguru import logger
 
+from ....config import settings
 from .models import (
     AnimationType,
     AnimationSequence,
@@ -702,7 +704,13 @@ class {self._class_name_from_title(sequence.title)}(Scene):
         return optimized_animation
     
     async def export_animation(self, animation_id: str, format: str = "mp4", options: Optional[Dict[str, Any]] = None) -> str:
-        """Export animation to specified format."""
+        """
+        Export animation to specified format.
+        
+        Video formats return the path of the exported file. Options:
+        ``output_dir``, ``quality`` (low/medium/high/production), ``width``,
+        ``crf``, ``fps`` (GIF) and ``progress_callback(format, fraction)``.
+        """
         if animation_id not in self.generated_animations:
             raise ValueError(f"Animation {animation_id} not found")
         
@@ -719,23 +727,62 @@ class {self._class_name_from_title(sequence.title)}(Scene):
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
+    async def export_animation_formats(
+        self,
+        animation_id: str,
+        formats: List[str],
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """Export several video formats from a single render, converting concurrently."""
+        if animation_id not in self.generated_animations:
+            raise ValueError(f"Animation {animation_id} not found")
+        
+        paths = await self._export_video(self.generated_animations[animation_id], formats, options)
+        return {fmt: str(path) for fmt, path in paths.items()}
+    
     async def _export_to_mp4(self, animation: Dict[str, Any], options: Optional[Dict[str, Any]]) -> str:
         """Export animation to MP4 format."""
-        # In production, this would call Manim's render pipeline
-        # For now, return the command to render
-        
-        options = options or {}
-        quality = options.get("quality", "high")
-        
-        render_command = f"manim -p{quality[0]} animation.py {self._class_name_from_title(animation['title'])}"
-        
-        return render_command
+        return str((await self._export_video(animation, ["mp4"], options))["mp4"])
     
     async def _export_to_gif(self, animation: Dict[str, Any], options: Optional[Dict[str, Any]]) -> str:
         """Export animation to GIF format."""
-        # Would convert MP4 to GIF
-        return "GIF export command"
+        return str((await self._export_video(animation, ["gif"], options))["gif"])
     
     async def _export_to_webm(self, animation: Dict[str, Any], options: Optional[Dict[str, Any]]) -> str:
         """Export animation to WebM format for web."""
-        return "WebM export command"
+        return str((await self._export_video(animation, ["webm"], options))["webm"])
+    
+    async def _export_video(
+        self,
+        animation: Dict[str, Any],
+        formats: List[str],
+        options: Optional[Dict[str, Any]]
+    ) -> Dict[str, Path]:
+        """Render the animation's Manim code once, then transcode to each format."""
+        # Imported here: manim_integration imports the agents package
+        from ....manim_integration.export_pipeline import (
+            manim_quality,
+            render_manim_code,
+            transcode_all
+        )
+        
+        options = options or {}
+        output_dir = Path(options.get("output_dir") or settings.VIDEO_OUTPUT_DIR)
+        scene_class = self._class_name_from_title(animation["title"])
+        
+        intermediate = await render_manim_code(
+            animation["manim_code"],
+            scene_class,
+            Path(settings.MANIM_TEMP_DIR) / "exports" / str(animation["id"]),
+            quality=manim_quality(options.get("quality", settings.MANIM_QUALITY))
+        )
+        logger.info(f"Rendered {animation['title']}, converting to {', '.join(formats)}")
+        
+        return await transcode_all(
+            intermediate,
+            output_dir,
+            str(animation["id"]),
+            formats,
+            options=options,
+            progress=options.get("progress_callback")
+        )
@@ -7,6 +7,7 @@ import asyncio
 from datetime import datetime
 from loguru import logger
 
+from ...content.diagram_generation.force_layout import ForceDirectedLayout, fit_to_box
 from .models import (
     DiagramType,
     DiagramSpecification,
@@ -14,6 +15,7 @@ from .models import (
     QualityMetrics,
     AccessibilityMetadata
 )
+from .spatial_index import SpatialIndex
 
 
 class DiagramGenerator:
@@ -247,15 +249,26 @@ class DiagramGenerator:
                     positions[node] = (x, y)
         
         elif algorithm.get("spring_length"):
-            # Force-directed layout (simplified)
-            # In production, this would use a proper force-directed algorithm
-            import random
+            # Force-directed layout over dependency links
+            ids = [concept.get("id", concept.get("name")) for concept in concepts]
+            index = {concept_id: i for i, concept_id in enumerate(ids)}
+            # Ordered de-duplication keeps the layout reproducible
+            links = dict.fromkeys(hierarchy.get("connections", []))
             for concept in concepts:
                 concept_id = concept.get("id", concept.get("name"))
-                positions[concept_id] = (
-                    random.uniform(100, width - 100),
-                    random.uniform(100, height - 100)
-                )
+                links.update(dict.fromkeys((dep, concept_id) for dep in concept.get("dependencies", [])))
+            edge_pairs = [
+                (index[source], index[target])
+                for source, target in links
+                if source in index and target in index
+            ]
+            
+            layout = ForceDirectedLayout(iterations=algorithm.get("iterations", 300))
+            unit_positions = await asyncio.to_thread(layout.run, len(ids), edge_pairs)
+            margin = 100
+            scaled = fit_to_box(unit_positions, (margin, margin), (width - margin, height - margin))
+            for concept_id, (x, y) in zip(ids, scaled):
+                positions[concept_id] = (float(x), float(y))
         
         return positions
     
@@ -323,6 +336,7 @@ class DiagramGenerator:
         
         # Adjust based on importance
         importance = concept.get("importance", 1.0)
+        height = base_height
         width *= importance
         height *= importance
         
@@ -378,14 +392,15 @@ class DiagramGenerator:
     ) -> List[Dict[str, Any]]:
         """Add relationship connections between elements."""
         all_items = elements.copy()
+        by_id = {element["id"]: element for element in elements}
+        index = SpatialIndex.from_elements(elements)
         
         for rel in relationships:
             source_id = f"element_{rel['source']}"
             target_id = f"element_{rel['target']}"
             
-            # Find source and target elements
-            source = next((e for e in elements if e["id"] == source_id), None)
-            target = next((e for e in elements if e["id"] == target_id), None)
+            source = by_id.get(source_id)
+            target = by_id.get(target_id)
             
             if source and target:
                 connection = {
@@ -399,7 +414,7 @@ class DiagramGenerator:
                         "markerEnd": "arrow"
                     },
                     "label": rel.get("label", ""),
-                    "path": self._calculate_connection_path(source, target)
+                    "path": self._calculate_connection_path(source, target, index)
                 }
                 
                 all_items.append(connection)
@@ -409,17 +424,21 @@ class DiagramGenerator:
     def _calculate_connection_path(
         self,
         source: Dict[str, Any],
-        target: Dict[str, Any]
+        target: Dict[str, Any],
+        index: Optional[SpatialIndex] = None
     ) -> str:
-        """Calculate SVG path for connection."""
+        """Calculate SVG path for connection, routed around other elements."""
         sx = source["position"]["x"] + source["size"]["width"] / 2
         sy = source["position"]["y"] + source["size"]["height"]
         tx = target["position"]["x"] + target["size"]["width"] / 2
         ty = target["position"]["y"]
         
-        # Simple straight line for now
-        # In production, this would calculate curved paths avoiding overlaps
-        return f"M {sx} {sy} L {tx} {ty}"
+        if index is None:
+            return f"M {sx} {sy} L {tx} {ty}"
+        
+        points = index.route((sx, sy), (tx, ty), ignore=(source["id"], target["id"]))
+        (x, y), rest = points[0], points[1:]
+        return f"M {x} {y} " + " ".join(f"L {px} {py}" for px, py in rest)
     
     async def _generate_accessibility(
         self,
@@ -548,21 +567,17 @@ class DiagramGenerator:
     
     def _check_visual_clarity(self, diagram: List[Dict[str, Any]]) -> float:
         """Check visual clarity of the diagram."""
-        # Check for overlapping elements (simplified)
         elements = [e for e in diagram if e["type"] != "arrow"]
         
         if len(elements) < 2:
             return 1.0
         
-        # Check spacing
-        min_distance = float('inf')
-        for i, e1 in enumerate(elements):
-            for e2 in elements[i+1:]:
-                dist = self._calculate_distance(
-                    e1["position"],
-                    e2["position"]
-                )
-                min_distance = min(min_distance, dist)
+        index = SpatialIndex.from_elements(elements)
+        if index.overlapping_pairs():
+            return 0.6
+        
+        # Spacing: the smallest nearest-neighbour distance
+        min_distance = min(index.nearest(e["id"])[1] for e in elements)
         
         # Score based on minimum distance
         if min_distance < 50:
@@ -0,0 +1,249 @@
+"""
+Uniform-grid spatial index for diagram elements.
+
+Elements are axis-aligned boxes bucketed into square cells, so overlap
+checks, nearest-neighbour spacing and line-of-sight tests for connection
+routing only visit nearby cells instead of every element.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import math
+
+# x, y (top-left corner), width, height
+Box = Tuple[float, float, float, float]
+Point = Tuple[float, float]
+
+
+def element_box(element: Dict[str, Any]) -> Box:
+    """Bounding box of a positioned diagram element."""
+    return (
+        element["position"]["x"],
+        element["position"]["y"],
+        element["size"]["width"],
+        element["size"]["height"]
+    )
+
+
+class SpatialIndex:
+    """
+    Grid of cells mapping to the boxes that touch them.
+
+    Boxes are registered in every cell within ``padding`` of them, so
+    segment tests with a clearance up to ``padding`` only need the cells
+    the segment itself crosses.
+    """
+
+    def __init__(self, cell_size: float = 200.0, padding: float = 10.0):
+        self.cell_size = max(cell_size, 1.0)
+        self.padding = padding
+        self.boxes: Dict[str, Box] = {}
+        self._cells: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        self._extent: Optional[Tuple[int, int, int, int]] = None  # occupied cell range
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[Dict[str, Any]]) -> "SpatialIndex":
+        """Index elements by id, with cells about twice the typical element size."""
+        boxes = {element["id"]: element_box(element) for element in elements}
+        extent = sum(max(w, h) for _, _, w, h in boxes.values()) / max(len(boxes), 1)
+        index = cls(cell_size=2 * extent or 200.0)
+        for key, box in boxes.items():
+            index.insert(key, box)
+        return index
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def _cells_for(self, box: Box, margin: float = 0.0) -> Iterator[Tuple[int, int]]:
+        x, y, w, h = box
+        x0, y0 = self._cell(x - margin, y - margin)
+        x1, y1 = self._cell(x + w + margin, y + h + margin)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def insert(self, key: str, box: Box) -> None:
+        self.boxes[key] = box
+        for cell in self._cells_for(box, self.padding):
+            self._cells[cell].append(key)
+        x, y, w, h = box
+        (x0, y0), (x1, y1) = self._cell(x, y), self._cell(x + w, y + h)
+        if self._extent is not None:
+            x0, y0 = min(x0, self._extent[0]), min(y0, self._extent[1])
+            x1, y1 = max(x1, self._extent[2]), max(y1, self._extent[3])
+        self._extent = (x0, y0, x1, y1)
+
+    def query(self, box: Box, margin: float = 0.0) -> Set[str]:
+        """Keys whose boxes intersect ``box`` grown by ``margin``."""
+        x, y, w, h = box
+        grown = (x - margin, y - margin, w + 2 * margin, h + 2 * margin)
+        found = set()
+        for cell in self._cells_for(box, margin):
+            for key in self._cells.get(cell, ()):
+                if key not in found and _boxes_intersect(self.boxes[key], grown):
+                    found.add(key)
+        return found
+
+    def overlapping_pairs(self) -> List[Tuple[str, str]]:
+        """All pairs of boxes that overlap, each reported once."""
+        pairs = set()
+        for keys in self._cells.values():
+            for i, first in enumerate(keys):
+                for second in keys[i + 1:]:
+                    pair = (first, second) if first < second else (second, first)
+                    if pair not in pairs and _boxes_intersect(self.boxes[first], self.boxes[second]):
+                        pairs.add(pair)
+        return sorted(pairs)
+
+    def nearest(self, key: str) -> Tuple[Optional[str], float]:
+        """Closest other element by centre distance, searching outward ring by ring."""
+        center = _center(self.boxes[key])
+        cx, cy = self._cell(*center)
+        x0, y0, x1, y1 = self._extent
+        max_ring = max(cx - x0, x1 - cx, cy - y0, y1 - cy)
+        best_key, best = None, math.inf
+        for ring in range(max_ring + 1):
+            for cell in _ring(cx, cy, ring):
+                for other in self._cells.get(cell, ()):
+                    if other == key:
+                        continue
+                    distance = math.dist(center, _center(self.boxes[other]))
+                    if distance < best:
+                        best_key, best = other, distance
+            # Anything not yet seen lies beyond this ring
+            if best <= ring * self.cell_size:
+                break
+        return best_key, best
+
+    def _cells_on_segment(self, start: Point, end: Point) -> Iterator[Tuple[int, int]]:
+        """Cells crossed by a segment, walked in order (Amanatides-Woo)."""
+        cx, cy = self._cell(*start)
+        ex, ey = self._cell(*end)
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        next_x = ((cx + (step_x > 0)) * self.cell_size - start[0]) / dx if dx else math.inf
+        next_y = ((cy + (step_y > 0)) * self.cell_size - start[1]) / dy if dy else math.inf
+        delta_x = abs(self.cell_size / dx) if dx else math.inf
+        delta_y = abs(self.cell_size / dy) if dy else math.inf
+
+        yield cx, cy
+        for _ in range(abs(ex - cx) + abs(ey - cy)):
+            if next_x < next_y:
+                cx += step_x
+                next_x += delta_x
+            else:
+                cy += step_y
+                next_y += delta_y
+            yield cx, cy
+
+    def _hits(self, start: Point, end: Point, ignore: Set[str], clearance: float) -> Iterator[str]:
+        """Elements a segment passes through or within ``clearance`` of, nearest cells first."""
+        seen = set(ignore)
+        # Widen the walk only when the clearance exceeds the registration padding
+        reach = int(math.ceil(max(clearance - self.padding, 0) / self.cell_size))
+        for cx, cy in self._cells_on_segment(start, end):
+            for x in range(cx - reach, cx + reach + 1):
+                for y in range(cy - reach, cy + reach + 1):
+                    for key in self._cells.get((x, y), ()):
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        bx, by, bw, bh = self.boxes[key]
+                        grown = (bx - clearance, by - clearance, bw + 2 * clearance, bh + 2 * clearance)
+                        if _segment_hits_box(start, end, grown):
+                            yield key
+
+    def blockers(self, start: Point, end: Point, ignore: Iterable[str] = (), clearance: float = 0.0) -> Set[str]:
+        """Elements that a straight segment passes through or within ``clearance`` of."""
+        return set(self._hits(start, end, set(ignore), clearance))
+
+    def is_clear(self, start: Point, end: Point, ignore: Iterable[str] = (), clearance: float = 0.0) -> bool:
+        """Whether a straight segment avoids every element; stops at the first hit."""
+        return next(self._hits(start, end, set(ignore), clearance), None) is None
+
+    def route(self, start: Point, end: Point, ignore: Iterable[str] = (), clearance: float = 10.0) -> List[Point]:
+        """
+        A polyline from ``start`` to ``end`` that avoids indexed elements.
+
+        The straight line is used when it is clear. Otherwise elbow routes
+        and detours around the blocking elements are tried, and the shortest
+        clear one wins; if none is clear the straight line is kept.
+        """
+        ignore = set(ignore)
+        blocking = self.blockers(start, end, ignore, clearance)
+        if not blocking:
+            return [start, end]
+
+        # Bounds of everything in the way, padded by the clearance
+        boxes = [self.boxes[key] for key in blocking]
+        left = min(x for x, _, _, _ in boxes) - 2 * clearance
+        top = min(y for _, y, _, _ in boxes) - 2 * clearance
+        right = max(x + w for x, _, w, _ in boxes) + 2 * clearance
+        bottom = max(y + h for _, y, _, h in boxes) + 2 * clearance
+
+        (sx, sy), (tx, ty) = start, end
+        candidates = [
+            [start, (tx, sy), end],
+            [start, (sx, ty), end],
+            [start, (sx, top), (tx, top), end],
+            [start, (sx, bottom), (tx, bottom), end],
+            [start, (left, sy), (left, ty), end],
+            [start, (right, sy), (right, ty), end],
+        ]
+        candidates.sort(key=_path_length)
+        for path in candidates:
+            if all(self.is_clear(a, b, ignore, clearance) for a, b in zip(path, path[1:])):
+                return path
+        return [start, end]
+
+
+def _center(box: Box) -> Point:
+    x, y, w, h = box
+    return x + w / 2, y + h / 2
+
+
+def _boxes_intersect(a: Box, b: Box) -> bool:
+    return a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+
+def _ring(cx: int, cy: int, ring: int) -> Iterator[Tuple[int, int]]:
+    """Cells at Chebyshev distance ``ring`` from (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for x in range(cx - ring, cx + ring + 1):
+        yield x, cy - ring
+        yield x, cy + ring
+    for y in range(cy - ring + 1, cy + ring):
+        yield cx - ring, y
+        yield cx + ring, y
+
+
+def _segment_hits_box(start: Point, end: Point, box: Box) -> bool:
+    """Liang-Barsky clip test of a segment against a box interior."""
+    x, y, w, h = box
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, start[0] - x),
+        (dx, x + w - start[0]),
+        (-dy, start[1] - y),
+        (dy, y + h - start[1]),
+    ):
+        if p == 0:
+            if q <= 0:
+                return False
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 >= t1:
+            return False
+    return True
+
+
+def _path_length(path: List[Point]) -> float:
+    return sum(math.dist(a, b) for a, b in zip(path, path[1:]))
@@ -7,8 +7,9 @@ to ensure technical accuracy, pedagogical effectiveness, and certification align
 
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
 from ....agents.core.autonomous_agent import AutonomousAgent, AgentCapability
@@ -532,38 +533,49 @@ class QualityAssuranceAgent(AutonomousAgent):
                 created_at=datetime.now()
             )
             
-            # Validate technical accuracy
-            technical_result = await self.technical_validator.validate_content(
-                request.content
-            )
-            
-            # Check certification alignment
-            cert_alignment = await self.cert_aligner.check_alignment(
-                request.content
-            )
-            
-            # Assess performance
-            performance = await self.performance_monitor.assess_content(
-                request.content
-            )
-            
-            # Analyze any existing feedback
-            feedback_analysis = None
+            # Independent validators run concurrently, each within its own budget
+            content = request.content
+            validators = {
+                "technical": lambda: self.technical_validator.validate_content(content),
+                "certification": lambda: self.cert_aligner.check_alignment(content),
+                "performance": lambda: self.performance_monitor.assess_content(content),
+            }
             if request.previous_feedback:
-                feedback_analysis = await self.feedback_analyzer.analyze_feedback(
+                validators["feedback"] = lambda: self.feedback_analyzer.analyze_feedback(
                     request.previous_feedback
                 )
             
-            # Compare with benchmarks
-            benchmark_result = await self.benchmark_manager.compare_with_benchmarks(
-                QAMetrics(
-                    timestamp=datetime.now(),
-                    technical_accuracy=technical_result.accuracy_score,
-                    pedagogical_effectiveness=request.content.pedagogical_score if hasattr(request.content, 'pedagogical_score') else 0.9,
-                    accessibility_score=request.content.accessibility_score if hasattr(request.content, 'accessibility_score') else 0.98,
-                    performance_score=performance.overall_score,
-                    user_satisfaction=feedback_analysis.average_rating if feedback_analysis else 0.0
+            budgets = getattr(request, "metadata", {}).get("validator_timeouts", {})
+            outcomes = await asyncio.gather(*(
+                self._run_stage(
+                    name,
+                    validator,
+                    budgets.get(name, settings.QA_VALIDATOR_TIMEOUT_SECONDS)
                 )
+                for name, validator in validators.items()
+            ))
+            results = {name: result for name, (result, _) in zip(validators, outcomes)}
+            stage_timings = {name: timing for name, (_, timing) in zip(validators, outcomes)}
+            
+            technical_result = results["technical"]
+            cert_alignment = results["certification"]
+            performance = results["performance"]
+            feedback_analysis = results.get("feedback")
+            
+            # Compare with benchmarks
+            benchmark_result, stage_timings["benchmark"] = await self._run_stage(
+                "benchmark",
+                lambda: self.benchmark_manager.compare_with_benchmarks(
+                    QAMetrics(
+                        timestamp=datetime.now(),
+                        technical_accuracy=technical_result.accuracy_score if technical_result else 0.0,
+                        pedagogical_effectiveness=request.content.pedagogical_score if hasattr(request.content, 'pedagogical_score') else 0.9,
+                        accessibility_score=request.content.accessibility_score if hasattr(request.content, 'accessibility_score') else 0.98,
+                        performance_score=performance.overall_score if performance else 0.0,
+                        user_satisfaction=feedback_analysis.average_rating if feedback_analysis else 0.0
+                    )
+                ),
+                budgets.get("benchmark", settings.QA_VALIDATOR_TIMEOUT_SECONDS)
             )
             
             # Generate comprehensive report
@@ -579,15 +591,27 @@ class QualityAssuranceAgent(AutonomousAgent):
                 feedback_analysis=feedback_analysis,
                 overall_metrics=QAMetrics(
                     timestamp=datetime.now(),
-                    technical_accuracy=technical_result.accuracy_score,
+                    technical_accuracy=technical_result.accuracy_score if technical_result else 0.0,
                     pedagogical_effectiveness=0.9,  # Would integrate with other agents
                     accessibility_score=0.98,  # Would integrate with other agents
-                    performance_score=performance.overall_score,
+                    performance_score=performance.overall_score if performance else 0.0,
                     user_satisfaction=feedback_analysis.average_rating if feedback_analysis else 0.0
-                )
+                ),
+                stage_timings=stage_timings
             )
             
+            start = time.perf_counter()
             quality_report = await self.report_generator.generate_report(report_data)
+            stage_timings["report"] = {
+                "status": "completed",
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+            }
+            slowest = max(validators, key=lambda name: stage_timings[name]["duration_ms"])
+            logger.info(
+                f"QA stages for {request.content_id}: "
+                + ", ".join(f"{name}={t['duration_ms']}ms ({t['status']})" for name, t in stage_timings.items())
+                + f"; slowest validator: {slowest}"
+            )
             
             # Start continuous monitoring if requested
             if request.enable_monitoring:
@@ -612,14 +636,19 @@ class QualityAssuranceAgent(AutonomousAgent):
             )
             
             return QAResult(
-                success=overall_score >= request.requirements.minimum_quality_score,
+                success=self._passes_quality_gate(
+                    overall_score,
+                    request.requirements.minimum_quality_score,
+                    {name: stage_timings[name] for name in validators}
+                ),
                 quality_report=quality_report,
                 overall_score=overall_score,
                 recommendations=self._generate_recommendations(
                     technical_result,
                     cert_alignment,
                     performance,
-                    feedback_analysis
+                    feedback_analysis,
+                    stage_timings
                 ),
                 monitoring_id=monitor_id if request.enable_monitoring else None
             )
@@ -634,6 +663,51 @@ class QualityAssuranceAgent(AutonomousAgent):
                 error=str(e)
             )
     
+    async def _run_stage(
+        self,
+        name: str,
+        stage: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Run one QA stage within its time budget, recording latency and outcome.
+        
+        A stage that fails or times out yields ``None`` instead of raising,
+        so the other stages' results are still used.
+        """
+        start = time.perf_counter()
+        result, status, error = None, "completed", None
+        try:
+            result = await asyncio.wait_for(stage(), timeout)
+        except asyncio.TimeoutError:
+            status, error = "timed_out", f"Exceeded {timeout}s budget"
+            logger.warning(f"QA stage {name} timed out after {timeout}s")
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.warning(f"QA stage {name} failed: {e}")
+        
+        timing = {"status": status, "duration_ms": round((time.perf_counter() - start) * 1000, 2)}
+        if error:
+            timing["error"] = error
+        return result, timing
+    
+    @staticmethod
+    def _passes_quality_gate(
+        overall_score: float,
+        minimum_score: float,
+        validator_timings: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        """
+        Whether content passes QA.
+        
+        The overall score is rescaled over the stages that completed, so a
+        validator that timed out or failed must fail the gate rather than
+        drop out of it.
+        """
+        if any(timing["status"] != "completed" for timing in validator_timings.values()):
+            return False
+        return overall_score >= minimum_score
+    
     async def _continuous_monitoring_loop(self) -> None:
         """Continuous monitoring loop that runs in the background."""
         while True:
@@ -826,12 +900,12 @@ class QualityAssuranceAgent(AutonomousAgent):
     
     def _calculate_overall_score(
         self,
-        technical_result: ValidationReport,
-        cert_alignment: CertificationMapping,
-        performance: PerformanceReport,
-        benchmark_result: BenchmarkResult
+        technical_result: Optional[ValidationReport],
+        cert_alignment: Optional[CertificationMapping],
+        performance: Optional[PerformanceReport],
+        benchmark_result: Optional[BenchmarkResult]
     ) -> float:
-        """Calculate overall quality score."""
+        """Calculate overall quality score from the stages that completed."""
         # Weighted average of different aspects
         weights = {
             "technical": 0.3,
@@ -841,36 +915,49 @@ class QualityAssuranceAgent(AutonomousAgent):
         }
         
         scores = {
-            "technical": technical_result.accuracy_score,
-            "certification": cert_alignment.alignment_score,
-            "performance": performance.overall_score,
-            "benchmark": benchmark_result.percentile / 100.0
+            "technical": technical_result.accuracy_score if technical_result else None,
+            "certification": cert_alignment.alignment_score if cert_alignment else None,
+            "performance": performance.overall_score if performance else None,
+            "benchmark": benchmark_result.percentile / 100.0 if benchmark_result else None
         }
         
-        return sum(scores[aspect] * weights[aspect] for aspect in weights)
+        # Missing stages are left out and the remaining weights rescaled
+        available = [aspect for aspect in weights if scores[aspect] is not None]
+        total_weight = sum(weights[aspect] for aspect in available)
+        if not total_weight:
+            return 0.0
+        return sum(scores[aspect] * weights[aspect] for aspect in available) / total_weight
     
     def _generate_recommendations(
         self,
-        technical_result: ValidationReport,
-        cert_alignment: CertificationMapping,
-        performance: PerformanceReport,
-        feedback_analysis: Optional[FeedbackAnalysis]
+        technical_result: Optional[ValidationReport],
+        cert_alignment: Optional[CertificationMapping],
+        performance: Optional[PerformanceReport],
+        feedback_analysis: Optional[FeedbackAnalysis],
+        stage_timings: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> List[str]:
         """Generate recommendations based on QA results."""
         recommendations = []
         
+        # Stages whose results are missing from this assessment
+        for name, timing in (stage_timings or {}).items():
+            if timing["status"] != "completed":
+                recommendations.append(
+                    f"Re-run {name} validation: {timing['status'].replace('_', ' ')} ({timing.get('error', '')})"
+                )
+        
         # Technical recommendations
-        if technical_result.accuracy_score < 0.95:
+        if technical_result and technical_result.accuracy_score < 0.95:
             recommendations.extend(technical_result.suggestions)
         
         # Certification recommendations
-        if cert_alignment.alignment_score < 0.90:
+        if cert_alignment and cert_alignment.alignment_score < 0.90:
             recommendations.append(
                 f"Improve coverage of certification objectives: {', '.join(cert_alignment.missing_objectives[:3])}"
             )
         
         # Performance recommendations
-        if performance.overall_score < 0.85:
+        if performance and performance.overall_score < 0.85:
             if performance.response_time > 3.0:
                 recommendations.append("Optimize content generation for better response times")
             if performance.memory_usage > 0.8:
@@ -9,12 +9,14 @@ This module ensures content aligns with certification requirements:
 """
 
 import asyncio
+import hashlib
 import json
 import re
 from typing import Dict, List, Optional, Any, Tuple, Set
 from datetime import datetime
 import logging
 from collections import defaultdict
+from functools import lru_cache
 
 from .models import (
     CertificationAlignment,
@@ -25,9 +27,23 @@ from .models import (
 from ....core.llm import MultimodalLLM
 from ....core.llm.multimodal_llm import MultimodalMessage
 from ....core.config import settings
+from .coverage_engine import ObjectiveCoverageEngine
 
 logger = logging.getLogger(__name__)
 
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of",
+    "with", "by", "from", "as", "is", "was", "are", "were"
+})
+MIN_TERM_LENGTH = 3
+
+
+@lru_cache(maxsize=4096)
+def _key_terms(text: str) -> Tuple[str, ...]:
+    """Lower-cased words of ``text`` without stop words or very short words."""
+    words = re.findall(r'\b\w+\b', text.lower())
+    return tuple(w for w in words if w not in STOP_WORDS and len(w) >= MIN_TERM_LENGTH)
+
 
 class CertificationAligner:
     """Validates content alignment with certification requirements."""
@@ -37,6 +53,12 @@ class CertificationAligner:
         self.llm = llm or MultimodalLLM()
         self.certification_database = self._load_certification_database()
         self.objective_mappings = {}
+        self.coverage_engine = ObjectiveCoverageEngine(llm=self.llm)
+        
+        # Objectives are static, so their key terms are extracted once
+        self.objective_terms: Dict[str, Tuple[str, ...]] = {}
+        for cert_info in self.certification_database.values():
+            self._index_objectives(cert_info)
         
     def _load_certification_database(self) -> Dict[str, Any]:
         """Load database of certification requirements."""
@@ -168,7 +190,8 @@ class CertificationAligner:
         objective_coverage = await self._map_content_to_objectives(
             content_topics,
             cert_info["domains"],
-            extracted_concepts
+            extracted_concepts,
+            self._certification_version(certification_id, cert_info)
         )
         
         # Calculate coverage metrics
@@ -207,6 +230,36 @@ class CertificationAligner:
         logger.info(f"Alignment score: {alignment.alignment_score}, Exam readiness: {alignment.exam_readiness_score}")
         return alignment
         
+    def _index_objectives(self, cert_info: Dict[str, Any]) -> None:
+        """Pre-tokenize a certification's objectives."""
+        for domain_info in cert_info.get("domains", {}).values():
+            for objective in domain_info.get("objectives", []):
+                self.objective_terms[objective] = _key_terms(objective)
+                
+    def _build_topic_index(self, topics: List[str]) -> Set[str]:
+        """
+        Every substring that a key term could match in the topics.
+        
+        Key terms are single words, so ``term in topic`` holds exactly when
+        the term occurs inside one of the topic's words; indexing each
+        distinct word's substrings of key-term length turns that scan into
+        a set lookup.
+        """
+        index = set()
+        words = {word for topic in topics for word in re.findall(r'\w+', topic)}
+        for word in words:
+            for start in range(len(word) - MIN_TERM_LENGTH + 1):
+                for end in range(start + MIN_TERM_LENGTH, len(word) + 1):
+                    index.add(word[start:end])
+        return index
+        
+    def _certification_version(self, certification_id: str, cert_info: Dict[str, Any]) -> str:
+        """Identify a certification revision; changed objectives give a new version."""
+        if cert_info.get("version"):
+            return f"{certification_id}:{cert_info['version']}"
+        digest = hashlib.sha256(json.dumps(cert_info["domains"], sort_keys=True).encode()).hexdigest()
+        return f"{certification_id}:{digest[:16]}"
+        
     async def _fetch_certification_info(self, certification_id: str) -> Optional[Dict[str, Any]]:
         """Fetch certification information using LLM if not in database."""
         try:
@@ -240,6 +293,7 @@ class CertificationAligner:
             
             # Cache for future use
             self.certification_database[certification_id] = cert_info
+            self._index_objectives(cert_info)
             return cert_info
             
         except Exception as e:
@@ -356,7 +410,8 @@ class CertificationAligner:
         self,
         content_topics: List[Dict[str, Any]],
         domains: Dict[str, Any],
-        extracted_concepts: Optional[List[str]] = None
+        extracted_concepts: Optional[List[str]] = None,
+        certification_version: str = ""
     ) -> Dict[str, Any]:
         """Map content topics to certification objectives."""
         mapping = defaultdict(list)
@@ -365,19 +420,36 @@ class CertificationAligner:
         partial_objectives = []
         
         all_topics = [topic["name"].lower() for topic in content_topics]
+        topic_texts = [
+            f"{topic['name']}: {topic['description']}" if topic.get("description") else topic["name"]
+            for topic in content_topics
+            if topic.get("name")
+        ]
         if extracted_concepts:
             all_topics.extend([c.lower() for c in extracted_concepts])
+            topic_texts.extend(extracted_concepts)
+            
+        # Semantic coverage for every objective at once
+        objectives = [
+            objective
+            for domain_info in domains.values()
+            for objective in domain_info["objectives"]
+        ]
+        semantic_scores = await self.coverage_engine.score(
+            objectives,
+            topic_texts,
+            certification_version
+        )
+        topic_index = self._build_topic_index(all_topics)
             
         # Check each domain and objective
         for domain_name, domain_info in domains.items():
             for objective in domain_info["objectives"]:
-                objective_lower = objective.lower()
-                
                 # Calculate coverage score for this objective
-                coverage_score = await self._calculate_objective_coverage(
+                coverage_score = self._calculate_objective_coverage(
                     objective,
-                    all_topics,
-                    content_topics
+                    topic_index,
+                    semantic_scores.get(objective, 0.0)
                 )
                 
                 if coverage_score >= 0.8:
@@ -412,76 +484,27 @@ class CertificationAligner:
             "mapping": dict(mapping)
         }
         
-    async def _calculate_objective_coverage(
+    def _calculate_objective_coverage(
         self,
         objective: str,
-        all_topics: List[str],
-        content_topics: List[Dict[str, Any]]
+        topic_index: Set[str],
+        semantic_score: float
     ) -> float:
         """Calculate how well an objective is covered by content."""
-        # Extract key terms from objective
-        objective_terms = self._extract_key_terms(objective)
+        # Key terms were extracted when the certification was loaded
+        objective_terms = self.objective_terms.get(objective) or _key_terms(objective)
         
         # Direct matching
-        direct_matches = sum(1 for term in objective_terms if any(term in topic for topic in all_topics))
+        direct_matches = sum(1 for term in objective_terms if term in topic_index)
         direct_score = direct_matches / len(objective_terms) if objective_terms else 0
         
-        # Semantic matching using LLM
-        semantic_score = await self._calculate_semantic_coverage(objective, content_topics)
-        
         # Weighted combination
         return 0.6 * direct_score + 0.4 * semantic_score
         
     def _extract_key_terms(self, text: str) -> List[str]:
         """Extract key terms from text."""
-        # Remove common words
-        stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "from", "as", "is", "was", "are", "were"}
-        
-        # Extract words
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Filter
-        key_terms = [w for w in words if w not in stop_words and len(w) > 2]
+        return list(_key_terms(text))
         
-        return key_terms
-        
-    async def _calculate_semantic_coverage(
-        self,
-        objective: str,
-        content_topics: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate semantic coverage using LLM."""
-        try:
-            topics_text = "\n".join([
-                f"- {t['name']}: {t['description']}" 
-                for t in content_topics[:20]  # Limit to prevent token overflow
-            ])
-            
-            prompt = f"""
-            Assess how well these topics cover this certification objective:
-            
-            Objective: {objective}
-            
-            Topics covered:
-            {topics_text}
-            
-            Return a coverage score from 0.0 to 1.0 where:
-            - 0.0 = No coverage
-            - 0.5 = Partial coverage
-            - 1.0 = Complete coverage
-            
-            Consider both direct matches and related concepts.
-            Return only the numeric score.
-            """
-            
-            response = await self.llm_client.generate(prompt)
-            score = float(response.strip())
-            return min(max(score, 0.0), 1.0)  # Ensure valid range
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate semantic coverage: {e}")
-            return 0.0
-            
     async def _analyze_coverage_depth(
         self,
         content: Dict[str, Any],
@@ -0,0 +1,260 @@
+"""
+Static checks for code blocks, run in validator worker processes.
+
+Each check takes the source of one code block and returns the issues it
+found as plain dicts, so results can be sent between processes as JSON
+and cached. This module only depends on the standard library (and PyYAML
+for YAML) so a worker can run it as a script without importing the rest
+of the application.
+
+As a script it serves requests line by line: each line on stdin is a JSON
+object with ``language`` and ``code``, and each reply is one JSON line on
+stdout with either ``issues``, ``unsupported`` or ``error``.
+
+Usage:
+    echo '{"language": "python", "code": "print \\"hi\\""}' \\
+        | python code_checks.py --memory-limit-mb 512
+"""
+
+import argparse
+import ast
+import json
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+# Bump whenever a check changes so cached results are not reused
+CHECKS_VERSION = "1"
+
+Issue = Dict[str, Any]
+
+
+def _issue(
+    severity: str,
+    title: str,
+    description: str,
+    location: Dict[str, Any],
+    suggested_fix: Optional[str] = None,
+    auto_fixable: bool = False
+) -> Issue:
+    return {
+        "severity": severity,
+        "title": title,
+        "description": description,
+        "location": location,
+        "suggested_fix": suggested_fix,
+        "auto_fixable": auto_fixable
+    }
+
+
+def check_python(code: str) -> List[Issue]:
+    """Syntax, deprecated Python 2 features and risky calls."""
+    issues = []
+
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        issues.append(_issue(
+            "critical",
+            "Python Syntax Error",
+            f"Syntax error in Python code: {str(e)}",
+            {"type": "code", "language": "python", "line": e.lineno},
+            f"Fix syntax error at line {e.lineno}: {e.msg}"
+        ))
+
+    deprecated_patterns = [
+        (r'\bprint\s+[^(]', "Use print() function instead of print statement"),
+        (r'\bxrange\(', "Use range() instead of xrange() in Python 3"),
+        (r'\braw_input\(', "Use input() instead of raw_input() in Python 3"),
+    ]
+    for pattern, message in deprecated_patterns:
+        if re.search(pattern, code):
+            issues.append(_issue(
+                "high", "Deprecated Python Feature", message,
+                {"type": "code", "language": "python"}, message, auto_fixable=True
+            ))
+
+    security_patterns = [
+        (r'eval\(', "Avoid using eval() for security reasons"),
+        (r'exec\(', "Avoid using exec() for security reasons"),
+        (r'__import__\(', "Avoid using __import__() directly"),
+        (r'pickle\.loads?\(', "Be careful with pickle - only load trusted data"),
+    ]
+    for pattern, message in security_patterns:
+        if re.search(pattern, code):
+            issues.append(_issue(
+                "high", "Security Concern", message,
+                {"type": "code", "language": "python"}, message
+            ))
+
+    return issues
+
+
+def check_javascript(code: str) -> List[Issue]:
+    """Common JavaScript/TypeScript best-practice violations."""
+    issues = []
+
+    js_patterns = [
+        (r'var\s+\w+', "Use 'let' or 'const' instead of 'var'", "medium"),
+        (r'==(?!=)', "Use '===' instead of '==' for comparison", "medium"),
+        (r'!=(?!=)', "Use '!==' instead of '!=' for comparison", "medium"),
+        (r'console\.(log|error|warn)', "Remove console statements in production", "low"),
+    ]
+    for pattern, message, severity in js_patterns:
+        if re.search(pattern, code):
+            issues.append(_issue(
+                severity, "JavaScript Best Practice", message,
+                {"type": "code", "language": "javascript"}, message,
+                auto_fixable=severity != "low"
+            ))
+
+    return issues
+
+
+def check_yaml(code: str) -> List[Issue]:
+    """YAML syntax, plus Kubernetes manifest checks when it looks like one."""
+    import yaml
+
+    issues = []
+    try:
+        yaml.safe_load(code)
+    except yaml.YAMLError as e:
+        issues.append(_issue(
+            "critical",
+            "YAML Syntax Error",
+            f"YAML parsing error: {str(e)}",
+            {"type": "code", "language": "yaml"},
+            "Fix YAML syntax according to error message"
+        ))
+
+    if "apiVersion" in code and "kind" in code:
+        issues.extend(check_kubernetes_yaml(code))
+
+    return issues
+
+
+def check_kubernetes_yaml(code: str) -> List[Issue]:
+    """Deprecated API versions and missing required fields in a manifest."""
+    import yaml
+
+    issues = []
+    try:
+        k8s_obj = yaml.safe_load(code)
+    except yaml.YAMLError:
+        return issues  # Reported by check_yaml
+    if not isinstance(k8s_obj, dict):
+        return issues
+
+    api_version = k8s_obj.get("apiVersion", "")
+    if api_version in ["extensions/v1beta1", "apps/v1beta1", "apps/v1beta2"]:
+        issues.append(_issue(
+            "high",
+            "Deprecated Kubernetes API Version",
+            f"API version '{api_version}' is deprecated",
+            {"type": "kubernetes", "field": "apiVersion"},
+            "Use 'apps/v1' for Deployments, StatefulSets, and DaemonSets",
+            auto_fixable=True
+        ))
+
+    if k8s_obj.get("kind", "") == "Deployment" and not (k8s_obj.get("spec") or {}).get("selector"):
+        issues.append(_issue(
+            "critical",
+            "Missing Required Field",
+            "Deployment must have spec.selector",
+            {"type": "kubernetes", "kind": "Deployment"},
+            "Add spec.selector.matchLabels"
+        ))
+
+    return issues
+
+
+def check_json(code: str) -> List[Issue]:
+    """JSON syntax."""
+    try:
+        json.loads(code)
+    except json.JSONDecodeError as e:
+        return [_issue(
+            "critical",
+            "JSON Syntax Error",
+            f"JSON parsing error: {str(e)}",
+            {"type": "code", "language": "json", "line": e.lineno, "column": e.colno},
+            f"Fix JSON syntax at line {e.lineno}, column {e.colno}"
+        )]
+    return []
+
+
+def check_shell(code: str) -> List[Issue]:
+    """Dangerous shell commands."""
+    issues = []
+
+    dangerous_patterns = [
+        (r'rm\s+-rf\s+/', "Dangerous rm -rf command on root directory"),
+        (r'chmod\s+777', "Avoid chmod 777 - use more restrictive permissions"),
+        (r'curl.*\|\s*bash', "Avoid piping curl directly to bash for security"),
+        (r'wget.*\|\s*sh', "Avoid piping wget directly to shell for security"),
+    ]
+    for pattern, message in dangerous_patterns:
+        if re.search(pattern, code):
+            issues.append(_issue(
+                "high", "Dangerous Shell Command", message,
+                {"type": "code", "language": "bash"}, message
+            ))
+
+    return issues
+
+
+CHECKS: Dict[str, Callable[[str], List[Issue]]] = {
+    "python": check_python,
+    "javascript": check_javascript,
+    "typescript": check_javascript,
+    "yaml": check_yaml,
+    "json": check_json,
+    "bash": check_shell,
+    "shell": check_shell,
+}
+
+
+def check_code(language: str, code: str) -> Optional[List[Issue]]:
+    """Issues in a code block, or None if the language has no static checks."""
+    check = CHECKS.get(language.lower())
+    return check(code) if check else None
+
+
+def _limit_memory(megabytes: int) -> None:
+    """Cap this process's address space; unsupported platforms run unlimited."""
+    try:
+        import resource
+        limit = megabytes * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """Answer check requests, one JSON line each, until stdin closes."""
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            issues = check_code(request["language"], request["code"])
+            reply = {"unsupported": True} if issues is None else {"issues": issues}
+        except MemoryError:
+            reply = {"error": "Memory limit exceeded"}
+        except Exception as e:
+            reply = {"error": f"{type(e).__name__}: {e}"}
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve code block checks over stdin/stdout.")
+    parser.add_argument("--memory-limit-mb", type=int, default=0, help="0 disables the limit")
+    args = parser.parse_args()
+    if args.memory_limit_mb > 0:
+        _limit_memory(args.memory_limit_mb)
+    serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Parallel code block validation in sandboxed worker processes.
+
+Code blocks are checked by a fixed number of long-lived worker processes
+running ``code_checks`` as a script, so parsing hundreds of samples never
+blocks the event loop and a pathological block cannot take the service
+down with it. Each worker has an address-space limit; a block that runs
+past its timeout has its worker killed and replaced. Results are cached
+by (language, code hash, checks version).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import code_checks
+from .code_checks import CHECKS_VERSION, Issue
+from ....config import settings
+from ....core.utils import LRUCache
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(code_checks.__file__)
+# Replies carry issue lists; allow more than asyncio's 64 KiB line default
+REPLY_LIMIT = 4 * 1024 * 1024
+
+
+class CodeCheckError(Exception):
+    """A code block could not be checked."""
+
+
+class _Worker:
+    """One checker process answering a request per line."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+
+    @classmethod
+    async def start(cls, memory_limit_mb: int) -> "_Worker":
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(WORKER_SCRIPT), "--memory-limit-mb", str(memory_limit_mb),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=REPLY_LIMIT
+        )
+        return cls(process)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def check(self, language: str, code: str) -> Dict[str, Any]:
+        request = json.dumps({"language": language, "code": code}) + "\n"
+        self.process.stdin.write(request.encode())
+        await self.process.stdin.drain()
+        line = await self.process.stdout.readline()
+        if not line:
+            raise CodeCheckError(f"Worker exited with code {await self.process.wait()}")
+        return json.loads(line)
+
+    async def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class CodeValidationPool:
+    """
+    Check code blocks concurrently on a pool of worker processes.
+
+    ``validate`` returns, per block, the issues found or None when the
+    block's language has no static checks. Throughput is reported by
+    ``metrics``.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        block_timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        cache_size: int = 4096
+    ):
+        self.max_workers = max_workers or settings.QA_CODE_WORKERS or os.cpu_count() or 1
+        self.block_timeout = block_timeout or settings.QA_CODE_BLOCK_TIMEOUT_SECONDS
+        self.memory_limit_mb = (
+            settings.QA_CODE_WORKER_MEMORY_MB if memory_limit_mb is None else memory_limit_mb
+        )
+        self.cache = LRUCache(maxsize=cache_size)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._pending: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._stats = {
+            "blocks": 0,
+            "cache_hits": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "busy_seconds": 0.0,  # worker time, summed over workers
+            "wall_seconds": 0.0,
+        }
+
+    @staticmethod
+    def cache_key(language: str, code: str) -> Tuple[str, str, str]:
+        return language.lower(), hashlib.sha256(code.encode()).hexdigest(), CHECKS_VERSION
+
+    def metrics(self) -> Dict[str, Any]:
+        """Counters since the pool was created, with blocks per second of validation."""
+        wall = self._stats["wall_seconds"]
+        return {
+            **self._stats,
+            "workers": self.max_workers,
+            "blocks_per_second": self._stats["blocks"] / wall if wall > 0 else 0.0,
+        }
+
+    async def validate(self, blocks: Sequence[Dict[str, Any]]) -> List[Optional[List[Issue]]]:
+        """Issues for each block (``code`` and ``language`` keys), in block order."""
+        start = time.perf_counter()
+        try:
+            return list(await asyncio.gather(*(
+                self.check(block["code"], block.get("language", "unknown")) for block in blocks
+            )))
+        finally:
+            self._stats["wall_seconds"] += time.perf_counter() - start
+
+    async def check(self, code: str, language: str) -> Optional[List[Issue]]:
+        """Issues in one block, or None if its language has no static checks."""
+        language = language.lower()
+        self._stats["blocks"] += 1
+        if language not in code_checks.CHECKS:
+            return None
+
+        key = self.cache_key(language, code)
+        cached = self.cache.get(key)
+        if cached is None:
+            # Identical blocks checked at the same time share one run
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._check_uncached(key, language, code))
+                self._pending[key] = pending
+                pending.add_done_callback(lambda _: self._pending.pop(key, None))
+                return await asyncio.shield(pending)
+            cached = await asyncio.shield(pending)
+        self._stats["cache_hits"] += 1
+        return cached
+
+    async def _check_uncached(self, key: Tuple[str, str, str], language: str, code: str) -> List[Issue]:
+        try:
+            reply = await self._run(language, code)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            logger.warning(f"Checking a {language} code block timed out after {self.block_timeout}s")
+            return [self._incomplete(language, f"Validation timed out after {self.block_timeout}s")]
+        except (CodeCheckError, OSError, ValueError) as e:
+            self._stats["failures"] += 1
+            logger.warning(f"Checking a {language} code block failed: {e}")
+            return [self._incomplete(language, str(e))]
+
+        if "error" in reply:
+            self._stats["failures"] += 1
+            return [self._incomplete(language, reply["error"])]
+        issues = reply.get("issues") or []
+        self.cache.set(key, issues)
+        return issues
+
+    async def shutdown(self) -> None:
+        """Stop all idle workers."""
+        if self._idle is None:
+            return
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is not None:
+                await worker.kill()
+        self._idle = None
+
+    async def _run(self, language: str, code: str) -> Dict[str, Any]:
+        """Send a block to an idle worker, replacing the worker if it hangs or dies."""
+        idle = self._idle_workers()
+        worker = await idle.get()
+        start = time.perf_counter()
+        try:
+            if worker is None:
+                worker = await _Worker.start(self.memory_limit_mb)
+            reply = await asyncio.wait_for(worker.check(language, code), self.block_timeout)
+        except BaseException:
+            # The worker may be mid-request; never hand it out again
+            if worker is not None:
+                await worker.kill()
+            idle.put_nowait(None)
+            raise
+        finally:
+            self._stats["busy_seconds"] += time.perf_counter() - start
+        idle.put_nowait(worker if worker.alive else None)
+        return reply
+
+    def _idle_workers(self) -> asyncio.Queue:
+        """Queue of idle workers for this loop; None entries are slots without a process yet."""
+        loop = asyncio.get_running_loop()
+        if self._idle is None or self._loop is not loop:
+            # Processes are bound to the loop that created them
+            self._loop = loop
+            self._idle = asyncio.Queue()
+            for _ in range(self.max_workers):
+                self._idle.put_nowait(None)
+        return self._idle
+
+    @staticmethod
+    def _incomplete(language: str, reason: str) -> Issue:
+        return {
+            "severity": "medium",
+            "title": "Code Validation Incomplete",
+            "description": f"The {language} code block could not be validated: {reason}",
+            "location": {"type": "code", "language": language},
+            "suggested_fix": "Simplify or shorten the code block so it can be validated",
+            "auto_fixable": False
+        }
+
+
+_pool: Optional[CodeValidationPool] = None
+
+
+def get_code_validation_pool() -> CodeValidationPool:
+    """Process-wide pool shared by all validators."""
+    global _pool
+    if _pool is None:
+        _pool = CodeValidationPool()
+    return _pool
@@ -8,14 +8,14 @@ This module provides continuous monitoring capabilities:
 - Automated alerts
 """
 
-import asyncio
 import json
 from typing import Dict, List, Optional, Any, Tuple, Callable, Optional
 from datetime import datetime, timedelta
 import logging
-from collections import defaultdict, deque
+from collections import defaultdict
 import statistics
 
+from .metric_series import MetricSeries
 from .models import (
     ContinuousMonitoring,
     QualityMetrics,
@@ -24,6 +24,7 @@ from .models import (
     SeverityLevel,
     QualityScore
 )
+from .monitor_scheduler import CheckScheduler
 from ....core.config import settings
 from ....core.llm import MultimodalLLM
 from ....core.llm.multimodal_llm import MultimodalMessage
@@ -34,15 +35,24 @@ logger = logging.getLogger(__name__)
 class ContinuousMonitor:
     """Provides continuous quality monitoring for content."""
     
+    # Checks kept per content item, both as QualityMetrics and per-metric series
+    HISTORY_SIZE = 100
+    
     def __init__(self, llm: Optional[MultimodalLLM] = None):
         """Initialize the continuous monitor."""
         self.llm = llm or MultimodalLLM()
         self.active_monitors = {}
-        self.monitoring_tasks = {}
+        self.check_funcs = {}
         self.alert_handlers = []
-        self.metrics_buffer = defaultdict(lambda: deque(maxlen=100))
+        # content_id -> metric name -> series
+        self.metrics_buffer: Dict[str, Dict[str, MetricSeries]] = defaultdict(dict)
         self.anomaly_detector = AnomalyDetector()
         self.trend_analyzer = TrendAnalyzer()
+        # One scheduler runs the checks of every monitored item
+        self.scheduler = CheckScheduler(
+            self._run_check,
+            max_concurrency=settings.QA_MONITOR_MAX_CONCURRENT_CHECKS
+        )
         
     async def start_monitoring(
         self,
@@ -55,12 +65,10 @@ class ContinuousMonitor:
         
         # Store monitoring configuration
         self.active_monitors[content_id] = monitoring_config
+        self.check_funcs[content_id] = quality_check_func
         
-        # Create monitoring task
-        task = asyncio.create_task(
-            self._monitoring_loop(content_id, monitoring_config, quality_check_func)
-        )
-        self.monitoring_tasks[content_id] = task
+        # First check after one interval, then every interval after the previous check
+        self.scheduler.schedule(content_id, monitoring_config.monitoring_interval)
         
         return True
         
@@ -68,103 +76,102 @@ class ContinuousMonitor:
         """Stop monitoring for content."""
         logger.info(f"Stopping monitoring for content {content_id}")
         
-        if content_id in self.monitoring_tasks:
-            # Cancel the monitoring task
-            self.monitoring_tasks[content_id].cancel()
-            
+        if self.scheduler.cancel(content_id):
             # Clean up
-            del self.monitoring_tasks[content_id]
             del self.active_monitors[content_id]
+            del self.check_funcs[content_id]
+            self.metrics_buffer.pop(content_id, None)
             
             return True
             
         return False
         
-    async def _monitoring_loop(
-        self,
-        content_id: str,
-        config: ContinuousMonitoring,
-        quality_check_func: Callable
-    ):
-        """Main monitoring loop for a content item."""
-        while True:
-            try:
-                # Wait for next check interval
-                await asyncio.sleep(config.monitoring_interval)
-                
-                # Update next check time
-                config.last_check = datetime.now()
-                config.next_check = config.last_check + timedelta(seconds=config.monitoring_interval)
-                
-                # Perform quality check
-                logger.debug(f"Performing quality check for {content_id}")
-                quality_metrics = await quality_check_func(content_id)
-                
-                # Store metrics
-                self._store_metrics(content_id, quality_metrics)
-                config.historical_metrics.append(quality_metrics)
-                
-                # Keep only recent history
-                if len(config.historical_metrics) > 100:
-                    config.historical_metrics = config.historical_metrics[-100:]
-                
-                # Check against thresholds
-                threshold_violations = self._check_thresholds(quality_metrics, config.quality_thresholds)
-                
-                # Detect anomalies
-                anomalies = await self.anomaly_detector.detect_anomalies(
-                    content_id,
-                    quality_metrics,
-                    config.historical_metrics
-                )
-                
-                if anomalies:
-                    config.anomalies_detected.extend(anomalies)
-                    
-                # Analyze trends
-                trends = await self.trend_analyzer.analyze_trends(
-                    config.historical_metrics
-                )
-                config.trend_analysis = trends
-                
-                # Check alert conditions
-                alerts_triggered = await self._check_alert_conditions(
-                    content_id,
-                    quality_metrics,
-                    threshold_violations,
-                    anomalies,
-                    config.alert_conditions
-                )
+    async def _run_check(self, content_id: str) -> bool:
+        """Run one scheduled quality check; False tells the scheduler to back off."""
+        config = self.active_monitors[content_id]
+        try:
+            # Update next check time
+            config.last_check = datetime.now()
+            config.next_check = config.last_check + timedelta(seconds=config.monitoring_interval)
+            
+            # Perform quality check
+            logger.debug(f"Performing quality check for {content_id}")
+            quality_metrics = await self.check_funcs[content_id](content_id)
+            
+            # Store metrics
+            self._store_metrics(content_id, quality_metrics)
+            config.historical_metrics.append(quality_metrics)
+            
+            # Keep only recent history
+            del config.historical_metrics[:-self.HISTORY_SIZE]
+            
+            # Check against thresholds
+            threshold_violations = self._check_thresholds(quality_metrics, config.quality_thresholds)
+            
+            # Detect anomalies
+            anomalies = await self.anomaly_detector.detect_anomalies(
+                content_id,
+                quality_metrics,
+                self.metrics_buffer[content_id]
+            )
+            
+            if anomalies:
+                config.anomalies_detected.extend(anomalies)
                 
-                # Handle alerts
-                if alerts_triggered:
-                    await self._handle_alerts(content_id, alerts_triggered)
-                    
-            except asyncio.CancelledError:
-                # Monitoring was stopped
-                break
-            except Exception as e:
-                logger.error(f"Error in monitoring loop for {content_id}: {e}")
-                await asyncio.sleep(60)  # Wait before retrying
+            # Analyze trends
+            trends = await self.trend_analyzer.analyze_trends(
+                self.metrics_buffer[content_id]
+            )
+            config.trend_analysis = trends
+            
+            # Check alert conditions
+            alerts_triggered = await self._check_alert_conditions(
+                content_id,
+                quality_metrics,
+                threshold_violations,
+                anomalies,
+                config.alert_conditions
+            )
+            
+            # Handle alerts
+            if alerts_triggered:
+                await self._handle_alerts(content_id, alerts_triggered)
                 
+        except Exception as e:
+            logger.error(f"Error in monitoring check for {content_id}: {e}")
+            return False
+            
+        return True
+        
+    def _series(self, content_id: str, name: str) -> MetricSeries:
+        """The stored series of one metric for a content item, created on first use."""
+        series = self.metrics_buffer[content_id].get(name)
+        if series is None:
+            series = self.metrics_buffer[content_id][name] = MetricSeries(
+                capacity=self.HISTORY_SIZE,
+                window=self.anomaly_detector.history_window,
+                alpha=self.trend_analyzer.smoothing_alpha
+            )
+        return series
+        
     def _store_metrics(self, content_id: str, metrics: QualityMetrics):
         """Store metrics in buffer for analysis."""
-        timestamp = datetime.now()
+        timestamp = datetime.now().timestamp()
         
         # Store overall score
-        self.metrics_buffer[f"{content_id}:overall"].append((timestamp, metrics.overall_score))
+        self._series(content_id, "overall").push(metrics.overall_score, timestamp)
         
         # Store dimension scores
         for dimension, score in metrics.dimension_scores.items():
-            self.metrics_buffer[f"{content_id}:{dimension.value}"].append((timestamp, score.score))
+            self._series(content_id, dimension.value).push(score.score, timestamp)
             
         # Store specific metrics
         if metrics.performance_metrics:
-            self.metrics_buffer[f"{content_id}:generation_time"].append(
-                (timestamp, metrics.performance_metrics.generation_time)
+            self._series(content_id, "generation_time").push(
+                metrics.performance_metrics.generation_time, timestamp
             )
-            self.metrics_buffer[f"{content_id}:api_costs"].append(
-                (timestamp, metrics.performance_metrics.api_costs)
+            self._series(content_id, "api_costs").push(
+                metrics.performance_metrics.api_costs, timestamp
             )
             
     def _check_thresholds(
@@ -213,6 +220,7 @@ class ContinuousMonitor:
         
         for condition in alert_conditions:
             if await self._evaluate_alert_condition(
+                content_id,
                 condition,
                 metrics,
                 threshold_violations,
@@ -231,6 +239,7 @@ class ContinuousMonitor:
         
     async def _evaluate_alert_condition(
         self,
+        content_id: str,
         condition: Dict[str, Any],
         metrics: QualityMetrics,
         violations: List[Dict[str, Any]],
@@ -266,8 +275,9 @@ class ContinuousMonitor:
             min_duration = condition.get("min_duration", 3)  # checks
             
             # Get recent trends
-            buffer_key = f"{dimension.value}" if dimension else "overall"
-            recent_values = [v for _, v in self.metrics_buffer.get(buffer_key, [])[-min_duration:]]
+            buffer_key = dimension.value if dimension else "overall"
+            series = self.metrics_buffer.get(content_id, {}).get(buffer_key)
+            recent_values = series.latest(min_duration).tolist() if series is not None else []
             
             if len(recent_values) >= min_duration:
                 trend = self._calculate_simple_trend(recent_values)
@@ -282,6 +292,7 @@ class ContinuousMonitor:
             results = []
             for sub_condition in sub_conditions:
                 result = await self._evaluate_alert_condition(
+                    content_id,
                     sub_condition,
                     metrics,
                     violations,
@@ -492,80 +503,51 @@ class AnomalyDetector:
         self,
         content_id: str,
         current_metrics: QualityMetrics,
-        historical_metrics: List[QualityMetrics]
+        series: Dict[str, MetricSeries]
     ) -> List[Dict[str, Any]]:
-        """Detect anomalies in current metrics."""
+        """Detect anomalies in current metrics against each metric's recent window."""
         anomalies = []
         
-        if len(historical_metrics) < self.history_window:
+        overall = series.get("overall")
+        if overall is None or overall.count < self.history_window:
             return anomalies  # Not enough history
             
-        # Get recent history
-        recent_history = historical_metrics[-self.history_window:]
-        
-        # Check overall score
-        overall_anomaly = self._check_metric_anomaly(
-            current_metrics.overall_score,
-            [m.overall_score for m in recent_history],
-            "overall_quality"
-        )
-        if overall_anomaly:
-            anomalies.append(overall_anomaly)
-            
-        # Check dimension scores
+        # Overall score, dimension scores and generation time
+        checks = [("overall", current_metrics.overall_score, "overall_quality", False)]
         for dimension, score in current_metrics.dimension_scores.items():
-            historical_scores = [
-                m.dimension_scores[dimension].score
-                for m in recent_history
-                if dimension in m.dimension_scores
-            ]
-            
-            if historical_scores:
-                dimension_anomaly = self._check_metric_anomaly(
-                    score.score,
-                    historical_scores,
-                    f"{dimension.value}_score"
-                )
-                if dimension_anomaly:
-                    anomalies.append(dimension_anomaly)
-                    
-        # Check performance metrics
+            checks.append((dimension.value, score.score, f"{dimension.value}_score", False))
         if current_metrics.performance_metrics:
-            perf = current_metrics.performance_metrics
-            
-            # Check generation time
-            historical_times = [
-                m.performance_metrics.generation_time
-                for m in recent_history
-                if m.performance_metrics
-            ]
-            
-            if historical_times:
-                time_anomaly = self._check_metric_anomaly(
-                    perf.generation_time,
-                    historical_times,
-                    "generation_time",
-                    higher_is_anomaly=True
+            checks.append((
+                "generation_time",
+                current_metrics.performance_metrics.generation_time,
+                "generation_time",
+                True
+            ))
+            
+        for key, value, metric_name, higher_is_anomaly in checks:
+            if key in series:
+                anomaly = self._check_metric_anomaly(
+                    value,
+                    series[key],
+                    metric_name,
+                    higher_is_anomaly=higher_is_anomaly
                 )
-                if time_anomaly:
-                    anomalies.append(time_anomaly)
+                if anomaly:
+                    anomalies.append(anomaly)
                     
         return anomalies
         
     def _check_metric_anomaly(
         self,
         current_value: float,
-        historical_values: List[float],
+        series: MetricSeries,
         metric_name: str,
         higher_is_anomaly: bool = False
     ) -> Optional[Dict[str, Any]]:
         """Check if current value is anomalous compared to history."""
-        if not historical_values:
-            return None
-            
-        # Calculate statistics
-        mean = statistics.mean(historical_values)
-        stdev = statistics.stdev(historical_values) if len(historical_values) > 1 else 0
+        # Running statistics over the series window
+        mean = series.mean
+        stdev = series.stdev
         
         if stdev == 0:
             return None  # No variation, can't detect anomaly
@@ -607,62 +589,38 @@ class TrendAnalyzer:
         self.min_points = 5  # Minimum points for trend analysis
         self.smoothing_window = 3  # Moving average window
         
+    @property
+    def smoothing_alpha(self) -> float:
+        """EWMA factor with the same center of mass as the moving average window."""
+        return 2 / (self.smoothing_window + 1)
+        
     async def analyze_trends(
         self,
-        historical_metrics: List[QualityMetrics]
+        series: Dict[str, MetricSeries]
     ) -> Dict[QualityDimension, str]:
         """Analyze trends for each quality dimension."""
         trends = {}
         
-        if len(historical_metrics) < self.min_points:
+        overall = series.get("overall")
+        if overall is None or len(overall) < self.min_points:
             return trends
             
-        # Analyze overall trend
-        overall_scores = [m.overall_score for m in historical_metrics]
-        overall_trend = self._calculate_trend(overall_scores)
-        
         # Analyze dimension trends
         for dimension in QualityDimension:
-            dim_scores = []
-            for metric in historical_metrics:
-                if dimension in metric.dimension_scores:
-                    dim_scores.append(metric.dimension_scores[dimension].score)
-                    
-            if len(dim_scores) >= self.min_points:
-                trends[dimension] = self._calculate_trend(dim_scores)
+            dimension_series = series.get(dimension.value)
+            if dimension_series is not None and len(dimension_series) >= self.min_points:
+                trends[dimension] = self._calculate_trend(dimension_series)
             else:
                 trends[dimension] = "insufficient_data"
                 
         return trends
         
-    def _calculate_trend(self, values: List[float]) -> str:
-        """Calculate trend from values with smoothing."""
-        if len(values) < self.min_points:
+    def _calculate_trend(self, series: MetricSeries) -> str:
+        """Calculate trend from the linear fit of the smoothed series."""
+        if len(series) < self.min_points:
             return "insufficient_data"
             
-        # Apply moving average smoothing
-        smoothed = self._moving_average(values, self.smoothing_window)
-        
-        # Fit linear regression to smoothed data
-        n = len(smoothed)
-        x = list(range(n))
-        x_mean = sum(x) / n
-        y_mean = sum(smoothed) / n
-        
-        numerator = sum((x[i] - x_mean) * (smoothed[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return "stable"
-            
-        slope = numerator / denominator
-        
-        # Calculate R-squared for confidence
-        y_pred = [slope * (x[i] - x_mean) + y_mean for i in range(n)]
-        ss_tot = sum((smoothed[i] - y_mean) ** 2 for i in range(n))
-        ss_res = sum((smoothed[i] - y_pred[i]) ** 2 for i in range(n))
-        
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        slope, r_squared = series.trend_fit()
         
         # Determine trend based on slope and confidence
         if r_squared < 0.3:  # Low confidence in trend
@@ -673,16 +631,3 @@ class TrendAnalyzer:
             return "improving"
         else:
             return "declining"
-            
-    def _moving_average(self, values: List[float], window: int) -> List[float]:
-        """Calculate moving average."""
-        if window > len(values):
-            window = len(values)
-            
-        smoothed = []
-        for i in range(len(values)):
-            start = max(0, i - window // 2)
-            end = min(len(values), i + window // 2 + 1)
-            smoothed.append(sum(values[start:end]) / (end - start))
-            
-        return smoothed
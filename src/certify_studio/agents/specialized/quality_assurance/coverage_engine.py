@@ -0,0 +1,198 @@
+"""
+Objective coverage scoring for certification alignment.
+
+Every objective is scored against every content topic with sentence
+embeddings in a single similarity-matrix product. Only objectives whose
+embedding score is ambiguous are sent to the LLM, many objectives per
+prompt, and the scores for a given content and certification version are
+cached so repeated QA runs make no model calls at all. Ambiguous scores
+the LLM failed to confirm are not cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ....core.llm.multimodal_llm import MultimodalMessage
+from ....core.utils import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectiveCoverageEngine:
+    """Semantic coverage of certification objectives by content topics."""
+
+    # Cosine similarities mapped linearly onto 0..1 coverage
+    SIMILARITY_FLOOR = 0.25
+    SIMILARITY_CEILING = 0.75
+    # Embedding scores in this band are confirmed by the LLM
+    AMBIGUOUS_BAND = (0.3, 0.7)
+    # Topics shown to the LLM per objective, chosen by similarity
+    TOPICS_PER_OBJECTIVE = 5
+
+    def __init__(
+        self,
+        llm: Any = None,
+        embedder: Any = None,
+        batch_size: int = 20,
+        cache_size: int = 128
+    ):
+        self.llm = llm
+        self._embedder = embedder
+        self._embedder_failed = False
+        self.batch_size = max(1, batch_size)
+        self.cache = LRUCache(maxsize=cache_size)
+        self.llm_calls = 0
+
+    @property
+    def embedder(self) -> Any:
+        """Shared embedding generator, created on first use if available."""
+        if self._embedder is None and not self._embedder_failed:
+            try:
+                from ....ml.embeddings import EmbeddingGenerator
+                self._embedder = EmbeddingGenerator()
+            except ImportError as e:
+                logger.warning(f"Embeddings unavailable, scoring coverage with the LLM only: {e}")
+                self._embedder_failed = True
+        return self._embedder
+
+    @staticmethod
+    def content_hash(topic_texts: Sequence[str]) -> str:
+        """Order-independent fingerprint of the content's topics."""
+        return hashlib.sha256(json.dumps(sorted(topic_texts)).encode()).hexdigest()
+
+    async def score(
+        self,
+        objectives: List[str],
+        topic_texts: List[str],
+        certification_version: str = ""
+    ) -> Dict[str, float]:
+        """Semantic coverage (0..1) of each objective by the topics."""
+        if not objectives:
+            return {}
+        if not topic_texts:
+            return {objective: 0.0 for objective in objectives}
+
+        key = (self.content_hash(topic_texts), certification_version)
+        cached = self.cache.get(key)
+        if cached is not None and all(objective in cached for objective in objectives):
+            return {objective: cached[objective] for objective in objectives}
+
+        similarity = await self._similarity_matrix(objectives, topic_texts)
+        if similarity is None:
+            scores = np.full(len(objectives), 0.0)
+            ambiguous = list(range(len(objectives)))
+            relevant = [list(range(min(len(topic_texts), 20)))] * len(objectives)
+        else:
+            best = similarity.max(axis=1)
+            scores = np.clip(
+                (best - self.SIMILARITY_FLOOR) / (self.SIMILARITY_CEILING - self.SIMILARITY_FLOOR),
+                0.0, 1.0
+            )
+            low, high = self.AMBIGUOUS_BAND
+            ambiguous = [i for i, score in enumerate(scores) if low <= score <= high]
+            top = min(self.TOPICS_PER_OBJECTIVE, len(topic_texts))
+            relevant = np.argsort(-similarity, axis=1)[:, :top].tolist()
+
+        confirmed = set()
+        if ambiguous and self.llm is not None:
+            batches = [
+                ambiguous[start:start + self.batch_size]
+                for start in range(0, len(ambiguous), self.batch_size)
+            ]
+            results = await asyncio.gather(*(
+                self._score_with_llm(
+                    [objectives[i] for i in batch],
+                    self._topics_for(batch, relevant, topic_texts)
+                )
+                for batch in batches
+            ))
+            for batch, llm_scores in zip(batches, results):
+                for i, llm_score in zip(batch, llm_scores):
+                    if llm_score is not None:
+                        scores[i] = llm_score
+                        confirmed.add(i)
+
+        coverage = {objective: float(score) for objective, score in zip(objectives, scores)}
+        # Ambiguous scores the LLM did not confirm are retried on the next run
+        unsure = set(ambiguous) - confirmed
+        self.cache.set(key, {
+            **(cached or {}),
+            **{objective: coverage[objective] for i, objective in enumerate(objectives) if i not in unsure}
+        })
+        return coverage
+
+    async def _similarity_matrix(
+        self,
+        objectives: List[str],
+        topic_texts: List[str]
+    ) -> Optional[np.ndarray]:
+        """Cosine similarity of every objective to every topic, or None without embeddings."""
+        embedder = self.embedder
+        if embedder is None:
+            return None
+        try:
+            vectors = await embedder.generate_text_embeddings(objectives + topic_texts)
+        except Exception as e:
+            logger.warning(f"Embedding objectives failed, falling back to the LLM: {e}")
+            return None
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1.0)
+        return vectors[:len(objectives)] @ vectors[len(objectives):].T
+
+    @staticmethod
+    def _topics_for(batch: List[int], relevant: List[List[int]], topic_texts: List[str]) -> List[str]:
+        """Union of the most relevant topics for a batch, in first-seen order."""
+        chosen = dict.fromkeys(t for i in batch for t in relevant[i])
+        return [topic_texts[t] for t in chosen]
+
+    async def _score_with_llm(
+        self,
+        objectives: List[str],
+        topics: List[str]
+    ) -> List[Optional[float]]:
+        """Score several objectives in one prompt; None where no score came back."""
+        numbered = "\n".join(f"{i}. {objective}" for i, objective in enumerate(objectives, 1))
+        topics_text = "\n".join(f"- {topic}" for topic in topics)
+        prompt = f"""
+        Assess how well these topics cover each certification objective.
+
+        Objectives:
+        {numbered}
+
+        Topics covered:
+        {topics_text}
+
+        Score each objective from 0.0 to 1.0 where:
+        - 0.0 = No coverage
+        - 0.5 = Partial coverage
+        - 1.0 = Complete coverage
+
+        Consider both direct matches and related concepts.
+        Return only JSON mapping each objective number to its score, e.g. {{"1": 0.8, "2": 0.3}}.
+        """
+
+        self.llm_calls += 1
+        try:
+            response = await self.llm.generate(
+                [MultimodalMessage(text=prompt)],
+                response_format={"type": "json"}
+            )
+            data = getattr(response, "structured_data", None) or json.loads(getattr(response, "text", response))
+        except Exception as e:
+            logger.error(f"Failed to score objective coverage with LLM: {e}")
+            return [None] * len(objectives)
+
+        scores = []
+        for i in range(1, len(objectives) + 1):
+            try:
+                scores.append(min(max(float(data[str(i)]), 0.0), 1.0))
+            except (KeyError, TypeError, ValueError):
+                scores.append(None)
+        return scores
@@ -0,0 +1,112 @@
+"""
+Fuzzy word lookup for typo detection.
+
+Uses symmetric deletes (as in SymSpell): every vocabulary word is stored
+under each string reachable by deleting up to ``max_distance`` characters.
+Two words within that edit distance always share such a string, so a
+query only generates its own deletes, looks them up and verifies the few
+candidates, instead of measuring its distance to every word in the
+vocabulary. Indexes are built once per vocabulary and shared across the
+process.
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def edit_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between two strings.
+
+    With ``max_distance``, stops as soon as the distance is known to
+    exceed it and returns ``max_distance + 1``.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+    if not s2:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(min(
+                previous_row[j + 1] + 1,       # insertion
+                current_row[j] + 1,            # deletion
+                previous_row[j] + (c1 != c2)   # substitution
+            ))
+        if max_distance is not None and min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """The word and every string obtained by deleting up to ``max_distance`` characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1:]
+            for candidate in frontier
+            for i in range(len(candidate))
+        } - found
+        found |= frontier
+    return found
+
+
+class FuzzyIndex:
+    """Vocabulary of words searchable by edit distance up to ``max_distance``."""
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2):
+        self.max_distance = max_distance
+        self._order: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = defaultdict(list)
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._order
+
+    def add(self, word: str) -> None:
+        if word in self._order:
+            return
+        self._order[word] = len(self._order)
+        for variant in _deletes(word, self.max_distance):
+            self._deletes[variant].append(word)
+
+    def search(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[int, str]]:
+        """Words within ``max_distance``, closest first, then in insertion order."""
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(f"Index only supports distances up to {self.max_distance}")
+
+        candidates = {
+            candidate
+            for variant in _deletes(word, max_distance)
+            for candidate in self._deletes.get(variant, ())
+        }
+        matches = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+        matches.sort(key=lambda match: (match[0], self._order[match[1]]))
+        return matches
+
+    def has_within(self, word: str, max_distance: Optional[int] = None) -> bool:
+        """Whether any word lies within ``max_distance``."""
+        return bool(self.search(word, max_distance))
+
+
+@lru_cache(maxsize=32)
+def get_fuzzy_index(vocabulary: Tuple[str, ...], max_distance: int = 2) -> FuzzyIndex:
+    """Process-wide index for a vocabulary, built on first use."""
+    return FuzzyIndex(vocabulary, max_distance)
@@ -0,0 +1,134 @@
+"""
+Fixed-size metric history with incrementally maintained statistics.
+
+Each monitored metric keeps its recent values in a numpy ring buffer.
+Every push updates, in constant time, the mean and variance over a recent
+window for anomaly detection, an exponentially weighted moving average,
+and the least-squares sums of that average over the whole buffer for
+trend detection, so no check ever rescans the history.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class MetricSeries:
+    """
+    Ring buffer of one metric's values with running statistics.
+
+    ``window`` is the number of latest values the mean and variance cover.
+    The trend is a linear fit of the EWMA, with smoothing factor ``alpha``,
+    over the last ``capacity`` pushes.
+    """
+
+    # Running sums are recomputed from the buffer this often to cancel float drift
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, capacity: int = 100, window: int = 20, alpha: float = 0.5):
+        if window > capacity:
+            raise ValueError("window cannot exceed capacity")
+        self.capacity = capacity
+        self.window = window
+        self.alpha = alpha
+        self.values = np.zeros(capacity)
+        self.timestamps = np.zeros(capacity)
+        self._smoothed = np.zeros(capacity)
+        self.count = 0  # Values pushed in total
+        # Windowed mean and sum of squared deviations (Welford)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.ewma: Optional[float] = None
+        # Least-squares sums of the smoothed values against their position in the buffer
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._sum_yy = 0.0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def push(self, value: float, timestamp: float = 0.0) -> None:
+        """Append a value, evicting the oldest once the buffer is full."""
+        value = float(value)
+        slot = self.count % self.capacity
+        size = len(self)
+
+        # Window mean/variance: add the new value and drop the one leaving the window
+        if size < self.window:
+            n = size + 1
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
+        else:
+            leaving = self.values[(self.count - self.window) % self.capacity]
+            old_mean = self._mean
+            self._mean += (value - leaving) / self.window
+            self._m2 += (value - leaving) * (value - self._mean + leaving - old_mean)
+
+        self.ewma = value if self.ewma is None else self.alpha * value + (1 - self.alpha) * self.ewma
+
+        # Trend sums: with a full buffer every position shifts down by one
+        if size < self.capacity:
+            self._sum_xy += size * self.ewma
+        else:
+            evicted = self._smoothed[slot]
+            self._sum_xy += -(self._sum_y - evicted) + (self.capacity - 1) * self.ewma
+            self._sum_y -= evicted
+            self._sum_yy -= evicted * evicted
+        self._sum_y += self.ewma
+        self._sum_yy += self.ewma * self.ewma
+
+        self.values[slot] = value
+        self.timestamps[slot] = timestamp
+        self._smoothed[slot] = self.ewma
+        self.count += 1
+        if self.count % self.RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """The last ``n`` values (all buffered values by default), oldest first."""
+        return self._ordered(self.values, n)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the last ``window`` values."""
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation of the last ``window`` values."""
+        n = min(self.count, self.window)
+        return math.sqrt(max(self._m2, 0.0) / (n - 1)) if n > 1 else 0.0
+
+    def trend_fit(self) -> Tuple[float, float]:
+        """Slope per push and R-squared of a linear fit to the smoothed values."""
+        n = len(self)
+        if n < 2:
+            return 0.0, 0.0
+        # Positions are 0..n-1
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        sxx = sum_xx - sum_x * sum_x / n
+        sxy = self._sum_xy - sum_x * self._sum_y / n
+        syy = self._sum_yy - self._sum_y * self._sum_y / n
+        slope = sxy / sxx
+        r_squared = sxy * sxy / (sxx * syy) if syy > 1e-12 else 0.0
+        return slope, min(max(r_squared, 0.0), 1.0)
+
+    def _ordered(self, buffer: np.ndarray, n: Optional[int] = None) -> np.ndarray:
+        size = len(self)
+        n = size if n is None else min(n, size)
+        end = self.count % self.capacity
+        indices = (np.arange(end - n, end)) % self.capacity
+        return buffer[indices]
+
+    def _resync(self) -> None:
+        """Recompute running sums exactly from the buffer."""
+        recent = self.latest(self.window)
+        self._mean = float(recent.mean())
+        self._m2 = float(((recent - self._mean) ** 2).sum())
+        smoothed = self._ordered(self._smoothed)
+        self._sum_y = float(smoothed.sum())
+        self._sum_xy = float(np.arange(len(smoothed)) @ smoothed)
+        self._sum_yy = float(smoothed @ smoothed)
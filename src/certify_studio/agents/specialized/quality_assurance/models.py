@@ -117,6 +117,8 @@ class QAReportData:
     certification_mapping: Optional[CertificationMapping] = None
     feedback_analysis: Optional[FeedbackAnalysis] = None
     overall_recommendation: str = ""
+    # Per-stage status and latency, e.g. {"technical": {"status": "completed", "duration_ms": 812.4}}
+    stage_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     generated_at: datetime = field(default_factory=datetime.now)
 
 
@@ -0,0 +1,158 @@
+"""
+Single-task scheduler for recurring quality checks.
+
+Every monitored item's next due time sits in one heap, and one dispatcher
+task sleeps until the earliest of them. Each wake-up takes every check
+that has come due as a batch and starts it, with a cap on how many run at
+once. The next run of a check is scheduled one interval after it
+finishes. Monitoring tens of thousands of items therefore costs one timer
+plus the checks actually running, not a sleeping task per item.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CheckFunc = Callable[[str], Awaitable[Any]]
+
+
+class CheckScheduler:
+    """
+    Run ``run_check(key)`` for every scheduled key once per its interval.
+
+    ``run_check`` returning False, or raising, delays that key's next run
+    by ``retry_delay`` on top of its interval.
+    """
+
+    def __init__(
+        self,
+        run_check: CheckFunc,
+        max_concurrency: int = 100,
+        retry_delay: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.run_check = run_check
+        self.max_concurrency = max(1, max_concurrency)
+        self.retry_delay = retry_delay
+        self.clock = clock
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[float, int]] = {}  # key -> (interval, generation)
+        self._generations = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._running: Dict[str, asyncio.Task] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, key: str, interval: float, delay: Optional[float] = None) -> None:
+        """
+        Check ``key`` every ``interval`` seconds, first after ``delay``
+        (default one interval). Rescheduling a key replaces its schedule and
+        cancels a check of it that is still running.
+        """
+        self._ensure_dispatcher()
+        self._cancel_running(key)
+        generation = next(self._generations)
+        self._entries[key] = (interval, generation)
+        self._push(key, generation, self.clock() + (interval if delay is None else delay))
+
+    def cancel(self, key: str) -> bool:
+        """Stop checking ``key``; a check already running is cancelled too."""
+        if self._entries.pop(key, None) is None:
+            return False
+        self._cancel_running(key)
+        # The heap entry is skipped when it comes due
+        return True
+
+    async def stop(self) -> None:
+        """Cancel the dispatcher and all running checks, and forget every key."""
+        tasks = list(self._running.values())
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._running.clear()
+        self._entries.clear()
+        self._heap.clear()
+
+    def _push(self, key: str, generation: int, due: float) -> None:
+        was_earliest = not self._heap or due < self._heap[0][0]
+        heapq.heappush(self._heap, (due, generation, key))
+        if was_earliest and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is not None and self._loop is loop and not self._dispatcher.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._running = {}
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        while True:
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - self.clock() if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            for key, generation in self._pop_due():
+                await self._slots.acquire()
+                if not self._is_current(key, generation):  # Cancelled while waiting for a slot
+                    self._slots.release()
+                    continue
+                self._running[key] = asyncio.create_task(self._run(key, generation))
+
+    def _pop_due(self) -> List[Tuple[str, int]]:
+        """Every live (key, generation) whose check is due, earliest first."""
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, generation, key = heapq.heappop(self._heap)
+            if self._is_current(key, generation):
+                due.append((key, generation))
+        return due
+
+    def _is_current(self, key: str, generation: int) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] == generation
+
+    def _cancel_running(self, key: str) -> None:
+        task = self._running.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    async def _run(self, key: str, generation: int) -> None:
+        succeeded = False
+        try:
+            succeeded = await self.run_check(key) is not False
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled check for {key} failed: {e}")
+        finally:
+            self._slots.release()
+            if self._running.get(key) is asyncio.current_task():
+                del self._running[key]
+        if self._is_current(key, generation):
+            delay = self._entries[key][0] + (0.0 if succeeded else self.retry_delay)
+            self._push(key, generation, self.clock() + delay)
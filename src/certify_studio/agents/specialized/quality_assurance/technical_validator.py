@@ -10,14 +10,15 @@ This module validates technical accuracy of content including:
 """
 
 import asyncio
-import ast
 import json
 import re
 import subprocess
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Set
 from datetime import datetime
 import logging
 
+from .code_validation_pool import get_code_validation_pool
+from .fuzzy_index import get_fuzzy_index
 from .models import (
     TechnicalAccuracy,
     ValidationIssue,
@@ -30,6 +31,14 @@ from ....config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shell commands every course is expected to use correctly
+COMMON_COMMANDS = [
+    "ls", "cd", "pwd", "mkdir", "rm", "cp", "mv", "cat", "grep", "find",
+    "docker", "kubectl", "git", "npm", "pip", "python", "java", "node"
+]
+# Commands this far from a known one are reported as likely typos
+MAX_TYPO_DISTANCE = 2
+
 
 class TechnicalValidator:
     """Validates technical accuracy of educational content."""
@@ -40,6 +49,8 @@ class TechnicalValidator:
         self.validation_cache = {}
         self.known_technologies = self._load_technology_database()
         self.best_practices = self._load_best_practices()
+        self.known_commands = self._known_commands()
+        self.code_pool = get_code_validation_pool()
         
     def _load_technology_database(self) -> Dict[str, Any]:
         """Load database of known technologies and their versions."""
@@ -47,22 +58,32 @@ class TechnicalValidator:
             "aws": {
                 "services": ["EC2", "S3", "Lambda", "RDS", "DynamoDB", "VPC", "IAM", "CloudFormation"],
                 "current_versions": {"CLI": "2.x", "SDK": "3.x"},
+                "commands": ["aws", "sam", "cdk"],
                 "deprecated": ["EC2-Classic"],
                 "best_practices": ["least-privilege", "encryption-at-rest", "multi-az"]
             },
             "python": {
                 "current_version": "3.12",
+                "commands": ["python3", "pip3", "pytest", "venv"],
                 "deprecated_features": ["print statement", "xrange", "raw_input"],
                 "best_practices": ["type hints", "async/await", "context managers"]
             },
             "kubernetes": {
                 "current_version": "1.28",
+                "commands": ["kubeadm", "kubelet", "helm", "minikube"],
                 "api_versions": {"apps/v1": "current", "extensions/v1beta1": "deprecated"},
                 "best_practices": ["resource-limits", "health-checks", "namespaces"]
             },
             # Add more technologies as needed
         }
         
+    def _known_commands(self) -> Tuple[str, ...]:
+        """Common commands plus the CLIs of every known technology, without duplicates."""
+        commands = list(COMMON_COMMANDS)
+        for technology in self.known_technologies.values():
+            commands.extend(technology.get("commands", []))
+        return tuple(dict.fromkeys(commands))
+
     def _load_best_practices(self) -> Dict[str, List[str]]:
         """Load best practices for various technologies."""
         return {
@@ -110,6 +131,11 @@ class TechnicalValidator:
                 certification_context
             )
             issues.extend(code_issues)
+            accuracy.code_validation_results = {
+                "blocks": len(technical_elements["code_blocks"]),
+                "issues": len(code_issues),
+                "pool": self.code_pool.metrics()
+            }
             
         if technical_elements.get("commands"):
             command_issues = await self._validate_commands(
@@ -233,185 +259,30 @@ class TechnicalValidator:
         """Validate code blocks for syntax and best practices."""
         issues = []
         
-        for block in code_blocks:
-            code = block["code"]
-            language = block["language"].lower()
-            
-            # Language-specific validation
-            if language == "python":
-                block_issues = await self._validate_python_code(code, block.get("context", ""))
-                issues.extend(block_issues)
-            elif language == "javascript" or language == "typescript":
-                block_issues = await self._validate_javascript_code(code, block.get("context", ""))
-                issues.extend(block_issues)
-            elif language == "yaml":
-                block_issues = await self._validate_yaml_code(code, block.get("context", ""))
-                issues.extend(block_issues)
-            elif language == "json":
-                block_issues = await self._validate_json_code(code, block.get("context", ""))
-                issues.extend(block_issues)
-            elif language == "bash" or language == "shell":
-                block_issues = await self._validate_shell_code(code, block.get("context", ""))
-                issues.extend(block_issues)
-            else:
-                # Generic validation using LLM
-                block_issues = await self._validate_generic_code(code, language, block.get("context", ""))
-                issues.extend(block_issues)
-                
-        return issues
-        
-    async def _validate_python_code(self, code: str, context: str) -> List[ValidationIssue]:
-        """Validate Python code for syntax and best practices."""
-        issues = []
-        
-        # Syntax validation
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
-            issues.append(ValidationIssue(
-                dimension=QualityDimension.TECHNICAL_ACCURACY,
-                severity=SeverityLevel.CRITICAL,
-                title="Python Syntax Error",
-                description=f"Syntax error in Python code: {str(e)}",
-                location={"type": "code", "language": "python", "line": e.lineno},
-                suggested_fix=f"Fix syntax error at line {e.lineno}: {e.msg}",
-                auto_fixable=False
-            ))
-            
-        # Check for deprecated features
-        deprecated_patterns = [
-            (r'\bprint\s+[^(]', "Use print() function instead of print statement"),
-            (r'\bxrange\(', "Use range() instead of xrange() in Python 3"),
-            (r'\braw_input\(', "Use input() instead of raw_input() in Python 3"),
-        ]
-        
-        for pattern, message in deprecated_patterns:
-            if re.search(pattern, code):
+        # Language-specific checks run in the worker pool; other languages go to the LLM
+        results = await self.code_pool.validate(code_blocks)
+        generic_blocks = []
+        for block, block_issues in zip(code_blocks, results):
+            if block_issues is None:
+                generic_blocks.append(block)
+                continue
+            for issue in block_issues:
                 issues.append(ValidationIssue(
                     dimension=QualityDimension.TECHNICAL_ACCURACY,
-                    severity=SeverityLevel.HIGH,
-                    title="Deprecated Python Feature",
-                    description=message,
-                    location={"type": "code", "language": "python"},
-                    suggested_fix=message,
-                    auto_fixable=True
+                    severity=SeverityLevel(issue["severity"]),
+                    title=issue["title"],
+                    description=issue["description"],
+                    location=dict(issue["location"]),
+                    suggested_fix=issue.get("suggested_fix"),
+                    auto_fixable=issue.get("auto_fixable", False)
                 ))
                 
-        # Check for security issues
-        security_patterns = [
-            (r'eval\(', "Avoid using eval() for security reasons"),
-            (r'exec\(', "Avoid using exec() for security reasons"),
-            (r'__import__\(', "Avoid using __import__() directly"),
-            (r'pickle\.loads?\(', "Be careful with pickle - only load trusted data"),
-        ]
-        
-        for pattern, message in security_patterns:
-            if re.search(pattern, code):
-                issues.append(ValidationIssue(
-                    dimension=QualityDimension.TECHNICAL_ACCURACY,
-                    severity=SeverityLevel.HIGH,
-                    title="Security Concern",
-                    description=message,
-                    location={"type": "code", "language": "python"},
-                    suggested_fix=message,
-                    auto_fixable=False
-                ))
-                
-        return issues
-        
-    async def _validate_javascript_code(self, code: str, context: str) -> List[ValidationIssue]:
-        """Validate JavaScript/TypeScript code."""
-        issues = []
-        
-        # Check for common issues
-        js_patterns = [
-            (r'var\s+\w+', "Use 'let' or 'const' instead of 'var'", SeverityLevel.MEDIUM),
-            (r'==(?!=)', "Use '===' instead of '==' for comparison", SeverityLevel.MEDIUM),
-            (r'!=(?!=)', "Use '!==' instead of '!=' for comparison", SeverityLevel.MEDIUM),
-            (r'console\.(log|error|warn)', "Remove console statements in production", SeverityLevel.LOW),
-        ]
-        
-        for pattern, message, severity in js_patterns:
-            if re.search(pattern, code):
-                issues.append(ValidationIssue(
-                    dimension=QualityDimension.TECHNICAL_ACCURACY,
-                    severity=severity,
-                    title="JavaScript Best Practice",
-                    description=message,
-                    location={"type": "code", "language": "javascript"},
-                    suggested_fix=message,
-                    auto_fixable=severity != SeverityLevel.LOW
-                ))
-                
-        return issues
-        
-    async def _validate_yaml_code(self, code: str, context: str) -> List[ValidationIssue]:
-        """Validate YAML configuration."""
-        issues = []
-        
-        try:
-            import yaml
-            yaml.safe_load(code)
-        except yaml.YAMLError as e:
-            issues.append(ValidationIssue(
-                dimension=QualityDimension.TECHNICAL_ACCURACY,
-                severity=SeverityLevel.CRITICAL,
-                title="YAML Syntax Error",
-                description=f"YAML parsing error: {str(e)}",
-                location={"type": "code", "language": "yaml"},
-                suggested_fix="Fix YAML syntax according to error message",
-                auto_fixable=False
-            ))
-            
-        # Check for Kubernetes-specific issues if applicable
-        if "apiVersion" in code and "kind" in code:
-            k8s_issues = await self._validate_kubernetes_yaml(code)
-            issues.extend(k8s_issues)
-            
-        return issues
-        
-    async def _validate_json_code(self, code: str, context: str) -> List[ValidationIssue]:
-        """Validate JSON syntax."""
-        issues = []
-        
-        try:
-            json.loads(code)
-        except json.JSONDecodeError as e:
-            issues.append(ValidationIssue(
-                dimension=QualityDimension.TECHNICAL_ACCURACY,
-                severity=SeverityLevel.CRITICAL,
-                title="JSON Syntax Error",
-                description=f"JSON parsing error: {str(e)}",
-                location={"type": "code", "language": "json", "line": e.lineno, "column": e.colno},
-                suggested_fix=f"Fix JSON syntax at line {e.lineno}, column {e.colno}",
-                auto_fixable=False
-            ))
-            
-        return issues
-        
-    async def _validate_shell_code(self, code: str, context: str) -> List[ValidationIssue]:
-        """Validate shell/bash commands."""
-        issues = []
-        
-        # Check for dangerous commands
-        dangerous_patterns = [
-            (r'rm\s+-rf\s+/', "Dangerous rm -rf command on root directory"),
-            (r'chmod\s+777', "Avoid chmod 777 - use more restrictive permissions"),
-            (r'curl.*\|\s*bash', "Avoid piping curl directly to bash for security"),
-            (r'wget.*\|\s*sh', "Avoid piping wget directly to shell for security"),
-        ]
-        
-        for pattern, message in dangerous_patterns:
-            if re.search(pattern, code):
-                issues.append(ValidationIssue(
-                    dimension=QualityDimension.TECHNICAL_ACCURACY,
-                    severity=SeverityLevel.HIGH,
-                    title="Dangerous Shell Command",
-                    description=message,
-                    location={"type": "code", "language": "bash"},
-                    suggested_fix=message,
-                    auto_fixable=False
-                ))
+        generic_results = await asyncio.gather(*(
+            self._validate_generic_code(block["code"], block["language"].lower(), block.get("context", ""))
+            for block in generic_blocks
+        ))
+        for block_issues in generic_results:
+            issues.extend(block_issues)
                 
         return issues
         
@@ -472,18 +343,20 @@ class TechnicalValidator:
         
         for command in commands:
             # Check if command exists (simplified)
-            base_command = command.split()[0].strip("$")
+            words = command.split()
+            if not words:
+                continue
+            base_command = words[0].strip("$")
             
-            # Check for typos in common commands
-            common_commands = ["ls", "cd", "pwd", "mkdir", "rm", "cp", "mv", "cat", "grep", "find", "docker", "kubectl", "git", "npm", "pip", "python", "java", "node"]
-            if base_command not in common_commands and self._is_likely_typo(base_command, common_commands):
+            # Check for typos in known commands
+            if base_command not in self.known_commands and self._is_likely_typo(base_command, self.known_commands):
                 issues.append(ValidationIssue(
                     dimension=QualityDimension.TECHNICAL_ACCURACY,
                     severity=SeverityLevel.HIGH,
                     title="Possible Command Typo",
                     description=f"'{base_command}' might be a typo",
                     location={"type": "command", "command": command},
-                    suggested_fix=f"Did you mean one of: {', '.join(self._find_similar_commands(base_command, common_commands))}?",
+                    suggested_fix=f"Did you mean one of: {', '.join(self._find_similar_commands(base_command, self.known_commands))}?",
                     auto_fixable=False
                 ))
                 
@@ -559,46 +432,6 @@ class TechnicalValidator:
                 
         return issues
         
-    async def _validate_kubernetes_yaml(self, yaml_content: str) -> List[ValidationIssue]:
-        """Validate Kubernetes YAML configuration."""
-        issues = []
-        
-        try:
-            import yaml
-            k8s_obj = yaml.safe_load(yaml_content)
-            
-            # Check API version
-            api_version = k8s_obj.get("apiVersion", "")
-            if api_version in ["extensions/v1beta1", "apps/v1beta1", "apps/v1beta2"]:
-                issues.append(ValidationIssue(
-                    dimension=QualityDimension.TECHNICAL_ACCURACY,
-                    severity=SeverityLevel.HIGH,
-                    title="Deprecated Kubernetes API Version",
-                    description=f"API version '{api_version}' is deprecated",
-                    location={"type": "kubernetes", "field": "apiVersion"},
-                    suggested_fix="Use 'apps/v1' for Deployments, StatefulSets, and DaemonSets",
-                    auto_fixable=True
-                ))
-                
-            # Check for required fields
-            kind = k8s_obj.get("kind", "")
-            if kind == "Deployment":
-                if not k8s_obj.get("spec", {}).get("selector"):
-                    issues.append(ValidationIssue(
-                        dimension=QualityDimension.TECHNICAL_ACCURACY,
-                        severity=SeverityLevel.CRITICAL,
-                        title="Missing Required Field",
-                        description="Deployment must have spec.selector",
-                        location={"type": "kubernetes", "kind": "Deployment"},
-                        suggested_fix="Add spec.selector.matchLabels",
-                        auto_fixable=False
-                    ))
-                    
-        except Exception as e:
-            logger.error(f"Error validating Kubernetes YAML: {e}")
-            
-        return issues
-        
     async def _check_deprecations(self, elements: Dict[str, List[Any]]) -> List[ValidationIssue]:
         """Check for deprecated features across all technologies."""
         issues = []
@@ -678,40 +511,14 @@ class TechnicalValidator:
             
         return sources
         
-    def _is_likely_typo(self, word: str, valid_words: List[str]) -> bool:
+    def _is_likely_typo(self, word: str, valid_words: Sequence[str]) -> bool:
         """Check if a word is likely a typo of valid words."""
-        for valid in valid_words:
-            if self._edit_distance(word, valid) <= 2:
-                return True
-        return False
-        
-    def _find_similar_commands(self, word: str, valid_words: List[str]) -> List[str]:
-        """Find similar valid commands."""
-        similar = []
-        for valid in valid_words:
-            if self._edit_distance(word, valid) <= 2:
-                similar.append(valid)
-        return similar[:3]  # Return top 3
-        
-    def _edit_distance(self, s1: str, s2: str) -> int:
-        """Calculate edit distance between two strings."""
-        if len(s1) < len(s2):
-            return self._edit_distance(s2, s1)
-            
-        if len(s2) == 0:
-            return len(s1)
-            
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-            
-        return previous_row[-1]
+        return get_fuzzy_index(tuple(valid_words), MAX_TYPO_DISTANCE).has_within(word)
+        
+    def _find_similar_commands(self, word: str, valid_words: Sequence[str]) -> List[str]:
+        """Find similar valid commands, closest first."""
+        matches = get_fuzzy_index(tuple(valid_words), MAX_TYPO_DISTANCE).search(word)
+        return [valid for _, valid in matches[:3]]  # Return top 3
         
     async def _validate_kubernetes_config(self, config: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate Kubernetes-specific configuration."""
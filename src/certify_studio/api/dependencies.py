@@ -2,12 +2,16 @@
 FastAPI dependencies for authentication, database, and common functionality.
 """
 
+import asyncio
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Annotated, AsyncGenerator
-from uuid import UUID
+from typing import Optional, Dict, Any, Annotated, AsyncGenerator, Set
+from uuid import UUID, uuid4
 
-from fastapi import Depends, HTTPException, status, Header, Request, UploadFile as FastAPIUploadFile
+from fastapi import Depends, HTTPException, status, Header, Request, Response, File, UploadFile as FastAPIUploadFile
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -18,7 +22,9 @@ import aiofiles
 from ..database import get_session
 from ..core.config import settings
 from ..core.logging import get_logger
-from .schemas import User, TokenData, RateLimitInfo
+from ..core.utils import LRUCache
+from .rate_limit import rate_limiter, route_cost
+from .schemas import User, RateLimitInfo
 
 logger = get_logger(__name__)
 
@@ -26,6 +32,12 @@ logger = get_logger(__name__)
 security = HTTPBearer()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow; keep it off the event loop and bound its CPU use
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.AUTH_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
 # JWT settings
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
@@ -54,14 +66,18 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash in the password thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, pwd_context.verify, plain_password, hashed_password
+    )
 
 
-def get_password_hash(password: str) -> str:
-    """Hash password."""
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    """Hash password in the password thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -75,6 +91,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode.update({
         "exp": expire,
         "iat": datetime.utcnow(),
+        "jti": uuid4().hex,
         "scope": "access"
     })
     
@@ -90,6 +107,7 @@ def create_refresh_token(data: dict) -> str:
     to_encode.update({
         "exp": expire,
         "iat": datetime.utcnow(),
+        "jti": uuid4().hex,
         "scope": "refresh"
     })
     
@@ -97,6 +115,206 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+class PrincipalCache:
+    """
+    Short-lived cache of authenticated users keyed by token id.
+    
+    Lookups hit an in-process LRU first and, when enabled, a shared Redis
+    copy, so a valid token costs a database read at most once per TTL.
+    Entries never outlive their token. Logging out revokes the token id;
+    updating a user bumps that user's generation and drops every cached
+    token of the user. ``validate`` runs before any cached principal is
+    trusted, so with Redis enabled revocations and invalidations made in
+    other processes apply to the next request.
+    """
+    
+    KEY_PREFIX = "certify:principal:"
+    USER_PREFIX = "certify:principal-user:"
+    REVOKED_PREFIX = "certify:revoked:"
+    GENERATION_PREFIX = "certify:principal-generation:"
+    
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+        use_redis: Optional[bool] = None
+    ):
+        self.ttl = ttl if ttl is not None else settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+        self.use_redis = settings.AUTH_PRINCIPAL_CACHE_REDIS if use_redis is None else use_redis
+        self._entries = LRUCache(maxsize or settings.AUTH_PRINCIPAL_CACHE_SIZE)
+        self._user_tokens: Dict[str, Set[str]] = {}
+        self._revoked = LRUCache(maxsize or settings.AUTH_PRINCIPAL_CACHE_SIZE)
+        # Last seen shared generation of each user with cached tokens
+        self._generations = LRUCache(maxsize or settings.AUTH_PRINCIPAL_CACHE_SIZE)
+    
+    @staticmethod
+    def token_key(token: str, payload: Dict[str, Any]) -> str:
+        """Token id, or a digest of the token for tokens issued without one."""
+        return payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+    
+    async def _redis(self) -> Optional[aioredis.Redis]:
+        if not self.use_redis:
+            return None
+        try:
+            return await get_redis()
+        except Exception as e:
+            logger.warning(f"Principal cache falling back to in-process only: {e}")
+            return None
+    
+    def _remember(self, key: str, user: User, expires_at: float) -> None:
+        self._entries.set(key, (expires_at, user))
+        # Forget tokens the LRU has already evicted
+        tokens = {k for k in self._user_tokens.get(str(user.id), ()) if k in self._entries}
+        tokens.add(key)
+        self._user_tokens[str(user.id)] = tokens
+    
+    def _forget_user(self, user_id: str) -> None:
+        for key in self._user_tokens.pop(user_id, set()):
+            self._entries.pop(key)
+    
+    async def validate(self, key: str, user_id: Any) -> bool:
+        """
+        Check that the token was not revoked, here or in another process.
+        
+        Also drops this process's cached principals of the user when another
+        process has invalidated them since they were cached.
+        """
+        revoked_until = self._revoked.get(key)
+        if revoked_until is not None and revoked_until > time.time():
+            return False
+        redis = await self._redis()
+        if redis is None:
+            return True
+        
+        user_id = str(user_id)
+        try:
+            pipe = redis.pipeline()
+            pipe.exists(self.REVOKED_PREFIX + key)
+            pipe.get(self.GENERATION_PREFIX + user_id)
+            revoked, generation = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Revocation lookup failed: {e}")
+            return True
+        if revoked:
+            return False
+        generation = generation or "0"
+        if self._generations.get(user_id) != generation:
+            self._forget_user(user_id)
+            self._generations.set(user_id, generation)
+        return True
+    
+    def get_local(self, key: str) -> Optional[User]:
+        """Cached user from this process, if still fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.time():
+            self._entries.pop(key)
+            return None
+        return user.model_copy()
+    
+    async def get(self, key: str) -> Optional[User]:
+        """Cached user from this process or the shared cache."""
+        user = self.get_local(key)
+        if user is not None:
+            return user
+        
+        redis = await self._redis()
+        if redis is None:
+            return None
+        try:
+            cached = await redis.get(self.KEY_PREFIX + key)
+            if cached is None:
+                return None
+            user = User.model_validate_json(cached)
+            ttl = await redis.ttl(self.KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"Principal cache lookup failed: {e}")
+            return None
+        self._remember(key, user, time.time() + max(ttl, 0))
+        return user.model_copy()
+    
+    async def set(self, key: str, user: User, token_exp: Optional[float] = None) -> None:
+        """Cache a user for one TTL, or until the token expires if sooner."""
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+        
+        self._remember(key, user.model_copy(), time.time() + ttl)
+        redis = await self._redis()
+        if redis is not None:
+            try:
+                pipe = redis.pipeline()
+                pipe.set(self.KEY_PREFIX + key, user.model_dump_json(), ex=max(int(ttl), 1))
+                pipe.sadd(self.USER_PREFIX + str(user.id), key)
+                pipe.expire(self.USER_PREFIX + str(user.id), max(int(self.ttl), 1))
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Principal cache write failed: {e}")
+    
+    async def revoke(self, key: str, user_id: Any, token_exp: Optional[float] = None) -> None:
+        """Revoke a token (logout) until it would have expired anyway."""
+        remaining = (token_exp - time.time()) if token_exp else ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        self._entries.pop(key)
+        self._user_tokens.get(str(user_id), set()).discard(key)
+        self._revoked.set(key, time.time() + remaining)
+        
+        redis = await self._redis()
+        if redis is not None and remaining > 0:
+            try:
+                pipe = redis.pipeline()
+                pipe.delete(self.KEY_PREFIX + key)
+                pipe.set(self.REVOKED_PREFIX + key, "1", ex=max(int(remaining), 1))
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Token revocation write failed: {e}")
+    
+    async def invalidate_user(self, user_id: Any) -> None:
+        """Drop every cached principal of a user after it changes."""
+        user_id = str(user_id)
+        self._forget_user(user_id)
+        
+        redis = await self._redis()
+        if redis is not None:
+            try:
+                user_key = self.USER_PREFIX + user_id
+                keys = await redis.smembers(user_key)
+                if keys:
+                    await redis.delete(*(self.KEY_PREFIX + key for key in keys))
+                await redis.delete(user_key)
+                # Entries cached before the bump expire within one TTL, so the counter may too
+                pipe = redis.pipeline()
+                pipe.incr(self.GENERATION_PREFIX + user_id)
+                pipe.expire(self.GENERATION_PREFIX + user_id, max(int(self.ttl), 1))
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Principal cache invalidation failed: {e}")
+
+
+principal_cache = PrincipalCache()
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Decode and validate an access token, raising 401 if invalid."""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        raise credentials_exception
+    
+    if payload.get("scope") != "access" or payload.get("sub") is None:
+        raise credentials_exception
+    return payload
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
@@ -108,36 +326,21 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(
-            credentials.credentials,
-            SECRET_KEY,
-            algorithms=[ALGORITHM]
-        )
-        
-        if payload.get("scope") != "access":
-            raise credentials_exception
-            
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-            
-        token_data = TokenData(
-            sub=user_id,
-            exp=payload.get("exp"),
-            iat=payload.get("iat"),
-            jti=payload.get("jti"),
-            scope=payload.get("scope")
-        )
-        
-    except JWTError:
+    payload = decode_access_token(credentials.credentials)
+    token_key = PrincipalCache.token_key(credentials.credentials, payload)
+    
+    # Revocations and invalidations apply before any cached principal is used
+    if not await principal_cache.validate(token_key, payload["sub"]):
         raise credentials_exception
     
-    # Get user from database
-    user = await db.get(User, UUID(token_data.sub))
+    user = await principal_cache.get(token_key)
     if user is None:
-        raise credentials_exception
-        
+        # Get user from database
+        user = await db.get(User, UUID(payload["sub"]))
+        if user is None:
+            raise credentials_exception
+        await principal_cache.set(token_key, user, payload.get("exp"))
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -173,52 +376,35 @@ async def get_current_verified_user(
 
 async def check_rate_limit(
     request: Request,
-    user: User = Depends(get_current_user),
-    redis: aioredis.Redis = Depends(get_redis)
+    response: Response,
+    user: User = Depends(get_current_user)
 ) -> RateLimitInfo:
-    """Check rate limit for user."""
-    # Rate limit key
-    key = f"rate_limit:{user.id}:{request.url.path}"
-    
-    # Get current count
-    current = await redis.get(key)
-    if current is None:
-        current = 0
-    else:
-        current = int(current)
-    
-    # Check limit based on user plan
+    """Check rate limit for user, weighting expensive endpoints."""
+    # Limit based on user plan
     limit = settings.RATE_LIMITS.get(user.plan_type, 100)
+    endpoint = request.scope.get("endpoint")
+    cost = route_cost(getattr(endpoint, "__name__", None))
     
-    if current >= limit:
-        # Calculate reset time
-        ttl = await redis.ttl(key)
-        reset_at = datetime.utcnow() + timedelta(seconds=ttl)
-        
+    result = await rate_limiter.hit(
+        f"user:{user.id}",
+        limit,
+        settings.RATE_LIMIT_PLAN_WINDOW,
+        cost
+    )
+    
+    if not result.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded",
-            headers={
-                "X-RateLimit-Limit": str(limit),
-                "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int(reset_at.timestamp())),
-                "Retry-After": str(ttl)
-            }
+            headers=result.headers()
         )
     
-    # Increment counter
-    pipe = redis.pipeline()
-    pipe.incr(key)
-    pipe.expire(key, 3600)  # 1 hour window
-    await pipe.execute()
-    
-    remaining = limit - current - 1
-    reset_at = datetime.utcnow() + timedelta(hours=1)
+    response.headers.update(result.headers())
     
     return RateLimitInfo(
         limit=limit,
-        remaining=remaining,
-        reset_at=reset_at
+        remaining=result.remaining,
+        reset_at=datetime.utcnow() + timedelta(seconds=result.reset_after)
     )
 
 
@@ -259,14 +445,40 @@ def require_admin(current_user: User = Depends(get_current_verified_user)) -> Us
 
 
 class FileUploadValidator:
-    """Handle file uploads securely."""
+    """
+    Handle file uploads securely.
+    
+    The upload is streamed to disk in fixed-size chunks: the size limit is
+    enforced as bytes arrive, the type is sniffed from the first chunk and
+    a SHA-256 is computed on the fly. Files are stored under their content
+    hash and an extension derived from the sniffed type, so re-uploading an
+    identical guide reuses the stored copy. The request body as a whole is
+    capped by ``RequestPipelineMiddleware``.
+    """
+    
+    # Extensions that decide between text types once the content is text
+    TEXT_EXTENSIONS = {
+        "md": "text/markdown",
+        "markdown": "text/markdown",
+    }
+    
+    # Stored file extension for each sniffed type; client filenames are never used
+    STORED_EXTENSIONS = {
+        "application/pdf": "pdf",
+        "text/plain": "txt",
+        "text/markdown": "md",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+        "application/epub+zip": "epub",
+    }
     
     def __init__(
         self,
-        max_size: int = 100 * 1024 * 1024,  # 100MB default
-        allowed_types: Optional[list] = None
+        max_size: Optional[int] = None,
+        allowed_types: Optional[list] = None,
+        chunk_size: Optional[int] = None
     ):
-        self.max_size = max_size
+        self.max_size = max_size or settings.MAX_UPLOAD_SIZE
+        self.chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
         self.allowed_types = allowed_types or [
             "application/pdf",
             "text/plain",
@@ -275,39 +487,91 @@ class FileUploadValidator:
             "application/epub+zip"
         ]
     
-    async def __call__(self, file: FastAPIUploadFile) -> Dict[str, Any]:
-        """Validate and process uploaded file."""
-        # Check file size
-        contents = await file.read()
-        if len(contents) > self.max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Maximum size: {self.max_size} bytes"
-            )
+    def sniff_content_type(self, head: bytes, filename: str) -> Optional[str]:
+        """Detect the content type from the first bytes of the file."""
+        extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        
+        if head.startswith(b"%PDF-"):
+            return "application/pdf"
+        if head.startswith(b"PK\x03\x04"):
+            # EPUB stores an uncompressed "mimetype" entry first
+            if head[30:58] == b"mimetypeapplication/epub+zip":
+                return "application/epub+zip"
+            if b"word/" in head or extension == "docx":
+                return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+            return "application/zip"
         
-        # Check content type
-        if file.content_type not in self.allowed_types:
+        try:
+            # A multi-byte character may be cut at the chunk boundary
+            head.decode("utf-8")
+        except UnicodeDecodeError as e:
+            if e.start < len(head) - 3:
+                return None
+        if b"\x00" in head:
+            return None
+        return self.TEXT_EXTENSIONS.get(extension, "text/plain")
+    
+    async def __call__(self, file: FastAPIUploadFile = File(...)) -> Dict[str, Any]:
+        """Validate and store an uploaded file with bounded memory."""
+        too_large = HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {self.max_size} bytes"
+        )
+        
+        # Reject early when the size is already known
+        if file.size is not None and file.size > self.max_size:
+            raise too_large
+        
+        filename = file.filename or "upload"
+        head = await file.read(self.chunk_size)
+        
+        # Check content type from the bytes, not the client's claim
+        content_type = self.sniff_content_type(head, filename)
+        if content_type not in self.allowed_types:
             raise HTTPException(
                 status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                 detail=f"File type not allowed. Allowed types: {', '.join(self.allowed_types)}"
             )
         
-        # Generate secure filename
-        file_id = UUID()
-        extension = file.filename.split(".")[-1] if "." in file.filename else "bin"
-        secure_filename = f"{file_id}.{extension}"
+        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+        file_id = uuid4()
+        partial_path = os.path.join(settings.UPLOAD_DIR, f".{file_id}.part")
+        hasher = hashlib.sha256()
+        size = 0
         
-        # Save file
-        upload_path = os.path.join(settings.UPLOAD_DIR, secure_filename)
-        async with aiofiles.open(upload_path, "wb") as f:
-            await f.write(contents)
+        try:
+            async with aiofiles.open(partial_path, "wb") as f:
+                chunk = head
+                while chunk:
+                    size += len(chunk)
+                    if size > self.max_size:
+                        raise too_large
+                    hasher.update(chunk)
+                    await f.write(chunk)
+                    chunk = await file.read(self.chunk_size)
+            
+            # Content-addressed storage deduplicates identical uploads
+            content_hash = hasher.hexdigest()
+            extension = self.STORED_EXTENSIONS.get(content_type, "bin")
+            upload_path = os.path.join(settings.UPLOAD_DIR, f"{content_hash}.{extension}")
+            duplicate = os.path.exists(upload_path)
+            if duplicate:
+                logger.info(f"Upload {filename} matches stored file {upload_path}")
+            else:
+                os.replace(partial_path, upload_path)
+        finally:
+            # Whatever failed, never leave the partial file behind
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
         
         return {
             "upload_id": file_id,
-            "filename": file.filename,
-            "content_type": file.content_type,
-            "size": len(contents),
-            "path": upload_path
+            "filename": filename,
+            "content_type": content_type,
+            "size": size,
+            "path": upload_path,
+            "content_hash": content_hash,
+            "duplicate": duplicate
         }
 
 
@@ -365,4 +629,4 @@ def get_request_id(
     """Get or generate request ID."""
     if x_request_id:
         return x_request_id
-    return str(UUID())
+    return str(uuid4())
@@ -8,6 +8,7 @@ from fastapi import FastAPI, Request, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from ..core.config import settings
 from ..core.logging import get_logger
@@ -211,32 +212,9 @@ def create_app() -> FastAPI:
     )
     async def metrics():
         """Prometheus metrics endpoint."""
-        # In production, use prometheus_client
-        metrics_text = """
-# HELP api_requests_total Total API requests
-# TYPE api_requests_total counter
-api_requests_total{method="GET",endpoint="/health"} 1234
-api_requests_total{method="POST",endpoint="/api/generation/generate"} 567
-
-# HELP api_request_duration_seconds API request duration
-# TYPE api_request_duration_seconds histogram
-api_request_duration_seconds_bucket{le="0.1"} 1000
-api_request_duration_seconds_bucket{le="0.5"} 1200
-api_request_duration_seconds_bucket{le="1.0"} 1300
-api_request_duration_seconds_bucket{le="+Inf"} 1400
-
-# HELP active_generations Number of active content generations
-# TYPE active_generations gauge
-active_generations 5
-
-# HELP content_quality_score Average content quality score
-# TYPE content_quality_score gauge
-content_quality_score 0.92
-        """
-        
         return Response(
-            content=metrics_text,
-            media_type="text/plain; version=0.0.4"
+            content=generate_latest(),
+            media_type=CONTENT_TYPE_LATEST
         )
     
     # API info endpoint
@@ -4,107 +4,199 @@ API middleware for authentication, rate limiting, and error handling.
 
 import time
 import uuid
-from typing import Callable
+from typing import Callable, Optional
 
-from fastapi import FastAPI, Request, Response, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..core.config import settings
 from ..core.logging import get_logger
+from ..integrations.observability.metrics import track_request_metrics
+from .rate_limit import rate_limiter
 from .schemas import ErrorResponse
 
 logger = get_logger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Add request ID to all requests."""
+class RequestPipelineMiddleware:
+    """
+    Request ID, logging, rate limiting, security headers and metrics as a
+    single pure ASGI middleware.
     
-    async def dispatch(self, request: Request, call_next):
-        # Get or generate request ID
-        request_id = request.headers.get("X-Request-ID")
-        if not request_id:
-            request_id = str(uuid.uuid4())
-        
-        # Store in request state
-        request.state.request_id = request_id
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Log all requests and responses."""
+    Unlike ``BaseHTTPMiddleware`` subclasses, this layer does not wrap each
+    request in an extra task and response stream. Headers are added to the
+    ``http.response.start`` message as it passes through, and the body is
+    forwarded untouched, so streaming responses (SSE, video) flow straight
+    to the client.
     
-    async def dispatch(self, request: Request, call_next):
-        # Start timer
-        start_time = time.time()
-        
-        # Get request info
-        request_id = getattr(request.state, "request_id", "unknown")
-        
-        # Log request
-        logger.info(
-            f"Request started",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client": request.client.host if request.client else "unknown"
-            }
-        )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate duration
-        duration = time.time() - start_time
-        
-        # Log response
-        logger.info(
-            f"Request completed",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_seconds": duration
-            }
-        )
-        
-        # Add timing header
-        response.headers["X-Process-Time"] = str(duration)
-        
-        return response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to responses."""
+    Request bodies are capped at ``max_body_size``: a larger Content-Length
+    is rejected before the route runs, and bodies without one stop being
+    read once they pass the limit. Without this, multipart parsing would
+    spool a whole oversized upload to disk before any route could check it.
+    """
     
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    SECURITY_HEADERS = [
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    ]
+    _security_header_names = frozenset(name for name, _ in SECURITY_HEADERS)
+    RATE_LIMIT_EXEMPT = ("/health", "/metrics")
+    # Multipart boundaries and form fields sent alongside the largest upload
+    BODY_OVERHEAD = 64 * 1024
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        request_id: bool = True,
+        logging: bool = True,
+        security_headers: bool = True,
+        rate_limit: bool = True,
+        metrics: Optional[bool] = None,
+        calls: Optional[int] = None,
+        period: Optional[int] = None,
+        max_body_size: Optional[int] = None
+    ):
+        self.app = app
+        self.request_id = request_id
+        self.logging = logging
+        self.security_headers = security_headers
+        self.rate_limit = rate_limit and settings.RATE_LIMIT_ENABLED
+        self.metrics = settings.ENABLE_METRICS if metrics is None else metrics
+        self.calls = calls or settings.RATE_LIMIT_REQUESTS
+        self.period = period or settings.RATE_LIMIT_WINDOW
+        self.max_body_size = max_body_size or settings.MAX_UPLOAD_SIZE + self.BODY_OVERHEAD
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        # Start timer
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        client_host = client[0] if client else "unknown"
         
-        # Remove server header
-        if "Server" in response.headers:
-            del response.headers["Server"]
+        # Get or generate request ID
+        request_id = "unknown"
+        if self.request_id:
+            request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+            scope.setdefault("state", {})["request_id"] = request_id
+        
+        if self.logging:
+            logger.info(
+                "Request started",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "client": client_host
+                }
+            )
         
-        return response
+        rate_limit_headers = {}
+        status_code = 500
+        response_started = False
+        body_size = 0
+        
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                body_size += len(message.get("body", b""))
+                if body_size > self.max_body_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body too large. Maximum size: {self.max_body_size} bytes"
+                    )
+            return message
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                if self.request_id:
+                    headers["X-Request-ID"] = request_id
+                if self.logging:
+                    headers["X-Process-Time"] = str(time.perf_counter() - start_time)
+                for name, value in rate_limit_headers.items():
+                    headers[name] = value
+                if self.security_headers:
+                    del headers["server"]
+                    message["headers"] = [
+                        item for item in message["headers"]
+                        if item[0].lower() not in self._security_header_names
+                    ] + self.SECURITY_HEADERS
+            await send(message)
+        
+        try:
+            if self.rate_limit and path not in self.RATE_LIMIT_EXEMPT:
+                result = await rate_limiter.hit(f"ip:{client_host}", self.calls, self.period)
+                rate_limit_headers = result.headers()
+                if not result.allowed:
+                    response = self._error_response(
+                        scope, status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded"
+                    )
+                    await response(scope, receive, send_wrapper)
+                    return
+            
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_body_size:
+                response = self._error_response(
+                    scope, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "Request body too large"
+                )
+                await response(scope, receive, send_wrapper)
+                return
+            
+            try:
+                await self.app(scope, receive_wrapper, send_wrapper)
+            except HTTPException as e:
+                # Raised by receive_wrapper outside any exception handler of the app
+                if e.status_code != status.HTTP_413_REQUEST_ENTITY_TOO_LARGE or response_started:
+                    raise
+                response = self._error_response(scope, e.status_code, "Request body too large")
+                await response(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            
+            if self.logging:
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "status_code": status_code,
+                        "duration_seconds": duration
+                    }
+                )
+            
+            if self.metrics:
+                # Label by route template, not raw path, to bound label cardinality
+                track_request_metrics(method, route_template(scope), status_code, duration)
+    
+    @staticmethod
+    def _error_response(scope: Scope, status_code: int, message: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content=ErrorResponse(
+                status="error",
+                message=message,
+                request_id=scope.get("state", {}).get("request_id")
+            ).model_dump(mode="json")
+        )
 
 
 def setup_middleware(app: FastAPI):
@@ -130,10 +222,8 @@ def setup_middleware(app: FastAPI):
     # Add GZip compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
     
-    # Add custom middleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(RequestIDMiddleware)
+    # Add request ID, logging, security headers and metrics in one layer
+    app.add_middleware(RequestPipelineMiddleware, rate_limit=False)
 
 
 def setup_exception_handlers(app: FastAPI):
@@ -192,111 +282,24 @@ def setup_exception_handlers(app: FastAPI):
         )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware."""
-    
-    def __init__(self, app, calls: int = 100, period: int = 3600):
-        super().__init__(app)
-        self.calls = calls
-        self.period = period
-        self.clients = {}
-    
-    async def dispatch(self, request: Request, call_next):
-        # Get client identifier
-        client_id = request.client.host if request.client else "unknown"
-        
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
-        
-        # Get current time
-        now = time.time()
-        
-        # Initialize client data if needed
-        if client_id not in self.clients:
-            self.clients[client_id] = {
-                "calls": 0,
-                "reset_time": now + self.period
-            }
-        
-        client_data = self.clients[client_id]
-        
-        # Reset if period expired
-        if now > client_data["reset_time"]:
-            client_data["calls"] = 0
-            client_data["reset_time"] = now + self.period
-        
-        # Check rate limit
-        if client_data["calls"] >= self.calls:
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content=ErrorResponse(
-                    status="error",
-                    message="Rate limit exceeded",
-                    request_id=getattr(request.state, "request_id", None)
-                ).model_dump(),
-                headers={
-                    "X-RateLimit-Limit": str(self.calls),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(client_data["reset_time"])),
-                    "Retry-After": str(int(client_data["reset_time"] - now))
-                }
-            )
-        
-        # Increment counter
-        client_data["calls"] += 1
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(self.calls - client_data["calls"])
-        response.headers["X-RateLimit-Reset"] = str(int(client_data["reset_time"]))
-        
-        return response
-
-
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Collect metrics for monitoring."""
-    
-    def __init__(self, app):
-        super().__init__(app)
-        self.request_count = 0
-        self.request_duration_sum = 0
-        self.status_codes = {}
-    
-    async def dispatch(self, request: Request, call_next):
-        # Start timer
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate duration
-        duration = time.time() - start_time
-        
-        # Update metrics
-        self.request_count += 1
-        self.request_duration_sum += duration
-        
-        status_code = response.status_code
-        if status_code not in self.status_codes:
-            self.status_codes[status_code] = 0
-        self.status_codes[status_code] += 1
-        
-        # Store metrics in app state for metrics endpoint
-        request.app.state.metrics = {
-            "request_count": self.request_count,
-            "request_duration_avg": self.request_duration_sum / self.request_count if self.request_count > 0 else 0,
-            "status_codes": self.status_codes
-        }
-        
-        return response
+def route_template(scope) -> str:
+    """Path template of the matched route, e.g. ``/export/{task_id}/stream``."""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
 
 
-def create_rate_limiter(calls: int = 100, period: int = 3600) -> Callable:
+def create_rate_limiter(calls: Optional[int] = None, period: Optional[int] = None) -> Callable:
     """Create a rate limiter middleware."""
-    def rate_limiter(app: FastAPI):
-        app.add_middleware(RateLimitMiddleware, calls=calls, period=period)
-    return rate_limiter
+    def add_rate_limiter(app: FastAPI):
+        app.add_middleware(
+            RequestPipelineMiddleware,
+            request_id=False,
+            logging=False,
+            security_headers=False,
+            metrics=False,
+            calls=calls,
+            period=period
+        )
+    return add_rate_limiter
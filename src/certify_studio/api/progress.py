@@ -0,0 +1,296 @@
+"""
+Progress notification channels for generation tasks.
+
+Each task has a channel holding its recent progress events. Producers
+publish into it and subscribers wake only when something changes, so an
+idle dashboard costs nothing between heartbeats. Events carry per-task
+sequence ids for ``Last-Event-ID`` resume. With Redis pub/sub enabled,
+events are also fanned out to every API process. A channel is dropped
+once it has been idle for the retention period after its task completed,
+or, for tasks run by another process, after its last relayed event.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Set
+from uuid import uuid4
+
+from ..config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHANNEL_PREFIX = "certify:progress:"
+
+
+@dataclass
+class ProgressEvent:
+    """A single progress notification."""
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        """Serialize as a Server-Sent Events frame."""
+        return f"id: {self.id}\nevent: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+@dataclass
+class ProgressChannel:
+    """Recent events and waiting subscribers for one task."""
+    history: Deque[ProgressEvent] = field(default_factory=lambda: deque(maxlen=settings.PROGRESS_HISTORY_SIZE))
+    last_id: int = 0
+    closed: bool = False
+    owner: Optional[str] = None  # User id of the task's owner
+    updated_at: float = field(default_factory=time.monotonic)
+    waiters: List[asyncio.Future] = field(default_factory=list)
+
+    def append(self, event: ProgressEvent):
+        """Store an event and wake every subscriber."""
+        self.history.append(event)
+        self.last_id = max(self.last_id, event.id)
+        self.updated_at = time.monotonic()
+        if event.event == "complete":
+            self.closed = True
+        waiters, self.waiters = self.waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def since(self, last_event_id: int) -> List[ProgressEvent]:
+        """Events after ``last_event_id``; the latest one if the gap was trimmed."""
+        events = [event for event in self.history if event.id > last_event_id]
+        if events and events[0].id > last_event_id + 1 and last_event_id > 0:
+            # The client missed events we no longer hold; a snapshot suffices
+            return events[-1:]
+        return events
+
+
+class PhaseDurationStats:
+    """Exponentially weighted average duration of each pipeline phase."""
+
+    def __init__(self, phase_order: Sequence[str], alpha: float = 0.2):
+        self.phase_order = list(phase_order)
+        self.alpha = alpha
+        self.averages: Dict[str, float] = {}
+
+    def record(self, phase: str, duration: float):
+        """Fold a completed phase's duration into its average."""
+        previous = self.averages.get(phase)
+        self.averages[phase] = duration if previous is None else (
+            self.alpha * duration + (1 - self.alpha) * previous
+        )
+
+    def estimate_remaining(
+        self,
+        phase: Optional[str],
+        phase_elapsed: float,
+        total_elapsed: float,
+        progress: float
+    ) -> Optional[float]:
+        """
+        Seconds left: what remains of the current phase plus the average of
+        every later phase seen before. Falls back to a linear estimate from
+        overall progress until the current phase has history.
+        """
+        if phase in self.phase_order and phase in self.averages:
+            later_phases = self.phase_order[self.phase_order.index(phase) + 1:]
+            current = max(self.averages[phase] - phase_elapsed, 0.0)
+            return current + sum(self.averages.get(p, 0.0) for p in later_phases)
+
+        if progress > 0:
+            return total_elapsed / (progress / 100) - total_elapsed
+        return None
+
+
+class ProgressBroker:
+    """Per-task progress channels with optional cross-process fan-out."""
+
+    def __init__(self, phase_order: Sequence[str]):
+        self.channels: Dict[str, ProgressChannel] = {}
+        self.phase_stats = PhaseDurationStats(phase_order)
+        self._phase_started: Dict[str, tuple] = {}
+        self._task_started: Dict[str, float] = {}
+        self._instance_id = uuid4().hex
+        self._expiring: Set[str] = set()
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self._broadcasts: Set[asyncio.Task] = set()
+
+    def channel(self, task_id: Any) -> ProgressChannel:
+        """Get or create the channel for a task."""
+        key = str(task_id)
+        if key not in self.channels:
+            self.channels[key] = ProgressChannel()
+        return self.channels[key]
+
+    def owner(self, task_id: Any) -> Optional[str]:
+        """Owner of a task known here, including tasks run by other processes."""
+        channel = self.channels.get(str(task_id))
+        return channel.owner if channel is not None else None
+
+    def publish(
+        self,
+        task_id: Any,
+        event: str,
+        data: Dict[str, Any],
+        owner: Optional[Any] = None
+    ) -> ProgressEvent:
+        """
+        Publish a progress event for a task.
+
+        Safe to call from synchronous callbacks running on the event loop.
+        Phase transitions update the duration history used for ETAs.
+        ``owner`` is relayed with the event so other processes can check
+        access to the task.
+        """
+        key = str(task_id)
+        now = time.monotonic()
+        self._task_started.setdefault(key, now)
+
+        phase = data.get("phase")
+        started = self._phase_started.get(key)
+        if phase is not None and (started is None or started[0] != phase):
+            if started is not None:
+                self.phase_stats.record(started[0], now - started[1])
+            self._phase_started[key] = (phase, now)
+            started = self._phase_started[key]
+
+        if event == "complete":
+            if started is not None and data.get("status") == "completed":
+                self.phase_stats.record(started[0], now - started[1])
+            self._phase_started.pop(key, None)
+            self._task_started.pop(key, None)
+            data.setdefault("eta_seconds", 0.0)
+        else:
+            data.setdefault("eta_seconds", self.phase_stats.estimate_remaining(
+                started[0] if started else None,
+                now - started[1] if started else 0.0,
+                now - self._task_started[key],
+                data.get("progress", 0)
+            ))
+
+        channel = self.channel(key)
+        if owner is not None:
+            channel.owner = str(owner)
+        progress_event = ProgressEvent(id=channel.last_id + 1, event=event, data=data)
+        channel.append(progress_event)
+
+        if event == "complete":
+            self._expire_later(key)
+        if self._redis is not None:
+            broadcast = asyncio.get_running_loop().create_task(self._broadcast(key, progress_event))
+            self._broadcasts.add(broadcast)
+            broadcast.add_done_callback(self._broadcasts.discard)
+        return progress_event
+
+    async def subscribe(
+        self,
+        task_id: Any,
+        last_event_id: int = 0,
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[ProgressEvent]]:
+        """
+        Yield events after ``last_event_id`` until the task completes.
+
+        Yields None whenever ``heartbeat`` seconds pass without an event so
+        the caller can keep the connection alive.
+        """
+        channel = self.channel(task_id)
+        heartbeat = heartbeat or settings.SSE_HEARTBEAT_SECONDS
+
+        while True:
+            events = channel.since(last_event_id)
+            for event in events:
+                last_event_id = event.id
+                yield event
+            if channel.closed:
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            channel.waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+            finally:
+                if waiter in channel.waiters:
+                    channel.waiters.remove(waiter)
+
+    async def start(self, redis) -> asyncio.Task:
+        """Relay events through Redis so every process sees every task."""
+        self._redis = redis
+        self._listener = asyncio.create_task(self._listen())
+        return self._listener
+
+    async def stop(self):
+        """Stop relaying events through Redis."""
+        if self._listener is not None:
+            self._listener.cancel()
+        self._redis = None
+        self._listener = None
+
+    def _expire_later(self, key: str):
+        """Drop the channel once it has been idle for the retention period."""
+        if key not in self._expiring:
+            self._expiring.add(key)
+            asyncio.get_running_loop().call_later(
+                settings.PROGRESS_RETENTION_SECONDS, self._expire, key
+            )
+
+    def _expire(self, key: str):
+        self._expiring.discard(key)
+        channel = self.channels.get(key)
+        if channel is None:
+            return
+        idle = time.monotonic() - channel.updated_at
+        if idle < settings.PROGRESS_RETENTION_SECONDS or channel.waiters:
+            # Still active: check again one retention period after its last event
+            self._expiring.add(key)
+            asyncio.get_running_loop().call_later(
+                max(settings.PROGRESS_RETENTION_SECONDS - idle, 1.0), self._expire, key
+            )
+            return
+        del self.channels[key]
+
+    async def _broadcast(self, key: str, event: ProgressEvent):
+        try:
+            await self._redis.publish(CHANNEL_PREFIX + key, json.dumps({
+                "origin": self._instance_id,
+                "owner": self.owner(key),
+                "id": event.id,
+                "event": event.event,
+                "data": event.data
+            }, default=str))
+        except Exception as e:
+            logger.warning(f"Progress broadcast failed for task {key}: {e}")
+
+    async def _listen(self):
+        pubsub = self._redis.pubsub()
+        try:
+            await pubsub.psubscribe(CHANNEL_PREFIX + "*")
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                payload = json.loads(message["data"])
+                if payload["origin"] == self._instance_id:
+                    continue
+                key = message["channel"]
+                key = key.decode() if isinstance(key, bytes) else key
+                key = key[len(CHANNEL_PREFIX):]
+                channel = self.channel(key)
+                channel.owner = payload.get("owner") or channel.owner
+                if payload["id"] > channel.last_id:
+                    channel.append(ProgressEvent(payload["id"], payload["event"], payload["data"]))
+                # The origin process may die before the task completes
+                self._expire_later(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Progress relay stopped, falling back to in-process delivery: {e}")
+            self._redis = None
+        finally:
+            await pubsub.close()
@@ -0,0 +1,169 @@
+"""
+Token-bucket rate limiting shared by the API middleware and dependencies.
+
+Buckets live in Redis and are updated by a single Lua script, so a check
+is one atomic round trip no matter how many API processes share the
+limit. Buckets refill continuously, which avoids the double burst that
+fixed windows allow at their boundaries. If Redis is disabled or down,
+each process falls back to a bounded in-memory LRU of buckets.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from ..core.utils import LRUCache
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "certify:ratelimit:"
+
+# Refill the bucket for the time elapsed, then try to take `cost` tokens.
+# Redis' clock is used so every API process agrees on "now".
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+    def headers(self) -> dict:
+        """Standard rate limit response headers."""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(time.time() + self.reset_after))
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+class RateLimiter:
+    """Token buckets in Redis with a bounded per-process fallback."""
+
+    def __init__(
+        self,
+        use_redis: Optional[bool] = None,
+        max_local_keys: Optional[int] = None,
+        retry_redis_after: float = 30.0
+    ):
+        self.use_redis = settings.RATE_LIMIT_REDIS_ENABLED if use_redis is None else use_redis
+        self.local_buckets = LRUCache(max_local_keys or settings.RATE_LIMIT_LOCAL_MAX_KEYS)
+        self.retry_redis_after = retry_redis_after
+        self._script = None
+        self._redis_down_until = 0.0
+
+    async def _get_script(self):
+        if not self.use_redis or time.monotonic() < self._redis_down_until:
+            return None
+        if self._script is None:
+            from .dependencies import get_redis
+            redis = await get_redis()
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    def _take_local(self, key: str, capacity: float, rate: float, cost: float):
+        now = time.time()
+        tokens, ts = self.local_buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+
+        allowed = tokens >= cost
+        retry_after = 0.0
+        if allowed:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / rate
+        self.local_buckets.set(key, (tokens, now))
+        return allowed, tokens, retry_after
+
+    async def hit(self, key: str, limit: int, window: float, cost: float = 1.0) -> RateLimitResult:
+        """
+        Take ``cost`` tokens from the bucket for ``key``.
+
+        Args:
+            key: Bucket identity, e.g. ``user:<id>`` or ``ip:<address>``
+            limit: Bucket capacity; also the sustained tokens per window
+            window: Seconds to refill an empty bucket
+            cost: Tokens this request consumes
+
+        Returns:
+            The decision with remaining tokens and timing hints
+        """
+        capacity = float(limit)
+        rate = capacity / window
+        cost = min(float(cost), capacity)
+
+        outcome = None
+        try:
+            script = await self._get_script()
+            if script is not None:
+                allowed, tokens, retry_after = await script(
+                    keys=[KEY_PREFIX + key], args=[capacity, rate, cost]
+                )
+                outcome = bool(int(allowed)), float(tokens), float(retry_after)
+        except Exception as e:
+            logger.warning(
+                f"Rate limiter falling back to in-process buckets for "
+                f"{self.retry_redis_after:.0f}s: {e}"
+            )
+            self._script = None
+            self._redis_down_until = time.monotonic() + self.retry_redis_after
+
+        if outcome is None:
+            outcome = self._take_local(key, capacity, rate, cost)
+
+        allowed, tokens, retry_after = outcome
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=int(tokens),
+            retry_after=retry_after,
+            reset_after=(capacity - tokens) / rate
+        )
+
+
+def route_cost(endpoint_name: Optional[str]) -> float:
+    """Tokens a request to the named endpoint consumes."""
+    if endpoint_name is None:
+        return 1.0
+    return settings.RATE_LIMIT_COSTS.get(endpoint_name, 1.0)
+
+
+rate_limiter = RateLimiter()
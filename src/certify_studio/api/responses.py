@@ -0,0 +1,237 @@
+"""
+File responses with HTTP conditional and range request support.
+
+Exports are served straight from disk. ``RangeFileResponse`` answers
+If-None-Match / If-Modified-Since with 304, honours single and multiple
+byte ranges (206, ``multipart/byteranges``) and hands the bytes to the
+server with the ``http.response.zerocopysend`` ASGI extension when it is
+available, so the kernel's sendfile does the copy.
+"""
+
+import os
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, Mapping, Optional, Tuple
+from uuid import uuid4
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+
+ByteRange = Tuple[int, int]  # inclusive start, exclusive end
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when no requested range overlaps the file."""
+
+
+def make_etag(stat_result: os.stat_result) -> str:
+    """Strong validator derived from modification time and size."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def parse_range_header(header: str, size: int) -> Optional[List[ByteRange]]:
+    """
+    Parse a ``Range`` header into sorted, merged byte ranges.
+
+    Returns:
+        None when the header is malformed or not in bytes (the caller then
+        serves the full file), otherwise a non-empty list of ranges
+
+    Raises:
+        RangeNotSatisfiable: If the header is valid but selects no bytes
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges = []
+    for part in spec.split(","):
+        start_text, dash, end_text = part.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if start_text == "":
+                # Suffix range: the last N bytes
+                suffix = int(end_text)
+                if suffix < 0:
+                    return None
+                if suffix == 0:
+                    continue
+                start, end = max(size - suffix, 0), size
+            else:
+                start = int(start_text)
+                if start < 0:
+                    return None
+                if end_text:
+                    end = int(end_text) + 1
+                    if end <= start:
+                        return None
+                    end = min(end, size)
+                else:
+                    end = size
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class RangeFileResponse(Response):
+    """Serve a file with ETag/Last-Modified validation and byte ranges."""
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: os.PathLike,
+        request_headers: Headers,
+        media_type: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        method: str = "GET",
+    ):
+        self.path = os.fspath(path)
+        self.media_type = media_type or "application/octet-stream"
+        self.send_body = method != "HEAD"
+        self.background = None
+        self.body = b""
+        self.ranges: List[ByteRange] = []
+        self.boundary: Optional[str] = None
+        self.part_headers: List[bytes] = []
+
+        stat_result = os.stat(self.path)
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise RuntimeError(f"File at path {self.path} is not a file.")
+        self.file_size = stat_result.st_size
+
+        etag = make_etag(stat_result)
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        self.status_code = 200
+        self.init_headers(headers)
+        self.headers.setdefault("accept-ranges", "bytes")
+        self.headers["etag"] = etag
+        self.headers["last-modified"] = last_modified
+
+        if self._not_modified(request_headers, etag, stat_result.st_mtime):
+            self.status_code = 304
+            self.send_body = False
+            del self.headers["content-length"]
+            del self.headers["content-type"]
+            return
+
+        range_header = request_headers.get("range")
+        if range_header and self._if_range_matches(request_headers, etag, last_modified):
+            try:
+                ranges = parse_range_header(range_header, self.file_size)
+            except RangeNotSatisfiable:
+                self.status_code = 416
+                self.send_body = False
+                self.headers["content-range"] = f"bytes */{self.file_size}"
+                self.headers["content-length"] = "0"
+                return
+            if ranges is not None:
+                self.status_code = 206
+                self.ranges = ranges
+
+        if not self.ranges:
+            self.ranges = [(0, self.file_size)]
+            self.headers["content-length"] = str(self.file_size)
+        elif len(self.ranges) == 1:
+            start, end = self.ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{self.file_size}"
+            self.headers["content-length"] = str(end - start)
+        else:
+            self._prepare_multipart()
+
+    @staticmethod
+    def _not_modified(request_headers: Headers, etag: str, mtime: float) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _if_range_matches(request_headers: Headers, etag: str, last_modified: str) -> bool:
+        if_range = request_headers.get("if-range")
+        return if_range is None or if_range in (etag, last_modified)
+
+    def _prepare_multipart(self):
+        self.boundary = uuid4().hex
+        content_type = self.media_type
+        self.part_headers = [
+            (
+                f"--{self.boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{self.file_size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in self.ranges
+        ]
+        trailer_length = len(f"\r\n--{self.boundary}--\r\n")
+        body_length = sum(end - start for start, end in self.ranges)
+        separators = 2 * (len(self.ranges) - 1)  # CRLF between parts
+        length = sum(map(len, self.part_headers)) + body_length + separators + trailer_length
+        self.headers["content-type"] = f"multipart/byteranges; boundary={self.boundary}"
+        self.headers["content-length"] = str(length)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if not self.send_body:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        zero_copy = "http.response.zerocopysend" in scope.get("extensions", {})
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for index, (start, end) in enumerate(self.ranges):
+                if self.boundary is not None:
+                    prefix = b"\r\n" if index else b""
+                    await send({
+                        "type": "http.response.body",
+                        "body": prefix + self.part_headers[index],
+                        "more_body": True,
+                    })
+                if zero_copy:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": file.wrapped.fileno(),
+                        "offset": start,
+                        "count": end - start,
+                        "more_body": True,
+                    })
+                else:
+                    await file.seek(start)
+                    remaining = end - start
+                    while remaining > 0:
+                        chunk = await file.read(min(self.chunk_size, remaining))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        trailer = f"\r\n--{self.boundary}--\r\n".encode("latin-1") if self.boundary else b""
+        await send({"type": "http.response.body", "body": trailer, "more_body": False})
@@ -7,7 +7,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
@@ -20,7 +20,11 @@ from ..dependencies import (
     create_access_token,
     create_refresh_token,
     get_current_user,
-    get_request_id
+    get_request_id,
+    decode_access_token,
+    principal_cache,
+    security,
+    PrincipalCache
 )
 from ..schemas import (
     User,
@@ -73,7 +77,7 @@ async def register(
         #     )
         
         # Create user
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash(password)
         user_id = UUID()
         
         # user = User(
@@ -146,7 +150,7 @@ async def login(
             updated_at=datetime.utcnow()
         )
         
-        # if not user or not verify_password(form_data.password, user.hashed_password):
+        # if not user or not await verify_password(form_data.password, user.hashed_password):
         #     raise HTTPException(
         #         status_code=status.HTTP_401_UNAUTHORIZED,
         #         detail="Incorrect email or password",
@@ -290,14 +294,18 @@ async def refresh_token(
     description="Invalidate user session"
 )
 async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: User = Depends(get_current_user),
     request_id: str = Depends(get_request_id)
 ) -> BaseResponse:
     """Logout user."""
-    # In a real implementation, you would:
-    # 1. Add the token to a blacklist
-    # 2. Clear any session data
-    # 3. Log the logout event
+    # Revoke the token so cached and future lookups reject it
+    payload = decode_access_token(credentials.credentials)
+    await principal_cache.revoke(
+        PrincipalCache.token_key(credentials.credentials, payload),
+        current_user.id,
+        payload.get("exp")
+    )
     
     logger.info(f"User {current_user.id} logged out")
     
@@ -333,6 +341,7 @@ async def verify_email(
         #     )
         # )
         # await db.commit()
+        # await principal_cache.invalidate_user(user_id)
         
         return BaseResponse(
             status=StatusEnum.SUCCESS,
@@ -410,7 +419,7 @@ async def reset_password(
         # user_id = decode_reset_token(token)
         
         # Update password
-        # hashed_password = get_password_hash(new_password)
+        # hashed_password = await get_password_hash(new_password)
         # await db.execute(
         #     update(User).where(User.id == user_id).values(
         #         hashed_password=hashed_password,
@@ -418,6 +427,7 @@ async def reset_password(
         #     )
         # )
         # await db.commit()
+        # await principal_cache.invalidate_user(user_id)
         
         return BaseResponse(
             status=StatusEnum.SUCCESS,
@@ -477,6 +487,9 @@ async def update_me(
             current_user.full_name = full_name
             current_user.updated_at = datetime.utcnow()
             
+            # Cached principals still hold the old profile
+            await principal_cache.invalidate_user(current_user.id)
+            
         return current_user
         
     except Exception as e:
@@ -11,9 +11,8 @@ from pathlib import Path
 
 from fastapi import (
     APIRouter, Depends, HTTPException, status,
-    BackgroundTasks, Response
+    BackgroundTasks, Request, Response
 )
-from fastapi.responses import FileResponse, StreamingResponse
 
 from ...core.logging import get_logger
 from ...agents.specialized.content_generation import ContentGenerationAgent
@@ -34,6 +33,7 @@ from ..schemas import (
     ExportOptions,
     BaseResponse
 )
+from ..responses import RangeFileResponse
 
 logger = get_logger(__name__)
 
@@ -259,6 +259,7 @@ async def get_export_status(
 )
 async def download_export(
     task_id: UUID,
+    request: Request,
     current_user: User = Depends(get_current_verified_user)
 ):
     """Download exported content."""
@@ -317,10 +318,12 @@ async def download_export(
     # Generate filename
     filename = f"export_{task_id}{file_path.suffix}"
     
-    return FileResponse(
+    # ETag/Last-Modified let clients and CDNs revalidate without a re-download
+    return RangeFileResponse(
         path=file_path,
+        request_headers=request.headers,
         media_type=content_type,
-        filename=filename,
+        method=request.method,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
             "Cache-Control": "no-cache"
@@ -335,8 +338,8 @@ async def download_export(
 )
 async def stream_export(
     task_id: UUID,
-    current_user: User = Depends(get_current_verified_user),
-    range: Optional[str] = None
+    request: Request,
+    current_user: User = Depends(get_current_verified_user)
 ):
     """Stream exported video content."""
     if task_id not in export_tasks:
@@ -369,17 +372,12 @@ async def stream_export(
             detail="Export file not found"
         )
     
-    file_size = file_path.stat().st_size
-    
-    # For simplicity, return the entire file
-    # In production, implement proper range request handling
-    return FileResponse(
+    # Players seek with Range requests; only the requested bytes are sent
+    return RangeFileResponse(
         path=file_path,
+        request_headers=request.headers,
         media_type="video/mp4" if task["format"] == OutputFormat.VIDEO_MP4 else "video/webm",
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Length": str(file_size)
-        }
+        method=request.method
     )
 
 
@@ -3,23 +3,28 @@ Content generation router - handles educational content generation requests.
 """
 
 import asyncio
+import shutil
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter, Depends, HTTPException, status, 
-    UploadFile, File, BackgroundTasks, WebSocket, WebSocketDisconnect
+    UploadFile, File, BackgroundTasks, WebSocket, WebSocketDisconnect, Header, Request
 )
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.config import settings
 from ...core.logging import get_logger
 from ...agents.multimodal_orchestrator import MultimodalOrchestrator, GenerationConfig, GenerationPhase
 from ...agents.specialized.pedagogical import PedagogicalReasoningAgent
 from ...agents.specialized.content_generation import ContentGenerationAgent
 from ...agents.specialized.domain_extraction import DomainExtractionAgent
 from ...agents.specialized.quality_assurance import QualityAssuranceAgent
+from ...manim_integration.scene_generator import ManimSceneGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..dependencies import (
     get_current_verified_user,
@@ -35,8 +40,13 @@ from ..schemas import (
     StatusEnum,
     ProgressUpdate,
     ErrorResponse,
-    GenerationMetrics
+    GenerationMetrics,
+    PreviewRequest,
+    PreviewResponse,
+    QualityLevel
 )
+from ..progress import ProgressBroker
+from ..responses import RangeFileResponse
 
 logger = get_logger(__name__)
 
@@ -57,6 +67,28 @@ orchestrator = MultimodalOrchestrator()
 # Active generation tasks
 active_tasks: Dict[UUID, Dict[str, Any]] = {}
 
+# Progress notifications for SSE and WebSocket subscribers
+progress_broker = ProgressBroker([phase.value for phase in GenerationPhase])
+
+TERMINAL_STATUSES = (StatusEnum.COMPLETED, StatusEnum.FAILED)
+
+
+def publish_progress(task_id: UUID) -> None:
+    """Notify subscribers of the task's current state."""
+    task = active_tasks[task_id]
+    task_status = StatusEnum(task["status"])
+    data = {
+        "task_id": str(task_id),
+        "phase": task.get("phase") or "unknown",
+        "progress": task["progress"],
+        "status": task_status.value
+    }
+    if task_status in TERMINAL_STATUSES:
+        data["error"] = task.get("error")
+        progress_broker.publish(task_id, "complete", data, owner=task["user_id"])
+    else:
+        progress_broker.publish(task_id, "progress", data, owner=task["user_id"])
+
 
 @router.post(
     "/generate",
@@ -160,11 +192,13 @@ async def run_generation(
         # Update task status
         active_tasks[task_id]["status"] = StatusEnum.PROCESSING
         active_tasks[task_id]["phase"] = GenerationPhase.EXTRACTION.value
+        publish_progress(task_id)
         
         # Progress callback
         def progress_callback(phase: GenerationPhase, progress: float):
             active_tasks[task_id]["phase"] = phase.value
             active_tasks[task_id]["progress"] = progress
+            publish_progress(task_id)
         
         # Run generation
         result = await orchestrator.generate_educational_content(
@@ -214,6 +248,8 @@ async def run_generation(
             "status": StatusEnum.FAILED,
             "error": str(e)
         })
+    
+    publish_progress(task_id)
 
 
 @router.get(
@@ -288,8 +324,8 @@ async def upload_content(
 ) -> Dict[str, Any]:
     """Upload content file."""
     try:
-        # Process upload
-        result = await upload_handler(file)
+        # The validator dependency has already streamed the file to disk
+        result = upload_handler
         
         # Store upload info in database
         # await db.execute(
@@ -310,7 +346,9 @@ async def upload_content(
             "message": "File uploaded successfully",
             "upload_id": result["upload_id"],
             "filename": result["filename"],
-            "size": result["size"]
+            "size": result["size"],
+            "content_hash": result["content_hash"],
+            "duplicate": result["duplicate"]
         }
         
     except HTTPException:
@@ -330,54 +368,55 @@ async def upload_content(
 )
 async def stream_progress(
     task_id: UUID,
-    current_user: User = Depends(get_current_verified_user)
+    current_user: User = Depends(get_current_verified_user),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
 ):
     """Stream progress updates using Server-Sent Events."""
-    if task_id not in active_tasks:
+    # Tasks run by other API processes are known here through the progress relay
+    task = active_tasks.get(task_id)
+    owner = task["user_id"] if task is not None else progress_broker.owner(task_id)
+    if owner is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
-    task = active_tasks[task_id]
-    
     # Check ownership
-    if task["user_id"] != current_user.id:
+    if str(owner) != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
     
+    try:
+        resume_from = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        resume_from = 0
+    
     async def event_generator():
-        """Generate SSE events."""
-        last_progress = -1
+        """Generate SSE events as the task publishes them."""
+        # Finished tasks whose channel has expired only need their final state
+        if str(task_id) not in progress_broker.channels:
+            if task is None:
+                return
+            publish_progress(task_id)
         
-        while True:
-            if task_id not in active_tasks:
-                break
-                
-            task = active_tasks[task_id]
+        async for event in progress_broker.subscribe(task_id, resume_from):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
             
-            # Send update if progress changed
-            if task["progress"] != last_progress:
-                last_progress = task["progress"]
-                
+            if event.event == "progress":
                 update = ProgressUpdate(
                     task_id=task_id,
-                    phase=task.get("phase", "unknown"),
-                    progress=task["progress"],
-                    message=f"Processing: {task.get('phase', 'unknown')}",
-                    eta_seconds=None  # Could calculate ETA
+                    phase=event.data["phase"],
+                    progress=event.data["progress"],
+                    message=f"Processing: {event.data['phase']}",
+                    eta_seconds=event.data.get("eta_seconds")
                 )
-                
-                yield f"data: {update.model_dump_json()}\n\n"
-            
-            # Check if completed
-            if task["status"] in [StatusEnum.COMPLETED, StatusEnum.FAILED]:
-                yield f"data: {{'event': 'complete', 'status': '{task['status']}'}}\n\n"
-                break
-            
-            await asyncio.sleep(1)
+                yield f"id: {event.id}\nevent: progress\ndata: {update.model_dump_json()}\n\n"
+            else:
+                yield event.to_sse()
     
     return StreamingResponse(
         event_generator(),
@@ -421,42 +460,28 @@ async def websocket_progress(
         # For now, skip ownership check on WebSocket
         # In production, implement proper auth
         
-        # Send updates
-        last_progress = -1
+        # Send updates as they are published
+        if str(task_id) not in progress_broker.channels:
+            publish_progress(task_id)
         
-        while True:
-            if task_id not in active_tasks:
-                break
-            
-            task = active_tasks[task_id]
+        async for event in progress_broker.subscribe(task_id):
+            if event is None:
+                continue
             
-            # Send update if progress changed
-            if task["progress"] != last_progress:
-                last_progress = task["progress"]
-                
+            if event.event == "progress":
                 await websocket.send_json({
                     "type": "progress",
-                    "data": {
-                        "task_id": str(task_id),
-                        "phase": task.get("phase", "unknown"),
-                        "progress": task["progress"],
-                        "status": task["status"]
-                    }
+                    "data": event.data
                 })
-            
-            # Check if completed
-            if task["status"] in [StatusEnum.COMPLETED, StatusEnum.FAILED]:
+            else:
                 await websocket.send_json({
                     "type": "complete",
                     "data": {
                         "task_id": str(task_id),
-                        "status": task["status"],
-                        "message": "Generation complete" if task["status"] == StatusEnum.COMPLETED else "Generation failed"
+                        "status": event.data["status"],
+                        "message": "Generation complete" if event.data["status"] == StatusEnum.COMPLETED.value else "Generation failed"
                     }
                 })
-                break
-            
-            await asyncio.sleep(1)
             
     except WebSocketDisconnect:
         pass
@@ -501,9 +526,221 @@ async def cancel_generation(
     # Cancel task
     task["status"] = StatusEnum.FAILED
     task["error"] = "Cancelled by user"
+    publish_progress(task_id)
     
     return {
         "status": "success",
         "message": "Generation cancelled"
     }
 
+
+
+# Scene previews: fast proxies for reviewers, full render queued behind them
+preview_tasks: Dict[UUID, Dict[str, Any]] = {}
+scene_generator = ManimSceneGenerator()
+
+PREVIEW_DIR = Path(settings.TEMP_DIR) / "previews"
+
+FULL_RENDER_QUALITY = {
+    QualityLevel.BASIC: "medium_quality",
+    QualityLevel.STANDARD: "high_quality",
+    QualityLevel.PREMIUM: "production_quality",
+    QualityLevel.ENTERPRISE: "fourk_quality"
+}
+
+
+def expire_preview_later(preview_id: UUID) -> None:
+    """Delete the preview and its files once its TTL has passed."""
+    preview_tasks[preview_id]["expires_at"] = time.monotonic() + settings.PREVIEW_TTL_SECONDS
+    asyncio.get_running_loop().call_later(
+        settings.PREVIEW_TTL_SECONDS, expire_preview, preview_id
+    )
+
+
+def expire_preview(preview_id: UUID) -> None:
+    task = preview_tasks.get(preview_id)
+    if task is None:
+        return
+    remaining = task["expires_at"] - time.monotonic()
+    if remaining > 0 or task.get("full_status") in (StatusEnum.PENDING, StatusEnum.PROCESSING):
+        # Touched since, or its full render is still writing files: check again later
+        delay = remaining if remaining > 0 else settings.PREVIEW_TTL_SECONDS
+        asyncio.get_running_loop().call_later(delay, expire_preview, preview_id)
+        return
+    del preview_tasks[preview_id]
+    asyncio.get_running_loop().run_in_executor(
+        None, shutil.rmtree, PREVIEW_DIR / str(preview_id), True
+    )
+
+
+def remove_stale_preview_dirs() -> None:
+    """Remove preview directories no live preview owns, e.g. left by a restart."""
+    if not PREVIEW_DIR.exists():
+        return
+    cutoff = time.time() - settings.PREVIEW_TTL_SECONDS
+    for directory in PREVIEW_DIR.iterdir():
+        try:
+            if UUID(directory.name) in preview_tasks:
+                continue
+            # Another process may still be rendering into it
+            modified = max(
+                (path.stat().st_mtime for path in directory.rglob("*")),
+                default=directory.stat().st_mtime
+            )
+            if modified < cutoff:
+                shutil.rmtree(directory, ignore_errors=True)
+        except (ValueError, OSError):
+            continue
+
+
+def build_preview_response(preview_id: UUID, task: Dict[str, Any], request_id: str) -> PreviewResponse:
+    """Preview response with file URLs for the task's current state."""
+    base = f"/api/generation/preview/{preview_id}/files"
+    return PreviewResponse(
+        status=StatusEnum.SUCCESS,
+        message="Preview ready",
+        request_id=UUID(request_id),
+        preview_id=preview_id,
+        video_url=f"{base}/{task['video'].name}",
+        thumbnail_urls=[f"{base}/{path.name}" for path in task["thumbnails"]],
+        keyframes=task["keyframes"],
+        full_render_status=task.get("full_status"),
+        full_render_url=f"{base}/full.mp4" if task.get("full_status") == StatusEnum.COMPLETED else None
+    )
+
+
+async def run_full_render(preview_id: UUID, scene: Dict[str, Any], quality: str) -> None:
+    """Render the full-quality version of a previewed scene."""
+    task = preview_tasks[preview_id]
+    task["full_status"] = StatusEnum.PROCESSING
+    try:
+        rendered = await scene_generator.render_scenes(
+            [scene], PREVIEW_DIR / str(preview_id) / "full", quality=quality
+        )
+        if not rendered:
+            raise RuntimeError("Full render failed")
+        task["files"]["full.mp4"] = rendered[0]
+        task["full_status"] = StatusEnum.COMPLETED
+    except Exception as e:
+        logger.error(f"Full render error for preview {preview_id}: {e}")
+        task["full_status"] = StatusEnum.FAILED
+    finally:
+        # The full render is only downloadable for the TTL after it finishes
+        task["expires_at"] = time.monotonic() + settings.PREVIEW_TTL_SECONDS
+
+
+@router.post(
+    "/preview",
+    response_model=PreviewResponse,
+    summary="Preview a scene",
+    description="Render a low-resolution proxy and keyframe thumbnails of one scene "
+                "and queue its full-quality render"
+)
+async def create_preview(
+    request: PreviewRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_verified_user),
+    request_id: str = Depends(get_request_id)
+) -> PreviewResponse:
+    """Render a scene preview."""
+    preview_id = uuid4()
+    try:
+        preview = await scene_generator.render_preview(
+            request.scene,
+            PREVIEW_DIR / str(preview_id),
+            thumbnails=request.thumbnails
+        )
+    except Exception as e:
+        logger.error(f"Preview render error: {e}")
+        await asyncio.to_thread(shutil.rmtree, PREVIEW_DIR / str(preview_id), True)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Scene could not be rendered"
+        )
+    
+    task = {
+        "user_id": current_user.id,
+        "created_at": datetime.utcnow(),
+        "video": preview["video"],
+        "thumbnails": preview["thumbnails"],
+        "keyframes": preview["keyframes"],
+        "files": {path.name: path for path in [preview["video"], *preview["thumbnails"]]}
+    }
+    preview_tasks[preview_id] = task
+    expire_preview_later(preview_id)
+    background_tasks.add_task(remove_stale_preview_dirs)
+    
+    if request.queue_full_render:
+        task["full_status"] = StatusEnum.PENDING
+        background_tasks.add_task(
+            run_full_render,
+            preview_id,
+            request.scene,
+            FULL_RENDER_QUALITY[request.quality_level]
+        )
+    
+    return build_preview_response(preview_id, task, request_id)
+
+
+def get_owned_preview(preview_id: UUID, current_user: User) -> Dict[str, Any]:
+    """Look up a preview and check it belongs to the user."""
+    if preview_id not in preview_tasks:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview not found"
+        )
+    
+    task = preview_tasks[preview_id]
+    if task["user_id"] != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    return task
+
+
+@router.get(
+    "/preview/{preview_id}",
+    response_model=PreviewResponse,
+    summary="Get preview status",
+    description="Get preview files and the status of the queued full-quality render"
+)
+async def get_preview(
+    preview_id: UUID,
+    current_user: User = Depends(get_current_verified_user),
+    request_id: str = Depends(get_request_id)
+) -> PreviewResponse:
+    """Get preview status."""
+    task = get_owned_preview(preview_id, current_user)
+    return build_preview_response(preview_id, task, request_id)
+
+
+@router.get(
+    "/preview/{preview_id}/files/{filename}",
+    summary="Download preview file",
+    description="Download a preview proxy, thumbnail or the finished full render"
+)
+async def get_preview_file(
+    preview_id: UUID,
+    filename: str,
+    request: Request,
+    current_user: User = Depends(get_current_verified_user)
+):
+    """Serve a preview file."""
+    task = get_owned_preview(preview_id, current_user)
+    
+    # Only files the preview produced can be served
+    file_path = task["files"].get(filename)
+    if file_path is None or not file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview file not found"
+        )
+    
+    return RangeFileResponse(
+        path=file_path,
+        request_headers=request.headers,
+        media_type="image/jpeg" if file_path.suffix == ".jpg" else "video/mp4",
+        method=request.method,
+        headers={"Cache-Control": "private, max-age=3600"}
+    )
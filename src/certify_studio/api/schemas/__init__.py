@@ -33,7 +33,8 @@ from .requests import (
     BatchGenerationRequest,
     AnalyticsRequest,
     UserPreferences,
-    ContentSearchRequest
+    ContentSearchRequest,
+    PreviewRequest
 )
 
 from .responses import (
@@ -50,7 +51,8 @@ from .responses import (
     BatchGenerationResponse,
     FeedbackResponse,
     SystemInfoResponse,
-    WebSocketMessage
+    WebSocketMessage,
+    PreviewResponse
 )
 
 __all__ = [
@@ -85,6 +87,7 @@ __all__ = [
     "AnalyticsRequest",
     "UserPreferences",
     "ContentSearchRequest",
+    "PreviewRequest",
     
     # Responses
     "BaseResponse",
@@ -100,5 +103,6 @@ __all__ = [
     "BatchGenerationResponse",
     "FeedbackResponse",
     "SystemInfoResponse",
-    "WebSocketMessage"
+    "WebSocketMessage",
+    "PreviewResponse"
 ]
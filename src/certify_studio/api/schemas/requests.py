@@ -120,6 +120,16 @@ class ExportRequest(BaseModel):
     email_notification: Optional[str] = Field(None, description="Email for notification")
 
 
+class PreviewRequest(BaseModel):
+    """Request a fast preview render of a single scene."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    scene: Dict[str, Any] = Field(..., description="Scene specification as produced by the animation agent")
+    thumbnails: bool = Field(True, description="Also extract stills at the scene's keyframes")
+    queue_full_render: bool = Field(True, description="Queue the full-quality render in the background")
+    quality_level: QualityLevel = Field(QualityLevel.STANDARD, description="Quality of the full render")
+
+
 class FeedbackSubmission(BaseModel):
     """User feedback submission."""
     model_config = ConfigDict(from_attributes=True)
@@ -221,6 +221,20 @@ class BatchGenerationResponse(BaseResponse):
     estimated_completion: Optional[datetime] = Field(None, description="Estimated completion time")
 
 
+class PreviewResponse(BaseResponse):
+    """Response for scene preview requests."""
+    model_config = ConfigDict(from_attributes=True)
+    
+    preview_id: UUID = Field(..., description="Preview ID")
+    video_url: str = Field(..., description="Low-resolution proxy video URL")
+    thumbnail_urls: List[str] = Field(default_factory=list, description="Keyframe thumbnail URLs")
+    keyframes: List[float] = Field(default_factory=list, description="Thumbnail timestamps in seconds")
+    
+    # Full-quality render queued behind the preview
+    full_render_status: Optional[StatusEnum] = Field(None, description="Full render status")
+    full_render_url: Optional[str] = Field(None, description="Full-quality video URL when ready")
+
+
 class FeedbackResponse(BaseResponse):
     """Response for feedback submission."""
     model_config = ConfigDict(from_attributes=True)
@@ -11,6 +11,7 @@ from typing import Optional
 
 from ....database.connection import get_db, database_manager
 from ....config import settings
+from ....ml.model_registry import model_registry
 
 router = APIRouter()
 
@@ -59,3 +60,12 @@ async def liveness_check():
     Simple check that the application is running.
     """
     return {"status": "alive"}
+
+
+@router.get("/models")
+async def model_status():
+    """
+    Shared ML model status: which models are loaded, how long each took
+    to load, the memory it added and how recently it was used.
+    """
+    return model_registry.metrics()
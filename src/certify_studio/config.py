@@ -92,6 +92,7 @@ class Settings(BaseSettings):
     TEMP_DIR: str = Field(default="./temp", env="TEMP_DIR")
     VIDEO_OUTPUT_DIR: str = Field(default="./exports/videos", env="VIDEO_OUTPUT_DIR")
     MAX_UPLOAD_SIZE: int = Field(default=100 * 1024 * 1024, env="MAX_UPLOAD_SIZE")  # 100MB
+    UPLOAD_CHUNK_SIZE: int = Field(default=1024 * 1024, env="UPLOAD_CHUNK_SIZE")  # 1MB
     
     # S3 Configuration
     S3_BUCKET_NAME: Optional[str] = Field(default=None, env="S3_BUCKET_NAME")
@@ -111,6 +112,14 @@ class Settings(BaseSettings):
     MANIM_QUALITY: str = Field(default="high", env="MANIM_QUALITY")  # low, medium, high, production
     MANIM_FPS: int = Field(default=30, env="MANIM_FPS")
     MANIM_RESOLUTION: str = Field(default="1920x1080", env="MANIM_RESOLUTION")
+    RENDER_WORKERS: int = Field(default=0, env="RENDER_WORKERS")  # 0 = one per CPU
+    RENDER_SCENE_TIMEOUT_SECONDS: int = Field(default=900, env="RENDER_SCENE_TIMEOUT_SECONDS")
+    RENDER_CACHE_ENABLED: bool = Field(default=True, env="RENDER_CACHE_ENABLED")
+    RENDER_CACHE_DIR: str = Field(default="/tmp/certify_studio/render_cache", env="RENDER_CACHE_DIR")
+    RENDER_CACHE_MAX_BYTES: int = Field(default=10 * 1024 ** 3, env="RENDER_CACHE_MAX_BYTES")
+    PREVIEW_RESOLUTION: str = Field(default="854x480", env="PREVIEW_RESOLUTION")
+    PREVIEW_FPS: int = Field(default=15, env="PREVIEW_FPS")
+    PREVIEW_TTL_SECONDS: int = Field(default=3600, env="PREVIEW_TTL_SECONDS")
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
@@ -125,6 +134,24 @@ class Settings(BaseSettings):
         },
         env="RATE_LIMITS"
     )
+    RATE_LIMIT_PLAN_WINDOW: int = Field(default=3600, env="RATE_LIMIT_PLAN_WINDOW")  # seconds
+    RATE_LIMIT_REDIS_ENABLED: bool = Field(default=True, env="RATE_LIMIT_REDIS_ENABLED")
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = Field(default=100000, env="RATE_LIMIT_LOCAL_MAX_KEYS")
+    # Tokens consumed per request, by endpoint function name (default 1)
+    RATE_LIMIT_COSTS: Dict[str, float] = Field(
+        default={
+            "generate_content": 20,
+            "extract_domain_knowledge": 10,
+            "check_quality": 10,
+            "export_content": 5,
+            "upload_content": 5,
+            "get_generation_status": 0.25,
+            "get_export_status": 0.25,
+            "stream_progress": 0.25,
+            "create_preview": 5
+        },
+        env="RATE_LIMIT_COSTS"
+    )
     
     # WebSocket Configuration
     WS_MAX_CONNECTIONS: int = Field(default=1000, env="WS_MAX_CONNECTIONS")
@@ -145,6 +172,39 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_GENERATIONS: int = Field(default=5, env="MAX_CONCURRENT_GENERATIONS")
     GENERATION_TIMEOUT: int = Field(default=1800, env="GENERATION_TIMEOUT")  # 30 minutes
     QUALITY_CHECK_ENABLED: bool = Field(default=True, env="QUALITY_CHECK_ENABLED")
+    QA_VALIDATOR_TIMEOUT_SECONDS: float = Field(default=120.0, env="QA_VALIDATOR_TIMEOUT_SECONDS")
+    QA_CODE_WORKERS: int = Field(default=0, env="QA_CODE_WORKERS")  # 0 = one per CPU
+    QA_CODE_BLOCK_TIMEOUT_SECONDS: float = Field(default=10.0, env="QA_CODE_BLOCK_TIMEOUT_SECONDS")
+    QA_CODE_WORKER_MEMORY_MB: int = Field(default=512, env="QA_CODE_WORKER_MEMORY_MB")  # 0 disables
+    QA_MONITOR_MAX_CONCURRENT_CHECKS: int = Field(default=100, env="QA_MONITOR_MAX_CONCURRENT_CHECKS")
+    
+    # Model Registry Settings
+    MODEL_PREWARM: List[str] = Field(default=[], env="MODEL_PREWARM")
+    MODEL_IDLE_UNLOAD_SECONDS: int = Field(default=0, env="MODEL_IDLE_UNLOAD_SECONDS")  # 0 disables
+    MODEL_MAX_RSS_MB: int = Field(default=0, env="MODEL_MAX_RSS_MB")  # 0 disables
+    
+    # Embedding Settings
+    EMBEDDING_BATCH_SIZE: int = Field(default=64, env="EMBEDDING_BATCH_SIZE")
+    EMBEDDING_CACHE_ENABLED: bool = Field(default=True, env="EMBEDDING_CACHE_ENABLED")
+    EMBEDDING_CACHE_DIR: str = Field(default="./cache/embeddings", env="EMBEDDING_CACHE_DIR")
+    EMBEDDING_CACHE_MAX_BYTES: int = Field(default=2 * 1024 ** 3, env="EMBEDDING_CACHE_MAX_BYTES")
+    
+    # NLP Settings
+    NLP_PARSE_CACHE_SIZE: int = Field(default=256, env="NLP_PARSE_CACHE_SIZE")
+    NLP_BATCH_PROCESSES: int = Field(default=1, env="NLP_BATCH_PROCESSES")
+    NLP_BATCH_SIZE: int = Field(default=16, env="NLP_BATCH_SIZE")
+    
+    # Authentication Cache Settings
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = Field(default=30.0, env="AUTH_PRINCIPAL_CACHE_TTL_SECONDS")
+    AUTH_PRINCIPAL_CACHE_SIZE: int = Field(default=10000, env="AUTH_PRINCIPAL_CACHE_SIZE")
+    AUTH_PRINCIPAL_CACHE_REDIS: bool = Field(default=False, env="AUTH_PRINCIPAL_CACHE_REDIS")
+    AUTH_HASH_WORKERS: int = Field(default=4, env="AUTH_HASH_WORKERS")
+    
+    # Progress Streaming Settings
+    SSE_HEARTBEAT_SECONDS: float = Field(default=15.0, env="SSE_HEARTBEAT_SECONDS")
+    PROGRESS_HISTORY_SIZE: int = Field(default=256, env="PROGRESS_HISTORY_SIZE")
+    PROGRESS_RETENTION_SECONDS: float = Field(default=300.0, env="PROGRESS_RETENTION_SECONDS")
+    PROGRESS_PUBSUB_ENABLED: bool = Field(default=False, env="PROGRESS_PUBSUB_ENABLED")
     
     # Export Settings
     EXPORT_FORMATS: List[str] = Field(
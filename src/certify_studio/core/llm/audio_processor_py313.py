@@ -21,12 +21,6 @@ import numpy as np
 import soundfile as sf
 import torch
 import torchaudio
-from transformers import (
-    WhisperProcessor,
-    WhisperForConditionalGeneration,
-    Wav2Vec2Processor,
-    Wav2Vec2ForCTC
-)
 
 # Try to import librosa, but make it optional for Python 3.13
 try:
@@ -47,6 +41,7 @@ from ...core.logging import get_logger
 from ...core.config import settings
 from ...knowledge.graph import KnowledgeGraph
 from ...ml.embeddings import EmbeddingGenerator
+from ...ml.model_registry import model_registry
 
 logger = get_logger(__name__)
 
@@ -140,9 +135,6 @@ class AudioProcessor:
         self.knowledge_graph = knowledge_graph
         self.embedding_generator = EmbeddingGenerator()
         
-        # Initialize models
-        self._initialize_models()
-        
         # Audio patterns learned over time
         self.audio_patterns = {
             'effective_pacing': [],
@@ -162,36 +154,31 @@ class AudioProcessor:
         
         logger.info("AudioProcessor initialized with Python 3.13 compatibility")
     
-    def _initialize_models(self):
-        """Initialize AI models for audio understanding."""
-        try:
-            # Whisper for transcription
-            self.whisper_processor = WhisperProcessor.from_pretrained(
-                "openai/whisper-base"
-            )
-            self.whisper_model = WhisperForConditionalGeneration.from_pretrained(
-                "openai/whisper-base"
-            )
-            
-            # Wav2Vec2 for acoustic analysis
-            self.wav2vec_processor = Wav2Vec2Processor.from_pretrained(
-                "facebook/wav2vec2-base-960h"
-            )
-            self.wav2vec_model = Wav2Vec2ForCTC.from_pretrained(
-                "facebook/wav2vec2-base-960h"
-            )
-            
-            # Device setup
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            self.whisper_model.to(self.device)
-            self.wav2vec_model.to(self.device)
-            
-            logger.info(f"Audio models initialized on {self.device}")
-            
-        except Exception as e:
-            logger.error(f"Error initializing audio models: {e}")
-            self.whisper_model = None
-            self.wav2vec_model = None
+    @property
+    def device(self):
+        return model_registry.device
+    
+    @property
+    def whisper_processor(self):
+        """Whisper processor for transcription (shared, lazily loaded)."""
+        whisper = model_registry.get_optional("whisper")
+        return whisper[0] if whisper else None
+    
+    @property
+    def whisper_model(self):
+        whisper = model_registry.get_optional("whisper")
+        return whisper[1] if whisper else None
+    
+    @property
+    def wav2vec_processor(self):
+        """Wav2Vec2 processor for acoustic analysis (shared, lazily loaded)."""
+        wav2vec = model_registry.get_optional("wav2vec2")
+        return wav2vec[0] if wav2vec else None
+    
+    @property
+    def wav2vec_model(self):
+        wav2vec = model_registry.get_optional("wav2vec2")
+        return wav2vec[1] if wav2vec else None
     
     def _load_audio(self, audio_path: Union[str, Path]) -> Tuple[np.ndarray, int]:
         """Load audio file with compatibility fallback."""
@@ -376,7 +363,8 @@ class AudioProcessor:
                               audio_data: np.ndarray,
                               sample_rate: int) -> str:
         """Transcribe audio using Whisper."""
-        if self.whisper_model is None:
+        # Load off the event loop; the properties below then find it in memory
+        if await model_registry.aget_optional("whisper") is None:
             return "Transcription model not available"
         
         # Resample if needed
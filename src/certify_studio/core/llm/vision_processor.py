@@ -20,19 +20,12 @@ import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import cv2
 import torch
-from transformers import (
-    AutoProcessor, 
-    AutoModelForVision2Seq,
-    BlipProcessor, 
-    BlipForConditionalGeneration,
-    LayoutLMv3Processor,
-    LayoutLMv3ForSequenceClassification
-)
 
 from ...core.logging import get_logger
 from ...core.config import settings
 from ...knowledge.graph import KnowledgeGraph
 from ...ml.embeddings import EmbeddingGenerator
+from ...ml.model_registry import model_registry
 
 logger = get_logger(__name__)
 
@@ -89,9 +82,6 @@ class VisionProcessor:
         self.knowledge_graph = knowledge_graph
         self.embedding_generator = EmbeddingGenerator()
         
-        # Initialize models
-        self._initialize_models()
-        
         # Visual understanding patterns learned over time
         self.visual_patterns = {
             'effective_diagrams': [],
@@ -104,37 +94,31 @@ class VisionProcessor:
         
         logger.info("VisionProcessor initialized with full multimodal capabilities")
     
-    def _initialize_models(self):
-        """Initialize AI models for vision understanding."""
-        try:
-            # BLIP for image captioning and understanding
-            self.blip_processor = BlipProcessor.from_pretrained(
-                "Salesforce/blip-image-captioning-large"
-            )
-            self.blip_model = BlipForConditionalGeneration.from_pretrained(
-                "Salesforce/blip-image-captioning-large"
-            )
-            
-            # LayoutLM for document understanding
-            self.layout_processor = LayoutLMv3Processor.from_pretrained(
-                "microsoft/layoutlmv3-base"
-            )
-            self.layout_model = LayoutLMv3ForSequenceClassification.from_pretrained(
-                "microsoft/layoutlmv3-base"
-            )
-            
-            # Move models to GPU if available
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            self.blip_model.to(self.device)
-            self.layout_model.to(self.device)
-            
-            logger.info(f"Vision models initialized on {self.device}")
-            
-        except Exception as e:
-            logger.error(f"Error initializing vision models: {e}")
-            # Fallback to basic processing if models fail to load
-            self.blip_model = None
-            self.layout_model = None
+    @property
+    def device(self):
+        return model_registry.device
+    
+    @property
+    def blip_processor(self):
+        """BLIP processor for image captioning (shared, lazily loaded)."""
+        blip = model_registry.get_optional("blip")
+        return blip[0] if blip else None
+    
+    @property
+    def blip_model(self):
+        blip = model_registry.get_optional("blip")
+        return blip[1] if blip else None
+    
+    @property
+    def layout_processor(self):
+        """LayoutLMv3 processor for document understanding (shared, lazily loaded)."""
+        layout = model_registry.get_optional("layoutlm")
+        return layout[0] if layout else None
+    
+    @property
+    def layout_model(self):
+        layout = model_registry.get_optional("layoutlm")
+        return layout[1] if layout else None
     
     async def process_image(self, 
                           image_path: Union[str, Path],
@@ -225,7 +209,8 @@ class VisionProcessor:
     
     async def _analyze_content(self, image: Image.Image) -> Dict[str, Any]:
         """Use BLIP to understand image content."""
-        if self.blip_model is None:
+        # Load off the event loop; the properties below then find it in memory
+        if await model_registry.aget_optional("blip") is None:
             return {"description": "Model not available", "tags": []}
         
         inputs = self.blip_processor(image, return_tensors="pt").to(self.device)
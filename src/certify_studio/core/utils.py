@@ -4,8 +4,10 @@ Common helper functions used across the platform
 """
 
 import re
+import threading
 import unicodedata
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Union
 import hashlib
 import json
 from datetime import datetime
@@ -349,6 +351,59 @@ def set_nested_value(data: Dict, path: str, value: Any) -> None:
     current[keys[-1]] = value
 
 
+class LRUCache:
+    """
+    Small thread-safe least-recently-used cache with a fixed capacity.
+    
+    Used for per-process memoisation where an unbounded dict would grow
+    with every distinct key (parsed documents, principals, icons).
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = max(1, maxsize)
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value and mark it as recently used."""
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a value."""
+        with self._lock:
+            return self._data.pop(key, default)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 # Export all utility functions
 __all__ = [
     'clean_text',
@@ -368,4 +423,5 @@ __all__ = [
     'remove_duplicates',
     'get_nested_value',
     'set_nested_value',
+    'LRUCache',
 ]
@@ -4,6 +4,7 @@ Analytics and tracking repository for Certify Studio.
 This module provides data access layer for analytics operations.
 """
 
+import math
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, date, timedelta
@@ -18,6 +19,7 @@ from ..models.analytics import (
     ABTestExperiment, EventType, MetricType
 )
 from .base_repo import BaseRepository, RepositoryError
+from ...integrations.observability.metrics import request_latency
 
 
 class AnalyticsRepository(BaseRepository[UserActivity]):
@@ -329,21 +331,43 @@ class AnalyticsRepository(BaseRepository[UserActivity]):
     async def get_endpoint_performance(
         self,
         endpoint: str,
-        hours: int = 24
+        hours: int = 24,
+        include_percentiles: bool = False
     ) -> Dict[str, Any]:
-        """Get performance statistics for an endpoint."""
+        """
+        Get performance statistics for an endpoint.
+        
+        Top-level figures cover every process and come from the
+        PerformanceMetrics table. Percentiles need an ordered-set aggregate
+        over the period, so they are only computed with
+        ``include_percentiles``; otherwise they are None.
+        
+        ``process_latency`` holds percentiles from this process's latency
+        sketches, which are cheap but only see requests this process
+        served; its ``request_count`` is the number of samples behind them.
+        """
         since = datetime.utcnow() - timedelta(hours=hours)
-        
-        result = await self.db_session.execute(
-            select(
-                func.count(PerformanceMetrics.id).label("request_count"),
-                func.avg(PerformanceMetrics.response_time_ms).label("avg_response_time"),
-                func.min(PerformanceMetrics.response_time_ms).label("min_response_time"),
-                func.max(PerformanceMetrics.response_time_ms).label("max_response_time"),
+        windows = max(1, math.ceil(hours * 3600 / request_latency.window_seconds))
+        sketch, _ = request_latency.snapshot(endpoint, windows=windows)
+        
+        columns = [
+            func.count(PerformanceMetrics.id).label("request_count"),
+            func.count(PerformanceMetrics.id).filter(
+                PerformanceMetrics.status_code >= 400
+            ).label("error_count"),
+            func.avg(PerformanceMetrics.response_time_ms).label("avg_response_time"),
+            func.min(PerformanceMetrics.response_time_ms).label("min_response_time"),
+            func.max(PerformanceMetrics.response_time_ms).label("max_response_time")
+        ]
+        if include_percentiles:
+            columns += [
                 func.percentile_cont(0.5).within_group(PerformanceMetrics.response_time_ms).label("p50"),
                 func.percentile_cont(0.95).within_group(PerformanceMetrics.response_time_ms).label("p95"),
                 func.percentile_cont(0.99).within_group(PerformanceMetrics.response_time_ms).label("p99")
-            )
+            ]
+        
+        result = await self.db_session.execute(
+            select(*columns)
             .where(
                 and_(
                     PerformanceMetrics.endpoint == endpoint,
@@ -354,30 +378,37 @@ class AnalyticsRepository(BaseRepository[UserActivity]):
         
         row = result.one()
         
-        # Get error rate
-        error_count = await self.db_session.execute(
-            select(func.count(PerformanceMetrics.id))
-            .where(
-                and_(
-                    PerformanceMetrics.endpoint == endpoint,
-                    PerformanceMetrics.measured_at >= since,
-                    PerformanceMetrics.status_code >= 400
-                )
-            )
+        request_count = row.request_count or 0
+        error_count = row.error_count or 0
+        
+        if include_percentiles:
+            p50, p95, p99 = (float(p) if p else 0 for p in (row.p50, row.p95, row.p99))
+        else:
+            p50 = p95 = p99 = None
+        
+        # Sketches record seconds; the table stores milliseconds
+        process_p50, process_p95, process_p99 = (
+            sketch.quantile(q) * 1000 if sketch.count else None for q in (0.5, 0.95, 0.99)
         )
         
         return {
             "endpoint": endpoint,
             "period_hours": hours,
-            "request_count": row.request_count or 0,
-            "error_count": error_count.scalar() or 0,
-            "error_rate": (error_count.scalar() or 0) / (row.request_count or 1),
+            "request_count": request_count,
+            "error_count": error_count,
+            "error_rate": error_count / (request_count or 1),
             "avg_response_time_ms": float(row.avg_response_time) if row.avg_response_time else 0,
             "min_response_time_ms": float(row.min_response_time) if row.min_response_time else 0,
             "max_response_time_ms": float(row.max_response_time) if row.max_response_time else 0,
-            "p50_response_time_ms": float(row.p50) if row.p50 else 0,
-            "p95_response_time_ms": float(row.p95) if row.p95 else 0,
-            "p99_response_time_ms": float(row.p99) if row.p99 else 0
+            "p50_response_time_ms": p50,
+            "p95_response_time_ms": p95,
+            "p99_response_time_ms": p99,
+            "process_latency": {
+                "request_count": sketch.count,
+                "p50_response_time_ms": process_p50,
+                "p95_response_time_ms": process_p95,
+                "p99_response_time_ms": process_p99
+            }
         }
     
     # BusinessMetric operations
@@ -4,7 +4,11 @@ Metrics Collection
 Sets up Prometheus metrics collection for monitoring application performance.
 """
 
-from prometheus_client import Counter, Histogram, Gauge, Info
+from prometheus_client import Counter, Histogram, Gauge, Info, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+import math
 import time
 from functools import wraps
 
@@ -86,6 +90,175 @@ ai_service_tokens_used = Counter(
     ["service", "operation"]
 )
 
+# Model registry metrics
+model_load_duration_seconds = Histogram(
+    "model_load_duration_seconds",
+    "Time to load an ML model into memory",
+    ["model"]
+)
+
+model_memory_bytes = Gauge(
+    "model_memory_bytes",
+    "Resident memory added when an ML model was loaded",
+    ["model"]
+)
+
+
+class LatencySketch:
+    """
+    Streaming quantile sketch with bounded relative error.
+    
+    Values fall into logarithmic bins, so any quantile is accurate to within
+    ``relative_accuracy`` of the true value. Memory grows only with the
+    dynamic range of the data, and sketches merge losslessly, which lets
+    time windows be combined without keeping raw samples.
+    """
+    
+    MIN_VALUE = 1e-9
+    
+    def __init__(self, relative_accuracy: float = 0.02, max_bins: int = 1024):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float):
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        
+        if value <= self.MIN_VALUE:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.bins[index] = self.bins.get(index, 0) + 1
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+    
+    def _collapse(self):
+        # Fold the two lowest bins; only the smallest quantiles lose accuracy
+        lowest, second = sorted(self.bins)[:2]
+        self.bins[second] += self.bins.pop(lowest)
+    
+    def merge(self, other: "LatencySketch"):
+        """Fold another sketch with the same accuracy into this one."""
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        while len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1), or None when empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class RequestLatencyTracker:
+    """
+    Per-route latency sketches over rolling time windows.
+    
+    Each (method, route) series keeps one sketch per window for the last
+    ``retained_windows`` windows. Updates only touch the current window, so
+    no locking is needed on the event loop.
+    """
+    
+    def __init__(self, window_seconds: int = 3600, retained_windows: int = 24):
+        self.window_seconds = window_seconds
+        self.retained_windows = retained_windows
+        self._series: Dict[Tuple[str, str], Deque[list]] = {}
+    
+    def observe(self, method: str, endpoint: str, duration: float, status_code: int):
+        """Record a request's duration in seconds."""
+        window = int(time.time() // self.window_seconds)
+        series = self._series.get((method, endpoint))
+        if series is None:
+            series = self._series[(method, endpoint)] = deque(maxlen=self.retained_windows)
+        if not series or series[-1][0] != window:
+            series.append([window, LatencySketch(), 0])
+        current = series[-1]
+        current[1].add(duration)
+        if status_code >= 400:
+            current[2] += 1
+    
+    def snapshot(
+        self,
+        endpoint: Optional[str] = None,
+        method: Optional[str] = None,
+        windows: int = 1
+    ) -> Tuple[LatencySketch, int]:
+        """
+        Merge the most recent ``windows`` windows of matching series.
+        
+        Returns:
+            (merged sketch, number of error responses)
+        """
+        oldest = int(time.time() // self.window_seconds) - windows + 1
+        merged = LatencySketch()
+        errors = 0
+        for (series_method, series_endpoint), series in list(self._series.items()):
+            if endpoint is not None and series_endpoint != endpoint:
+                continue
+            if method is not None and series_method != method:
+                continue
+            for window, sketch, window_errors in list(series):
+                if window >= oldest:
+                    merged.merge(sketch)
+                    errors += window_errors
+        return merged, errors
+    
+    def series(self):
+        """Known (method, endpoint) pairs."""
+        return list(self._series)
+
+
+class RequestQuantileCollector:
+    """Expose p50/p95/p99 per route from the latency sketches."""
+    
+    QUANTILES = (0.5, 0.95, 0.99)
+    
+    def __init__(self, tracker: RequestLatencyTracker):
+        self.tracker = tracker
+    
+    def collect(self):
+        family = GaugeMetricFamily(
+            "http_request_duration_quantile_seconds",
+            "HTTP request duration quantiles over the current and previous window",
+            labels=["method", "endpoint", "quantile"]
+        )
+        for method, endpoint in self.tracker.series():
+            sketch, _ = self.tracker.snapshot(endpoint, method, windows=2)
+            if sketch.count == 0:
+                continue
+            for q in self.QUANTILES:
+                family.add_metric([method, endpoint, str(q)], sketch.quantile(q))
+        yield family
+
+
+request_latency = RequestLatencyTracker()
+REGISTRY.register(RequestQuantileCollector(request_latency))
+
 
 def setup_metrics():
     """Initialize metrics collection."""
@@ -109,6 +282,8 @@ def track_request_metrics(method: str, endpoint: str, status_code: int, duration
         method=method,
         endpoint=endpoint
     ).observe(duration)
+    
+    request_latency.observe(method, endpoint, duration, status_code)
 
 
 def track_generation_metrics(func):
@@ -170,3 +345,9 @@ def track_ai_service_usage(
             service=service,
             operation=operation
         ).inc(tokens)
+
+
+def track_model_load(model: str, duration: float, rss_delta_bytes: int):
+    """Track ML model load time and memory footprint."""
+    model_load_duration_seconds.labels(model=model).observe(duration)
+    model_memory_bytes.labels(model=model).set(rss_delta_bytes)
@@ -7,8 +7,9 @@ the platform smarter with every interaction.
 """
 
 import asyncio
+import heapq
 import json
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,7 +18,6 @@ import numpy as np
 from collections import defaultdict
 
 from neo4j import AsyncGraphDatabase
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ..core.logging import get_logger
 from ..core.config import settings
@@ -95,6 +95,57 @@ class LearningPattern:
     refinements: List[Dict[str, Any]] = field(default_factory=list)
 
 
+class PrerequisiteFrontier:
+    """
+    The set of concepts a learner is ready for, maintained incrementally.
+
+    Each unlearned concept carries a counter of satisfied prerequisites;
+    marking a concept as learned only touches the concepts that depend on
+    it, so advancing the frontier costs O(out-degree) instead of a scan of
+    the whole graph. A frontier is a view over the graph's prerequisite
+    index at creation time - concepts added to the graph afterwards are
+    not picked up.
+    """
+
+    def __init__(self,
+                 prerequisites: Dict[str, Set[str]],
+                 dependents: Dict[str, Set[str]],
+                 roots: Set[str],
+                 learned: Iterable[str] = ()):
+        self._prerequisites = prerequisites
+        self._dependents = dependents
+        self._satisfied: Dict[str, int] = defaultdict(int)
+        self.learned: Set[str] = set()
+        self.ready: Set[str] = set(roots)
+
+        for concept_id in learned:
+            self.mark_learned(concept_id)
+
+    def mark_learned(self, concept_id: str) -> Set[str]:
+        """
+        Mark a concept as learned.
+
+        Returns:
+            Concepts that became ready as a result
+        """
+        if concept_id in self.learned:
+            return set()
+
+        self.learned.add(concept_id)
+        self.ready.discard(concept_id)
+
+        unlocked = set()
+        for dependent in self._dependents.get(concept_id, ()):
+            if dependent in self.learned:
+                continue
+            self._satisfied[dependent] += 1
+            if self._satisfied[dependent] == len(self._prerequisites.get(dependent, ())):
+                self.ready.add(dependent)
+                unlocked.add(dependent)
+
+        return unlocked
+
+
 class KnowledgeGraph:
     """
     The intelligent knowledge graph that learns and improves.
@@ -123,6 +174,16 @@ class KnowledgeGraph:
         self.concepts: Dict[str, Concept] = {}
         self.patterns: Dict[str, LearningPattern] = {}
         
+        # Prerequisite index: concept -> prerequisites, prerequisite -> dependents
+        self._prerequisite_index: Dict[str, Set[str]] = {}
+        self._dependents_index: Dict[str, Set[str]] = defaultdict(set)
+        self._root_concepts: Set[str] = set()
+        
+        # Stacked, L2-normalised concept embeddings (rebuilt lazily)
+        self._embedding_matrix: Optional[np.ndarray] = None
+        self._embedding_rows: Dict[str, int] = {}
+        self._embedding_index_dirty = True
+        
         # Learning metrics
         self.concept_effectiveness: Dict[str, List[float]] = defaultdict(list)
         self.path_effectiveness: Dict[Tuple[str, ...], float] = {}
@@ -168,6 +229,7 @@ class KnowledgeGraph:
         # Add to in-memory structures
         self.concepts[concept.id] = concept
         self.graph.add_node(concept.id, **concept.__dict__)
+        self._index_concept(concept)
         
         # Add to Neo4j if connected
         if self.driver:
@@ -196,9 +258,10 @@ class KnowledgeGraph:
         self.graph.add_edge(
             relationship.source,
             relationship.target,
-            type=relationship.type,
             **relationship.__dict__
         )
+        if relationship.type == RelationType.PREREQUISITE:
+            self._index_prerequisite(relationship.source, relationship.target)
         
         # Add to Neo4j if connected
         if self.driver:
@@ -208,6 +271,80 @@ class KnowledgeGraph:
                     relationship
                 )
     
+    def _index_concept(self, concept: Concept):
+        """Update the prerequisite and embedding indexes for a concept."""
+        # Keep edges added through add_relationship; the graph keeps them too
+        prereqs = self._prerequisite_index.setdefault(concept.id, set())
+        prereqs.update(concept.prerequisites)
+        for prereq in prereqs:
+            self._dependents_index[prereq].add(concept.id)
+        
+        if prereqs:
+            self._root_concepts.discard(concept.id)
+        else:
+            self._root_concepts.add(concept.id)
+        
+        self._embedding_index_dirty = True
+    
+    def _index_prerequisite(self, prerequisite: str, concept_id: str):
+        """Record a single prerequisite edge in the prerequisite index."""
+        self._prerequisite_index.setdefault(concept_id, set()).add(prerequisite)
+        self._dependents_index[prerequisite].add(concept_id)
+        self._root_concepts.discard(concept_id)
+    
+    def set_concept_embedding(self, concept_id: str, embedding: Optional[np.ndarray]):
+        """Set a concept's embedding and invalidate the stacked matrix."""
+        concept = self.concepts.get(concept_id)
+        if concept is None:
+            return
+        concept.embedding = embedding
+        self._embedding_index_dirty = True
+    
+    def _ensure_embedding_index(self):
+        """Rebuild the stacked embedding matrix if concepts changed."""
+        if not self._embedding_index_dirty:
+            return
+        
+        rows: Dict[str, int] = {}
+        vectors = []
+        dim = None
+        for concept_id, concept in self.concepts.items():
+            if concept.embedding is None:
+                continue
+            vector = np.asarray(concept.embedding, dtype=np.float32).ravel()
+            if dim is None:
+                dim = vector.shape[0]
+            elif vector.shape[0] != dim:
+                logger.warning(f"Skipping embedding for {concept_id}: dimension {vector.shape[0]} != {dim}")
+                continue
+            rows[concept_id] = len(vectors)
+            vectors.append(vector)
+        
+        if vectors:
+            matrix = np.vstack(vectors)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._embedding_matrix = matrix / norms
+        else:
+            self._embedding_matrix = None
+        
+        self._embedding_rows = rows
+        self._embedding_index_dirty = False
+    
+    def create_frontier(self, learned_concepts: Iterable[str] = ()) -> PrerequisiteFrontier:
+        """
+        Create a prerequisite frontier for a learner.
+        
+        Keep the returned frontier alongside the learner's session and call
+        ``mark_learned`` as concepts are mastered to avoid rebuilding it.
+        """
+        return PrerequisiteFrontier(
+            self._prerequisite_index,
+            self._dependents_index,
+            self._root_concepts,
+            learned_concepts
+        )
+    
     async def find_learning_path(self,
                                start_concepts: List[str],
                                target_concept: str,
@@ -215,11 +352,11 @@ class KnowledgeGraph:
         """
         Find the optimal learning path to a target concept.
         
-        This uses intelligence about:
-        - Prerequisite relationships
-        - Cognitive load management
-        - Learner preferences
-        - Historical effectiveness
+        The prerequisite closure of the target (minus what the learner
+        already knows) is computed once and ordered topologically, so the
+        cost is linear in the size of the closure. Among concepts whose
+        prerequisites are satisfied, the planner prefers easier, more
+        effective concepts matching the learner's cognitive level.
         
         Args:
             start_concepts: Concepts the learner already knows
@@ -227,201 +364,210 @@ class KnowledgeGraph:
             learner_profile: Optional learner characteristics
             
         Returns:
-            Ordered list of concept IDs to learn
+            Ordered list of concept IDs to learn, ending with the target.
+            Empty if the target is unknown, already known, or blocked by a
+            prerequisite cycle.
         """
         if target_concept not in self.concepts:
             logger.warning(f"Target concept {target_concept} not found")
             return []
         
-        # Find all paths from start concepts to target
-        all_paths = []
-        for start in start_concepts:
-            if start in self.graph:
-                try:
-                    paths = nx.all_simple_paths(
-                        self.graph,
-                        start,
-                        target_concept,
-                        cutoff=10
-                    )
-                    all_paths.extend(list(paths))
-                except nx.NetworkXNoPath:
-                    continue
+        return self._plan_prerequisite_path(target_concept, start_concepts, learner_profile)
+    
+    def _plan_prerequisite_path(self,
+                                target: str,
+                                known: Iterable[str],
+                                learner_profile: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Topologically order the unlearned prerequisite closure of a target."""
+        learned = set(known)
+        if target in learned:
+            return []
         
-        if not all_paths:
-            # No direct path, find prerequisites
-            return await self._find_prerequisite_path(target_concept, start_concepts)
+        # Prerequisite closure, stopping at concepts already learned
+        closure = {target}
+        missing = set()
+        stack = [target]
+        while stack:
+            current = stack.pop()
+            for prereq in self._prerequisite_index.get(current, ()):
+                if prereq in learned or prereq in closure:
+                    continue
+                if prereq not in self.concepts:
+                    missing.add(prereq)
+                    continue
+                closure.add(prereq)
+                stack.append(prereq)
         
-        # Score paths based on effectiveness
-        best_path = None
-        best_score = -1
+        if missing:
+            logger.warning(
+                f"Ignoring {len(missing)} unknown prerequisites while planning "
+                f"{target}: {sorted(missing)[:10]}"
+            )
         
-        for path in all_paths:
-            score = await self._score_learning_path(path, learner_profile)
-            if score > best_score:
-                best_score = score
-                best_path = path
+        # Kahn's algorithm with a learner-weighted priority queue
+        indegree = {concept_id: 0 for concept_id in closure}
+        for concept_id in closure:
+            for prereq in self._prerequisite_index.get(concept_id, ()):
+                if prereq in closure:
+                    indegree[concept_id] += 1
+        
+        learner_level = learner_profile.get('cognitive_level') if learner_profile else None
+        ready = [
+            self._plan_priority(concept_id, learner_level)
+            for concept_id, degree in indegree.items() if degree == 0
+        ]
+        heapq.heapify(ready)
         
-        return best_path if best_path else []
-    
-    async def _find_prerequisite_path(self,
-                                    target: str,
-                                    known: List[str]) -> List[str]:
-        """Find prerequisite path when no direct path exists."""
         path = []
-        to_learn = {target}
-        learned = set(known)
-        
-        while to_learn:
-            # Find concept with all prerequisites met
-            for concept_id in to_learn:
-                concept = self.concepts.get(concept_id)
-                if not concept:
+        while ready:
+            *_, concept_id = heapq.heappop(ready)
+            path.append(concept_id)
+            for dependent in self._dependents_index.get(concept_id, ()):
+                if dependent not in indegree:
                     continue
-                
-                if all(p in learned for p in concept.prerequisites):
-                    path.append(concept_id)
-                    learned.add(concept_id)
-                    to_learn.remove(concept_id)
-                    break
-            else:
-                # Add missing prerequisites
-                for concept_id in list(to_learn):
-                    concept = self.concepts.get(concept_id)
-                    if concept:
-                        for prereq in concept.prerequisites:
-                            if prereq not in learned and prereq not in to_learn:
-                                to_learn.add(prereq)
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, self._plan_priority(dependent, learner_level))
+        
+        if len(path) < len(closure):
+            blocked = sorted(c for c, degree in indegree.items() if degree > 0)
+            logger.warning(
+                f"Prerequisite cycle blocks learning path to {target}; "
+                f"{len(blocked)} concepts unresolved: {blocked[:10]}"
+            )
+            return []
         
         return path
     
-    async def _score_learning_path(self,
-                                 path: List[str],
-                                 learner_profile: Optional[Dict[str, Any]]) -> float:
-        """Score a learning path based on multiple factors."""
-        if len(path) < 2:
-            return 0.0
-        
-        factors = []
-        
-        # Historical effectiveness
-        path_key = tuple(path)
-        if path_key in self.path_effectiveness:
-            factors.append(self.path_effectiveness[path_key])
-        
-        # Cognitive load progression
-        difficulties = [self.concepts[c].difficulty for c in path if c in self.concepts]
-        if difficulties:
-            # Prefer gradual increase in difficulty
-            diff_changes = np.diff(difficulties)
-            smooth_progression = 1.0 - np.std(diff_changes)
-            factors.append(smooth_progression)
-        
-        # Concept relationships strength
-        edge_strengths = []
-        for i in range(len(path) - 1):
-            if self.graph.has_edge(path[i], path[i+1]):
-                edge_data = self.graph[path[i]][path[i+1]]
-                edge_strengths.append(edge_data.get('strength', 0.5))
-        
-        if edge_strengths:
-            factors.append(np.mean(edge_strengths))
-        
-        # Learner profile alignment
-        if learner_profile:
-            # Match cognitive levels
-            learner_level = learner_profile.get('cognitive_level', 'understand')
-            level_matches = sum(
-                1 for c in path
-                if c in self.concepts and 
-                self.concepts[c].cognitive_level == learner_level
-            )
-            factors.append(level_matches / len(path))
+    def _plan_priority(self, concept_id: str, learner_level: Optional[str]) -> Tuple[float, str]:
+        """
+        Heap key for the planner, best next concept first.
         
-        return np.mean(factors) if factors else 0.5
+        Scores a concept on equally weighted factors: ease (so difficulty
+        rises gradually along the path), recorded effectiveness and, when
+        the learner's level is known, whether the concept matches it.
+        """
+        concept = self.concepts[concept_id]
+        factors = [1.0 - concept.difficulty, concept.effectiveness_score]
+        if learner_level is not None:
+            factors.append(1.0 if concept.cognitive_level == learner_level else 0.0)
+        return (-float(np.mean(factors)), concept_id)
     
     async def suggest_next_concepts(self,
                                   learned_concepts: List[str],
-                                  n_suggestions: int = 5) -> List[Tuple[str, float]]:
+                                  n_suggestions: int = 5,
+                                  frontier: Optional[PrerequisiteFrontier] = None) -> List[Tuple[str, float]]:
         """
         Suggest next concepts to learn based on what's already learned.
         
         Args:
             learned_concepts: Concepts already mastered
             n_suggestions: Number of suggestions to return
+            frontier: Optional frontier maintained for this learner; built
+                from ``learned_concepts`` when omitted
             
         Returns:
             List of (concept_id, relevance_score) tuples
         """
-        learned_set = set(learned_concepts)
-        suggestions = []
+        if frontier is None:
+            frontier = self.create_frontier(learned_concepts)
         
-        # Find concepts where prerequisites are met
-        for concept_id, concept in self.concepts.items():
-            if concept_id in learned_set:
-                continue
-            
-            # Check if prerequisites are met
-            if all(p in learned_set for p in concept.prerequisites):
-                # Calculate relevance score
-                score = await self._calculate_concept_relevance(
-                    concept_id,
-                    learned_concepts
-                )
-                suggestions.append((concept_id, score))
+        candidates = [
+            concept_id for concept_id in frontier.ready
+            if concept_id in self.concepts and concept_id not in frontier.learned
+        ]
+        if not candidates or n_suggestions <= 0:
+            return []
         
-        # Sort by score and return top N
-        suggestions.sort(key=lambda x: x[1], reverse=True)
-        return suggestions[:n_suggestions]
+        scores = self._score_candidates(candidates, learned_concepts)
+        
+        # Top N without sorting every candidate
+        if len(candidates) > n_suggestions:
+            top = np.argpartition(-scores, n_suggestions - 1)[:n_suggestions]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        
+        return [(candidates[i], float(scores[i])) for i in top]
     
     async def _calculate_concept_relevance(self,
                                          concept_id: str,
                                          learned_concepts: List[str]) -> float:
         """Calculate how relevant a concept is given learned concepts."""
-        concept = self.concepts.get(concept_id)
-        if not concept:
+        if concept_id not in self.concepts:
             return 0.0
+        return float(self._score_candidates([concept_id], learned_concepts)[0])
+    
+    def _score_candidates(self,
+                          candidates: List[str],
+                          learned_concepts: List[str]) -> np.ndarray:
+        """
+        Score candidate concepts against learned concepts in one pass.
         
-        factors = []
-        
-        # Direct connections to learned concepts
-        connection_count = sum(
-            1 for learned in learned_concepts
-            if self.graph.has_edge(learned, concept_id) or
-               self.graph.has_edge(concept_id, learned)
-        )
-        factors.append(connection_count / max(len(learned_concepts), 1))
-        
-        # Conceptual similarity (if embeddings available)
-        if concept.embedding is not None:
-            similarities = []
-            for learned_id in learned_concepts:
-                learned_concept = self.concepts.get(learned_id)
-                if learned_concept and learned_concept.embedding is not None:
-                    sim = cosine_similarity(
-                        concept.embedding.reshape(1, -1),
-                        learned_concept.embedding.reshape(1, -1)
-                    )[0, 0]
-                    similarities.append(sim)
-            
-            if similarities:
-                factors.append(np.mean(similarities))
+        Each score is the mean of: share of learned concepts directly
+        connected to the candidate, mean cosine similarity to learned
+        concepts (when embeddings exist), effectiveness, and difficulty fit.
+        """
+        n = len(candidates)
+        positions = {concept_id: i for i, concept_id in enumerate(candidates)}
+        totals = np.zeros(n, dtype=np.float64)
+        counts = np.zeros(n, dtype=np.float64)
+        
+        # Direct connections to learned concepts, walked from the learned side
+        connections = np.zeros(n, dtype=np.float64)
+        for learned in learned_concepts:
+            if learned not in self.graph:
+                continue
+            neighbours = set(self.graph.successors(learned))
+            neighbours.update(self.graph.predecessors(learned))
+            for neighbour in neighbours:
+                pos = positions.get(neighbour)
+                if pos is not None:
+                    connections[pos] += 1
+        totals += connections / max(len(learned_concepts), 1)
+        counts += 1
+        
+        # Conceptual similarity: mean of cosines == dot with the mean unit vector
+        self._ensure_embedding_index()
+        if self._embedding_matrix is not None:
+            learned_rows = [
+                self._embedding_rows[c] for c in learned_concepts
+                if c in self._embedding_rows
+            ]
+            candidate_pos = [
+                i for i, c in enumerate(candidates) if c in self._embedding_rows
+            ]
+            if learned_rows and candidate_pos:
+                mean_learned = self._embedding_matrix[learned_rows].mean(axis=0)
+                candidate_rows = [self._embedding_rows[candidates[i]] for i in candidate_pos]
+                totals[candidate_pos] += self._embedding_matrix[candidate_rows] @ mean_learned
+                counts[candidate_pos] += 1
         
         # Effectiveness score
-        factors.append(concept.effectiveness_score)
+        totals += np.fromiter(
+            (self.concepts[c].effectiveness_score for c in candidates),
+            dtype=np.float64,
+            count=n
+        )
+        counts += 1
         
         # Difficulty appropriateness
         learned_difficulties = [
-            self.concepts[c].difficulty 
-            for c in learned_concepts 
+            self.concepts[c].difficulty
+            for c in learned_concepts
             if c in self.concepts
         ]
         if learned_difficulties:
-            avg_learned = np.mean(learned_difficulties)
-            difficulty_match = 1.0 - abs(concept.difficulty - (avg_learned + 0.1))
-            factors.append(max(0, difficulty_match))
+            target = np.mean(learned_difficulties) + 0.1
+            difficulties = np.fromiter(
+                (self.concepts[c].difficulty for c in candidates),
+                dtype=np.float64,
+                count=n
+            )
+            totals += np.maximum(0.0, 1.0 - np.abs(difficulties - target))
+            counts += 1
         
-        return np.mean(factors) if factors else 0.5
+        return totals / counts
     
     async def record_learning_outcome(self,
                                     concept_id: str,
@@ -650,6 +796,7 @@ class KnowledgeGraph:
                 )
                 self.concepts[concept.id] = concept
                 self.graph.add_node(concept.id, **concept.__dict__)
+                self._index_concept(concept)
             
             # Load relationships
             relationships_result = await session.run(
@@ -663,6 +810,8 @@ class KnowledgeGraph:
                     type=record['type'],
                     strength=record['r'].get('strength', 1.0)
                 )
+                if record['type'] == RelationType.PREREQUISITE.value:
+                    self._index_prerequisite(record['source'], record['target'])
         
         logger.info(f"Loaded {len(self.concepts)} concepts and {self.graph.number_of_edges()} relationships")
     
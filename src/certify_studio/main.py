@@ -20,11 +20,7 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from .config import get_settings
 from .api.main import api_router
-from .api.middleware import (
-    LoggingMiddleware,
-    RateLimitMiddleware,
-    SecurityHeadersMiddleware
-)
+from .api.middleware import RequestPipelineMiddleware
 from .database.connection import database_manager
 from .integrations.observability.logging import setup_logging
 from .integrations.observability.metrics import setup_metrics
@@ -84,6 +80,24 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Agent orchestrator not available: {e}")
         app.state.agent_orchestrator = None
     
+    # Pre-warm shared ML models and start idle unloading, if configured
+    try:
+        from .ml.model_registry import start_model_registry
+        app.state.model_maintenance_task = await start_model_registry()
+    except ImportError as e:
+        logger.warning(f"Model registry not available: {e}")
+        app.state.model_maintenance_task = None
+    
+    # Relay generation progress between API processes
+    if settings.PROGRESS_PUBSUB_ENABLED:
+        try:
+            from .api.dependencies import get_redis
+            from .api.routers.generation import progress_broker
+            await progress_broker.start(await get_redis())
+            logger.info("Progress relay started")
+        except Exception as e:
+            logger.warning(f"Progress relay unavailable, using in-process delivery: {e}")
+    
     # Initialize background task queues
     try:
         from .core.celery import celery_app
@@ -110,6 +124,16 @@ async def lifespan(app: FastAPI):
         await database_manager.close()
         logger.info("Database connections closed")
         
+        # Stop progress relay
+        if settings.PROGRESS_PUBSUB_ENABLED:
+            from .api.routers.generation import progress_broker
+            await progress_broker.stop()
+        
+        # Stop model maintenance
+        task = getattr(app.state, 'model_maintenance_task', None)
+        if task:
+            task.cancel()
+        
         # Cleanup AI services
         if hasattr(app.state, 'agent_orchestrator') and app.state.agent_orchestrator:
             # AgenticOrchestrator doesn't have cleanup method
@@ -151,9 +175,7 @@ def create_application() -> FastAPI:
     # Add middleware
     app.add_middleware(GZipMiddleware, minimum_size=1000)
     app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RateLimitMiddleware)
-    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(RequestPipelineMiddleware)
     
     # Include API routes
     app.include_router(api_router, prefix="/api")
@@ -12,7 +12,7 @@ from .scenes.accessible_scene import AccessibleScene
 from .scenes.multi_export_scene import MultiExportScene
 from .scenes.optimized_scene import OptimizedCertificationScene
 
-from .icons.icon_library import OfficialIconLibrary
+from .icons.icon_library import OfficialIconLibrary, get_icon_library
 from .animations.aws_animations import AWSArchitectureAnimations
 from .animations.azure_animations import AzureArchitectureAnimations
 from .animations.gcp_animations import GCPArchitectureAnimations
@@ -34,6 +34,7 @@ __all__ = [
     
     # Icons and Assets
     "OfficialIconLibrary",
+    "get_icon_library",
     
     # Animations
     "AWSArchitectureAnimations",
@@ -4,17 +4,26 @@ Official Icon Library for Cloud Providers
 This module provides access to official cloud provider icons with enterprise-grade
 quality and consistent styling. Integrates with official AWS, Azure, GCP, and
 Kubernetes icon sets.
+
+Libraries are shared per provider within a process (see ``get_icon_library``):
+the icon index is built once from ``metadata.json``, parsed SVG geometry is
+cached on disk, and each loaded icon is kept as a template that callers
+receive copies of.
 """
 
 import os
 import json
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List, Tuple, Union
 from urllib.request import urlretrieve
 from urllib.parse import urljoin
 import hashlib
 
-from manim import SVGMobject, ImageMobject, Group, Text, VGroup
+import manim
+import numpy as np
+from manim import SVGMobject, ImageMobject, Group, Rectangle, Text, VGroup, VMobject
 import requests
 from PIL import Image
 import cairosvg
@@ -44,16 +53,22 @@ class OfficialIconLibrary:
         self.provider = provider
         self.cache_dir = Path("assets/icons") / provider.value
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.converted_dir = self.cache_dir / ".converted"
+        self.parsed_dir = self.cache_dir / ".parsed"
         
         # Icon metadata cache
         self.icon_metadata = {}
-        self.icon_cache = {}
+        # Styled icon templates; callers always get copies
+        self.icon_cache: Dict[Tuple[str, int, Optional[str]], VMobject] = {}
+        # Service name -> {category: icon path}, in category order
+        self.icon_index: Dict[str, Dict[str, Path]] = {}
         
         # Load provider-specific configuration
         self.config = self._load_provider_config()
         
         # Ensure icons are available
         self._ensure_icons_available()
+        self._build_icon_index()
         
     def _load_provider_config(self) -> Dict:
         """Load provider-specific icon configuration."""
@@ -136,6 +151,16 @@ class OfficialIconLibrary:
         with open(metadata_file, 'w') as f:
             json.dump(self.icon_metadata, f, indent=2)
             
+    def _build_icon_index(self):
+        """Index icon paths by service name from the metadata, once."""
+        order = {category: i for i, category in enumerate(self.config["icon_sets"])}
+        keys = sorted(self.icon_metadata, key=lambda key: order.get(key.partition("/")[0], len(order)))
+        for key in keys:
+            category, _, icon_name = key.partition("/")
+            path = self.cache_dir / category / self.icon_metadata[key]["filename"]
+            if path.exists():
+                self.icon_index.setdefault(icon_name, {})[category] = path
+            
     def _download_essential_icons(self):
         """Download essential icons for the provider."""
         essential_icons = self._get_essential_icons()
@@ -249,8 +274,16 @@ class OfficialIconLibrary:
         icon_filename = self._get_icon_filename(icon_name)
         local_path = self.cache_dir / category / icon_filename
         
-        # Skip if already exists and valid
+        metadata_key = f"{category}/{icon_name}"
+        
+        # Skip if already recorded and unchanged on disk
+        recorded = self.icon_metadata.get(metadata_key)
+        if recorded and local_path.exists() and local_path.stat().st_size == recorded.get("size"):
+            return True
+            
+        # Record icons that are present but missing from the metadata
         if local_path.exists() and self._validate_icon(local_path):
+            self._record_icon(metadata_key, icon_filename, local_path)
             return True
             
         try:
@@ -263,13 +296,7 @@ class OfficialIconLibrary:
             # Validate downloaded icon
             if self._validate_icon(local_path):
                 # Update metadata
-                self.icon_metadata[f"{category}/{icon_name}"] = {
-                    "filename": icon_filename,
-                    "url": url,
-                    "size": local_path.stat().st_size,
-                    "hash": self._calculate_file_hash(local_path),
-                    "downloaded_at": str(Path.ctime(local_path))
-                }
+                self._record_icon(metadata_key, icon_filename, local_path, url)
                 return True
             else:
                 # Remove invalid file
@@ -280,6 +307,16 @@ class OfficialIconLibrary:
             print(f"Failed to download {icon_name}: {e}")
             return False
             
+    def _record_icon(self, key: str, filename: str, path: Path, url: Optional[str] = None):
+        """Add an icon file to the metadata."""
+        self.icon_metadata[key] = {
+            "filename": filename,
+            "url": url,
+            "size": path.stat().st_size,
+            "hash": self._calculate_file_hash(path),
+            "downloaded_at": str(path.stat().st_ctime)
+        }
+        
     def _get_icon_filename(self, icon_name: str) -> str:
         """Get standardized icon filename."""
         naming_template = self.config["icon_naming"]
@@ -352,7 +389,7 @@ class OfficialIconLibrary:
         size = size or DIMENSIONS["icon_size"]
         
         # Try cache first
-        cache_key = f"{service_name}_{size}_{category}"
+        cache_key = (service_name, size, category)
         if cache_key in self.icon_cache:
             return self.icon_cache[cache_key].copy()
             
@@ -366,11 +403,11 @@ class OfficialIconLibrary:
             try:
                 # Load official icon
                 if icon_path.suffix.lower() == '.svg':
-                    icon = SVGMobject(str(icon_path))
+                    icon = self._load_svg(icon_path)
                 else:
                     # Convert to SVG if needed
                     svg_path = self._convert_to_svg(icon_path)
-                    icon = SVGMobject(str(svg_path))
+                    icon = self._load_svg(svg_path)
                     
                 # Apply standard styling
                 icon = self._apply_icon_styling(icon, size)
@@ -388,12 +425,20 @@ class OfficialIconLibrary:
                        service_name: str, 
                        category: str = None) -> Optional[Path]:
         """Find icon file path, searching all categories if needed."""
+        locations = self.icon_index.get(service_name, {})
         
-        # If category specified, search there first
+        # A specified category is the only place searched
+        if category:
+            icon_path = locations.get(category)
+        else:
+            icon_path = next(iter(locations.values()), None)
+        if icon_path is not None:
+            return icon_path
+            
+        # Icons placed on disk without metadata are not indexed
         if category:
             search_dirs = [self.cache_dir / category]
         else:
-            # Search all categories
             search_dirs = [
                 self.cache_dir / cat for cat in self.config["icon_sets"].keys()
                 if (self.cache_dir / cat).exists()
@@ -404,17 +449,96 @@ class OfficialIconLibrary:
         for search_dir in search_dirs:
             icon_path = search_dir / filename
             if icon_path.exists():
+                self.icon_index.setdefault(service_name, {})[search_dir.name] = icon_path
                 return icon_path
                 
         return None
         
+    def _load_svg(self, svg_path: Path) -> VMobject:
+        """
+        Load SVG geometry, reusing parsed paths cached on disk.
+        
+        The cache holds every sub-path's points in a ``.npz`` file and their
+        styles in a ``.json`` file, keyed by the file content and Manim
+        version, so a changed icon or Manim upgrade is parsed afresh. Neither
+        format can execute code when loaded.
+        """
+        content = svg_path.read_bytes()
+        key = hashlib.sha256(content + manim.__version__.encode()).hexdigest()
+        cached_points = self.parsed_dir / f"{key}.npz"
+        cached_styles = self.parsed_dir / f"{key}.json"
+        
+        if cached_points.exists() and cached_styles.exists():
+            try:
+                with np.load(cached_points, allow_pickle=False) as arrays:
+                    points, offsets = arrays["points"], arrays["offsets"]
+                with open(cached_styles) as f:
+                    styles = json.load(f)
+                return self._mobject_from_paths(points, offsets, styles)
+            except Exception as e:
+                print(f"Ignoring unreadable icon cache {key}: {e}")
+                
+        icon = SVGMobject(str(svg_path))
+        parts = icon.family_members_with_points()
+        points = np.concatenate([part.points for part in parts]) if parts else np.zeros((0, 3))
+        offsets = np.cumsum([0] + [len(part.points) for part in parts])
+        # Colors as strings: both Manim's color classes print as a parseable color
+        styles = [
+            {
+                "fill_color": str(part.get_fill_color()),
+                "fill_opacity": float(part.get_fill_opacity()),
+                "stroke_color": str(part.get_stroke_color()),
+                "stroke_width": float(part.get_stroke_width()),
+                "stroke_opacity": float(part.get_stroke_opacity())
+            }
+            for part in parts
+        ]
+        
+        try:
+            self.parsed_dir.mkdir(parents=True, exist_ok=True)
+            fd, staging = tempfile.mkstemp(dir=self.parsed_dir, suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, points=points, offsets=offsets)
+            os.replace(staging, cached_points)
+            fd, staging = tempfile.mkstemp(dir=self.parsed_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(styles, f)
+            os.replace(staging, cached_styles)
+        except OSError as e:
+            print(f"Failed to cache parsed icon {svg_path.name}: {e}")
+            
+        # Same structure whether or not the cache was hit
+        return self._mobject_from_paths(points, offsets, styles)
+        
+    @staticmethod
+    def _mobject_from_paths(points: np.ndarray, offsets: np.ndarray, styles: List[Dict]) -> VGroup:
+        """Rebuild an icon from cached sub-path geometry and style."""
+        if len(offsets) != len(styles) + 1:
+            raise ValueError("Icon cache geometry and styles do not match")
+            
+        icon = VGroup()
+        for start, end, style in zip(offsets[:-1], offsets[1:], styles):
+            part = VMobject()
+            part.set_points(points[start:end])
+            part.set_fill(style["fill_color"], opacity=style["fill_opacity"])
+            part.set_stroke(
+                style["stroke_color"],
+                width=style["stroke_width"],
+                opacity=style["stroke_opacity"]
+            )
+            icon.add(part)
+        return icon
+        
     def _convert_to_svg(self, image_path: Path) -> Path:
-        """Convert image to SVG format."""
-        svg_path = image_path.with_suffix('.svg')
+        """Convert image to SVG format, keeping conversions on disk."""
+        digest = self._calculate_file_hash(image_path)[:16]
+        svg_path = self.converted_dir / f"{image_path.stem}-{digest}.svg"
         
         if svg_path.exists():
             return svg_path
             
+        self.converted_dir.mkdir(parents=True, exist_ok=True)
+            
         # Convert PNG to SVG (basic conversion)
         try:
             with Image.open(image_path) as img:
@@ -550,3 +674,23 @@ class OfficialIconLibrary:
                 name = name[:-3]
                 
         return name.lower().replace("-", "_")
+
+
+_libraries: Dict[CertificationProvider, OfficialIconLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_icon_library(provider: CertificationProvider) -> OfficialIconLibrary:
+    """
+    Get the process-wide icon library for a provider.
+    
+    The library, its icon index and its loaded icon templates are created
+    once and shared by every caller in the process.
+    """
+    library = _libraries.get(provider)
+    if library is None:
+        with _libraries_lock:
+            library = _libraries.get(provider)
+            if library is None:
+                library = _libraries[provider] = OfficialIconLibrary(provider)
+    return library
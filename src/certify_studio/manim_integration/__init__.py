@@ -3,13 +3,15 @@ Manim integration module for rendering agent-generated content.
 """
 
 from .scene_generator import ManimSceneGenerator
-from .element_renderer import ElementRenderer
-from .animation_builder import AnimationBuilder
-from .export_manager import ExportManager
+from .render_farm import RenderFarm, RenderJob, RenderResult, render_farm
+from .render_cache import RenderCache, render_cache
 
 __all__ = [
     'ManimSceneGenerator',
-    'ElementRenderer', 
-    'AnimationBuilder',
-    'ExportManager'
+    'RenderFarm',
+    'RenderJob',
+    'RenderResult',
+    'render_farm',
+    'RenderCache',
+    'render_cache'
 ]
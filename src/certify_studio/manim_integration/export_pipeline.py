@@ -0,0 +1,260 @@
+"""
+Video export: render once with Manim, then transcode with ffmpeg.
+
+Every requested format is produced from the same intermediate MP4, and the
+conversions run concurrently as separate ffmpeg processes. The presets use
+only software codecs (libx264, libvpx-vp9, the GIF palette filters), so
+output is identical on machines with and without GPUs. Progress is read
+from ffmpeg's ``-progress`` stream and reported per format.
+"""
+
+import asyncio
+import inspect
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from ..core.config import settings
+from ..core.logging import get_logger
+from .render_cache import RenderCache, render_cache
+from .render_farm import RenderFarm, RenderJob, render_farm
+
+logger = get_logger(__name__)
+
+# (format, fraction complete) -> None; may be a coroutine function
+ProgressCallback = Callable[[str, float], Union[None, Awaitable[None]]]
+
+VIDEO_FORMATS = ("mp4", "webm", "gif")
+
+MANIM_QUALITIES = {
+    "low": "low_quality",
+    "medium": "medium_quality",
+    "high": "high_quality",
+    "production": "production_quality",
+    "4k": "fourk_quality",
+}
+
+
+class ExportError(RuntimeError):
+    """Rendering or transcoding failed."""
+
+
+def manim_quality(quality: str) -> str:
+    """Map a short quality name (as in MANIM_QUALITY) to Manim's name."""
+    return MANIM_QUALITIES.get(quality, quality)
+
+
+def transcode_args(format: str, options: Optional[Dict[str, Any]] = None, source_suffix: str = ".mp4") -> List[str]:
+    """ffmpeg output arguments for ``format``."""
+    options = options or {}
+    width = options.get("width")
+    scale = f"scale={width}:-2:flags=lanczos" if width else None
+
+    if format == "mp4":
+        if source_suffix == ".mp4" and not scale and "crf" not in options:
+            # Manim already wrote H.264; only move the index to the front
+            return ["-c", "copy", "-movflags", "+faststart"]
+        args = [
+            "-c:v", "libx264", "-preset", options.get("preset", "medium"),
+            "-crf", str(options.get("crf", 20)), "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart", "-c:a", "aac", "-b:a", "128k",
+        ]
+        return (["-vf", scale] if scale else []) + args
+
+    if format == "webm":
+        args = [
+            "-c:v", "libvpx-vp9", "-crf", str(options.get("crf", 32)), "-b:v", "0",
+            "-deadline", "good", "-cpu-used", "4", "-row-mt", "1",
+            "-pix_fmt", "yuv420p", "-c:a", "libopus", "-b:a", "96k",
+        ]
+        return (["-vf", scale] if scale else []) + args
+
+    if format == "gif":
+        fps = options.get("fps", 12)
+        filters = [f"fps={fps}"] + ([scale] if scale else [])
+        # Palette generation and use in one filter graph: a single pass over the input
+        graph = (
+            f"{','.join(filters)},split[a][b];"
+            f"[a]palettegen=stats_mode=diff[p];[b][p]paletteuse=dither=bayer:bayer_scale=5"
+        )
+        return ["-filter_complex", graph, "-loop", str(options.get("loop", 0))]
+
+    raise ValueError(f"Unsupported video format: {format}")
+
+
+async def _notify(progress: Optional[ProgressCallback], format: str, fraction: float) -> None:
+    if progress is None:
+        return
+    result = progress(format, fraction)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def probe_duration(path: Path, ffprobe: str = "ffprobe") -> Optional[float]:
+    """Duration of a media file in seconds, or None if it cannot be read."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            ffprobe, "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", str(path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return None
+    stdout, _ = await process.communicate()
+    try:
+        return float(stdout.decode().strip())
+    except ValueError:
+        return None
+
+
+async def transcode(
+    source: Path,
+    output: Path,
+    format: str,
+    options: Optional[Dict[str, Any]] = None,
+    duration: Optional[float] = None,
+    progress: Optional[ProgressCallback] = None,
+    threads: int = 0,
+    ffmpeg: str = "ffmpeg"
+) -> Path:
+    """Convert ``source`` to ``format`` at ``output``, reporting progress."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(f".{output.name}.part{output.suffix}")
+    command = [
+        ffmpeg, "-y", "-hide_banner", "-loglevel", "error", "-nostats",
+        "-progress", "pipe:1", "-i", str(source),
+        *transcode_args(format, options, source.suffix),
+        "-threads", str(threads), str(partial),
+    ]
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stderr_task = asyncio.create_task(process.stderr.read())
+    try:
+        async for raw in process.stdout:
+            key, _, value = raw.decode(errors="replace").strip().partition("=")
+            if key == "out_time_us" and duration and value.isdigit():
+                await _notify(progress, format, min(int(value) / 1e6 / duration, 0.99))
+        await process.wait()
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        partial.unlink(missing_ok=True)
+        raise
+    stderr = await stderr_task
+
+    if process.returncode != 0:
+        partial.unlink(missing_ok=True)
+        raise ExportError(f"ffmpeg {format} export failed: {stderr.decode(errors='replace').strip()}")
+
+    os.replace(partial, output)
+    await _notify(progress, format, 1.0)
+    return output
+
+
+async def transcode_all(
+    source: Path,
+    output_dir: Path,
+    stem: str,
+    formats: List[str],
+    options: Optional[Dict[str, Any]] = None,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Path]:
+    """Produce every format from one intermediate, concurrently."""
+    duration = await probe_duration(source)
+    threads = max(1, (os.cpu_count() or 1) // max(1, len(formats)))
+
+    async def convert(format: str) -> Path:
+        return await transcode(
+            source, output_dir / f"{stem}.{format}", format, options,
+            duration=duration, progress=progress, threads=threads
+        )
+
+    tasks = [asyncio.create_task(convert(format)) for format in formats]
+    try:
+        paths = await asyncio.gather(*tasks)
+    except BaseException:
+        # Stop the other encoders; transcode kills ffmpeg and removes its partial file
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return dict(zip(formats, paths))
+
+
+async def extract_frames(
+    source: Path,
+    times: List[float],
+    output_dir: Path,
+    width: Optional[int] = None,
+    ffmpeg: str = "ffmpeg"
+) -> List[Path]:
+    """Save a JPEG still of ``source`` at each timestamp, concurrently."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    duration = await probe_duration(source)
+    scale = ["-vf", f"scale={width}:-2"] if width else []
+
+    async def grab(index: int, time: float) -> Path:
+        if duration:
+            # Seeking to the very end yields no frame
+            time = min(time, max(duration - 0.1, 0))
+        output = output_dir / f"keyframe_{index:03d}.jpg"
+        process = await asyncio.create_subprocess_exec(
+            ffmpeg, "-y", "-loglevel", "error", "-ss", f"{time:.3f}", "-i", str(source),
+            "-frames:v", "1", *scale, "-q:v", "3", str(output),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise ExportError(f"Frame extraction at {time}s failed: {stderr.decode(errors='replace').strip()}")
+        return output
+
+    return list(await asyncio.gather(*(grab(i, t) for i, t in enumerate(times))))
+
+
+async def render_manim_code(
+    manim_code: str,
+    scene_class: str,
+    output_dir: Path,
+    quality: str = "high_quality",
+    farm: Optional[RenderFarm] = None,
+    cache: Optional[RenderCache] = None
+) -> Path:
+    """Render generated Manim code to an MP4, reusing a cached render if present."""
+    farm = farm or render_farm
+    if cache is None and settings.RENDER_CACHE_ENABLED:
+        cache = render_cache
+
+    key = None
+    destination = output_dir / f"{scene_class}.mp4"
+    if cache is not None:
+        key = cache.key_for(manim_code, quality=quality, extra={"scene_class": scene_class})
+        if await asyncio.to_thread(cache.fetch, key, destination):
+            return destination
+
+    job = RenderJob(
+        scene_data={},
+        output_dir=output_dir,
+        output_name=scene_class,
+        quality=quality,
+        manim_code=manim_code,
+        scene_class=scene_class
+    )
+    if cache is not None:
+        job.config["partial_movie_dir"] = str(cache.partial_dir(scene_class, quality))
+
+    try:
+        result = (await farm.render_all([job]))[0]
+    finally:
+        if cache is not None:
+            await asyncio.to_thread(cache.record_partials, Path(job.config["partial_movie_dir"]))
+    if not result.success:
+        raise ExportError(f"Rendering {scene_class} failed: {result.error}")
+    if cache is not None:
+        await asyncio.to_thread(cache.put, key, result.output)
+    return result.output
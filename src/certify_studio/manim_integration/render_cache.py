@@ -0,0 +1,265 @@
+"""
+Content-addressed cache for rendered Manim scenes.
+
+Clips are stored under a hash of everything that determines the pixels:
+the scene spec (scene data or generated Manim code), the theme, the render
+quality and the installed Manim version. Identical scenes are therefore
+rendered once and reused across generations and users. Manim's partial
+movie files are kept per scene as well, so a scene whose spec changed only
+slightly re-renders just the animations that differ.
+
+The cache directory has a byte budget; entries are evicted least recently
+used first. Recency is kept in file modification times so it survives
+restarts and is shared by every process using the directory. Each process
+keeps its own index and re-syncs it from disk periodically or when it
+goes over budget. Partial movie directories handed to a render are not
+evicted while it may still be writing to them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def manim_version() -> str:
+    """Installed Manim version, part of every cache key."""
+    try:
+        from importlib.metadata import version
+        return version("manim")
+    except Exception:
+        return "unknown"
+
+
+def _disk_size(path: Path) -> int:
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return path.stat().st_size
+
+
+class RenderCache:
+    """Disk cache of rendered clips and partial movie files with an LRU byte budget."""
+
+    # Seconds between re-syncs of the index with entries other processes wrote
+    RESCAN_SECONDS = 60.0
+
+    def __init__(self, root: Optional[Union[str, Path]] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root or settings.RENDER_CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else settings.RENDER_CACHE_MAX_BYTES
+        self.clips_dir = self.root / "clips"
+        self.partials_dir = self.root / "partials"
+        self._entries: "OrderedDict[Path, int]" = OrderedDict()
+        # Partial movie directories in use by this process's renders
+        self._pinned: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._scanned_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(
+        spec: Union[str, Dict[str, Any]],
+        theme: Optional[Dict[str, Any]] = None,
+        quality: str = "high_quality",
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Hash of everything that affects a scene's rendered output."""
+        payload = json.dumps(
+            {
+                "spec": spec,
+                "theme": theme or {},
+                "quality": quality,
+                "extra": extra or {},
+                "manim": manim_version(),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        """Index existing entries on first use."""
+        if not self._loaded:
+            self._rescan()
+
+    def _rescan(self) -> None:
+        """Re-index entries from disk, oldest first. Caller holds the lock."""
+        entries = []
+        for base in (self.clips_dir, self.partials_dir):
+            if not base.exists():
+                continue
+            for path in base.glob("*/*"):
+                if path.name.endswith(".tmp"):
+                    continue
+                try:
+                    entries.append((path.stat().st_mtime, path, _disk_size(path)))
+                except OSError:
+                    continue
+        # Modification times can tie within a clock tick; this process's own order breaks ties
+        rank = {path: i for i, path in enumerate(self._entries)}
+        entries.sort(key=lambda entry: (entry[0], rank.get(entry[1], -1)))
+        self._entries = OrderedDict((path, size) for _, path, size in entries)
+        self._loaded = True
+        self._scanned_at = time.monotonic()
+
+    def _clip_path(self, key: str, suffix: str) -> Path:
+        return self.clips_dir / key[:2] / f"{key}{suffix}"
+
+    def _touch(self, path: Path) -> None:
+        """Mark an entry as recently used. Caller holds the lock."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        if path in self._entries:
+            self._entries.move_to_end(path)
+
+    def get(self, key: str, suffix: str = ".mp4") -> Optional[Path]:
+        """Return the cached clip for ``key``, or None on a miss."""
+        path = self._clip_path(key, suffix)
+        with self._lock:
+            self._load()
+            if not path.exists():
+                self._entries.pop(path, None)
+                self.misses += 1
+                return None
+            self._touch(path)
+            self.hits += 1
+            return path
+
+    def fetch(self, key: str, destination: Path, suffix: str = ".mp4") -> Optional[Path]:
+        """Place the cached clip at ``destination``; None on a miss."""
+        cached = self.get(key, suffix)
+        if cached is None:
+            return None
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _link_or_copy(cached, destination)
+        except FileNotFoundError:
+            # Evicted by another process between lookup and copy
+            return None
+        return destination
+
+    def put(self, key: str, source: Path) -> Path:
+        """Store a rendered clip under ``key`` and enforce the budget."""
+        path = self._clip_path(key, source.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        _link_or_copy(source, staging)
+        os.replace(staging, path)
+        with self._lock:
+            self._load()
+            self._entries[path] = path.stat().st_size
+            self._touch(path)
+            self._evict()
+        return path
+
+    def partial_dir(self, scene_id: str, quality: str) -> Path:
+        """
+        Persistent directory for one scene's partial movie files.
+        
+        The directory is pinned against eviction until ``record_partials``
+        is called for it, which callers must do whether or not the render
+        succeeded.
+        """
+        name = hashlib.sha256(f"{scene_id}:{quality}:{manim_version()}".encode()).hexdigest()[:32]
+        path = self.partials_dir / name[:2] / name
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._load()
+            self._entries.setdefault(path, 0)
+            self._pinned[path] = self._pinned.get(path, 0) + 1
+            self._touch(path)
+        return path
+
+    def record_partials(self, path: Path) -> None:
+        """Re-measure and unpin a partial movie directory after a render used it."""
+        with self._lock:
+            self._load()
+            if self._pinned.get(path, 0) > 1:
+                self._pinned[path] -= 1
+            else:
+                self._pinned.pop(path, None)
+            if path.exists():
+                self._entries[path] = _disk_size(path)
+                self._touch(path)
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        return sum(self._entries.values())
+
+    def _in_use(self, path: Path) -> bool:
+        """Whether a partial movie directory may still be written to by a render."""
+        if path in self._pinned:
+            return True
+        if path.parent.parent != self.partials_dir:
+            return False
+        try:
+            # Renders in other processes: too recent to have timed out yet
+            return time.time() - path.stat().st_mtime < settings.RENDER_SCENE_TIMEOUT_SECONDS
+        except OSError:
+            return False
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under budget. Caller holds the lock."""
+        total = sum(self._entries.values())
+        if total > self.max_bytes or time.monotonic() - self._scanned_at > self.RESCAN_SECONDS:
+            # Other processes write to the same directory
+            self._rescan()
+            total = sum(self._entries.values())
+        if total <= self.max_bytes:
+            return
+        
+        for path, size in list(self._entries.items())[:-1]:
+            if total <= self.max_bytes:
+                break
+            if self._in_use(path):
+                continue
+            del self._entries[path]
+            total -= size
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not evict render cache entry {path}: {e}")
+            logger.debug(f"Evicted render cache entry {path.name} ({size} bytes)")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self._entries.clear()
+            self._pinned.clear()
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard-link when source and destination share a filesystem, else copy."""
+    if destination.exists():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+render_cache = RenderCache()
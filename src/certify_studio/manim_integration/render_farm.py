@@ -0,0 +1,227 @@
+"""
+Parallel render farm for Manim scenes.
+
+Each scene is rendered in its own worker process with a private Manim
+configuration and media directory, so scenes never share the global
+``manim.config`` or overwrite each other's partial movie files. Jobs are
+taken from a priority queue by a fixed number of workers; a job that runs
+past its timeout has its process killed and is reported as failed.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..core.config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+WORKER_MODULE = "certify_studio.manim_integration.render_worker"
+
+
+@dataclass
+class RenderJob:
+    """A single scene to render."""
+    scene_data: Dict[str, Any]
+    output_dir: Path
+    output_name: str
+    quality: str = "high_quality"
+    priority: int = 0
+    timeout: Optional[float] = None
+    config: Dict[str, Any] = field(default_factory=dict)
+    manim_code: Optional[str] = None  # Render a generated scene module instead of scene_data
+    scene_class: Optional[str] = None
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a render job."""
+    job: RenderJob
+    output: Optional[Path] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.output is not None
+
+
+class RenderFarm:
+    """
+    Render scenes concurrently, one isolated process per scene.
+
+    Lower ``priority`` values are rendered first; jobs with equal priority
+    keep submission order.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        scene_timeout: Optional[float] = None,
+        work_dir: Optional[Path] = None,
+        worker_command: Optional[Sequence[str]] = None
+    ):
+        self.max_workers = max_workers or settings.RENDER_WORKERS or os.cpu_count() or 1
+        self.scene_timeout = scene_timeout or settings.RENDER_SCENE_TIMEOUT_SECONDS
+        self.work_dir = Path(work_dir or settings.MANIM_TEMP_DIR)
+        self.worker_command = list(worker_command or [sys.executable, "-m", WORKER_MODULE])
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._workers = []
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def submit(self, job: RenderJob) -> "asyncio.Future[RenderResult]":
+        """Queue a job; the returned future resolves to its result."""
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job.priority, next(self._sequence), job, future))
+        return future
+
+    async def render_all(self, jobs: List[RenderJob]) -> List[RenderResult]:
+        """Render jobs concurrently and return results in job order."""
+        return list(await asyncio.gather(*(self.submit(job) for job in jobs)))
+
+    async def shutdown(self) -> None:
+        """Stop the workers; queued jobs that have not started are cancelled."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, job, future = await self._queue.get()
+            try:
+                if future.cancelled():
+                    continue
+                result = await self._run(job)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Render of {job.output_name} crashed: {e}")
+                result = RenderResult(job, error=str(e))
+            finally:
+                self._queue.task_done()
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, job: RenderJob) -> RenderResult:
+        """Render one job in a subprocess with its own media directory."""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        media_dir = Path(tempfile.mkdtemp(prefix=f"{job.output_name}_", dir=self.work_dir))
+        payload = json.dumps({
+            "scene_data": job.scene_data,
+            "media_dir": str(media_dir),
+            "output_name": job.output_name,
+            "quality": job.quality,
+            "config": job.config,
+            "manim_code": job.manim_code,
+            "scene_class": job.scene_class,
+        }, default=str).encode()
+        timeout = job.timeout or self.scene_timeout
+        start = time.perf_counter()
+
+        process = await asyncio.create_subprocess_exec(
+            *self.worker_command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(payload), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.warning(f"Render of {job.output_name} timed out after {timeout}s")
+                return RenderResult(job, error=f"Timed out after {timeout}s",
+                                    duration=time.perf_counter() - start)
+            except asyncio.CancelledError:
+                process.kill()
+                await process.wait()
+                raise
+
+            reply = self._parse_reply(stdout)
+            if process.returncode != 0 or "output" not in reply:
+                error = reply.get("error") or stderr.decode(errors="replace").strip()[-2000:]
+                logger.warning(f"Render of {job.output_name} failed: {error}")
+                return RenderResult(job, error=error or f"Exit code {process.returncode}",
+                                    duration=time.perf_counter() - start)
+
+            rendered = Path(reply["output"])
+            job.output_dir.mkdir(parents=True, exist_ok=True)
+            destination = job.output_dir / f"{job.output_name}{rendered.suffix}"
+            shutil.move(str(rendered), destination)
+            return RenderResult(job, output=destination, duration=time.perf_counter() - start)
+        finally:
+            shutil.rmtree(media_dir, ignore_errors=True)
+
+    @staticmethod
+    def _parse_reply(stdout: bytes) -> Dict[str, Any]:
+        """The worker's reply is the last JSON line it printed."""
+        for line in reversed(stdout.decode(errors="replace").splitlines()):
+            line = line.strip()
+            if line.startswith("{"):
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+        return {}
+
+
+async def concat_videos(videos: List[Path], output: Path, ffmpeg: str = "ffmpeg") -> Path:
+    """
+    Join rendered scenes into one video without re-encoding.
+
+    All inputs come from the same render settings, so ffmpeg's concat
+    demuxer can copy the streams.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    list_file = output.with_suffix(".concat.txt")
+    list_file.write_text("".join(
+        "file '{}'\n".format(str(Path(video).resolve()).replace("'", "'\\''"))
+        for video in videos
+    ))
+    try:
+        process = await asyncio.create_subprocess_exec(
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-c", "copy", str(output),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed: {stderr.decode(errors='replace').strip()}")
+    finally:
+        list_file.unlink(missing_ok=True)
+    return output
+
+
+render_farm = RenderFarm()
@@ -0,0 +1,94 @@
+"""
+Render a single Manim scene in an isolated process.
+
+Manim keeps its configuration in a process-wide ``config`` object, so
+scenes are rendered one per process by the render farm. The job arrives
+as JSON on stdin; the path of the rendered movie is printed as JSON on
+the last line of stdout.
+
+Usage:
+    echo '{"scene_data": {...}, "media_dir": "...", "output_name": "scene_000"}' \\
+        | python -m certify_studio.manim_integration.render_worker
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+VIDEO_SUFFIXES = (".mp4", ".mov", ".webm", ".gif")
+
+
+def find_rendered_movie(media_dir: Path, output_name: Optional[str] = None) -> Optional[Path]:
+    """
+    Locate the movie Manim wrote under ``media_dir``.
+
+    Partial movie files are ignored; if ``output_name`` is given only files
+    with that stem match. The newest match wins.
+    """
+    candidates = [
+        path for path in Path(media_dir).rglob("*")
+        if path.suffix in VIDEO_SUFFIXES
+        and "partial_movie_files" not in path.parts
+        and (output_name is None or path.stem == output_name)
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_mtime)
+
+
+def load_scene(job: Dict[str, Any]):
+    """Build the scene: generated Manim code if given, else agent scene data."""
+    if job.get("manim_code"):
+        module_path = Path(job["media_dir"]) / "generated_scene.py"
+        module_path.write_text(job["manim_code"])
+        spec = importlib.util.spec_from_file_location("generated_scene", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, job["scene_class"])()
+
+    from .scene_generator import AgentGeneratedScene
+    return AgentGeneratedScene(job["scene_data"])
+
+
+def render_job(job: Dict[str, Any]) -> Path:
+    """Render one scene with a configuration private to this process."""
+    from manim import tempconfig
+
+    overrides = {
+        "quality": job.get("quality", "high_quality"),
+        "media_dir": job["media_dir"],
+        "output_file": job["output_name"],
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    overrides.update(job.get("config", {}))
+
+    with tempconfig(overrides):
+        scene = load_scene(job)
+        scene.render()
+        movie = getattr(scene.renderer.file_writer, "movie_file_path", None)
+
+    if movie and Path(movie).exists():
+        return Path(movie)
+
+    found = find_rendered_movie(Path(job["media_dir"]), job["output_name"])
+    if found is None:
+        raise FileNotFoundError(f"No movie written under {job['media_dir']}")
+    return found
+
+
+def main() -> int:
+    job = json.load(sys.stdin)
+    try:
+        output = render_job(job)
+    except Exception as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}))
+        return 1
+    print(json.dumps({"output": str(output)}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
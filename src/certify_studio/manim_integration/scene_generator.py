@@ -4,15 +4,24 @@ Manim scene generator that converts agent output to Manim scenes.
 
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
+import asyncio
 import json
 
 from manim import *
+from ..core.config import settings
 from ..core.logging import get_logger
+from .export_pipeline import ExportError, extract_frames
+from .render_cache import RenderCache, render_cache
+from .render_farm import RenderFarm, RenderJob, concat_videos, render_farm
+from .render_worker import find_rendered_movie
 from ..agents.content.animation_choreography_agent import AnimationScene, AnimationElement
 from ..agents.content.diagram_generation.models import Diagram, DiagramElement, DiagramEdge
 
 logger = get_logger(__name__)
 
+# Farm priority for previews; full renders default to 0
+PREVIEW_PRIORITY = -10
+
 
 class AgentGeneratedScene(Scene):
     """Base scene class for agent-generated content."""
@@ -23,6 +32,44 @@ class AgentGeneratedScene(Scene):
         self.mobjects_map = {}
         self.animation_queue = []
     
+    @staticmethod
+    def preview_config() -> Dict[str, Any]:
+        """Manim config overrides for fast low-resolution, low-fps proxies."""
+        
+        width, height = settings.PREVIEW_RESOLUTION.split("x")
+        return {
+            "pixel_width": int(width),
+            "pixel_height": int(height),
+            "frame_rate": settings.PREVIEW_FPS
+        }
+    
+    @staticmethod
+    def keyframe_times(scene_data: Dict[str, Any]) -> List[float]:
+        """
+        Timestamps worth a preview thumbnail, in seconds.
+        
+        Uses the sequence's AnimationKeyframe times when present, otherwise
+        the moments elements enter or leave the scene.
+        """
+        
+        content = scene_data.get("content", {})
+        keyframes = scene_data.get("keyframes") or content.get("keyframes") or []
+        times = {
+            float(kf["time"] if isinstance(kf, dict) else kf.time)
+            for kf in keyframes
+        }
+        
+        if not times:
+            specs = content.get("scenes", [content])
+            for spec in specs:
+                for element in spec.get("elements", []):
+                    timing = element.get("timing", {})
+                    for edge in ("start", "end"):
+                        if edge in timing:
+                            times.add(float(timing[edge]))
+        
+        return sorted(t for t in times if t >= 0)
+    
     def construct(self):
         """Construct the scene from agent data."""
         
@@ -508,37 +555,138 @@ if __name__ == "__main__":
         
         return AgentGeneratedScene(scene_data)
     
-    def render_scenes(
+    async def render_scenes(
         self,
         scenes_data: List[Dict[str, Any]],
         output_dir: Path,
-        quality: str = "high_quality"
+        quality: str = "high_quality",
+        concat_output: Optional[Path] = None,
+        farm: Optional[RenderFarm] = None,
+        theme: Optional[Dict[str, Any]] = None,
+        cache: Optional[RenderCache] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        require_all: bool = False
     ) -> List[Path]:
-        """Render multiple scenes."""
+        """
+        Render multiple scenes in parallel on the render farm.
+        
+        Scenes render in separate processes, each with its own Manim config
+        and media directory. Scenes already in the render cache are copied
+        instead of rendered. Rendered files are returned in scene order;
+        failed scenes are logged and left out, or with ``require_all`` raise
+        an ExportError naming them. If ``concat_output`` is given the rendered
+        scenes are also joined into that single video.
+        """
+        
+        farm = farm or render_farm
+        if cache is None and settings.RENDER_CACHE_ENABLED:
+            cache = render_cache
+        
+        config_overrides = config_overrides or {}
+        variant = quality
+        if config_overrides:
+            variant += ":" + json.dumps(config_overrides, sort_keys=True)
+        
+        outputs: List[Optional[Path]] = [None] * len(scenes_data)
+        jobs, job_indices, job_keys = [], [], []
+        for i, scene_data in enumerate(scenes_data):
+            output_name = f"scene_{i:03d}"
+            key = None
+            if cache is not None:
+                key = cache.key_for(scene_data, theme, quality, extra=config_overrides)
+                outputs[i] = await asyncio.to_thread(
+                    cache.fetch, key, output_dir / f"{output_name}.mp4"
+                )
+                if outputs[i] is not None:
+                    continue
+            job = RenderJob(
+                scene_data=scene_data,
+                output_dir=output_dir,
+                output_name=output_name,
+                quality=quality,
+                priority=priority + scene_data.get("priority", 0),
+                config=dict(config_overrides)
+            )
+            if cache is not None:
+                # Without a stable id, only an identical spec may reuse partial movies
+                scene_id = scene_data.get("id") or key
+                job.config["partial_movie_dir"] = str(cache.partial_dir(scene_id, variant))
+            jobs.append(job)
+            job_indices.append(i)
+            job_keys.append(key)
+        
+        logger.info(
+            f"Rendering {len(jobs)} of {len(scenes_data)} scenes on {farm.max_workers} workers "
+            f"({len(scenes_data) - len(jobs)} cached)"
+        )
+        
+        try:
+            results = await farm.render_all(jobs)
+        finally:
+            if cache is not None:
+                # Unpins the partial movie directories, rendered or not
+                for job in jobs:
+                    await asyncio.to_thread(cache.record_partials, Path(job.config["partial_movie_dir"]))
+        
+        failed = []
+        for index, key, result in zip(job_indices, job_keys, results):
+            if not result.success:
+                logger.warning(f"Scene {result.job.output_name} was not rendered: {result.error}")
+                failed.append(result.job.output_name)
+                continue
+            outputs[index] = result.output
+            if cache is not None:
+                await asyncio.to_thread(cache.put, key, result.output)
         
-        rendered_files = []
+        if failed and require_all:
+            raise ExportError(
+                f"{len(failed)} of {len(scenes_data)} scenes failed to render: {', '.join(failed)}"
+            )
         
-        for i, scene_data in enumerate(scenes_data):
-            logger.info(f"Rendering scene {i+1}/{len(scenes_data)}")
-            
-            # Configure Manim
-            config.quality = quality
-            config.output_file = f"scene_{i:03d}"
-            
-            # Create and render scene
-            scene = self.create_scene_instance(scene_data)
-            scene.render()
-            
-            # Get output file
-            output_file = self._get_latest_output_file(output_dir)
-            if output_file:
-                rendered_files.append(output_file)
+        rendered_files = [output for output in outputs if output is not None]
+        
+        if concat_output and rendered_files:
+            await concat_videos(rendered_files, concat_output)
         
         return rendered_files
     
+    async def render_preview(
+        self,
+        scene_data: Dict[str, Any],
+        output_dir: Path,
+        thumbnails: bool = True,
+        farm: Optional[RenderFarm] = None,
+        cache: Optional[RenderCache] = None
+    ) -> Dict[str, Any]:
+        """
+        Render a fast low-resolution proxy of one scene.
+        
+        The proxy jumps ahead of full-quality renders in the farm queue.
+        With ``thumbnails`` a still is also taken at every keyframe.
+        Returns the proxy path, the thumbnail paths and their timestamps.
+        """
+        
+        rendered = await self.render_scenes(
+            [scene_data],
+            output_dir,
+            quality="low_quality",
+            farm=farm,
+            cache=cache,
+            config_overrides=AgentGeneratedScene.preview_config(),
+            priority=PREVIEW_PRIORITY
+        )
+        if not rendered:
+            raise ExportError("Preview render failed")
+        
+        preview = {"video": rendered[0], "thumbnails": [], "keyframes": []}
+        if thumbnails:
+            times = AgentGeneratedScene.keyframe_times(scene_data) or [0.0]
+            preview["thumbnails"] = await extract_frames(rendered[0], times, output_dir / "thumbnails")
+            preview["keyframes"] = times
+        return preview
+    
     def _get_latest_output_file(self, output_dir: Path) -> Optional[Path]:
         """Get the most recently created output file."""
         
-        # This would check Manim's output directory
-        # For now, return a placeholder
-        return output_dir / "rendered_scene.mp4"
+        return find_rendered_movie(output_dir)
@@ -3,10 +3,14 @@ ML Module for Certify Studio
 Advanced machine learning capabilities for educational intelligence.
 """
 
+from .model_registry import ModelRegistry, ModelUnavailableError, model_registry
 from .embeddings import EmbeddingGenerator
 from .nlp import NLPProcessor
 
 __all__ = [
     'EmbeddingGenerator',
-    'NLPProcessor'
+    'NLPProcessor',
+    'ModelRegistry',
+    'ModelUnavailableError',
+    'model_registry'
 ]
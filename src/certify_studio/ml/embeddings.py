@@ -12,18 +12,18 @@ import numpy as np
 from pathlib import Path
 
 import torch
-from sentence_transformers import SentenceTransformer
-from transformers import (
-    AutoTokenizer,
-    AutoModel,
-    CLIPProcessor,
-    CLIPModel
-)
 import librosa
 from PIL import Image
 
 from ..core.logging import get_logger
 from ..core.config import settings
+from .model_registry import (
+    ModelRegistry,
+    model_registry,
+    TEXT_EMBEDDING_MODEL,
+    TEXT_EMBEDDING_DIM
+)
+from .vector_cache import VectorCache, content_key, get_vector_cache
 
 logger = get_logger(__name__)
 
@@ -36,32 +36,51 @@ class EmbeddingGenerator:
     the educational essence of content across modalities.
     """
     
-    def __init__(self):
-        """Initialize embedding models."""
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        
-        # Text embedding model - educational content optimized
-        self.text_model = SentenceTransformer('all-MiniLM-L6-v2')
-        self.text_model.to(self.device)
-        
-        # Multimodal model for vision-text
-        try:
-            self.clip_processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
-            self.clip_model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
-            self.clip_model.to(self.device)
-            self.multimodal_available = True
-        except Exception as e:
-            logger.warning(f"CLIP model not available: {e}")
-            self.multimodal_available = False
-        
-        # Educational concept embedding space
+    def __init__(self, registry: Optional[ModelRegistry] = None):
+        """
+        Initialize the generator.
+        
+        Models come from the shared registry and are only loaded on first
+        use, so constructing several generators is cheap.
+        
+        Args:
+            registry: Model registry, defaults to the process-wide one
+        """
+        self.registry = registry or model_registry
+        
+        # Educational concept embedding space (core concepts added lazily)
         self.concept_embeddings = {}
-        self._initialize_concept_space()
+        self._concept_space_initialized = False
         
-        logger.info(f"EmbeddingGenerator initialized on {self.device}")
+        logger.info("EmbeddingGenerator initialized")
+    
+    @property
+    def device(self) -> torch.device:
+        return self.registry.device
+    
+    @property
+    def text_model(self):
+        """Text embedding model - educational content optimized."""
+        return self.registry.get("sentence_transformer")
+    
+    @property
+    def multimodal_available(self) -> bool:
+        """Whether the CLIP vision-text model can be used."""
+        return self.registry.get_optional("clip") is not None
+    
+    @property
+    def clip_processor(self):
+        return self.registry.get("clip")[0]
+    
+    @property
+    def clip_model(self):
+        return self.registry.get("clip")[1]
     
     def _initialize_concept_space(self):
         """Initialize educational concept embedding space."""
+        if self._concept_space_initialized:
+            return
+        
         # Core educational concepts with their embeddings
         # In production, these would be learned from data
         core_concepts = [
@@ -70,8 +89,85 @@ class EmbeddingGenerator:
             "competency", "mastery", "prerequisite", "foundation"
         ]
         
-        for concept in core_concepts:
-            self.concept_embeddings[concept] = self.text_model.encode(concept)
+        embeddings = self._encode(core_concepts)
+        for concept, embedding in zip(core_concepts, embeddings):
+            self.concept_embeddings.setdefault(concept, embedding)
+        self._concept_space_initialized = True
+    
+    def _vector_cache(self) -> Optional[VectorCache]:
+        """Persistent embedding cache shared by every process, if enabled."""
+        if not settings.EMBEDDING_CACHE_ENABLED:
+            return None
+        return get_vector_cache(
+            settings.EMBEDDING_CACHE_DIR,
+            TEXT_EMBEDDING_MODEL,
+            TEXT_EMBEDDING_DIM,
+            max_bytes=settings.EMBEDDING_CACHE_MAX_BYTES
+        )
+    
+    def _encode(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Encode texts in batches, reusing cached vectors.
+        
+        Only distinct texts missing from the cache reach the model; they
+        are encoded in one batched call and written back to the cache.
+        """
+        if not texts:
+            return np.zeros((0, TEXT_EMBEDDING_DIM), dtype=np.float32)
+        
+        cache = self._vector_cache()
+        if cache is not None:
+            keys = [content_key(text) for text in texts]
+            vectors, missing = cache.get_many(keys)
+        else:
+            vectors = np.zeros((len(texts), TEXT_EMBEDDING_DIM), dtype=np.float32)
+            missing = list(range(len(texts)))
+        
+        if missing:
+            positions: Dict[str, List[int]] = {}
+            for i in missing:
+                positions.setdefault(texts[i], []).append(i)
+            
+            encoded = self.text_model.encode(
+                list(positions),
+                batch_size=batch_size or settings.EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            ).astype(np.float32, copy=False)
+            
+            for rows, vector in zip(positions.values(), encoded):
+                vectors[rows] = vector
+            
+            if cache is not None:
+                cache.put_many([content_key(text) for text in positions], encoded)
+        
+        return vectors
+    
+    async def generate_text_embeddings(self,
+                                     texts: List[str],
+                                     educational_context: Optional[Dict[str, Any]] = None,
+                                     batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Generate embeddings for many texts in batched model calls.
+        
+        Args:
+            texts: Input texts
+            educational_context: Context applied to every text
+            batch_size: Texts per model batch, defaults to config
+            
+        Returns:
+            Matrix with one embedding row per text
+        """
+        embeddings = await asyncio.to_thread(self._encode, list(texts), batch_size)
+        
+        if educational_context:
+            # Enhance with educational context
+            embeddings = np.vstack([
+                self._enhance_with_education_context(embedding, text, educational_context)
+                for embedding, text in zip(embeddings, texts)
+            ]) if len(texts) else embeddings
+        
+        return embeddings
     
     async def generate_text_embedding(self, 
                                     text: str,
@@ -86,16 +182,8 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector
         """
-        # Basic text embedding
-        base_embedding = self.text_model.encode(text, convert_to_numpy=True)
-        
-        if educational_context:
-            # Enhance with educational context
-            base_embedding = self._enhance_with_education_context(
-                base_embedding, text, educational_context
-            )
-        
-        return base_embedding
+        embeddings = await self.generate_text_embeddings([text], educational_context)
+        return embeddings[0]
     
     async def generate_multimodal_embedding(self,
                                           image: Optional[Image.Image] = None,
@@ -124,8 +212,8 @@ class EmbeddingGenerator:
             weights.append(0.4)  # Text is primary for education
         
         # Image embedding
-        if image and self.multimodal_available:
-            image_emb = self._generate_image_embedding(image)
+        if image and await self.registry.aget_optional("clip") is not None:
+            image_emb = await asyncio.to_thread(self._generate_image_embedding, image)
             embeddings.append(image_emb)
             weights.append(0.3)
         
@@ -137,7 +225,7 @@ class EmbeddingGenerator:
         
         # Metadata embedding
         if metadata:
-            meta_emb = self._generate_metadata_embedding(metadata)
+            meta_emb = await asyncio.to_thread(self._generate_metadata_embedding, metadata)
             embeddings.append(meta_emb)
             weights.append(0.1)
         
@@ -228,7 +316,7 @@ class EmbeddingGenerator:
         combined_text = "; ".join(meta_text)
         
         if combined_text:
-            return self.text_model.encode(combined_text, convert_to_numpy=True)
+            return self._encode([combined_text])[0]
         else:
             return np.zeros(384)
     
@@ -243,17 +331,18 @@ class EmbeddingGenerator:
         # Cognitive level enhancement
         if 'cognitive_level' in context:
             level_text = f"cognitive level {context['cognitive_level']}"
-            level_emb = self.text_model.encode(level_text, convert_to_numpy=True)
+            level_emb = self._encode([level_text])[0]
             enhancements.append(level_emb * 0.1)
         
         # Learning objective alignment
         if 'learning_objectives' in context:
             objectives_text = " ".join(context['learning_objectives'][:3])
-            obj_emb = self.text_model.encode(objectives_text, convert_to_numpy=True)
+            obj_emb = self._encode([objectives_text])[0]
             enhancements.append(obj_emb * 0.15)
         
         # Concept alignment
         if 'concepts' in context:
+            self._initialize_concept_space()
             # Find concept similarity
             concept_sims = []
             for concept in context['concepts']:
@@ -446,33 +535,60 @@ class EmbeddingGenerator:
     
     async def find_similar_content(self,
                                  query_embedding: np.ndarray,
-                                 content_embeddings: Dict[str, np.ndarray],
+                                 content_embeddings: Union[Dict[str, np.ndarray], np.ndarray],
                                  top_k: int = 5,
-                                 threshold: float = 0.7) -> List[Tuple[str, float]]:
+                                 threshold: float = 0.7,
+                                 content_ids: Optional[List[Any]] = None) -> List[Tuple[Any, float]]:
         """
         Find similar educational content.
         
+        Similarity is the cosine rescaled to 0-1, as in
+        ``compute_educational_similarity``, computed for every item in one
+        matrix product; the top-k is selected with ``argpartition``.
+        
         Args:
             query_embedding: Query embedding
-            content_embeddings: Dictionary of content_id -> embedding
+            content_embeddings: Dictionary of content_id -> embedding, or a
+                stacked (n, dim) matrix
             top_k: Number of results to return
             threshold: Minimum similarity threshold
+            content_ids: Row identifiers when passing a matrix (defaults to
+                row indices)
             
         Returns:
             List of (content_id, similarity_score) tuples
         """
-        similarities = []
-        
-        for content_id, content_embedding in content_embeddings.items():
-            sim = self.compute_educational_similarity(query_embedding, content_embedding)
-            
-            if sim >= threshold:
-                similarities.append((content_id, sim))
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        return similarities[:top_k]
+        if isinstance(content_embeddings, dict):
+            content_ids = list(content_embeddings)
+            matrix = (
+                np.vstack([np.asarray(e, dtype=np.float32).ravel() for e in content_embeddings.values()])
+                if content_ids else np.zeros((0, np.asarray(query_embedding).shape[-1]), dtype=np.float32)
+            )
+        else:
+            matrix = np.asarray(content_embeddings, dtype=np.float32)
+            if content_ids is None:
+                content_ids = list(range(matrix.shape[0]))
+        
+        if matrix.shape[0] == 0 or top_k <= 0:
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        
+        row_norms = np.linalg.norm(matrix, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine = (matrix @ query) / (row_norms * query_norm)
+        similarities = np.where(row_norms > 0, (cosine + 1) / 2, 0.0)
+        
+        candidates = np.flatnonzero(similarities >= threshold)
+        if candidates.size > top_k:
+            top = np.argpartition(-similarities[candidates], top_k - 1)[:top_k]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        
+        return [(content_ids[i], float(similarities[i])) for i in candidates]
     
     async def generate_audio_embedding(self,
                                      audio_data: np.ndarray,
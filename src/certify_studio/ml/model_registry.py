@@ -0,0 +1,434 @@
+"""
+Model Registry - Shared, Lazily Loaded ML Models
+Part of the AI Agent Orchestration Platform for Educational Excellence
+
+Every heavyweight model (sentence embeddings, CLIP, spaCy, NER, Whisper,
+Wav2Vec2, BLIP, LayoutLMv3) is loaded at most once per process, on first
+use, and shared by every consumer. Models can be pre-warmed at startup and
+unloaded again when idle or when the process exceeds a memory budget.
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..core.logging import get_logger
+from ..core.config import settings
+
+logger = get_logger(__name__)
+
+# Sentence embedding model shared by EmbeddingGenerator and its vector cache
+TEXT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+TEXT_EMBEDDING_DIM = 384
+
+
+class ModelUnavailableError(RuntimeError):
+    """Raised when a registered model cannot be loaded."""
+
+
+@dataclass
+class ModelEntry:
+    """Bookkeeping for a single registered model."""
+    name: str
+    loader: Callable[[], Any]
+    description: str = ""
+    instance: Any = None
+    loaded: bool = False
+    error: Optional[str] = None
+    load_seconds: float = 0.0
+    rss_delta_bytes: int = 0
+    loaded_at: Optional[float] = None
+    last_used: Optional[float] = None
+    use_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, best effort."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        # ru_maxrss is the peak, in KiB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of lazily loaded models.
+
+    Loading is thread-safe and happens once per model; concurrent callers
+    wait for the first load instead of loading their own copy. A failed
+    load is remembered so optional models are not retried on every call -
+    ``unload`` clears the failure and allows another attempt.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._device = None
+        # RSS at which unloading last stopped freeing memory
+        self._stalled_rss: Optional[int] = None
+
+    @property
+    def device(self):
+        """Torch device shared by all models (resolved on first access)."""
+        if self._device is None:
+            import torch
+            self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        return self._device
+
+    def register(self,
+                 name: str,
+                 loader: Callable[[], Any],
+                 description: str = "",
+                 replace: bool = False):
+        """
+        Register a model loader.
+
+        Args:
+            name: Registry key
+            loader: Zero-argument callable returning the loaded model
+            description: Human readable description for metrics
+            replace: Replace an existing registration (unloading it first)
+        """
+        with self._lock:
+            if name in self._entries and not replace:
+                return
+            previous = self._entries.get(name)
+            self._entries[name] = ModelEntry(name=name, loader=loader, description=description)
+
+        if previous is not None:
+            with previous.lock:
+                if previous.loaded:
+                    self._release(previous)
+
+    def registered(self) -> List[str]:
+        """Names of all registered models."""
+        return list(self._entries)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a model is currently in memory."""
+        entry = self._entries.get(name)
+        return bool(entry and entry.loaded)
+
+    def get(self, name: str) -> Any:
+        """
+        Return a model, loading it on first use.
+
+        Raises:
+            KeyError: If no model is registered under ``name``
+            ModelUnavailableError: If the model failed to load
+        """
+        entry = self._entries[name]
+
+        # Read the instance under the lock: a concurrent unload may release it
+        with entry.lock:
+            if not entry.loaded:
+                if entry.error is not None:
+                    raise ModelUnavailableError(f"{name}: {entry.error}")
+                self._load(entry)
+            instance = entry.instance
+            entry.last_used = time.monotonic()
+            entry.use_count += 1
+        return instance
+
+    def get_optional(self, name: str) -> Optional[Any]:
+        """Return a model, or None if it is unavailable."""
+        try:
+            return self.get(name)
+        except ModelUnavailableError:
+            return None
+
+    async def aget(self, name: str) -> Any:
+        """``get`` for coroutines: a model that is not in memory loads in a worker thread."""
+        if self.is_loaded(name):
+            return self.get(name)
+        return await asyncio.to_thread(self.get, name)
+
+    async def aget_optional(self, name: str) -> Optional[Any]:
+        """``get_optional`` for coroutines, loading in a worker thread."""
+        try:
+            return await self.aget(name)
+        except ModelUnavailableError:
+            return None
+
+    def _load(self, entry: ModelEntry):
+        """Load a model while holding its lock."""
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        try:
+            instance = entry.loader()
+        except Exception as e:
+            entry.error = str(e) or e.__class__.__name__
+            logger.warning(f"Model {entry.name} unavailable: {entry.error}")
+            raise ModelUnavailableError(f"{entry.name}: {entry.error}") from e
+
+        entry.load_seconds = time.perf_counter() - start
+        entry.rss_delta_bytes = max(0, current_rss_bytes() - rss_before)
+        entry.instance = instance
+        entry.loaded = True
+        entry.loaded_at = time.monotonic()
+
+        logger.info(
+            f"Loaded model {entry.name} in {entry.load_seconds:.2f}s "
+            f"(+{entry.rss_delta_bytes / (1024 * 1024):.0f} MiB RSS)"
+        )
+
+        try:
+            from ..integrations.observability.metrics import track_model_load
+            track_model_load(entry.name, entry.load_seconds, entry.rss_delta_bytes)
+        except ImportError:
+            pass
+
+    async def prewarm(self, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        Load models ahead of the first request.
+
+        Args:
+            names: Models to load, defaults to every registered model
+
+        Returns:
+            Mapping of model name to whether it is available
+        """
+        names = list(names) if names is not None else self.registered()
+
+        async def _warm(name: str) -> bool:
+            if name not in self._entries:
+                logger.warning(f"Cannot pre-warm unknown model {name}")
+                return False
+            return await asyncio.to_thread(self.get_optional, name) is not None
+
+        results = await asyncio.gather(*(_warm(name) for name in names))
+        return dict(zip(names, results))
+
+    def unload(self, name: str) -> bool:
+        """Drop a model from memory (it will reload on next use)."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+
+        with entry.lock:
+            entry.error = None
+            if not entry.loaded:
+                return False
+            self._release(entry)
+
+        self._collect_garbage()
+        logger.info(f"Unloaded model {name}")
+        return True
+
+    def _release(self, entry: ModelEntry):
+        entry.instance = None
+        entry.loaded = False
+        entry.loaded_at = None
+
+    def unload_idle(self, max_idle_seconds: float) -> List[str]:
+        """Unload models not used within ``max_idle_seconds``."""
+        now = time.monotonic()
+        idle = [
+            entry.name for entry in list(self._entries.values())
+            if entry.loaded and now - (entry.last_used or entry.loaded_at or now) >= max_idle_seconds
+        ]
+        return [name for name in idle if self.unload(name)]
+
+    def enforce_memory_limit(self, max_rss_bytes: int) -> List[str]:
+        """
+        Unload least recently used models until RSS is under the limit.
+
+        Stops as soon as an unload does not lower RSS: the memory is held
+        by something other than the models, so unloading the rest would
+        only force them to reload. Until RSS grows again later calls only
+        leave the remaining models loaded.
+        """
+        rss = current_rss_bytes()
+        if rss <= max_rss_bytes:
+            self._stalled_rss = None
+            return []
+        if self._stalled_rss is not None and rss <= self._stalled_rss:
+            return []
+
+        unloaded = []
+        loaded = sorted(
+            (entry for entry in self._entries.values() if entry.loaded),
+            key=lambda entry: entry.last_used or entry.loaded_at or 0.0
+        )
+        for entry in loaded:
+            if rss <= max_rss_bytes:
+                break
+            if not self.unload(entry.name):
+                continue
+            unloaded.append(entry.name)
+            previous, rss = rss, current_rss_bytes()
+            if rss >= previous:
+                self._stalled_rss = rss
+                logger.warning(
+                    f"RSS {rss / (1024 * 1024):.0f} MiB exceeds the "
+                    f"{max_rss_bytes / (1024 * 1024):.0f} MiB budget but unloading "
+                    f"{entry.name} freed nothing; keeping the remaining models"
+                )
+                break
+
+        if unloaded:
+            logger.warning(f"Memory pressure: unloaded {unloaded}")
+        return unloaded
+
+    async def run_maintenance(self,
+                              interval_seconds: float = 60.0,
+                              max_idle_seconds: Optional[float] = None,
+                              max_rss_bytes: Optional[int] = None):
+        """Periodically unload idle models and enforce the memory budget."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            if max_idle_seconds:
+                self.unload_idle(max_idle_seconds)
+            if max_rss_bytes:
+                self.enforce_memory_limit(max_rss_bytes)
+
+    def _collect_garbage(self):
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Load time, memory and usage statistics for every model."""
+        now = time.monotonic()
+        return {
+            "process_rss_bytes": current_rss_bytes(),
+            "models": {
+                entry.name: {
+                    "description": entry.description,
+                    "loaded": entry.loaded,
+                    "error": entry.error,
+                    "load_seconds": round(entry.load_seconds, 3),
+                    "rss_delta_bytes": entry.rss_delta_bytes,
+                    "use_count": entry.use_count,
+                    "idle_seconds": round(now - entry.last_used, 1) if entry.last_used else None,
+                }
+                for entry in self._entries.values()
+            }
+        }
+
+
+# Default loaders. Heavy libraries are imported inside each loader so that
+# importing a consumer module does not pull in torch/transformers weights.
+
+def _load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(TEXT_EMBEDDING_MODEL)
+    model.to(model_registry.device)
+    return model
+
+
+def _load_clip():
+    from transformers import CLIPProcessor, CLIPModel
+    processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
+    model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
+    model.to(model_registry.device)
+    return processor, model
+
+
+def _load_spacy():
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm")
+    except OSError as e:
+        raise ModelUnavailableError(
+            "spaCy model not found. Run: python -m spacy download en_core_web_sm"
+        ) from e
+
+
+def _load_ner():
+    from transformers import pipeline
+    return pipeline(
+        "ner",
+        model="dslim/bert-base-NER",
+        aggregation_strategy="simple"
+    )
+
+
+def _load_whisper():
+    from transformers import WhisperProcessor, WhisperForConditionalGeneration
+    processor = WhisperProcessor.from_pretrained("openai/whisper-base")
+    model = WhisperForConditionalGeneration.from_pretrained("openai/whisper-base")
+    model.to(model_registry.device)
+    return processor, model
+
+
+def _load_wav2vec2():
+    from transformers import Wav2Vec2Processor, Wav2Vec2ForCTC
+    processor = Wav2Vec2Processor.from_pretrained("facebook/wav2vec2-base-960h")
+    model = Wav2Vec2ForCTC.from_pretrained("facebook/wav2vec2-base-960h")
+    model.to(model_registry.device)
+    return processor, model
+
+
+def _load_blip():
+    from transformers import BlipProcessor, BlipForConditionalGeneration
+    processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-large")
+    model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-large")
+    model.to(model_registry.device)
+    return processor, model
+
+
+def _load_layoutlm():
+    from transformers import LayoutLMv3Processor, LayoutLMv3ForSequenceClassification
+    processor = LayoutLMv3Processor.from_pretrained("microsoft/layoutlmv3-base")
+    model = LayoutLMv3ForSequenceClassification.from_pretrained("microsoft/layoutlmv3-base")
+    model.to(model_registry.device)
+    return processor, model
+
+
+model_registry = ModelRegistry()
+
+model_registry.register("sentence_transformer", _load_sentence_transformer, f"{TEXT_EMBEDDING_MODEL} text embeddings")
+model_registry.register("clip", _load_clip, "CLIP ViT-B/32 processor and model")
+model_registry.register("spacy", _load_spacy, "spaCy en_core_web_sm pipeline")
+model_registry.register("ner", _load_ner, "dslim/bert-base-NER pipeline")
+model_registry.register("whisper", _load_whisper, "Whisper base processor and model")
+model_registry.register("wav2vec2", _load_wav2vec2, "Wav2Vec2 base-960h processor and model")
+model_registry.register("blip", _load_blip, "BLIP large captioning processor and model")
+model_registry.register("layoutlm", _load_layoutlm, "LayoutLMv3 base processor and model")
+
+
+async def start_model_registry() -> Optional[asyncio.Task]:
+    """
+    Apply startup configuration: pre-warm models and start the idle /
+    memory-pressure sweeper if either limit is configured.
+
+    Returns:
+        The maintenance task, if one was started
+    """
+    if settings.MODEL_PREWARM:
+        results = await model_registry.prewarm(settings.MODEL_PREWARM)
+        logger.info(f"Pre-warmed models: {results}")
+
+    max_idle = settings.MODEL_IDLE_UNLOAD_SECONDS or None
+    max_rss = settings.MODEL_MAX_RSS_MB * 1024 * 1024 if settings.MODEL_MAX_RSS_MB else None
+    if not (max_idle or max_rss):
+        return None
+
+    return asyncio.create_task(model_registry.run_maintenance(
+        interval_seconds=60.0,
+        max_idle_seconds=max_idle,
+        max_rss_bytes=max_rss
+    ))
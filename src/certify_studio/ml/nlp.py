@@ -9,16 +9,16 @@ and ensures content is pedagogically sound.
 import re
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
-import spacy
 import nltk
-from transformers import pipeline, AutoTokenizer, AutoModelForTokenClassification
 import numpy as np
 
 from ..core.logging import get_logger
 from ..core.config import settings
+from ..core.utils import LRUCache, generate_hash
+from .model_registry import ModelRegistry, model_registry
 
 logger = get_logger(__name__)
 
@@ -55,6 +55,23 @@ class ExtractedConcept:
     related_terms: List[str] = None
     
 
+@dataclass
+class AnnotatedText:
+    """
+    A text parsed once and shared by every analysis.
+    
+    Holds the spaCy doc (None when spaCy is unavailable), NLTK sentence
+    and word tokens, and the syllable count used for readability.
+    """
+    text: str
+    content_hash: str
+    doc: Any
+    sentences: List[str]
+    words: List[str]
+    syllable_count: int
+    complexity: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
 @dataclass
 class Relationship:
     """A relationship between concepts."""
@@ -73,15 +90,20 @@ class NLPProcessor:
     conveys educational concepts and ensures pedagogical clarity.
     """
     
-    def __init__(self):
-        """Initialize NLP models and resources."""
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model")
-        except:
-            logger.warning("spaCy model not found. Run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    def __init__(self,
+                 cache_size: Optional[int] = None,
+                 registry: Optional[ModelRegistry] = None):
+        """
+        Initialize NLP resources.
+        
+        The spaCy pipeline and NER model come from the shared model
+        registry and are loaded on first use.
+        
+        Args:
+            cache_size: Number of annotated texts kept in the parse cache
+            registry: Model registry, defaults to the process-wide one
+        """
+        self.registry = registry or model_registry
         
         # Initialize NLTK resources
         self._initialize_nltk()
@@ -89,21 +111,116 @@ class NLPProcessor:
         # Educational concept patterns
         self._initialize_patterns()
         
-        # Readability analyzer
-        self.readability_cache = {}
+        # Parsed documents keyed by content hash, shared across analyses
+        self.parse_cache = LRUCache(cache_size or settings.NLP_PARSE_CACHE_SIZE)
+        
+        logger.info("NLPProcessor initialized")
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, or None if the model is not installed."""
+        return self.registry.get_optional("spacy")
+    
+    @property
+    def ner_pipeline(self):
+        """Concept extraction model (would use fine-tuned model in production)."""
+        return self.registry.get_optional("ner")
+    
+    def annotate(self, text: str) -> AnnotatedText:
+        """
+        Parse text once, reusing a cached annotation for identical content.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Annotated text with spaCy doc, NLTK tokens and syllable count
+        """
+        content_hash = generate_hash(text)
+        annotated = self.parse_cache.get(content_hash)
+        if annotated is None:
+            nlp = self.nlp
+            doc = nlp(text) if nlp is not None else None
+            annotated = self._build_annotation(text, content_hash, doc)
+            self.parse_cache.set(content_hash, annotated)
+        return annotated
+    
+    async def annotate_batch(self,
+                           texts: List[str],
+                           n_process: Optional[int] = None,
+                           batch_size: Optional[int] = None) -> List[AnnotatedText]:
+        """
+        Annotate many texts, parsing each distinct uncached text once.
+        
+        Uncached texts are run through ``nlp.pipe`` (optionally across
+        several processes) in a worker thread so the event loop stays free.
         
-        # Concept extraction model (would use fine-tuned model in production)
-        try:
-            self.ner_pipeline = pipeline(
-                "ner",
-                model="dslim/bert-base-NER",
-                aggregation_strategy="simple"
+        Args:
+            texts: Content pieces, e.g. the sections of a course
+            n_process: spaCy worker processes, defaults to config
+            batch_size: Texts per spaCy batch, defaults to config
+            
+        Returns:
+            Annotations in the same order as ``texts``
+        """
+        hashes = [generate_hash(text) for text in texts]
+        # Results are collected locally; inserting fresh parses may evict cached ones
+        found: Dict[str, AnnotatedText] = {}
+        pending: Dict[str, str] = {}
+        for text, content_hash in zip(texts, hashes):
+            if content_hash in found or content_hash in pending:
+                continue
+            cached = self.parse_cache.get(content_hash)
+            if cached is not None:
+                found[content_hash] = cached
+            else:
+                pending[content_hash] = text
+        
+        if pending:
+            annotations = await asyncio.to_thread(
+                self._annotate_uncached,
+                list(pending.items()),
+                n_process or settings.NLP_BATCH_PROCESSES,
+                batch_size or settings.NLP_BATCH_SIZE
             )
-        except:
-            logger.warning("NER model not available")
-            self.ner_pipeline = None
+            for annotated in annotations:
+                found[annotated.content_hash] = annotated
+                self.parse_cache.set(annotated.content_hash, annotated)
         
-        logger.info("NLPProcessor initialized")
+        return [found[content_hash] for content_hash in hashes]
+    
+    async def _annotate(self, text: str) -> AnnotatedText:
+        """``annotate`` for coroutines: parsing and loading spaCy happen in a worker thread."""
+        return (await self.annotate_batch([text], n_process=1))[0]
+    
+    def _annotate_uncached(self,
+                           items: List[Tuple[str, str]],
+                           n_process: int,
+                           batch_size: int) -> List[AnnotatedText]:
+        """Parse (hash, text) pairs with a single spaCy pipe."""
+        texts = [text for _, text in items]
+        nlp = self.nlp
+        if nlp is not None:
+            docs = nlp.pipe(texts, n_process=n_process, batch_size=batch_size)
+        else:
+            docs = (None for _ in texts)
+        
+        return [
+            self._build_annotation(text, content_hash, doc)
+            for (content_hash, text), doc in zip(items, docs)
+        ]
+    
+    def _build_annotation(self, text: str, content_hash: str, doc: Any) -> AnnotatedText:
+        """Tokenize with NLTK and count syllables for a parsed text."""
+        words = nltk.word_tokenize(text)
+        return AnnotatedText(
+            text=text,
+            content_hash=content_hash,
+            doc=doc,
+            sentences=nltk.sent_tokenize(text),
+            words=words,
+            syllable_count=self._count_syllables(words)
+        )
     
     def _initialize_nltk(self):
         """Initialize NLTK resources."""
@@ -161,9 +278,10 @@ class NLPProcessor:
         concepts = set()
         
         # Use NER if available
-        if self.ner_pipeline:
+        ner_pipeline = await self.registry.aget_optional("ner")
+        if ner_pipeline:
             try:
-                entities = self.ner_pipeline(text)
+                entities = ner_pipeline(text)
                 for entity in entities:
                     if entity['score'] > 0.7:
                         concepts.add(entity['word'])
@@ -175,8 +293,8 @@ class NLPProcessor:
         concepts.update([c.text for c in extracted])
         
         # SpaCy noun phrases
-        if self.nlp:
-            doc = self.nlp(text)
+        doc = (await self._annotate(text)).doc
+        if doc is not None:
             for chunk in doc.noun_chunks:
                 if 2 <= len(chunk.text.split()) <= 4:  # Reasonable concept length
                     concepts.add(chunk.text)
@@ -251,8 +369,8 @@ class NLPProcessor:
                 relationships.append((source, relation_type, target))
         
         # Use dependency parsing if spaCy available
-        if self.nlp:
-            doc = self.nlp(text)
+        doc = (await self._annotate(text)).doc
+        if doc is not None:
             for token in doc:
                 if token.dep_ in ["nsubj", "dobj"] and token.head.pos_ == "VERB":
                     # Extract subject-verb-object relationships
@@ -277,10 +395,9 @@ class NLPProcessor:
         Returns:
             Complexity analysis results
         """
-        # Check cache
-        text_hash = hash(text)
-        if text_hash in self.readability_cache:
-            return self.readability_cache[text_hash]
+        annotated = await self._annotate(text)
+        if annotated.complexity is not None:
+            return annotated.complexity
         
         analysis = {
             'complexity_level': TextComplexity.INTERMEDIATE,
@@ -290,9 +407,9 @@ class NLPProcessor:
         }
         
         # Basic metrics
-        sentences = nltk.sent_tokenize(text)
-        words = nltk.word_tokenize(text)
-        syllables = self._count_syllables(text)
+        sentences = annotated.sentences
+        words = annotated.words
+        syllables = annotated.syllable_count
         
         analysis['metrics'] = {
             'sentence_count': len(sentences),
@@ -329,15 +446,14 @@ class NLPProcessor:
         if analysis['complexity_level'] == TextComplexity.EXPERT:
             analysis['recommendations'].append("Consider simplifying for broader audience")
         
-        # Cache result
-        self.readability_cache[text_hash] = analysis
+        # Cache result alongside the parse
+        annotated.complexity = analysis
         
         return analysis
     
-    def _count_syllables(self, text: str) -> int:
-        """Count syllables in text."""
+    def _count_syllables(self, words: List[str]) -> int:
+        """Count syllables in already tokenized words."""
         syllable_count = 0
-        words = nltk.word_tokenize(text.lower())
         
         for word in words:
             # Simple syllable counting algorithm
@@ -383,10 +499,10 @@ class NLPProcessor:
         Returns:
             Simplified text
         """
-        if not self.nlp:
+        doc = (await self._annotate(text)).doc
+        if doc is None:
             return text
         
-        doc = self.nlp(text)
         simplified_sentences = []
         
         for sent in doc.sents:
@@ -442,7 +558,7 @@ class NLPProcessor:
             concepts = await self.extract_concepts(text)
             
             # Find sentences containing concepts
-            sentences = nltk.sent_tokenize(text)
+            sentences = (await self._annotate(text)).sentences
             concept_sentences = []
             
             for sent in sentences:
@@ -464,7 +580,7 @@ class NLPProcessor:
                 return summary
         
         # Fallback to simple extractive summary
-        sentences = nltk.sent_tokenize(text)
+        sentences = (await self._annotate(text)).sentences
         if sentences:
             return sentences[0]
         
@@ -523,11 +639,11 @@ class NLPProcessor:
             'suggestions': []
         }
         
-        if not self.nlp:
+        doc = (await self._annotate(text)).doc
+        if doc is None:
             analysis['issues'].append("NLP model not available for coherence analysis")
             return analysis
         
-        doc = self.nlp(text)
         sentences = list(doc.sents)
         
         if len(sentences) < 2:
@@ -687,6 +803,22 @@ class NLPProcessor:
         
         return validation
     
+    async def validate_educational_content_batch(self,
+                                               texts: List[str],
+                                               n_process: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Validate many content pieces, parsing each one once up front.
+        
+        Args:
+            texts: Content pieces, e.g. the sections of a course
+            n_process: spaCy worker processes, defaults to config
+            
+        Returns:
+            Validation results in the same order as ``texts``
+        """
+        await self.annotate_batch(texts, n_process=n_process)
+        return [await self.validate_educational_content(text) for text in texts]
+    
     def clean_educational_text(self, text: str) -> str:
         """
         Clean text while preserving educational formatting.
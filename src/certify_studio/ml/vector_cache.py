@@ -0,0 +1,222 @@
+"""
+Vector Cache - Persistent, Shared Embedding Store
+Part of the AI Agent Orchestration Platform for Educational Excellence
+
+Embeddings are keyed by a SHA-256 of their source content and stored as
+fixed-size float32 records in an append-only file that every process maps
+into memory. Writers append under an exclusive file lock; readers pick up
+records written by other processes by re-scanning only the new tail.
+
+A writer that finds a partial record at the end (left by a crash or a
+full disk) truncates it before appending. When an append would take the
+file past its size limit the file is replaced by an empty one and the
+cache is rebuilt from new writes; other processes notice the new file
+and drop their index.
+"""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Hex digests never contain NUL, which numpy strips from fixed-width bytes
+KEY_BYTES = 64
+
+
+def content_key(text: str) -> bytes:
+    """Hex SHA-256 digest of the text, used as the cache key."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest().encode("ascii")
+
+
+class VectorCache:
+    """
+    Content-hash keyed float32 vector store backed by a memory-mapped file.
+
+    Each record is a ``KEY_BYTES`` hex digest followed by ``dim`` float32
+    values. The file is only appended to until it reaches ``max_bytes``, so
+    a reader can compute the number of complete records from its size and
+    map them without locking.
+    """
+
+    def __init__(self, directory: str, namespace: str, dim: int, max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Directory holding cache files
+            namespace: Model identifier; vectors from different models never mix
+            dim: Vector dimension
+            max_bytes: File size at which the cache is rebuilt; None for no limit
+        """
+        self.dim = dim
+        self.max_bytes = max_bytes
+        self.record_dtype = np.dtype([("key", f"S{KEY_BYTES}"), ("vec", "<f4", (dim,))])
+        safe_namespace = "".join(c if c.isalnum() or c in "-_." else "_" for c in namespace)
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{safe_namespace}-{dim}.f32"
+        self.lock_path = directory / f"{safe_namespace}-{dim}.lock"
+        self.path.touch(exist_ok=True)
+
+        self._index: Dict[bytes, int] = {}
+        self._records: Optional[np.memmap] = None
+        self._scanned = 0
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+        self._refresh()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive inter-process lock for appends."""
+        with open(self.lock_path, "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _refresh(self):
+        """Map newly appended records (ours or another process's)."""
+        stat = os.stat(self.path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id:
+            # First scan, or another process rebuilt the file
+            self._index.clear()
+            self._records = None
+            self._scanned = 0
+            self._file_id = file_id
+
+        count = stat.st_size // self.record_dtype.itemsize
+        if count == self._scanned:
+            return
+
+        self._records = np.memmap(self.path, dtype=self.record_dtype, mode="r", shape=(count,))
+        for row, key in enumerate(self._records["key"][self._scanned:count], start=self._scanned):
+            self._index.setdefault(bytes(key), row)
+        self._scanned = count
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_many(self, keys: Sequence[bytes]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up vectors for many keys.
+
+        Returns:
+            (vectors, missing) where ``vectors`` has a row per key (zeros for
+            misses) and ``missing`` lists the positions not found
+        """
+        vectors = np.zeros((len(keys), self.dim), dtype=np.float32)
+        with self._lock:
+            rows = [self._index.get(key) for key in keys]
+            if any(row is None for row in rows):
+                self._refresh()
+                # Looked up again in full: the refresh may have found a rebuilt file
+                rows = [self._index.get(key) for key in keys]
+
+            found = [i for i, row in enumerate(rows) if row is not None]
+            if found:
+                vectors[found] = self._records["vec"][[rows[i] for i in found]]
+
+        missing = [i for i, row in enumerate(rows) if row is None]
+        return vectors, missing
+
+    def put_many(self, keys: Sequence[bytes], vectors: np.ndarray):
+        """Append vectors for keys not already stored."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(keys), self.dim)
+
+        with self._lock, self._file_lock():
+            self._refresh()
+            fresh = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._index and key not in fresh:
+                    fresh[key] = vector
+            if not fresh:
+                return
+
+            itemsize = self.record_dtype.itemsize
+            size = os.path.getsize(self.path)
+            if size % itemsize:
+                # A partial record from an interrupted write would misalign every later one
+                logger.warning(f"Truncating partial record at the end of {self.path}")
+                size -= size % itemsize
+                os.truncate(self.path, size)
+
+            if self.max_bytes is not None and size + len(fresh) * itemsize > self.max_bytes:
+                if not self._rebuild():
+                    return
+                limit = self.max_bytes // itemsize
+                fresh = dict(list(fresh.items())[:limit])
+                if not fresh:
+                    return
+
+            records = np.empty(len(fresh), dtype=self.record_dtype)
+            records["key"] = list(fresh.keys())
+            records["vec"] = np.stack(list(fresh.values()))
+
+            # A single write of whole records keeps readers consistent
+            with open(self.path, "ab") as handle:
+                handle.write(records.tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._refresh()
+
+    def _rebuild(self) -> bool:
+        """Replace the file with an empty one. Caller holds both locks."""
+        logger.info(f"Embedding cache {self.path} reached {self.max_bytes} bytes, starting over")
+        staging = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            staging.write_bytes(b"")
+            # Other processes keep reading their mapping of the old file until they refresh
+            os.replace(staging, self.path)
+        except OSError as e:
+            logger.warning(f"Could not rebuild embedding cache {self.path}: {e}")
+            staging.unlink(missing_ok=True)
+            return False
+        self._refresh()
+        return True
+
+
+_caches: Dict[Tuple[str, str, int], Optional[VectorCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_vector_cache(
+    directory: str,
+    namespace: str,
+    dim: int,
+    max_bytes: Optional[int] = None
+) -> Optional[VectorCache]:
+    """Process-wide VectorCache per (directory, namespace, dim); None if unusable."""
+    key = (str(Path(directory).resolve()), namespace, dim)
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                _caches[key] = VectorCache(directory, namespace, dim, max_bytes=max_bytes)
+            except OSError as e:
+                logger.warning(f"Embedding cache unavailable at {directory}: {e}")
+                _caches[key] = None
+        return _caches[key]
@@ -0,0 +1,52 @@
+"""
+Unit tests for CertificationAligner's direct term matching.
+"""
+
+import random
+import string
+
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance.cert_aligner import CertificationAligner
+
+
+@pytest.fixture
+def aligner():
+    # Term matching needs no LLM
+    aligner = CertificationAligner.__new__(CertificationAligner)
+    aligner.certification_database = aligner._load_certification_database()
+    aligner.objective_terms = {}
+    for cert_info in aligner.certification_database.values():
+        aligner._index_objectives(cert_info)
+    return aligner
+
+
+@pytest.mark.unit
+class TestTermIndex:
+    """Test that indexed matching agrees with substring scanning."""
+
+    def test_objectives_pre_tokenized(self, aligner):
+        assert aligner.objective_terms["Design secure access to AWS resources"] == (
+            "design", "secure", "access", "aws", "resources"
+        )
+
+    def test_index_matches_substring_scan(self, aligner):
+        rng = random.Random(0)
+        alphabet = string.ascii_lowercase[:6] + " -/"
+        topics = ["".join(rng.choice(alphabet) for _ in range(rng.randint(3, 30))) for _ in range(200)]
+        terms = ["".join(rng.choice("abcdef") for _ in range(rng.randint(3, 5))) for _ in range(500)]
+
+        index = aligner._build_topic_index(topics)
+
+        for term in terms:
+            assert (term in index) == any(term in topic for topic in topics)
+
+    def test_objective_coverage(self, aligner):
+        index = aligner._build_topic_index(["designing secure vpcs", "iam resources"])
+
+        # design, secure, resources match; access, aws do not
+        score = aligner._calculate_objective_coverage(
+            "Design secure access to AWS resources", index, semantic_score=0.5
+        )
+
+        assert score == pytest.approx(0.6 * 3 / 5 + 0.4 * 0.5)
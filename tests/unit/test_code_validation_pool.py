@@ -0,0 +1,67 @@
+"""
+Unit tests for code block checks and the validation worker pool.
+"""
+
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance import code_validation_pool
+from certify_studio.agents.specialized.quality_assurance.code_checks import check_code
+from certify_studio.agents.specialized.quality_assurance.code_validation_pool import CodeValidationPool
+
+
+@pytest.mark.unit
+class TestCodeChecks:
+    """Test the static checks run inside workers."""
+
+    def test_python_syntax_error(self):
+        issues = check_code("python", "def broken(:\n    pass")
+
+        assert issues[0]["title"] == "Python Syntax Error"
+        assert issues[0]["severity"] == "critical"
+
+    def test_deprecated_kubernetes_api(self):
+        manifest = "apiVersion: extensions/v1beta1\nkind: Deployment\nspec:\n  selector: {}\n"
+        titles = [issue["title"] for issue in check_code("yaml", manifest)]
+
+        assert "Deprecated Kubernetes API Version" in titles
+
+    def test_unsupported_language(self):
+        assert check_code("rust", "fn main() {}") is None
+
+
+@pytest.mark.unit
+class TestCodeValidationPool:
+    """Test dispatch, caching and timeouts with real worker processes."""
+
+    async def test_validates_blocks_in_order(self):
+        pool = CodeValidationPool(max_workers=2, block_timeout=10, memory_limit_mb=0)
+        blocks = [
+            {"code": "x = 1", "language": "python"},
+            {"code": "{bad json", "language": "json"},
+            {"code": "fn main() {}", "language": "rust"},
+            {"code": "x = 1", "language": "Python"},
+        ]
+        try:
+            results = await pool.validate(blocks)
+        finally:
+            await pool.shutdown()
+
+        assert results[0] == []
+        assert results[1][0]["title"] == "JSON Syntax Error"
+        assert results[2] is None
+        assert results[3] == [] and pool.metrics()["cache_hits"] == 1
+        assert pool.metrics()["blocks_per_second"] > 0
+
+    async def test_hung_worker_is_replaced(self, tmp_path, monkeypatch):
+        script = tmp_path / "hang.py"
+        script.write_text("import time\ntime.sleep(60)\n")
+        monkeypatch.setattr(code_validation_pool, "WORKER_SCRIPT", script)
+        pool = CodeValidationPool(max_workers=1, block_timeout=0.5, memory_limit_mb=0)
+        try:
+            results = await pool.validate([{"code": "x = 1", "language": "python"}])
+        finally:
+            await pool.shutdown()
+
+        assert results[0][0]["title"] == "Code Validation Incomplete"
+        assert pool.metrics()["timeouts"] == 1
+        assert pool.cache.get(pool.cache_key("python", "x = 1")) is None
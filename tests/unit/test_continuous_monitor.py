@@ -0,0 +1,126 @@
+"""
+Unit tests for continuous monitoring: metric series, check scheduling and
+anomaly/trend detection.
+"""
+
+import asyncio
+import statistics
+
+import numpy as np
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance.continuous_monitor import ContinuousMonitor
+from certify_studio.agents.specialized.quality_assurance.metric_series import MetricSeries
+from certify_studio.agents.specialized.quality_assurance.models import (
+    ContinuousMonitoring,
+    QualityMetrics
+)
+from certify_studio.agents.specialized.quality_assurance.monitor_scheduler import CheckScheduler
+
+
+@pytest.mark.unit
+class TestMetricSeries:
+    """Test running statistics against direct computation."""
+
+    def test_window_statistics_match_recomputation(self):
+        series = MetricSeries(capacity=50, window=20)
+        values = np.random.default_rng(0).random(1234)
+        for value in values:
+            series.push(value)
+
+        assert series.mean == pytest.approx(values[-20:].mean())
+        assert series.stdev == pytest.approx(statistics.stdev(values[-20:]))
+        np.testing.assert_allclose(series.latest(), values[-50:])
+
+    def test_trend_fit_matches_least_squares(self):
+        series = MetricSeries(capacity=30, window=10, alpha=0.5)
+        values = np.random.default_rng(1).random(75) + np.arange(75) * 0.01
+        smoothed = []
+        for value in values:
+            series.push(value)
+            smoothed.append(value if not smoothed else 0.5 * value + 0.5 * smoothed[-1])
+
+        x = np.arange(30)
+        slope, intercept = np.polyfit(x, smoothed[-30:], 1)
+        r_squared = np.corrcoef(x, smoothed[-30:])[0, 1] ** 2
+        fitted_slope, fitted_r_squared = series.trend_fit()
+
+        assert fitted_slope == pytest.approx(slope)
+        assert fitted_r_squared == pytest.approx(r_squared)
+
+
+@pytest.mark.unit
+class TestCheckScheduler:
+    """Test batching, cancellation and concurrency limits."""
+
+    async def test_runs_every_key_repeatedly(self):
+        runs = {}
+
+        async def check(key):
+            runs[key] = runs.get(key, 0) + 1
+
+        scheduler = CheckScheduler(check)
+        for i in range(200):
+            scheduler.schedule(f"content-{i}", interval=0.02, delay=0)
+        await asyncio.sleep(0.15)
+        await scheduler.stop()
+
+        assert len(runs) == 200
+        assert min(runs.values()) >= 2
+
+    async def test_cancelled_key_stops_running(self):
+        runs = []
+
+        async def check(key):
+            runs.append(key)
+
+        scheduler = CheckScheduler(check)
+        scheduler.schedule("kept", interval=0.02, delay=0)
+        scheduler.schedule("dropped", interval=0.02, delay=0.05)
+        assert scheduler.cancel("dropped")
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+
+        assert "dropped" not in runs and "kept" in runs
+        assert not scheduler.cancel("dropped")
+
+    async def test_concurrency_limit(self):
+        active = peak = 0
+
+        async def check(key):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        scheduler = CheckScheduler(check, max_concurrency=5)
+        for i in range(50):
+            scheduler.schedule(str(i), interval=10, delay=0)
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+
+        assert peak == 5
+
+
+@pytest.mark.unit
+class TestContinuousMonitor:
+    """Test monitoring an item end to end with a stubbed quality check."""
+
+    async def test_detects_quality_drop(self):
+        scores = iter([0.9, 0.91, 0.89, 0.9, 0.92] * 5 + [0.2] + [0.9] * 100)
+
+        async def quality_check(content_id):
+            return QualityMetrics(overall_score=next(scores))
+
+        monitor = ContinuousMonitor(llm=object())
+        config = ContinuousMonitoring(content_id="course-1", monitoring_interval=0)
+        await monitor.start_monitoring("course-1", config, quality_check)
+        while len(config.historical_metrics) < 30:
+            await asyncio.sleep(0.001)
+        assert await monitor.stop_monitoring("course-1")
+
+        anomaly = next(a for a in config.anomalies_detected if a["metric"] == "overall_quality")
+        assert anomaly["current_value"] == 0.2
+        assert anomaly["direction"] == "below"
+        assert "course-1" not in monitor.metrics_buffer
@@ -0,0 +1,105 @@
+"""
+Unit tests for embedding-first objective coverage scoring.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance.coverage_engine import ObjectiveCoverageEngine
+
+VECTORS = {
+    "design vpc": [1.0, 0.0, 0.0],
+    "VPC design": [1.0, 0.0, 0.0],
+    "cost optimization": [0.0, 0.0, 1.0],
+    "storage tiers": [0.0, 1.0, 0.0],
+    "choose resilient storage": [0.0, 0.5, 0.866],   # cosine 0.5 with "storage tiers"
+}
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_text_embeddings(self, texts):
+        self.calls += 1
+        return np.array([VECTORS[text] for text in texts])
+
+
+class FakeLLM:
+    def __init__(self, scores=None, fail=False):
+        self.prompts = []
+        self.scores = scores or {}
+        self.fail = fail
+
+    async def generate(self, messages, response_format=None):
+        self.prompts.append(messages[0].text)
+        if self.fail:
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(structured_data=self.scores, text="")
+
+
+OBJECTIVES = ["design vpc", "cost optimization", "choose resilient storage"]
+TOPICS = ["VPC design", "storage tiers"]
+
+
+@pytest.mark.unit
+class TestObjectiveCoverageEngine:
+    """Test similarity scoring, LLM escalation and caching."""
+
+    async def test_only_ambiguous_objectives_reach_llm(self):
+        llm = FakeLLM({"1": 0.9})
+        engine = ObjectiveCoverageEngine(llm=llm, embedder=FakeEmbedder())
+
+        scores = await engine.score(OBJECTIVES, TOPICS, "AWS-SAA-C03:v1")
+
+        assert scores["design vpc"] == pytest.approx(1.0)
+        assert scores["cost optimization"] == 0.0
+        assert scores["choose resilient storage"] == pytest.approx(0.9)
+        assert len(llm.prompts) == 1
+        assert "choose resilient storage" in llm.prompts[0]
+        assert "design vpc" not in llm.prompts[0]
+
+    async def test_results_cached_per_content_and_version(self):
+        embedder, llm = FakeEmbedder(), FakeLLM({"1": 0.9})
+        engine = ObjectiveCoverageEngine(llm=llm, embedder=embedder)
+
+        first = await engine.score(OBJECTIVES, TOPICS, "v1")
+        second = await engine.score(OBJECTIVES, list(reversed(TOPICS)), "v1")
+        assert first == second
+        assert embedder.calls == 1 and len(llm.prompts) == 1
+
+        await engine.score(OBJECTIVES, TOPICS, "v2")
+        assert embedder.calls == 2
+
+    async def test_llm_failure_keeps_embedding_score(self):
+        engine = ObjectiveCoverageEngine(llm=FakeLLM(fail=True), embedder=FakeEmbedder())
+
+        scores = await engine.score(OBJECTIVES, TOPICS)
+
+        assert scores["choose resilient storage"] == pytest.approx(0.5, abs=1e-3)
+
+    async def test_ambiguous_objectives_are_batched(self):
+        llm = FakeLLM({"1": 0.5, "2": 0.5})
+        engine = ObjectiveCoverageEngine(llm=llm, embedder=FakeEmbedder(), batch_size=2)
+        engine.AMBIGUOUS_BAND = (0.0, 1.0)
+
+        await engine.score(OBJECTIVES, TOPICS)
+
+        assert len(llm.prompts) == 2
+
+    async def test_unconfirmed_scores_are_not_cached(self):
+        """An ambiguous score the LLM failed on is retried on the next run."""
+        llm = FakeLLM(fail=True)
+        engine = ObjectiveCoverageEngine(llm=llm, embedder=FakeEmbedder())
+        await engine.score(OBJECTIVES, TOPICS, "v1")
+
+        cached = engine.cache.get((engine.content_hash(TOPICS), "v1"))
+        assert set(cached) == {"design vpc", "cost optimization"}
+
+        llm.fail, llm.scores = False, {"1": 0.9}
+        scores = await engine.score(OBJECTIVES, TOPICS, "v1")
+
+        assert scores["choose resilient storage"] == pytest.approx(0.9)
+        assert len(llm.prompts) == 2
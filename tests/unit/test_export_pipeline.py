@@ -0,0 +1,119 @@
+"""
+Unit tests for the ffmpeg export pipeline.
+"""
+
+import asyncio
+import stat
+
+import pytest
+
+from certify_studio.manim_integration import export_pipeline
+from certify_studio.manim_integration.export_pipeline import (
+    ExportError,
+    extract_frames,
+    transcode,
+    transcode_all,
+    transcode_args
+)
+
+# Stands in for ffmpeg: prints -progress output and writes the last argument
+FAKE_FFMPEG = """#!/bin/sh
+for last; do :; done
+case "$*" in *libvpx*) echo "encoder error" >&2; exit 1;; esac
+echo "out_time_us=1000000"
+echo "progress=continue"
+echo "out_time_us=2000000"
+echo "progress=end"
+echo data > "$last"
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.mark.unit
+class TestTranscodeArgs:
+    """Test the format presets."""
+
+    def test_mp4_from_mp4_is_remuxed(self):
+        """An H.264 intermediate is copied, not re-encoded."""
+        assert transcode_args("mp4") == ["-c", "copy", "-movflags", "+faststart"]
+        assert "libx264" in transcode_args("mp4", {"width": 640})
+
+    def test_gif_uses_single_pass_palette(self):
+        """GIFs generate and apply their palette in one filter graph."""
+        args = transcode_args("gif", {"fps": 10, "width": 480})
+        graph = args[args.index("-filter_complex") + 1]
+
+        assert graph.startswith("fps=10,scale=480:-2")
+        assert "palettegen" in graph and "paletteuse" in graph
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            transcode_args("avi")
+
+
+@pytest.mark.unit
+class TestTranscode:
+    """Test running ffmpeg and reading its progress."""
+
+    async def test_reports_progress_and_writes_output(self, tmp_path, fake_ffmpeg):
+        """Progress is reported as a fraction of the duration, ending at 1."""
+        reports = []
+        output = await transcode(
+            tmp_path / "in.mp4", tmp_path / "out" / "video.mp4", "mp4",
+            duration=4, progress=lambda fmt, fraction: reports.append((fmt, fraction)),
+            ffmpeg=fake_ffmpeg
+        )
+
+        assert output.read_text() == "data\n"
+        assert reports == [("mp4", 0.25), ("mp4", 0.5), ("mp4", 1.0)]
+
+    async def test_failure_raises_and_cleans_up(self, tmp_path, fake_ffmpeg):
+        """A failed conversion raises with ffmpeg's message and leaves no file."""
+        with pytest.raises(ExportError, match="encoder error"):
+            await transcode(tmp_path / "in.mp4", tmp_path / "video.webm", "webm", ffmpeg=fake_ffmpeg)
+
+        assert list(tmp_path.glob("*.webm")) == []
+
+    async def test_extract_frames_per_keyframe(self, tmp_path, fake_ffmpeg):
+        """One still is written per timestamp, in order."""
+        frames = await extract_frames(
+            tmp_path / "proxy.mp4", [0.0, 1.5, 3.0], tmp_path / "thumbs", ffmpeg=fake_ffmpeg
+        )
+
+        assert [f.name for f in frames] == ["keyframe_000.jpg", "keyframe_001.jpg", "keyframe_002.jpg"]
+        assert all(f.exists() for f in frames)
+
+    async def test_one_failed_format_cancels_the_rest(self, tmp_path, monkeypatch):
+        """The first failure stops the other conversions before it is raised."""
+        cancelled = []
+
+        async def fake_transcode(source, output, format, *args, **kwargs):
+            if format == "webm":
+                raise ExportError("ffmpeg webm export failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(format)
+                raise
+            return output
+
+        async def no_duration(source):
+            return None
+
+        monkeypatch.setattr(export_pipeline, "transcode", fake_transcode)
+        monkeypatch.setattr(export_pipeline, "probe_duration", no_duration)
+
+        with pytest.raises(ExportError, match="webm"):
+            await asyncio.wait_for(
+                transcode_all(tmp_path / "in.mp4", tmp_path, "video", ["mp4", "webm", "gif"]),
+                timeout=2
+            )
+
+        assert sorted(cancelled) == ["gif", "mp4"]
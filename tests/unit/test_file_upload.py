@@ -0,0 +1,63 @@
+"""
+Unit tests for streamed upload validation and storage.
+"""
+
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from certify_studio.api import dependencies
+from certify_studio.api.dependencies import FileUploadValidator
+
+PDF = b"%PDF-1.7\n" + b"0" * 100
+
+
+def upload(data: bytes, filename: str) -> UploadFile:
+    # No declared size, so the limit is enforced while streaming
+    return UploadFile(file=io.BytesIO(data), filename=filename)
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dependencies.settings, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestFileUploadValidator:
+    """Test size limits, type sniffing and content-addressed storage."""
+
+    async def test_size_limit_while_streaming(self, upload_dir):
+        """An upload over the limit is rejected and leaves no partial file."""
+        validator = FileUploadValidator(max_size=64, chunk_size=16)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await validator(upload(PDF, "guide.pdf"))
+
+        assert exc_info.value.status_code == 413
+        assert os.listdir(upload_dir) == []
+
+    async def test_sniffing_rejects_disguised_binary(self, upload_dir):
+        """The type comes from the bytes, not the filename."""
+        validator = FileUploadValidator()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await validator(upload(b"\x7fELF\x02\x01\x01\x00" + bytes(64), "guide.pdf"))
+
+        assert exc_info.value.status_code == 415
+        assert os.listdir(upload_dir) == []
+
+    async def test_identical_uploads_share_one_file(self, upload_dir):
+        """A re-upload is stored once, under its SHA-256 and sniffed extension."""
+        validator = FileUploadValidator(chunk_size=16)
+
+        first = await validator(upload(PDF, "guide.exe"))
+        second = await validator(upload(PDF, "copy.pdf"))
+
+        assert first["content_type"] == "application/pdf"
+        assert first["path"].endswith(f"{first['content_hash']}.pdf")
+        assert not first["duplicate"] and second["duplicate"]
+        assert second["path"] == first["path"]
+        assert os.listdir(upload_dir) == [os.path.basename(first["path"])]
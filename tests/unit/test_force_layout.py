@@ -0,0 +1,56 @@
+"""
+Unit tests for the vectorized force-directed layout.
+"""
+
+import numpy as np
+import pytest
+
+from certify_studio.agents.content.diagram_generation.force_layout import (
+    ForceDirectedLayout,
+    fit_to_box
+)
+
+
+def ring(n):
+    return [(i, (i + 1) % n) for i in range(n)]
+
+
+@pytest.mark.unit
+class TestForceDirectedLayout:
+    """Test layout determinism, bounds and convergence."""
+
+    def test_same_seed_same_layout(self):
+        first = ForceDirectedLayout(seed=7).run(40, ring(40))
+        second = ForceDirectedLayout(seed=7).run(40, ring(40))
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_positions_in_unit_square(self):
+        positions = ForceDirectedLayout().run(60, ring(60))
+
+        assert positions.shape == (60, 2)
+        assert positions.min() >= 0 and positions.max() <= 1
+
+    def test_stops_when_settled(self):
+        """A small graph settles well before the iteration cap."""
+        layout = ForceDirectedLayout(iterations=1000)
+        layout.run(30, ring(30))
+
+        assert layout.iterations_run < 1000
+
+    def test_grid_repulsion_matches_exact(self):
+        """The Barnes-Hut approximation stays close to exact all-pairs forces."""
+        layout = ForceDirectedLayout()
+        pos = np.random.default_rng(0).random((800, 2))
+        k = np.sqrt(1 / 800)
+
+        exact = layout._repulsion_exact(pos, k)
+        approx = layout._repulsion_tree(pos, k)
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+
+        assert np.median(error) < 0.05
+
+    def test_fit_to_box(self):
+        positions = fit_to_box(np.array([[0.0, 0.0], [1.0, 0.5]]), (100, 100), (300, 500))
+
+        np.testing.assert_array_equal(positions, [[100, 100], [300, 300]])
@@ -0,0 +1,90 @@
+"""
+Unit tests for the official icon library's index and caches.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from certify_studio.manim_extensions.constants import CertificationProvider
+from certify_studio.manim_extensions.icons import icon_library
+from certify_studio.manim_extensions.icons.icon_library import OfficialIconLibrary
+
+POD_SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">
+  <rect x="1" y="1" width="8" height="8" fill="#326CE5"/>
+  <circle cx="5" cy="5" r="2" fill="#FFFFFF"/>
+</svg>"""
+
+
+def offline_download(url, path):
+    raise OSError("offline")
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    """Icon cache with one Kubernetes icon on disk and no network access."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(icon_library, "urlretrieve", offline_download)
+    # The library keeps its cache relative to the working directory
+    directory = Path("assets") / "icons" / CertificationProvider.KUBERNETES.value
+    (directory / "workloads").mkdir(parents=True)
+    (directory / "workloads" / "pod.svg").write_text(POD_SVG)
+    return directory
+
+
+def make_library() -> OfficialIconLibrary:
+    return OfficialIconLibrary(CertificationProvider.KUBERNETES)
+
+
+@pytest.mark.unit
+class TestOfficialIconLibrary:
+    """Test icon lookup, parsed-SVG caching and template copies."""
+
+    def test_index_lookup(self, icon_dir):
+        """Icons on disk at startup are indexed by service and category."""
+        library = make_library()
+        pod = icon_dir / "workloads" / "pod.svg"
+
+        assert library.icon_index["pod"] == {"workloads": pod}
+        assert library._find_icon_path("pod") == pod
+        assert library._find_icon_path("pod", "workloads") == pod
+        assert library._find_icon_path("pod", "services") is None
+
+    def test_unindexed_icon_found_on_disk(self, icon_dir):
+        """An icon added after startup is found by its filename and indexed."""
+        library = make_library()
+        (icon_dir / "services").mkdir(exist_ok=True)
+        service = icon_dir / "services" / "service.svg"
+        service.write_text(POD_SVG)
+
+        assert library._find_icon_path("service") == service
+        assert library.icon_index["service"] == {"services": service}
+
+    def test_warm_load_skips_svg_parsing(self, icon_dir, monkeypatch):
+        """A second process rebuilds the icon from the parsed cache alone."""
+        cold = make_library().get_service_icon("pod")
+        parsed = icon_dir / ".parsed"
+        assert sorted(path.suffix for path in parsed.iterdir()) == [".json", ".npz"]
+
+        def no_parsing(*args, **kwargs):
+            raise AssertionError("SVG parsed despite a warm cache")
+
+        monkeypatch.setattr(icon_library, "SVGMobject", no_parsing)
+        warm = make_library().get_service_icon("pod")
+
+        assert len(warm.submobjects) == len(cold.submobjects)
+        for warm_part, cold_part in zip(warm.submobjects, cold.submobjects):
+            assert (warm_part.points == cold_part.points).all()
+            assert warm_part.get_fill_opacity() == cold_part.get_fill_opacity()
+
+    def test_callers_get_template_copies(self, icon_dir):
+        """Changing a returned icon leaves the cached template untouched."""
+        library = make_library()
+        first = library.get_service_icon("pod")
+        first.shift([1, 0, 0])
+        second = library.get_service_icon("pod")
+
+        template = library.icon_cache[("pod", icon_library.DIMENSIONS["icon_size"], None)]
+        assert first is not second and second is not template
+        assert (second.get_center() == template.get_center()).all()
+        assert not (first.get_center() == template.get_center()).all()
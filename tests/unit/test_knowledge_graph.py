@@ -0,0 +1,140 @@
+"""
+Unit tests for the knowledge graph.
+
+Tests the prerequisite frontier and concept suggestions.
+"""
+
+import pytest
+import numpy as np
+
+from certify_studio.knowledge.graph import (
+    KnowledgeGraph, Concept, ConceptType, Relationship, RelationType
+)
+
+
+def make_concept(concept_id, prerequisites=None, difficulty=0.5, embedding=None,
+                 cognitive_level="understand"):
+    """Create a minimal concept."""
+    return Concept(
+        id=concept_id,
+        name=concept_id.title(),
+        type=ConceptType.FUNDAMENTAL,
+        description="",
+        cognitive_level=cognitive_level,
+        difficulty=difficulty,
+        prerequisites=prerequisites or [],
+        embedding=embedding
+    )
+
+
+@pytest.mark.unit
+class TestPrerequisiteFrontier:
+    """Test incremental prerequisite frontier."""
+    
+    @pytest.fixture
+    async def graph(self):
+        """Create a small prerequisite chain."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("basics"))
+        await graph.add_concept(make_concept("networking"))
+        await graph.add_concept(make_concept("vpc", ["basics", "networking"]))
+        await graph.add_concept(make_concept("peering", ["vpc"]))
+        return graph
+    
+    async def test_roots_ready_initially(self, graph):
+        """Concepts without prerequisites start in the frontier."""
+        frontier = graph.create_frontier()
+        assert frontier.ready == {"basics", "networking"}
+        
+    async def test_mark_learned_unlocks_dependents(self, graph):
+        """A concept unlocks once every prerequisite is learned."""
+        frontier = graph.create_frontier(["basics"])
+        assert "vpc" not in frontier.ready
+        
+        unlocked = frontier.mark_learned("networking")
+        assert unlocked == {"vpc"}
+        assert frontier.ready == {"vpc"}
+        
+        # Learning twice is a no-op
+        assert frontier.mark_learned("networking") == set()
+        
+    async def test_suggestions_only_from_frontier(self, graph):
+        """Suggestions respect prerequisites."""
+        suggestions = await graph.suggest_next_concepts(["basics", "networking"])
+        assert [concept_id for concept_id, _ in suggestions] == ["vpc"]
+        
+    async def test_suggestions_ranked_by_similarity(self):
+        """Embedding similarity to learned concepts drives ranking."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("learned", embedding=np.array([1.0, 0.0])))
+        await graph.add_concept(make_concept("close", embedding=np.array([0.9, 0.1])))
+        await graph.add_concept(make_concept("far", embedding=np.array([0.0, 1.0])))
+        
+        suggestions = await graph.suggest_next_concepts(["learned"], n_suggestions=1)
+        
+        assert suggestions[0][0] == "close"
+        single = await graph._calculate_concept_relevance("close", ["learned"])
+        assert suggestions[0][1] == pytest.approx(single)
+
+
+@pytest.mark.unit
+class TestLearningPathPlanner:
+    """Test topological learning path planning."""
+    
+    async def test_path_is_topological(self):
+        """Prerequisites come before the concepts that need them."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("basics", difficulty=0.3))
+        await graph.add_concept(make_concept("networking", difficulty=0.1))
+        await graph.add_concept(make_concept("vpc", ["basics", "networking"]))
+        await graph.add_concept(make_concept("peering", ["vpc"]))
+        
+        path = await graph.find_learning_path([], "peering")
+        assert path == ["networking", "basics", "vpc", "peering"]
+        
+        path = await graph.find_learning_path(["basics"], "peering")
+        assert path == ["networking", "vpc", "peering"]
+        
+    async def test_unknown_prerequisites_ignored(self):
+        """Prerequisites missing from the graph do not stall planning."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("vpc", ["not-in-graph"]))
+        
+        assert await graph.find_learning_path([], "vpc") == ["vpc"]
+        
+    async def test_learner_level_breaks_near_ties(self):
+        """A concept matching the learner's level goes first when difficulty is close."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("theory", difficulty=0.3, cognitive_level="understand"))
+        await graph.add_concept(make_concept("lab", difficulty=0.4, cognitive_level="apply"))
+        await graph.add_concept(make_concept("exam", ["theory", "lab"]))
+        
+        assert await graph.find_learning_path([], "exam") == ["theory", "lab", "exam"]
+        assert await graph.find_learning_path(
+            [], "exam", {"cognitive_level": "apply"}
+        ) == ["lab", "theory", "exam"]
+        
+    async def test_relationship_edges_survive_concept_update(self):
+        """Re-adding a concept keeps prerequisites added as relationships."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("iam"))
+        await graph.add_concept(make_concept("basics"))
+        await graph.add_concept(make_concept("s3", ["basics"]))
+        await graph.add_relationship(
+            Relationship(source="iam", target="s3", type=RelationType.PREREQUISITE)
+        )
+        
+        await graph.add_concept(make_concept("s3", ["basics"], difficulty=0.6))
+        
+        path = await graph.find_learning_path([], "s3")
+        assert set(path[:2]) == {"iam", "basics"} and path[-1] == "s3"
+        assert "s3" not in graph.create_frontier(["basics"]).ready
+        
+    async def test_cycle_returns_empty_path(self):
+        """Cyclic prerequisites are detected instead of looping forever."""
+        graph = KnowledgeGraph(neo4j_uri="bolt://unused")
+        await graph.add_concept(make_concept("a", ["b"]))
+        await graph.add_concept(make_concept("b", ["a"]))
+        await graph.add_concept(make_concept("c", ["a"]))
+        
+        assert await graph.find_learning_path([], "c") == []
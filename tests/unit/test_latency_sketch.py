@@ -0,0 +1,59 @@
+"""
+Unit tests for streaming request latency quantiles.
+"""
+
+import random
+
+import pytest
+
+from certify_studio.integrations.observability.metrics import (
+    LatencySketch,
+    RequestLatencyTracker
+)
+
+
+@pytest.mark.unit
+class TestLatencySketch:
+    """Test the relative-error quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Estimated quantiles stay within the configured relative error."""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(20000))
+        sketch = LatencySketch(relative_accuracy=0.02)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.03)
+
+    def test_merge_matches_single_sketch(self):
+        """Merging window sketches equals sketching all values at once."""
+        left, right, whole = LatencySketch(), LatencySketch(), LatencySketch()
+        for i in range(1, 1001):
+            (left if i % 2 else right).add(i / 1000)
+            whole.add(i / 1000)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.quantile(0.95) == whole.quantile(0.95)
+
+
+@pytest.mark.unit
+class TestRequestLatencyTracker:
+    """Test per-route latency tracking."""
+
+    def test_snapshot_filters_routes_and_counts_errors(self):
+        """Snapshots merge only the requested route and count 4xx/5xx."""
+        tracker = RequestLatencyTracker()
+        tracker.observe("GET", "/items/{id}", 0.1, 200)
+        tracker.observe("GET", "/items/{id}", 0.2, 500)
+        tracker.observe("POST", "/items", 1.0, 201)
+
+        sketch, errors = tracker.snapshot("/items/{id}")
+
+        assert sketch.count == 2
+        assert errors == 1
+        assert sketch.max == pytest.approx(0.2)
@@ -0,0 +1,91 @@
+"""
+Unit tests for the pure ASGI request pipeline middleware.
+"""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from certify_studio.api.middleware import RequestPipelineMiddleware
+from certify_studio.api.rate_limit import RateLimiter
+
+
+def build_client(monkeypatch, **options) -> TestClient:
+    """Client for a small app wrapped in the pipeline."""
+    monkeypatch.setattr(
+        "certify_studio.api.middleware.rate_limiter",
+        RateLimiter(use_redis=False)
+    )
+
+    async def echo_id(request):
+        return PlainTextResponse(request.state.request_id)
+
+    async def stream(request):
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}".encode()
+        return StreamingResponse(chunks())
+
+    async def upload(request):
+        return PlainTextResponse(str(len(await request.body())))
+
+    app = Starlette(routes=[
+        Route("/id", echo_id),
+        Route("/stream", stream),
+        Route("/upload", upload, methods=["POST"])
+    ])
+    app.add_middleware(RequestPipelineMiddleware, metrics=False, **options)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestRequestPipelineMiddleware:
+    """Test the combined middleware behaviour."""
+
+    def test_request_id_and_headers(self, monkeypatch):
+        """Request IDs propagate and security headers are set."""
+        client = build_client(monkeypatch)
+
+        response = client.get("/id", headers={"X-Request-ID": "abc"})
+
+        assert response.text == "abc"
+        assert response.headers["x-request-id"] == "abc"
+        assert response.headers["x-frame-options"] == "DENY"
+        assert "x-process-time" in response.headers
+        assert "x-ratelimit-remaining" in response.headers
+
+    def test_streaming_passes_through(self, monkeypatch):
+        """Streamed bodies arrive intact."""
+        client = build_client(monkeypatch)
+
+        assert client.get("/stream").text == "chunk0chunk1chunk2"
+
+    def test_rate_limit_rejects(self, monkeypatch):
+        """Requests beyond the client limit get 429 with Retry-After."""
+        client = build_client(monkeypatch, calls=2, period=60)
+
+        statuses = [client.get("/id").status_code for _ in range(3)]
+        rejected = client.get("/id")
+
+        assert statuses == [200, 200, 429]
+        assert rejected.headers["retry-after"]
+        assert rejected.headers["x-request-id"]
+
+    def test_body_limit_by_content_length(self, monkeypatch):
+        """A declared body over the limit is rejected before the route runs."""
+        client = build_client(monkeypatch, max_body_size=10)
+
+        assert client.post("/upload", content=b"x" * 10).text == "10"
+        assert client.post("/upload", content=b"x" * 11).status_code == 413
+
+    def test_body_limit_while_receiving(self, monkeypatch):
+        """A chunked body stops being read once it passes the limit."""
+        client = build_client(monkeypatch, max_body_size=10)
+
+        def chunks():
+            for _ in range(4):
+                yield b"xxxx"
+
+        assert client.post("/upload", content=chunks()).status_code == 413
@@ -0,0 +1,130 @@
+"""
+Unit tests for the shared model registry.
+
+Tests lazy loading, sharing, failure handling and unloading.
+"""
+
+import threading
+
+import pytest
+
+from certify_studio.ml import model_registry as registry_module
+from certify_studio.ml.model_registry import ModelRegistry, ModelUnavailableError
+
+
+@pytest.mark.unit
+class TestModelRegistry:
+    """Test process-wide model registry."""
+    
+    @pytest.fixture
+    def registry(self):
+        """Create a registry with counting loaders."""
+        registry = ModelRegistry()
+        registry.load_calls = []
+        
+        def load_fake():
+            registry.load_calls.append("fake")
+            return object()
+        
+        def load_broken():
+            registry.load_calls.append("broken")
+            raise OSError("weights missing")
+        
+        registry.register("fake", load_fake)
+        registry.register("broken", load_broken)
+        return registry
+    
+    def test_loads_lazily_and_once(self, registry):
+        """Models load on first get and are shared afterwards."""
+        assert registry.load_calls == []
+        assert not registry.is_loaded("fake")
+        
+        first = registry.get("fake")
+        second = registry.get("fake")
+        
+        assert first is second
+        assert registry.load_calls == ["fake"]
+        assert registry.metrics()["models"]["fake"]["use_count"] == 2
+        
+    def test_failed_load_is_remembered(self, registry):
+        """A failing loader is not retried until unloaded."""
+        with pytest.raises(ModelUnavailableError):
+            registry.get("broken")
+        assert registry.get_optional("broken") is None
+        assert registry.load_calls == ["broken"]
+        
+        registry.unload("broken")
+        assert registry.get_optional("broken") is None
+        assert registry.load_calls == ["broken", "broken"]
+        
+    def test_unload_idle(self, registry):
+        """Idle models are released and reload on next use."""
+        registry.get("fake")
+        
+        assert registry.unload_idle(max_idle_seconds=0) == ["fake"]
+        assert not registry.is_loaded("fake")
+        
+        registry.get("fake")
+        assert registry.load_calls == ["fake", "fake"]
+        
+    def test_get_never_returns_a_released_model(self, registry, monkeypatch):
+        """An unload racing with get cannot hand the caller a released model."""
+        registry.get("fake")
+        
+        class UnloadingClock:
+            """Runs an unload from another thread in the middle of get."""
+            
+            def monotonic(self):
+                monkeypatch.undo()
+                unloader = threading.Thread(target=registry.unload, args=("fake",))
+                unloader.start()
+                unloader.join(timeout=0.2)
+                return 0.0
+        
+        monkeypatch.setattr(registry_module, "time", UnloadingClock())
+        
+        assert registry.get("fake") is not None
+        
+    async def test_prewarm(self, registry):
+        """Pre-warming loads models and reports availability."""
+        results = await registry.prewarm(["fake", "broken", "unknown"])
+        
+        assert results == {"fake": True, "broken": False, "unknown": False}
+        assert registry.is_loaded("fake")
+        
+    async def test_async_get_loads_off_the_event_loop(self, registry):
+        """aget runs the loader in a worker thread and then serves from memory."""
+        loader_threads = []
+        registry.register("threaded", lambda: loader_threads.append(threading.current_thread()) or object())
+        
+        first = await registry.aget("threaded")
+        
+        assert loader_threads and loader_threads[0] is not threading.main_thread()
+        assert await registry.aget("threaded") is first
+        assert len(loader_threads) == 1
+        assert await registry.aget_optional("broken") is None
+        
+    def test_memory_limit_unloads_until_under_budget(self, registry, monkeypatch):
+        """Least recently used models are unloaded while each unload frees memory."""
+        registry.register("other", object)
+        registry.register("newest", object)
+        for name in ("fake", "other", "newest"):
+            registry.get(name)
+        rss = iter([300, 200, 100])
+        monkeypatch.setattr(registry_module, "current_rss_bytes", lambda: next(rss))
+        
+        assert registry.enforce_memory_limit(150) == ["fake", "other"]
+        assert registry.is_loaded("newest")
+        
+    def test_memory_limit_stops_when_unloading_frees_nothing(self, registry, monkeypatch):
+        """Models stay loaded once unloading stops lowering RSS."""
+        registry.register("other", object)
+        registry.get("fake")
+        registry.get("other")
+        monkeypatch.setattr(registry_module, "current_rss_bytes", lambda: 300)
+        
+        assert registry.enforce_memory_limit(100) == ["fake"]
+        assert registry.is_loaded("other")
+        # Nothing changed since: the next sweep leaves the remaining model alone
+        assert registry.enforce_memory_limit(100) == []
+        assert registry.is_loaded("other")
@@ -0,0 +1,61 @@
+"""
+Unit tests for NLPProcessor batch annotation and its parse cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from certify_studio.core.utils import LRUCache
+from certify_studio.ml.nlp import AnnotatedText, NLPProcessor
+
+
+@pytest.fixture
+def make_processor():
+    def make(cache_size):
+        # Skip NLTK downloads and model loading; parsing is stubbed below
+        processor = NLPProcessor.__new__(NLPProcessor)
+        processor.registry = SimpleNamespace(get_optional=lambda name: None)
+        processor.parse_cache = LRUCache(cache_size)
+        processor.parsed = []
+
+        def build(text, content_hash, doc):
+            processor.parsed.append(text)
+            return AnnotatedText(text, content_hash, doc, [text], text.split(), 0)
+
+        processor._build_annotation = build
+        return processor
+    return make
+
+
+@pytest.mark.unit
+class TestAnnotateBatch:
+    """Test cache reuse, eviction and oversized batches."""
+
+    async def test_cache_hit_is_not_reparsed(self, make_processor):
+        processor = make_processor(8)
+        first = processor.annotate("a")
+
+        results = await processor.annotate_batch(["a", "b", "b"])
+
+        assert results[0] is first
+        assert [r.text for r in results] == ["a", "b", "b"]
+        assert processor.parsed == ["a", "b"]
+
+    async def test_cached_entry_evicted_by_batch(self, make_processor):
+        processor = make_processor(2)
+        first = processor.annotate("a")
+
+        results = await processor.annotate_batch(["a", "b", "c"])
+
+        assert results[0] is first
+        assert [r.text for r in results] == ["a", "b", "c"]
+
+    async def test_batch_larger_than_cache(self, make_processor):
+        processor = make_processor(2)
+        texts = [f"text {i}" for i in range(10)] * 2
+
+        results = await processor.annotate_batch(texts)
+
+        assert [r.text for r in results] == texts
+        assert len(processor.parsed) == 10
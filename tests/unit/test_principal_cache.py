@@ -0,0 +1,187 @@
+"""
+Unit tests for the authenticated principal cache.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from certify_studio.api import dependencies
+from certify_studio.api.dependencies import (
+    PrincipalCache,
+    create_access_token,
+    decode_access_token,
+    get_current_user
+)
+from certify_studio.api.schemas import User, PlanType
+
+
+class FakeRedis:
+    """The subset of Redis commands the principal cache uses, in memory."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def ttl(self, key):
+        return 30
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+def make_user(**fields) -> User:
+    return User(**{
+        "id": uuid4(),
+        "email": "test@example.com",
+        "username": "testuser",
+        "is_active": True,
+        "is_verified": True,
+        "plan_type": PlanType.FREE,
+        "total_generations": 0,
+        "total_storage_mb": 0,
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        **fields
+    })
+
+
+def credentials_for(user: User) -> Mock:
+    credentials = Mock()
+    credentials.credentials = create_access_token({"sub": str(user.id)})
+    return credentials
+
+
+def make_db(user: User) -> Mock:
+    db = Mock()
+    db.get = AsyncMock(side_effect=lambda model, user_id: user.model_copy())
+    return db
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    """Route every cache created with use_redis=True to one in-memory Redis."""
+    redis = FakeRedis()
+    monkeypatch.setattr(dependencies, "get_redis", AsyncMock(return_value=redis))
+    return redis
+
+
+@pytest.mark.unit
+class TestPrincipalCache:
+    """Test caching, revocation and invalidation of principals."""
+
+    async def test_cache_hit_skips_database(self, monkeypatch):
+        """A second request with the same token is served from the cache."""
+        monkeypatch.setattr(dependencies, "principal_cache", PrincipalCache(use_redis=False))
+        user = make_user()
+        db = make_db(user)
+        credentials = credentials_for(user)
+
+        first = await get_current_user(credentials, db)
+        second = await get_current_user(credentials, db)
+
+        assert first.id == second.id == user.id
+        assert db.get.await_count == 1
+
+    async def test_logout_revokes_cached_token(self, monkeypatch):
+        """A revoked token is rejected even though its principal was cached."""
+        cache = PrincipalCache(use_redis=False)
+        monkeypatch.setattr(dependencies, "principal_cache", cache)
+        user = make_user()
+        credentials = credentials_for(user)
+        await get_current_user(credentials, make_db(user))
+
+        payload = decode_access_token(credentials.credentials)
+        await cache.revoke(PrincipalCache.token_key(credentials.credentials, payload), user.id, payload["exp"])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials, make_db(user))
+        assert exc_info.value.status_code == 401
+
+    async def test_logout_in_other_process_revokes_local_entry(self, monkeypatch, shared_redis):
+        """A token revoked by another process is rejected despite a local cache hit."""
+        local = PrincipalCache(use_redis=True)
+        other = PrincipalCache(use_redis=True)
+        monkeypatch.setattr(dependencies, "principal_cache", local)
+        user = make_user()
+        credentials = credentials_for(user)
+        await get_current_user(credentials, make_db(user))
+
+        payload = decode_access_token(credentials.credentials)
+        await other.revoke(PrincipalCache.token_key(credentials.credentials, payload), user.id, payload["exp"])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials, make_db(user))
+        assert exc_info.value.status_code == 401
+
+    async def test_profile_update_invalidates_cached_user(self, monkeypatch):
+        """After invalidate_user the next request reloads the user."""
+        cache = PrincipalCache(use_redis=False)
+        monkeypatch.setattr(dependencies, "principal_cache", cache)
+        user = make_user()
+        credentials = credentials_for(user)
+        await get_current_user(credentials, make_db(user))
+
+        updated = user.model_copy(update={"username": "renamed"})
+        await cache.invalidate_user(user.id)
+
+        result = await get_current_user(credentials, make_db(updated))
+        assert result.username == "renamed"
+
+    async def test_profile_update_in_other_process_invalidates_local_entry(self, monkeypatch, shared_redis):
+        """An invalidation made by another process drops this process's cached user."""
+        local = PrincipalCache(use_redis=True)
+        other = PrincipalCache(use_redis=True)
+        monkeypatch.setattr(dependencies, "principal_cache", local)
+        user = make_user()
+        credentials = credentials_for(user)
+        await get_current_user(credentials, make_db(user))
+
+        updated = user.model_copy(update={"is_active": False})
+        await other.invalidate_user(user.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials, make_db(updated))
+        assert exc_info.value.status_code == 403
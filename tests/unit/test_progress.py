@@ -0,0 +1,159 @@
+"""
+Unit tests for generation progress channels.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from certify_studio.api import progress
+from certify_studio.api.progress import CHANNEL_PREFIX, PhaseDurationStats, ProgressBroker
+
+
+class FakePubSub:
+    """Pub/sub connection replaying a fixed list of messages."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def psubscribe(self, pattern):
+        pass
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self, messages):
+        self.messages = messages
+        self.published = []
+
+    async def publish(self, channel, message):
+        await asyncio.sleep(0)
+        self.published.append((channel, json.loads(message)))
+
+    def pubsub(self):
+        return FakePubSub(self.messages)
+
+
+def relayed(task_id, event_id, event, data, owner="owner"):
+    return {
+        "type": "pmessage",
+        "channel": CHANNEL_PREFIX + task_id,
+        "data": json.dumps({"origin": "other", "owner": owner, "id": event_id, "event": event, "data": data})
+    }
+
+
+@pytest.fixture
+def short_retention(monkeypatch):
+    monkeypatch.setattr(progress.settings, "PROGRESS_RETENTION_SECONDS", 0.05)
+
+
+@pytest.mark.unit
+class TestProgressBroker:
+    """Test event-driven progress delivery."""
+
+    async def test_subscriber_wakes_on_publish(self):
+        """Subscribers receive events as soon as they are published."""
+        broker = ProgressBroker(["extraction", "export"])
+        received = []
+
+        async def consume():
+            async for event in broker.subscribe("task", heartbeat=5):
+                received.append(event)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        broker.publish("task", "progress", {"phase": "extraction", "progress": 10})
+        broker.publish("task", "complete", {"phase": "export", "progress": 100, "status": "completed"})
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert [event.id for event in received] == [1, 2]
+        assert received[-1].event == "complete"
+
+    async def test_resume_after_last_event_id(self):
+        """Reconnecting with Last-Event-ID replays only newer events."""
+        broker = ProgressBroker(["extraction"])
+        for progress in (10, 20, 30):
+            broker.publish("task", "progress", {"phase": "extraction", "progress": progress})
+        broker.publish("task", "complete", {"status": "completed"})
+
+        events = [event async for event in broker.subscribe("task", last_event_id=2)]
+
+        assert [event.id for event in events] == [3, 4]
+
+    async def test_heartbeat_when_idle(self):
+        """An idle subscription yields None at the heartbeat interval."""
+        broker = ProgressBroker(["extraction"])
+        subscription = broker.subscribe("task", heartbeat=0.01)
+
+        assert await asyncio.wait_for(subscription.__anext__(), timeout=1) is None
+        await subscription.aclose()
+
+    async def test_completed_channel_expires(self, short_retention):
+        """A completed task's channel is dropped after the retention period."""
+        broker = ProgressBroker(["extraction"])
+        broker.publish("task", "complete", {"status": "completed"}, owner="user")
+
+        assert broker.owner("task") == "user"
+        await asyncio.sleep(0.2)
+        assert "task" not in broker.channels
+
+    async def test_relayed_channels_expire(self, short_retention):
+        """Channels of tasks run by other processes expire, finished or not."""
+        broker = ProgressBroker(["extraction"])
+        await broker.start(FakeRedis([
+            relayed("done", 1, "complete", {"status": "completed"}),
+            relayed("stalled", 1, "progress", {"phase": "extraction", "progress": 10}),
+        ]))
+        try:
+            await asyncio.sleep(0.01)
+            assert broker.owner("done") == "owner"
+            assert broker.owner("stalled") == "owner"
+
+            await asyncio.sleep(0.2)
+            assert broker.channels == {}
+        finally:
+            await broker.stop()
+
+    async def test_broadcasts_are_kept_until_sent(self):
+        """Events are relayed by tasks the broker holds until they finish."""
+        broker = ProgressBroker(["extraction"])
+        redis = FakeRedis([])
+        await broker.start(redis)
+        try:
+            broker.publish("task", "progress", {"phase": "extraction", "progress": 10})
+            assert len(broker._broadcasts) == 1
+
+            await asyncio.sleep(0.01)
+            assert broker._broadcasts == set()
+            assert redis.published[0][0] == CHANNEL_PREFIX + "task"
+            assert redis.published[0][1]["data"]["progress"] == 10
+        finally:
+            await broker.stop()
+
+
+@pytest.mark.unit
+class TestPhaseDurationStats:
+    """Test ETA estimates from phase history."""
+
+    def test_linear_fallback_without_history(self):
+        """Without history the ETA extrapolates overall progress."""
+        stats = PhaseDurationStats(["a", "b"])
+
+        assert stats.estimate_remaining("a", 5, 10, 25) == pytest.approx(30)
+        assert stats.estimate_remaining("a", 0, 0, 0) is None
+
+    def test_uses_phase_averages(self):
+        """With history the ETA is the rest of this phase plus later phases."""
+        stats = PhaseDurationStats(["a", "b", "c"])
+        for phase, duration in (("a", 10), ("b", 20), ("c", 30)):
+            stats.record(phase, duration)
+
+        assert stats.estimate_remaining("b", 5, 15, 40) == pytest.approx(45)
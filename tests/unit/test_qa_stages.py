@@ -0,0 +1,88 @@
+"""
+Unit tests for the quality assurance agent's stage fan-out.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance.agent import QualityAssuranceAgent
+
+
+class StageTestAgent(QualityAssuranceAgent):
+    """Concrete agent with the BDI cycle stubbed out."""
+
+    async def _analyze_situation(self):
+        return {}
+
+    async def _update_beliefs(self, observation):
+        pass
+
+    async def _generate_intentions(self):
+        return []
+
+    async def _update_plans(self, intentions):
+        pass
+
+    async def _execute_step(self, step):
+        return {}
+
+    async def _evaluate_outcome(self, outcome):
+        return {}
+
+
+@pytest.fixture
+def agent():
+    # Scoring and stage helpers need none of the agent's components
+    return StageTestAgent.__new__(StageTestAgent)
+
+
+@pytest.mark.unit
+class TestQAStages:
+    """Test per-stage budgets, partial results and scoring."""
+
+    async def test_stages_run_concurrently(self, agent):
+        async def slow():
+            await asyncio.sleep(0.2)
+            return "done"
+
+        start = asyncio.get_running_loop().time()
+        outcomes = await asyncio.gather(*(agent._run_stage(name, slow, 1.0) for name in "abc"))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [result for result, _ in outcomes] == ["done"] * 3
+        assert elapsed < 0.5
+
+    async def test_timeout_and_failure_give_partial_results(self, agent):
+        async def hang():
+            await asyncio.sleep(10)
+
+        async def broken():
+            raise ValueError("bad content")
+
+        result, timing = await agent._run_stage("performance", hang, 0.05)
+        assert result is None and timing["status"] == "timed_out"
+
+        result, timing = await agent._run_stage("technical", broken, 1.0)
+        assert result is None
+        assert timing["status"] == "failed" and timing["error"] == "bad content"
+        assert timing["duration_ms"] >= 0
+
+    def test_overall_score_rescales_missing_stages(self, agent):
+        technical = SimpleNamespace(accuracy_score=0.8)
+        performance = SimpleNamespace(overall_score=0.6)
+
+        score = agent._calculate_overall_score(technical, None, performance, None)
+
+        assert score == pytest.approx((0.8 * 0.3 + 0.6 * 0.25) / 0.55)
+        assert agent._calculate_overall_score(None, None, None, None) == 0.0
+
+    def test_incomplete_validator_fails_gate(self, agent):
+        """A timed-out or failed validator fails QA even when the rescaled score passes."""
+        completed = {"status": "completed", "duration_ms": 5.0}
+        timed_out = {"status": "timed_out", "duration_ms": 120000.0, "error": "Exceeded 120s budget"}
+
+        assert agent._passes_quality_gate(0.95, 0.8, {"technical": completed, "certification": completed})
+        assert not agent._passes_quality_gate(0.95, 0.8, {"technical": completed, "certification": timed_out})
+        assert not agent._passes_quality_gate(0.5, 0.8, {"technical": completed})
@@ -0,0 +1,100 @@
+"""
+Unit tests for range and conditional file responses.
+"""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from certify_studio.api.responses import (
+    RangeFileResponse,
+    RangeNotSatisfiable,
+    parse_range_header
+)
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Client for an app serving a 100-byte file."""
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(100)))
+
+    async def serve(request):
+        return RangeFileResponse(
+            path,
+            request_headers=request.headers,
+            media_type="video/mp4",
+            method=request.method
+        )
+
+    app = Starlette(routes=[Route("/file", serve, methods=["GET", "HEAD"])])
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestParseRangeHeader:
+    """Test Range header parsing."""
+
+    def test_forms_are_normalised(self):
+        """Open, closed and suffix ranges are clipped, sorted and merged."""
+        assert parse_range_header("bytes=0-9", 100) == [(0, 10)]
+        assert parse_range_header("bytes=90-", 100) == [(90, 100)]
+        assert parse_range_header("bytes=-5", 100) == [(95, 100)]
+        assert parse_range_header("bytes=50-500", 100) == [(50, 100)]
+        assert parse_range_header("bytes=20-29, 0-4, 25-39", 100) == [(0, 5), (20, 40)]
+
+    def test_malformed_is_ignored(self):
+        """Malformed headers fall back to the full file."""
+        assert parse_range_header("items=0-1", 100) is None
+        assert parse_range_header("bytes=9-2", 100) is None
+        assert parse_range_header("bytes=abc", 100) is None
+
+    def test_unsatisfiable(self):
+        """Ranges entirely past the end are rejected."""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=100-200", 100)
+
+
+@pytest.mark.unit
+class TestRangeFileResponse:
+    """Test served responses."""
+
+    def test_full_and_single_range(self, client):
+        """A plain GET returns the file; a Range returns only those bytes."""
+        full = client.get("/file")
+        assert full.status_code == 200
+        assert full.content == bytes(range(100))
+        assert full.headers["accept-ranges"] == "bytes"
+
+        partial = client.get("/file", headers={"Range": "bytes=10-19"})
+        assert partial.status_code == 206
+        assert partial.content == bytes(range(10, 20))
+        assert partial.headers["content-range"] == "bytes 10-19/100"
+
+    def test_multiple_ranges(self, client):
+        """Disjoint ranges are sent as multipart/byteranges."""
+        response = client.get("/file", headers={"Range": "bytes=0-1,50-51"})
+
+        assert response.status_code == 206
+        assert response.headers["content-type"].startswith("multipart/byteranges")
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert b"Content-Range: bytes 0-1/100" in response.content
+        assert bytes([50, 51]) in response.content
+
+    def test_unsatisfiable_range(self, client):
+        """Out-of-bounds ranges get 416 with the file size."""
+        response = client.get("/file", headers={"Range": "bytes=200-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */100"
+
+    def test_conditional_requests(self, client):
+        """Matching validators produce 304; a stale If-Range serves the full file."""
+        etag = client.get("/file").headers["etag"]
+
+        assert client.get("/file", headers={"If-None-Match": etag}).status_code == 304
+
+        stale = client.get("/file", headers={"Range": "bytes=0-1", "If-Range": '"stale"'})
+        assert stale.status_code == 200
+        assert len(stale.content) == 100
@@ -0,0 +1,44 @@
+"""
+Unit tests for the token-bucket rate limiter.
+"""
+
+import pytest
+
+from certify_studio.api.rate_limit import RateLimiter
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test the in-process token bucket fallback."""
+
+    async def test_bucket_exhausts_and_reports_retry(self):
+        """Requests beyond capacity are rejected with a retry hint."""
+        limiter = RateLimiter(use_redis=False)
+
+        results = [await limiter.hit("ip:1", limit=3, window=60) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert results[2].remaining == 0
+        assert results[3].retry_after == pytest.approx(20, rel=0.01)
+        assert "Retry-After" in results[3].headers()
+
+    async def test_costs_are_weighted(self):
+        """An expensive request drains more of the bucket."""
+        limiter = RateLimiter(use_redis=False)
+
+        expensive = await limiter.hit("user:1", limit=10, window=60, cost=8)
+        cheap = await limiter.hit("user:1", limit=10, window=60, cost=0.5)
+        rejected = await limiter.hit("user:1", limit=10, window=60, cost=8)
+
+        assert expensive.remaining == 2
+        assert cheap.allowed
+        assert not rejected.allowed
+
+    async def test_local_buckets_are_bounded(self):
+        """Old client buckets are evicted instead of growing forever."""
+        limiter = RateLimiter(use_redis=False, max_local_keys=100)
+
+        for client in range(1000):
+            await limiter.hit(f"ip:{client}", limit=5, window=60)
+
+        assert len(limiter.local_buckets) == 100
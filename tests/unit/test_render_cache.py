@@ -0,0 +1,143 @@
+"""
+Unit tests for the content-addressed render cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from certify_studio.core.config import settings
+from certify_studio.manim_integration.render_cache import RenderCache
+from certify_studio.manim_integration.render_farm import RenderResult
+from certify_studio.manim_integration.scene_generator import ManimSceneGenerator
+
+
+def write_clip(path, size: int):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+class RecordingFarm:
+    """Farm that "renders" instantly and remembers the jobs it was given."""
+
+    max_workers = 1
+
+    def __init__(self):
+        self.jobs = []
+
+    async def render_all(self, jobs):
+        self.jobs.extend(jobs)
+        results = []
+        for job in jobs:
+            job.output_dir.mkdir(parents=True, exist_ok=True)
+            results.append(RenderResult(job=job, output=write_clip(job.output_dir / f"{job.output_name}.mp4", 10)))
+        return results
+
+
+@pytest.mark.unit
+class TestRenderCache:
+    """Test cache keys, lookups and LRU eviction."""
+
+    def test_key_depends_on_render_inputs(self):
+        """Keys ignore dict ordering but change with quality and theme."""
+        spec = {"id": "s1", "elements": [1, 2]}
+        key = RenderCache.key_for(spec, {"primary": "#fff"}, "high_quality")
+
+        assert key == RenderCache.key_for(dict(reversed(spec.items())), {"primary": "#fff"}, "high_quality")
+        assert key != RenderCache.key_for(spec, {"primary": "#fff"}, "low_quality")
+        assert key != RenderCache.key_for(spec, {"primary": "#000"}, "high_quality")
+
+    def test_put_and_fetch(self, tmp_path):
+        """A stored clip is returned for the same key."""
+        cache = RenderCache(tmp_path / "cache", max_bytes=10_000)
+        key = cache.key_for({"id": "s1"})
+        cache.put(key, write_clip(tmp_path / "render.mp4", 100))
+
+        fetched = cache.fetch(key, tmp_path / "out" / "scene_000.mp4")
+
+        assert fetched.read_bytes() == b"x" * 100
+        assert cache.fetch(cache.key_for({"id": "s2"}), tmp_path / "out" / "other.mp4") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """The budget is enforced by dropping the least recently used clip."""
+        cache = RenderCache(tmp_path / "cache", max_bytes=250)
+        keys = [cache.key_for({"id": i}) for i in range(3)]
+        cache.put(keys[0], write_clip(tmp_path / "a.mp4", 100))
+        cache.put(keys[1], write_clip(tmp_path / "b.mp4", 100))
+        assert cache.get(keys[0]) is not None
+
+        cache.put(keys[2], write_clip(tmp_path / "c.mp4", 100))
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.size <= 250
+
+    def test_index_survives_restart(self, tmp_path):
+        """A new cache instance sees clips written by a previous one."""
+        key = RenderCache.key_for({"id": "s1"})
+        RenderCache(tmp_path / "cache", max_bytes=10_000).put(key, write_clip(tmp_path / "a.mp4", 10))
+
+        assert RenderCache(tmp_path / "cache", max_bytes=10_000).get(key) is not None
+
+    def test_budget_counts_other_processes_entries(self, tmp_path):
+        """Clips stored by another process count towards the budget once re-synced."""
+        first = RenderCache(tmp_path / "cache", max_bytes=250)
+        second = RenderCache(tmp_path / "cache", max_bytes=250)
+        keys = [RenderCache.key_for({"id": i}) for i in range(3)]
+        first.put(keys[0], write_clip(tmp_path / "a.mp4", 100))
+        second.put(keys[1], write_clip(tmp_path / "b.mp4", 100))
+
+        # Under budget by its own count, so only the periodic re-sync sees the other clip
+        first.put(keys[2], write_clip(tmp_path / "c.mp4", 100))
+        assert len(list((tmp_path / "cache" / "clips").rglob("*.mp4"))) == 3
+
+        first._scanned_at -= RenderCache.RESCAN_SECONDS + 1
+        first.put(keys[2], tmp_path / "c.mp4")
+
+        clips = list((tmp_path / "cache" / "clips").rglob("*.mp4"))
+        assert len(clips) == 2
+        assert first.size <= 250
+
+    def test_partials_in_use_are_not_evicted(self, tmp_path, monkeypatch):
+        """A partial movie dir is kept while this or another process may render into it."""
+        monkeypatch.setattr(settings, "RENDER_SCENE_TIMEOUT_SECONDS", 3600)
+        cache = RenderCache(tmp_path / "cache", max_bytes=150)
+        other = RenderCache(tmp_path / "cache", max_bytes=150)
+        partial = cache.partial_dir("s1", "high_quality")
+        write_clip(partial / "part_000.mp4", 100)
+        old = time.time() - 7200
+        os.utime(partial, (old, old))
+
+        # Pinned here; too old to be protected by its modification time
+        cache.put(cache.key_for({"id": 1}), write_clip(tmp_path / "a.mp4", 100))
+        cache.put(cache.key_for({"id": 2}), write_clip(tmp_path / "b.mp4", 100))
+        assert partial.exists()
+
+        # Not pinned in the other process, but recently written to
+        os.utime(partial)
+        other.put(other.key_for({"id": 3}), write_clip(tmp_path / "c.mp4", 100))
+        assert partial.exists()
+
+        # Released and idle: evictable again
+        cache.record_partials(partial)
+        os.utime(partial, (old, old))
+        cache._scanned_at = 0.0
+        cache.put(cache.key_for({"id": 4}), write_clip(tmp_path / "d.mp4", 100))
+        assert not partial.exists()
+
+    async def test_partial_movies_shared_only_by_identical_specs(self, tmp_path):
+        """Scenes without an id get partial movie directories keyed on their spec."""
+        cache = RenderCache(tmp_path / "cache", max_bytes=10_000)
+        farm = RecordingFarm()
+        generator = ManimSceneGenerator()
+
+        await generator.render_scenes([{"elements": [1]}], tmp_path / "run1", farm=farm, cache=cache)
+        await generator.render_scenes([{"elements": [2]}], tmp_path / "run2", farm=farm, cache=cache)
+        await generator.render_scenes([{"id": "s1", "elements": [1]}], tmp_path / "run3", farm=farm, cache=cache)
+        await generator.render_scenes([{"id": "s1", "elements": [2]}], tmp_path / "run4", farm=farm, cache=cache)
+
+        partial_dirs = [job.config["partial_movie_dir"] for job in farm.jobs]
+        assert partial_dirs[0] != partial_dirs[1]
+        assert partial_dirs[2] == partial_dirs[3]
@@ -0,0 +1,81 @@
+"""
+Unit tests for the parallel Manim render farm.
+"""
+
+import sys
+
+import pytest
+
+from certify_studio.manim_integration.render_farm import RenderFarm, RenderJob
+
+FAKE_WORKER = """
+import json, pathlib, sys, time
+job = json.load(sys.stdin)
+time.sleep(job["scene_data"].get("sleep", 0))
+if job["scene_data"].get("fail"):
+    print(json.dumps({"error": "boom"}))
+    sys.exit(1)
+movie = pathlib.Path(job["media_dir"]) / "videos" / (job["output_name"] + ".mp4")
+movie.parent.mkdir(parents=True)
+movie.write_text(job["scene_data"]["title"])
+print(json.dumps({"output": str(movie)}))
+"""
+
+
+def make_farm(tmp_path, **options) -> RenderFarm:
+    return RenderFarm(
+        work_dir=tmp_path / "work",
+        worker_command=[sys.executable, "-c", FAKE_WORKER],
+        **options
+    )
+
+
+@pytest.mark.unit
+class TestRenderFarm:
+    """Test job scheduling and output collection."""
+
+    async def test_results_in_job_order_with_isolated_media(self, tmp_path):
+        """Outputs land in the output directory and temp media is removed."""
+        farm = make_farm(tmp_path, max_workers=3)
+        jobs = [
+            RenderJob({"title": f"scene {i}", "sleep": 0.2 if i == 0 else 0},
+                      tmp_path / "out", f"scene_{i:03d}")
+            for i in range(4)
+        ]
+
+        results = await farm.render_all(jobs)
+        await farm.shutdown()
+
+        assert [r.output.name for r in results] == [f"scene_{i:03d}.mp4" for i in range(4)]
+        assert results[2].output.read_text() == "scene 2"
+        assert list((tmp_path / "work").iterdir()) == []
+
+    async def test_failures_and_timeouts_are_reported(self, tmp_path):
+        """A failing or hung scene yields an error without blocking others."""
+        farm = make_farm(tmp_path, max_workers=2, scene_timeout=1)
+        jobs = [
+            RenderJob({"title": "ok"}, tmp_path / "out", "ok"),
+            RenderJob({"fail": True}, tmp_path / "out", "bad"),
+            RenderJob({"sleep": 30}, tmp_path / "out", "hung"),
+        ]
+
+        ok, bad, hung = await farm.render_all(jobs)
+        await farm.shutdown()
+
+        assert ok.success
+        assert bad.error == "boom"
+        assert "Timed out" in hung.error
+
+    async def test_priority_order(self, tmp_path):
+        """With one worker, lower priority values render first."""
+        farm = make_farm(tmp_path, max_workers=1)
+        jobs = [
+            RenderJob({"title": name}, tmp_path / "out", name, priority=priority)
+            for name, priority in (("late", 5), ("early", 0), ("middle", 2))
+        ]
+
+        results = await farm.render_all(jobs)
+        await farm.shutdown()
+
+        order = sorted(results, key=lambda r: r.output.stat().st_mtime_ns)
+        assert [r.job.output_name for r in order] == ["early", "middle", "late"]
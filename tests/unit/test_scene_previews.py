@@ -0,0 +1,208 @@
+"""
+Unit tests for scene previews: keyframe selection, file access and expiry.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from certify_studio.api.dependencies import check_rate_limit, get_current_verified_user
+from certify_studio.api.routers import generation
+from certify_studio.api.schemas import User, PlanType, StatusEnum
+from certify_studio.manim_integration.scene_generator import AgentGeneratedScene
+
+
+def make_user() -> User:
+    return User(
+        id=uuid4(),
+        email="test@example.com",
+        username="testuser",
+        is_active=True,
+        is_verified=True,
+        plan_type=PlanType.FREE,
+        total_generations=0,
+        total_storage_mb=0,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+async def wait_until_removed(path, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while path.exists() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def preview_dir(tmp_path, monkeypatch):
+    """Previews written under tmp_path, rendered instantly and without full renders."""
+    monkeypatch.setattr(generation, "PREVIEW_DIR", tmp_path / "previews")
+    generation.preview_tasks.clear()
+
+    async def render_preview(scene, output_dir, thumbnails=True):
+        output_dir.mkdir(parents=True)
+        video = output_dir / "scene_000.mp4"
+        video.write_bytes(b"\x00" * 64)
+        still = output_dir / "thumb_000.jpg"
+        still.write_bytes(b"\xff" * 16)
+        (output_dir / "render.log").write_text("not downloadable")
+        return {"video": video, "thumbnails": [still], "keyframes": [0.0]}
+
+    monkeypatch.setattr(generation.scene_generator, "render_preview", render_preview)
+    yield tmp_path / "previews"
+    generation.preview_tasks.clear()
+
+
+@pytest.fixture
+def users():
+    return {"owner": make_user(), "other": make_user()}
+
+
+@pytest.fixture
+def client(preview_dir, users):
+    """Client whose caller is whichever user ``client.as_user`` names."""
+    app = FastAPI()
+    app.include_router(generation.router, prefix="/api")
+    current = {"user": users["owner"]}
+    app.dependency_overrides[get_current_verified_user] = lambda: current["user"]
+    app.dependency_overrides[check_rate_limit] = lambda: None
+    test_client = TestClient(app)
+    test_client.as_user = lambda name: current.update(user=users[name])
+    return test_client
+
+
+def create_preview(client) -> dict:
+    response = client.post(
+        "/api/generation/preview",
+        json={"scene": {"id": "s1"}, "queue_full_render": False}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.unit
+class TestKeyframeTimes:
+    """Test which timestamps get a preview thumbnail."""
+
+    def test_keyframes_are_used_when_present(self):
+        """Keyframe dicts and objects give sorted, de-duplicated, non-negative times."""
+        scene = {
+            "keyframes": [{"time": 4}, SimpleNamespace(time=1.5), {"time": 4.0}, {"time": -1}],
+            "content": {"elements": [{"timing": {"start": 9}}]}
+        }
+
+        assert AgentGeneratedScene.keyframe_times(scene) == [1.5, 4.0]
+
+    def test_keyframes_inside_content(self):
+        """Keyframes nested in the agent content are found too."""
+        scene = {"content": {"keyframes": [{"time": 2}, {"time": 0}]}}
+
+        assert AgentGeneratedScene.keyframe_times(scene) == [0.0, 2.0]
+
+    def test_falls_back_to_element_timing(self):
+        """Without keyframes, element entries and exits across sub-scenes are used."""
+        scene = {"content": {"scenes": [
+            {"elements": [{"timing": {"start": 0, "end": 3}}, {"timing": {"start": 1}}]},
+            {"elements": [{"timing": {"end": 6}}, {"name": "untimed"}]}
+        ]}}
+
+        assert AgentGeneratedScene.keyframe_times(scene) == [0.0, 1.0, 3.0, 6.0]
+        assert AgentGeneratedScene.keyframe_times({}) == []
+
+
+@pytest.mark.unit
+class TestPreviewRoutes:
+    """Test preview ownership checks and the downloadable file whitelist."""
+
+    def test_owner_downloads_preview_files(self, client):
+        """The proxy and thumbnails listed in the response can be downloaded."""
+        preview = create_preview(client)
+
+        video = client.get(preview["video_url"])
+        thumbnail = client.get(preview["thumbnail_urls"][0])
+
+        assert video.status_code == 200
+        assert video.headers["content-type"] == "video/mp4"
+        assert thumbnail.status_code == 200
+        assert thumbnail.headers["content-type"] == "image/jpeg"
+
+    def test_other_user_is_denied(self, client):
+        """Another user gets 403 for both the status and the files."""
+        preview = create_preview(client)
+        client.as_user("other")
+
+        assert client.get(f"/api/generation/preview/{preview['preview_id']}").status_code == 403
+        assert client.get(preview["video_url"]).status_code == 403
+
+    def test_unknown_preview_is_not_found(self, client):
+        assert client.get(f"/api/generation/preview/{uuid4()}").status_code == 404
+
+    def test_only_produced_files_are_served(self, client):
+        """Files the preview did not produce are 404, even in its directory."""
+        preview = create_preview(client)
+        base = f"/api/generation/preview/{preview['preview_id']}/files"
+
+        assert client.get(f"{base}/render.log").status_code == 404
+        assert client.get(f"{base}/full.mp4").status_code == 404
+        assert client.get(f"{base}/..%2F..%2Fsecret").status_code == 404
+
+
+@pytest.mark.unit
+class TestPreviewExpiry:
+    """Test that previews and their files are removed after the TTL."""
+
+    async def test_expired_preview_is_removed(self, preview_dir, users):
+        """Once the TTL has passed the preview and its directory are deleted."""
+        preview_id = uuid4()
+        directory = preview_dir / str(preview_id)
+        directory.mkdir(parents=True)
+        generation.preview_tasks[preview_id] = {"user_id": users["owner"].id, "files": {}}
+        generation.expire_preview_later(preview_id)
+
+        generation.preview_tasks[preview_id]["expires_at"] = time.monotonic() - 1
+        generation.expire_preview(preview_id)
+        await wait_until_removed(directory)
+
+        assert preview_id not in generation.preview_tasks
+        assert not directory.exists()
+
+    async def test_running_full_render_is_kept(self, preview_dir, users):
+        """A preview whose full render is still running outlives its TTL."""
+        preview_id = uuid4()
+        directory = preview_dir / str(preview_id)
+        directory.mkdir(parents=True)
+        generation.preview_tasks[preview_id] = {
+            "user_id": users["owner"].id,
+            "files": {},
+            "full_status": StatusEnum.PROCESSING,
+            "expires_at": time.monotonic() - 1
+        }
+
+        generation.expire_preview(preview_id)
+
+        assert preview_id in generation.preview_tasks
+        assert directory.exists()
+
+    def test_stale_directories_are_swept(self, preview_dir, users):
+        """Untracked directories untouched for the TTL are removed; others stay."""
+        stale, fresh, tracked = (preview_dir / str(uuid4()) for _ in range(3))
+        for directory in (stale, fresh, tracked):
+            directory.mkdir(parents=True)
+            (directory / "scene_000.mp4").write_bytes(b"\x00")
+        old = time.time() - generation.settings.PREVIEW_TTL_SECONDS - 60
+        for directory in (stale, tracked):
+            os.utime(directory / "scene_000.mp4", (old, old))
+            os.utime(directory, (old, old))
+        generation.preview_tasks[generation.UUID(tracked.name)] = {"user_id": users["owner"].id}
+
+        generation.remove_stale_preview_dirs()
+
+        assert not stale.exists()
+        assert fresh.exists() and tracked.exists()
@@ -0,0 +1,47 @@
+"""
+Unit tests for the diagram spatial index.
+"""
+
+import pytest
+
+from certify_studio.agents.specialized.content_generation.spatial_index import SpatialIndex
+
+
+@pytest.fixture
+def index():
+    index = SpatialIndex(cell_size=100)
+    index.insert("a", (0, 0, 50, 50))
+    index.insert("b", (40, 40, 50, 50))   # overlaps a
+    index.insert("c", (400, 0, 50, 50))
+    index.insert("d", (1000, 1000, 50, 50))
+    return index
+
+
+@pytest.mark.unit
+class TestSpatialIndex:
+    """Test overlap, spacing and routing queries."""
+
+    def test_overlapping_pairs(self, index):
+        assert index.overlapping_pairs() == [("a", "b")]
+
+    def test_query(self, index):
+        assert index.query((42, 42, 5, 5)) == {"a", "b"}
+        assert index.query((300, 0, 10, 10), margin=100) == {"c"}
+
+    def test_nearest(self, index):
+        assert index.nearest("a") == ("b", pytest.approx(40 * 2 ** 0.5))
+        assert index.nearest("d")[0] == "c"
+
+    def test_route_avoids_obstacle(self):
+        index = SpatialIndex(cell_size=100)
+        index.insert("wall", (100, 0, 50, 200))
+        start, end = (0, 100), (300, 100)
+
+        path = index.route(start, end)
+
+        assert path[0] == start and path[-1] == end
+        assert len(path) > 2
+        assert all(not index.blockers(a, b, clearance=10) for a, b in zip(path, path[1:]))
+
+    def test_clear_route_is_straight(self, index):
+        assert index.route((0, 300), (400, 300)) == [(0, 300), (400, 300)]
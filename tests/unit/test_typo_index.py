@@ -0,0 +1,47 @@
+"""
+Unit tests for the command typo index.
+"""
+
+import random
+import string
+
+import pytest
+
+from certify_studio.agents.specialized.quality_assurance.fuzzy_index import (
+    FuzzyIndex,
+    edit_distance,
+    get_fuzzy_index
+)
+
+
+@pytest.mark.unit
+class TestFuzzyIndex:
+    """Test bounded-distance lookups against a linear scan."""
+
+    def test_edit_distance(self):
+        assert edit_distance("kitten", "sitting") == 3
+        assert edit_distance("", "git") == 3
+        assert edit_distance("docker", "docker") == 0
+        assert edit_distance("kitten", "sitting", max_distance=1) == 2
+
+    def test_search_matches_linear_scan(self):
+        rng = random.Random(0)
+        words = ["".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(2, 7))) for _ in range(300)]
+        index = FuzzyIndex(words)
+
+        for _ in range(50):
+            query = "".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(2, 7)))
+            expected = {word for word in words if edit_distance(query, word) <= 2}
+            assert {word for _, word in index.search(query, 2)} == expected
+
+    def test_closest_first(self):
+        index = FuzzyIndex(["git", "pip", "gist", "kit"])
+
+        assert [word for _, word in index.search("gitt", 2)] == ["git", "gist", "kit"]
+        assert index.search("docker", 1) == []
+
+    def test_index_shared_per_vocabulary(self):
+        vocabulary = ("ls", "cd", "git")
+
+        assert get_fuzzy_index(vocabulary) is get_fuzzy_index(tuple(vocabulary))
+        assert len(get_fuzzy_index(vocabulary)) == 3
@@ -0,0 +1,77 @@
+"""
+Unit tests for the persistent embedding vector cache.
+"""
+
+import numpy as np
+import pytest
+
+from certify_studio.ml.vector_cache import VectorCache, content_key
+
+
+@pytest.mark.unit
+class TestVectorCache:
+    """Test memory-mapped, content-hash keyed vector store."""
+    
+    def test_roundtrip_and_misses(self, tmp_path):
+        """Stored vectors come back; unknown keys are reported missing."""
+        cache = VectorCache(str(tmp_path), "test-model", dim=4)
+        keys = [content_key("alpha"), content_key("beta")]
+        cache.put_many(keys, np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.float32))
+        
+        vectors, missing = cache.get_many([keys[1], content_key("gamma"), keys[0]])
+        
+        assert missing == [1]
+        assert vectors[0].tolist() == [5, 6, 7, 8]
+        assert vectors[2].tolist() == [1, 2, 3, 4]
+        
+    def test_duplicate_keys_not_appended(self, tmp_path):
+        """Writing a key twice keeps a single record."""
+        cache = VectorCache(str(tmp_path), "test-model", dim=2)
+        key = content_key("alpha")
+        cache.put_many([key, key], np.ones((2, 2), dtype=np.float32))
+        cache.put_many([key], np.zeros((1, 2), dtype=np.float32))
+        
+        assert len(cache) == 1
+        assert cache.path.stat().st_size == cache.record_dtype.itemsize
+        
+    def test_visible_to_other_instances(self, tmp_path):
+        """A second cache on the same file sees records appended later."""
+        reader = VectorCache(str(tmp_path), "test-model", dim=2)
+        writer = VectorCache(str(tmp_path), "test-model", dim=2)
+        writer.put_many([content_key("alpha")], np.array([[3, 4]], dtype=np.float32))
+        
+        vectors, missing = reader.get_many([content_key("alpha")])
+        
+        assert missing == []
+        assert vectors[0].tolist() == [3, 4]
+        
+    def test_partial_record_is_truncated_before_appending(self, tmp_path):
+        """A torn write at the end does not misalign records appended later."""
+        cache = VectorCache(str(tmp_path), "test-model", dim=2)
+        cache.put_many([content_key("alpha")], np.array([[1, 2]], dtype=np.float32))
+        with open(cache.path, "ab") as handle:
+            handle.write(b"\x00" * 5)
+        
+        cache.put_many([content_key("beta")], np.array([[3, 4]], dtype=np.float32))
+        
+        reader = VectorCache(str(tmp_path), "test-model", dim=2)
+        vectors, missing = reader.get_many([content_key("alpha"), content_key("beta")])
+        assert missing == []
+        assert vectors.tolist() == [[1, 2], [3, 4]]
+        assert cache.path.stat().st_size == 2 * cache.record_dtype.itemsize
+        
+    def test_rebuilt_when_full(self, tmp_path):
+        """Past the size limit the file starts over, and other instances notice."""
+        itemsize = VectorCache(str(tmp_path), "test-model", dim=2).record_dtype.itemsize
+        writer = VectorCache(str(tmp_path), "test-model", dim=2, max_bytes=2 * itemsize)
+        reader = VectorCache(str(tmp_path), "test-model", dim=2, max_bytes=2 * itemsize)
+        keys = [content_key(text) for text in ("alpha", "beta", "gamma")]
+        writer.put_many(keys[:2], np.array([[1, 2], [3, 4]], dtype=np.float32))
+        assert reader.get_many(keys[:1])[1] == []
+        
+        writer.put_many(keys[2:], np.array([[5, 6]], dtype=np.float32))
+        
+        assert writer.path.stat().st_size == itemsize
+        vectors, missing = reader.get_many(keys)
+        assert missing == [0, 1]
+        assert vectors[2].tolist() == [5, 6]